@@ -76,6 +76,11 @@ class Settings(BaseSettings):
     database_max_overflow: int = 10
 
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = Field(
+        default=50,
+        ge=1,
+        description="Maximum connections in the shared asyncio Redis pool",
+    )
     worker_concurrency: int = Field(
         default=10,
         ge=1,
@@ -116,6 +121,113 @@ class Settings(BaseSettings):
     session_secret_key: str = "change-me-in-production-session"  # noqa: S105
     session_expire_minutes: int = 60 * 24 * 7
     session_cookie_name: str = "session_id"
+    session_refresh_after_fraction: float = Field(
+        default=0.1,
+        ge=0,
+        le=1,
+        description="Fraction of the session lifetime that must elapse before a request slides its expiry again",
+    )
+
+    api_key_cache_ttl: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds a valid API key lookup is reused per process (0 disables)",
+    )
+    api_key_negative_cache_ttl: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds an unknown or revoked API key is remembered per process (0 disables)",
+    )
+    api_key_cache_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Maximum number of API key hashes cached per process",
+    )
+    api_key_last_used_resolution: int = Field(
+        default=60,
+        ge=0,
+        description="Minimum seconds between buffered last_used_at writes for the same key per process",
+    )
+    auth_user_cache_ttl: int = Field(
+        default=60,
+        ge=0,
+        description="Seconds an authenticated user snapshot is cached per process (0 disables the cache)",
+    )
+    auth_user_cache_size: int = Field(
+        default=10_000,
+        ge=0,
+        description="Maximum number of user snapshots held in the per-process auth cache",
+    )
+    password_hash_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor for new password hashes; older hashes are upgraded on login",
+    )
+    password_hash_workers: int = Field(
+        default=4,
+        gt=0,
+        description="Threads per process that run bcrypt hashing and verification",
+    )
+    password_hash_max_pending: int = Field(
+        default=64,
+        gt=0,
+        description="bcrypt operations queued or running per process before new ones are rejected with 429",
+    )
+
+    banner_snapshot_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Maximum seconds a process serves its banner snapshot before reloading it from the database",
+    )
+    banner_version_check_interval: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds between checks of the Redis banner version counter (0 checks on every request)",
+    )
+    release_tree_ttl: int = Field(
+        default=3600,
+        ge=0,
+        description="Maximum seconds a process serves its downloads release tree before reloading it",
+    )
+    release_tree_version_check_interval: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds between checks of the Redis release version counter (0 checks on every request)",
+    )
+
+    response_cache_stale_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds a cached page is served stale past its TTL while one request refreshes it",
+    )
+    response_cache_lock_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds one request may spend recomputing a cached page before another takes over",
+    )
+    response_cache_local_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=0,
+        description="Byte budget of the per-process in-memory tier of the response cache (0 disables it)",
+    )
+    response_cache_local_max_entry_bytes: int = Field(
+        default=1024 * 1024,
+        ge=0,
+        description="Largest cached response kept in the per-process tier",
+    )
+
+    markup_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Maximum number of rendered Markdown/RST documents held in the per-process cache (0 disables it)",
+    )
+
+    download_stats_daily_ttl: int = Field(
+        default=8 * 24 * 60 * 60,
+        gt=0,
+        description="Seconds a daily download counter lives in Redis, counted from its first increment",
+    )
 
     csrf_secret: str = "change-me-csrf-secret"  # noqa: S105
     csrf_cookie_name: str = "csrftoken"
@@ -128,6 +240,36 @@ class Settings(BaseSettings):
     smtp_from_email: str = "noreply@python.org"
     smtp_from_name: str = "Python.org"
     smtp_use_tls: bool = True
+    smtp_pool_size: int = Field(
+        default=4,
+        gt=0,
+        description="Maximum number of SMTP connections open at once per process",
+    )
+    smtp_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds before an SMTP command times out",
+    )
+    smtp_max_messages_per_connection: int = Field(
+        default=100,
+        gt=0,
+        description="Messages sent over one SMTP connection before it is replaced",
+    )
+    smtp_idle_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds an idle pooled SMTP connection is kept before it is closed",
+    )
+    email_bulk_chunk_size: int = Field(
+        default=500,
+        gt=0,
+        description="Recipients per job when a bulk email is split into chunks",
+    )
+    email_template_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description="Maximum number of compiled email template fields held in the per-process cache (0 disables it)",
+    )
     email_verification_expire_hours: int = 24
     jobs_admin_email: str = "jobs@python.org"
     events_admin_email: str = "events@python.org"
@@ -140,6 +282,31 @@ class Settings(BaseSettings):
 
     python_blog_feed_url: str = "https://blog.python.org/feeds/posts/default?alt=rss"
     python_blog_url: str = "https://blog.python.org"
+    feed_fetch_concurrency: int = Field(
+        default=16,
+        gt=0,
+        description="Maximum number of feeds fetched at once",
+    )
+    feed_fetch_per_host: int = Field(
+        default=2,
+        gt=0,
+        description="Maximum number of concurrent feed requests to a single host",
+    )
+    feed_fetch_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds before a feed request times out",
+    )
+    sync_fetch_concurrency: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum number of concurrent requests made by the external content sync",
+    )
+    sync_fetch_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds before an external content sync request times out",
+    )
 
     fastly_api_key: str | None = None
 
@@ -8,7 +8,7 @@ from pydotorg.core.auth.guards import (
     require_staff,
 )
 from pydotorg.core.auth.jwt import jwt_service
-from pydotorg.core.auth.middleware import JWTAuthMiddleware
+from pydotorg.core.auth.middleware import AuthMethod, AuthResult, JWTAuthMiddleware
 from pydotorg.core.auth.password import password_service
 from pydotorg.core.auth.schemas import (
     LoginRequest,
@@ -20,6 +20,8 @@ from pydotorg.core.auth.schemas import (
 from pydotorg.core.auth.session import SessionAuthMiddleware, SessionService, session_service
 
 __all__ = [
+    "AuthMethod",
+    "AuthResult",
     "JWTAuthMiddleware",
     "LoginRequest",
     "RefreshTokenRequest",
@@ -0,0 +1,244 @@
+"""API key lookup cache and write-behind ``last_used_at`` tracking.
+
+API traffic is read-mostly, so authenticating a key should not write to the
+database. Two pieces keep it that way:
+
+* :class:`APIKeyCache` remembers key-hash lookups per process for a short TTL,
+  including misses, so repeated requests with the same key (valid or not) skip
+  the ``api_keys`` query. Entries for keys changed through the ORM are dropped
+  on commit; other processes pick the change up when their TTL runs out.
+* :func:`record_api_key_use` buffers last-used timestamps in a Redis hash.
+  :func:`flush_api_key_last_used` drains that hash into ``api_keys`` with one
+  multi-row ``UPDATE`` and runs on a SAQ cron.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Final
+from uuid import UUID
+
+from redis.exceptions import RedisError, ResponseError
+from sqlalchemy import DateTime, Uuid, column, func, update, values
+
+from pydotorg.config import settings
+from pydotorg.core.changes import ChangeCollector
+from pydotorg.core.redis import awaitable, get_redis
+from pydotorg.domains.users.api_keys import APIKey
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+LAST_USED_BUFFER_KEY = "pydotorg:auth:api-key-last-used"
+LAST_USED_FLUSHING_KEY = f"{LAST_USED_BUFFER_KEY}:flushing"
+
+_SESSION_INFO_KEY = "pydotorg_invalidated_api_key_hashes"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAPIKey:
+    """The parts of an active ``APIKey`` row needed to authenticate a request."""
+
+    id: UUID
+    user_id: UUID
+    expires_at: datetime | None
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the API key has expired."""
+        return self.expires_at is not None and datetime.now(tz=UTC) > self.expires_at
+
+
+class _Miss:
+    """Sentinel type for "not cached", as opposed to a cached negative lookup."""
+
+
+MISS: Final = _Miss()
+
+
+class APIKeyCache:
+    """Bounded TTL + LRU cache of key-hash lookups, positive and negative.
+
+    Example:
+        >>> cache = APIKeyCache()
+        >>> cache.set(key_hash, None)  # remember an unknown key
+        >>> cache.get(key_hash) is None
+        True
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.api_key_cache_size,
+        ttl: float = settings.api_key_cache_ttl,
+        negative_ttl: float = settings.api_key_negative_cache_ttl,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of key hashes kept; least recently used are evicted first.
+            ttl: Seconds a valid key lookup is reused. ``0`` disables positive caching.
+            negative_ttl: Seconds an unknown or inactive key is remembered. ``0`` disables negative caching.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, CachedAPIKey | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key_hash: str) -> CachedAPIKey | None | _Miss:
+        """Return the cached lookup, ``None`` for a cached miss, or :data:`MISS`."""
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            self.misses += 1
+            return MISS
+
+        expires_at, api_key = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key_hash, None)
+            self.misses += 1
+            return MISS
+
+        self._entries.move_to_end(key_hash)
+        self.hits += 1
+        return api_key
+
+    def set(self, key_hash: str, api_key: CachedAPIKey | None) -> None:
+        """Remember the lookup result for ``key_hash``; ``None`` means no active key."""
+        ttl = self.ttl if api_key is not None else self.negative_ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        self._entries[key_hash] = (time.monotonic() + ttl, api_key)
+        self._entries.move_to_end(key_hash)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key_hashes: set[str]) -> None:
+        """Drop the given key hashes from this process's cache."""
+        for key_hash in key_hashes:
+            self._entries.pop(key_hash, None)
+
+    def clear(self) -> None:
+        """Drop every cached lookup."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+api_key_cache = APIKeyCache()
+
+_last_recorded: dict[UUID, float] = {}
+
+
+async def record_api_key_use(api_key_id: UUID, redis: Redis | None = None) -> None:
+    """Buffer "this key was just used" for the next flush.
+
+    Each process writes a given key at most once per
+    ``settings.api_key_last_used_resolution`` seconds. The buffer is a Redis hash
+    of key ID to epoch seconds, so later writes overwrite earlier ones.
+
+    Args:
+        api_key_id: ID of the key that authenticated the request.
+        redis: Async Redis client. Defaults to a client on the shared pool.
+    """
+    now = time.monotonic()
+    last = _last_recorded.get(api_key_id)
+    if last is not None and now - last < settings.api_key_last_used_resolution:
+        return
+    _last_recorded[api_key_id] = now
+    if len(_last_recorded) > settings.api_key_cache_size:
+        _last_recorded.clear()
+
+    try:
+        await awaitable((redis or get_redis()).hset(LAST_USED_BUFFER_KEY, str(api_key_id), str(time.time())))
+    except (RedisError, OSError):
+        _last_recorded.pop(api_key_id, None)
+        logger.warning(f"Failed to buffer last_used_at for API key {api_key_id}", exc_info=True)
+
+
+def _parse_buffer(raw: dict[Any, Any]) -> list[dict[str, Any]]:
+    rows = []
+    for raw_id, raw_ts in raw.items():
+        try:
+            key_id = UUID(raw_id.decode() if isinstance(raw_id, bytes) else raw_id)
+            used_at = datetime.fromtimestamp(float(raw_ts), tz=UTC)
+        except (TypeError, ValueError):
+            logger.warning(f"Dropping malformed API key usage entry {raw_id!r}={raw_ts!r}")
+            continue
+        rows.append({"id": key_id, "last_used_at": used_at})
+    return rows
+
+
+async def flush_api_key_last_used(redis: Redis, session: AsyncSession) -> int:
+    """Write buffered last-used timestamps to ``api_keys`` in a single ``UPDATE``.
+
+    The buffer is renamed aside before reading, so uses recorded during the
+    flush land in a fresh hash for the next run. If a previous flush failed
+    after the rename, its leftover batch is retried first. ``last_used_at``
+    never moves backwards.
+
+    Args:
+        redis: Async Redis client.
+        session: Database session used for the update.
+
+    Returns:
+        Number of keys in the flushed batch.
+    """
+    if not await redis.exists(LAST_USED_FLUSHING_KEY):
+        try:
+            await redis.rename(LAST_USED_BUFFER_KEY, LAST_USED_FLUSHING_KEY)
+        except ResponseError:
+            return 0
+
+    rows = _parse_buffer(await awaitable(redis.hgetall(LAST_USED_FLUSHING_KEY)))
+    if rows:
+        batch = values(
+            column("id", Uuid()),
+            column("last_used_at", DateTime(timezone=True)),
+            name="api_key_usage",
+        ).data([(row["id"], row["last_used_at"]) for row in rows])
+        await session.execute(
+            update(APIKey)
+            .where(APIKey.id == batch.c.id)
+            .values(
+                last_used_at=func.greatest(
+                    func.coalesce(APIKey.last_used_at, batch.c.last_used_at),
+                    batch.c.last_used_at,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+    await redis.delete(LAST_USED_FLUSHING_KEY)
+    return len(rows)
+
+
+def _collect_changed_api_keys(session: Session, changed: set[str] | None) -> set[str] | None:
+    """Remember key hashes whose row changed in this transaction."""
+    changed = changed or set()
+    for instance in (*session.dirty, *session.deleted):
+        if isinstance(instance, APIKey) and instance.key_hash:
+            changed.add(instance.key_hash)
+    return changed or None
+
+
+def _invalidate_changed_api_keys(changed: set[str]) -> None:
+    api_key_cache.invalidate(changed)
+
+
+changed_api_keys = ChangeCollector(_SESSION_INFO_KEY, _collect_changed_api_keys, _invalidate_changed_api_keys)
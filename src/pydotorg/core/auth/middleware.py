@@ -1,225 +1,246 @@
-"""JWT, session, and API key authentication middleware."""
+"""JWT, session, and API key authentication middleware.
+
+Credentials are resolved once per request. The outcome is stored in the ASGI
+scope as an :class:`AuthResult` under ``scope["auth_result"]`` and reused by
+everything downstream, so headers and cookies are parsed once and an API key
+costs one lookup no matter how many consumers ask for the user.
+"""
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from dataclasses import dataclass
+from enum import StrEnum
 from typing import TYPE_CHECKING
 
 from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
-from litestar.connection import Request
-from litestar.middleware import AbstractAuthenticationMiddleware, AuthenticationResult, MiddlewareProtocol
+from litestar.enums import ScopeType
+from litestar.middleware import AbstractAuthenticationMiddleware, AuthenticationResult
 from sqlalchemy import select
 
 from pydotorg.config import settings
+from pydotorg.core.auth.api_key_cache import MISS, CachedAPIKey, api_key_cache, record_api_key_use
+from pydotorg.core.auth.guards import API_KEY_AUTH
 from pydotorg.core.auth.jwt import jwt_service
 from pydotorg.core.auth.session import session_service
+from pydotorg.core.auth.user_cache import user_cache
 from pydotorg.domains.users.api_keys import APIKey
 from pydotorg.domains.users.models import User
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
+    from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
     from litestar import Litestar
     from litestar.connection import ASGIConnection
-    from litestar.types import ASGIApp, Receive, Scope, Send
+    from litestar.types import Receive, Scope, Send
     from sqlalchemy.ext.asyncio import AsyncSession
 
 API_KEY_HEADER = "X-API-Key"
+AUTH_RESULT_SCOPE_KEY = "auth_result"
+ACCESS_TOKEN_COOKIE = "access_token"  # noqa: S105
 
+_API_KEY_HEADER_BYTES = API_KEY_HEADER.lower().encode()
+_BEARER_PREFIX = "Bearer "
 
-class UserPopulationMiddleware(MiddlewareProtocol):
-    """Middleware that always populates user in scope, regardless of exclude_from_auth.
-
-    This runs BEFORE the auth middleware and ensures user is available in templates
-    for showing admin buttons etc.
-    """
 
-    def __init__(self, app: ASGIApp) -> None:
-        self.app = app
+class AuthMethod(StrEnum):
+    """How a request was authenticated."""
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] == "http":
-            # Try to populate user from session/token
-            user = await self._get_user_from_request(scope)
-            if user:
-                scope["user"] = user
-        await self.app(scope, receive, send)
+    API_KEY = "api_key"
+    JWT = "jwt"
+    SESSION = "session"
 
-    async def _get_user_from_request(self, scope: Scope) -> User | None:
-        """Try to get user from API key, session, or JWT token."""
-        request = Request(scope)
 
-        # Try API key first (highest priority for programmatic access)
-        api_key_header = request.headers.get(API_KEY_HEADER)
-        if api_key_header:
-            user = await self._get_user_from_api_key(scope, api_key_header)
-            if user:
-                scope["auth_method"] = "api_key"
-                return user
+@dataclass(frozen=True, slots=True)
+class AuthResult:
+    """Outcome of resolving a request's credentials.
 
-        # Try JWT token
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-            try:
-                user_id = jwt_service.get_user_id_from_token(token)
-                return await self._get_user(scope, user_id)
-            except ValueError:
-                pass
+    Attributes:
+        user: The authenticated active user, or None for anonymous requests.
+        method: Which credential authenticated the user.
+        credential: The raw JWT or session ID that authenticated the user (never the API key).
+    """
 
-        # Try token from cookie
-        token_cookie = request.cookies.get("access_token")
-        if token_cookie:
-            try:
-                user_id = jwt_service.get_user_id_from_token(token_cookie)
-                return await self._get_user(scope, user_id)
-            except ValueError:
-                pass
+    user: User | None = None
+    method: AuthMethod | None = None
+    credential: str | None = None
+
+    @property
+    def auth(self) -> str | None:
+        """Value exposed as ``connection.auth``; guards compare it against ``API_KEY_AUTH``."""
+        if self.method is AuthMethod.API_KEY:
+            return API_KEY_AUTH
+        return self.credential
+
+
+ANONYMOUS = AuthResult()
+
+
+@dataclass(frozen=True, slots=True)
+class _Credentials:
+    api_key: str | None = None
+    bearer_token: str | None = None
+    cookie_token: str | None = None
+    session_id: str | None = None
+
+
+def _extract_credentials(scope: Scope) -> _Credentials:
+    """Pull every supported credential out of the raw ASGI headers in a single pass."""
+    api_key = authorization = None
+    cookie_headers: list[str] = []
+    for name, value in scope.get("headers", []):
+        if name == _API_KEY_HEADER_BYTES:
+            api_key = value.decode("latin-1")
+        elif name == b"authorization":
+            authorization = value.decode("latin-1")
+        elif name == b"cookie":
+            cookie_headers.append(value.decode("latin-1"))
+
+    cookie_token = session_id = None
+    for cookie_header in cookie_headers:
+        for chunk in cookie_header.split(";"):
+            key, sep, raw_value = chunk.partition("=")
+            if not sep:
+                continue
+            key = key.strip()
+            if key == ACCESS_TOKEN_COOKIE:
+                cookie_token = raw_value.strip().strip('"')
+            elif key == settings.session_cookie_name:
+                session_id = raw_value.strip().strip('"')
+
+    bearer_token = None
+    if authorization and authorization.startswith(_BEARER_PREFIX):
+        bearer_token = authorization[len(_BEARER_PREFIX) :]
+
+    return _Credentials(
+        api_key=api_key or None,
+        bearer_token=bearer_token or None,
+        cookie_token=cookie_token or None,
+        session_id=session_id or None,
+    )
+
+
+def _get_sqlalchemy_config(app: Litestar) -> SQLAlchemyAsyncConfig | None:
+    plugin = app.plugins.get(SQLAlchemyPlugin)
+    if plugin is None:
+        return None
+    return plugin.config[0] if isinstance(plugin.config, list) else plugin.config
 
-        # Try session
-        session_id = request.cookies.get(settings.session_cookie_name)
-        if session_id:
-            user_id = session_service.get_user_id_from_session(session_id)
-            if user_id:
-                return await self._get_user(scope, user_id)
 
-        return None
+async def _load_user(db_session: AsyncSession, user_id: UUID) -> User | None:
+    """Query the active user for ``user_id`` and remember it in the per-process user cache."""
+    result = await db_session.execute(select(User).where(User.id == user_id, User.is_active.is_(True)))
+    user = result.scalar_one_or_none()
+    if user is not None:
+        user_cache.set(user)
+    return user
 
-    @staticmethod
-    async def _get_user_from_api_key(scope: Scope, raw_key: str) -> User | None:
-        """Validate API key and return associated user."""
-        app: Litestar = scope["app"]
-        plugin = app.plugins.get(SQLAlchemyPlugin)
-        if plugin is None:
-            return None
-        config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
-        async with config.get_session() as db_session:
-            db_session: AsyncSession
-            key_hash = APIKey.hash_key(raw_key)
-            result = await db_session.execute(
-                select(APIKey).where(APIKey.key_hash == key_hash, APIKey.is_active.is_(True)).options()
-            )
-            api_key = result.scalar_one_or_none()
-            if api_key is None:
-                return None
-            if api_key.is_expired:
-                return None
-            # Update last_used_at
-            api_key.last_used_at = datetime.now(tz=UTC)
-            await db_session.commit()
-            # Get the user
-            user_result = await db_session.execute(
-                select(User).where(User.id == api_key.user_id, User.is_active.is_(True))
-            )
-            return user_result.scalar_one_or_none()
 
-    @staticmethod
-    async def _get_user(scope: Scope, user_id) -> User | None:
-        """Retrieve active user from database."""
-        app: Litestar = scope["app"]
-        plugin = app.plugins.get(SQLAlchemyPlugin)
-        if plugin is None:
-            return None
-        config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
-        async with config.get_session() as db_session:  # type: ignore[union-attr]
-            db_session: AsyncSession
-            result = await db_session.execute(select(User).where(User.id == user_id, User.is_active.is_(True)))
-            return result.scalar_one_or_none()
+def get_auth_result(scope: Scope) -> AuthResult | None:
+    """Return the credentials already resolved for this request, if any."""
+    return scope.get(AUTH_RESULT_SCOPE_KEY)  # type: ignore[return-value]
 
 
 class JWTAuthMiddleware(AbstractAuthenticationMiddleware):
+    """Single-pass authentication for API keys, JWTs (header or cookie), and sessions.
+
+    The user is populated on every HTTP request, including routes marked
+    ``exclude_from_auth``, so templates can show account and admin links on
+    public pages. ``connection.auth`` is only applied to routes that take part in
+    authentication, matching Litestar's exclusion rules. Session lookups slide
+    the session expiry in the same Redis round trip (see ``SessionService``).
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == ScopeType.HTTP:
+            result = await self.resolve(scope)
+            if result.user is not None:
+                scope["user"] = result.user
+        await super().__call__(scope, receive, send)
+
     async def authenticate_request(self, connection: ASGIConnection) -> AuthenticationResult:
-        # Check if user was already populated by UserPopulationMiddleware
-        existing_user = connection.scope.get("user")
-        if existing_user:
-            auth_method = connection.scope.get("auth_method", "session")
-            return AuthenticationResult(user=existing_user, auth=auth_method)
-
-        # Try API key first
-        api_key = self._extract_api_key(connection)
-        if api_key:
-            user = await self._get_user_from_api_key(connection, api_key)
+        result = await self.resolve(connection.scope)
+        return AuthenticationResult(user=result.user, auth=result.auth)
+
+    @classmethod
+    async def resolve(cls, scope: Scope) -> AuthResult:
+        """Resolve the request's credentials, at most once per scope.
+
+        Precedence is API key, then bearer token, then ``access_token`` cookie,
+        then session cookie. An invalid credential falls through to the next one.
+        """
+        cached = get_auth_result(scope)
+        if cached is not None:
+            return cached
+        result = await cls._resolve_credentials(scope, _extract_credentials(scope))
+        scope[AUTH_RESULT_SCOPE_KEY] = result  # type: ignore[literal-required]
+        return result
+
+    @classmethod
+    async def _resolve_credentials(cls, scope: Scope, credentials: _Credentials) -> AuthResult:
+        if credentials.api_key:
+            user = await cls._get_user_from_api_key(scope, credentials.api_key)
             if user:
-                return AuthenticationResult(user=user, auth="api_key")
-
-        token = self._extract_token(connection)
+                return AuthResult(user=user, method=AuthMethod.API_KEY)
 
-        if token:
+        for token in (credentials.bearer_token, credentials.cookie_token):
+            if not token:
+                continue
             try:
                 user_id = jwt_service.get_user_id_from_token(token)
-                user = await self._get_user(connection, user_id)
-                if user:
-                    return AuthenticationResult(user=user, auth=token)
             except ValueError:
-                pass
+                continue
+            user = await cls._get_user(scope, user_id)
+            if user:
+                return AuthResult(user=user, method=AuthMethod.JWT, credential=token)
 
-        session_id = self._extract_session_id(connection)
-        if session_id:
-            user_id = session_service.get_user_id_from_session(session_id)
+        if credentials.session_id:
+            user_id = await session_service.get_user_id_from_session(credentials.session_id)
             if user_id:
-                user = await self._get_user(connection, user_id)
+                user = await cls._get_user(scope, user_id)
                 if user:
-                    session_service.refresh_session(session_id)
-                    return AuthenticationResult(user=user, auth=session_id)
-
-        return AuthenticationResult(user=None, auth=None)
-
-    @staticmethod
-    async def _get_user(connection: ASGIConnection, user_id) -> User | None:
-        """Retrieve active user from database."""
-        plugin = connection.app.plugins.get(SQLAlchemyPlugin)
-        if plugin is None:
-            return None
-        config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
-        async with config.get_session() as db_session:  # type: ignore[union-attr]
-            db_session: AsyncSession
-            result = await db_session.execute(select(User).where(User.id == user_id, User.is_active.is_(True)))
-            return result.scalar_one_or_none()
-
-    @staticmethod
-    def _extract_token(connection: ASGIConnection) -> str | None:
-        """Extract JWT token from Authorization header or cookie."""
-        auth_header = connection.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            return auth_header[7:]
+                    return AuthResult(user=user, method=AuthMethod.SESSION, credential=credentials.session_id)
 
-        token_cookie = connection.cookies.get("access_token")
-        if token_cookie:
-            return token_cookie
-
-        return None
+        return ANONYMOUS
 
     @staticmethod
-    def _extract_session_id(connection: ASGIConnection) -> str | None:
-        """Extract session ID from cookie."""
-        return connection.cookies.get(settings.session_cookie_name)
-
-    @staticmethod
-    def _extract_api_key(connection: ASGIConnection) -> str | None:
-        """Extract API key from X-API-Key header."""
-        return connection.headers.get(API_KEY_HEADER)
-
-    @staticmethod
-    async def _get_user_from_api_key(connection: ASGIConnection, raw_key: str) -> User | None:
-        """Validate API key and return associated user."""
-        plugin = connection.app.plugins.get(SQLAlchemyPlugin)
-        if plugin is None:
+    async def _get_user(scope: Scope, user_id: UUID) -> User | None:
+        """Retrieve active user from the user cache or database."""
+        cached = user_cache.get(user_id)
+        if cached is not None:
+            return cached
+        config = _get_sqlalchemy_config(scope["app"])
+        if config is None:
             return None
-        config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
         async with config.get_session() as db_session:
-            db_session: AsyncSession
-            key_hash = APIKey.hash_key(raw_key)
-            result = await db_session.execute(
-                select(APIKey).where(APIKey.key_hash == key_hash, APIKey.is_active.is_(True))
-            )
-            api_key = result.scalar_one_or_none()
-            if api_key is None:
+            return await _load_user(db_session, user_id)
+
+    @classmethod
+    async def _get_user_from_api_key(cls, scope: Scope, raw_key: str) -> User | None:
+        """Validate API key and return associated user.
+
+        Lookups are cached per key hash (including misses) and ``last_used_at``
+        is buffered for a periodic bulk flush, so a valid key costs no writes
+        and a repeated key usually costs no queries.
+        """
+        key_hash = APIKey.hash_key(raw_key)
+        api_key = api_key_cache.get(key_hash)
+        if api_key is MISS:
+            config = _get_sqlalchemy_config(scope["app"])
+            if config is None:
                 return None
-            if api_key.is_expired:
-                return None
-            # Update last_used_at
-            api_key.last_used_at = datetime.now(tz=UTC)
-            await db_session.commit()
-            # Get the user
-            user_result = await db_session.execute(
-                select(User).where(User.id == api_key.user_id, User.is_active.is_(True))
-            )
-            return user_result.scalar_one_or_none()
+            async with config.get_session() as db_session:
+                row = (
+                    await db_session.execute(
+                        select(APIKey.id, APIKey.user_id, APIKey.expires_at).where(
+                            APIKey.key_hash == key_hash, APIKey.is_active.is_(True)
+                        )
+                    )
+                ).one_or_none()
+            api_key = CachedAPIKey(*row) if row is not None else None
+            api_key_cache.set(key_hash, api_key)
+
+        if api_key is None or api_key.is_expired:
+            return None
+        await record_api_key_use(api_key.id)
+        return await cls._get_user(scope, api_key.user_id)
@@ -1,17 +1,75 @@
-"""Password hashing and verification utilities."""
+"""Password hashing and verification utilities.
+
+bcrypt is deliberately slow: a hash or check at the default cost takes a few
+hundred milliseconds of CPU. The async methods of :class:`PasswordService` run
+it on a small dedicated thread pool (bcrypt releases the GIL while hashing) so
+a login never stalls the event loop. At most ``settings.password_hash_max_pending``
+operations may be queued or running per process; beyond that, new ones are
+rejected with :class:`PasswordHashingBusyError` (a 429) instead of queueing
+without bound during a credential-stuffing burst.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
 import bcrypt
+from litestar.exceptions import TooManyRequestsException
+
+from pydotorg.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 MIN_PASSWORD_LENGTH = 8
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(TooManyRequestsException):
+    """Raised when the password hashing pool already has too many operations pending."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            detail="Too many sign-in attempts are being processed. Please try again shortly.",
+            headers={"retry-after": "1"},
+        )
+
 
 class PasswordService:
-    @staticmethod
-    def hash_password(password: str) -> str:
+    def __init__(
+        self,
+        *,
+        rounds: int = settings.password_hash_rounds,
+        max_workers: int = settings.password_hash_workers,
+        max_pending: int = settings.password_hash_max_pending,
+    ) -> None:
+        """Initialize the service; the thread pool is started on first use.
+
+        Args:
+            rounds: bcrypt cost factor for new hashes.
+            max_workers: Threads running bcrypt.
+            max_pending: Operations queued or running before new ones are rejected.
+        """
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.peak_pending = 0
+        self._pending = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    def hash_password(self, password: str) -> str:
         password_bytes = password.encode("utf-8")
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(self.rounds)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode("utf-8")
 
@@ -21,6 +79,88 @@ class PasswordService:
         hashed_bytes = hashed_password.encode("utf-8")
         return bcrypt.checkpw(password_bytes, hashed_bytes)
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Return whether ``hashed_password`` was made with a cost other than ``rounds``."""
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+    async def hash(self, password: str) -> str:
+        """Hash ``password`` on the bcrypt thread pool.
+
+        Raises:
+            PasswordHashingBusyError: If too many operations are already pending.
+        """
+        return await self._run(self.hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Check ``plain_password`` against ``hashed_password`` on the bcrypt thread pool.
+
+        Raises:
+            PasswordHashingBusyError: If too many operations are already pending.
+        """
+        return await self._run(self.verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Verify a password and rehash it if its cost differs from ``rounds``.
+
+        Args:
+            plain_password: Password as submitted.
+            hashed_password: Stored hash.
+
+        Returns:
+            Whether the password matches, and a replacement hash to store if it
+            matches but was hashed with another cost (``None`` otherwise).
+
+        Raises:
+            PasswordHashingBusyError: If too many operations are already pending.
+        """
+        if not await self.verify(plain_password, hashed_password):
+            return False, None
+        if not self.needs_rehash(hashed_password):
+            return True, None
+        new_hash = await self.hash(plain_password)
+        self.rehashed += 1
+        return True, new_hash
+
+    def stats(self) -> dict[str, int]:
+        """Return pool size, queue depth and operation counters."""
+        return {
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the thread pool; it is started again on next use."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], *args: str) -> T:
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning("Password hashing pool is saturated", extra={"pending": self._pending})
+            raise PasswordHashingBusyError
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        self._pending += 1
+        self.peak_pending = max(self.peak_pending, self._pending)
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self._pending -= 1
+        self.completed += 1
+        return result
+
     @staticmethod
     def validate_password_strength(password: str) -> tuple[bool, str | None]:
         if len(password) < MIN_PASSWORD_LENGTH:
@@ -3,71 +3,120 @@
 from __future__ import annotations
 
 import secrets
-from datetime import timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
 from litestar.middleware import AbstractAuthenticationMiddleware, AuthenticationResult
-from redis import Redis
 from sqlalchemy import select
 
 from pydotorg.config import settings
+from pydotorg.core.redis import get_redis
 from pydotorg.domains.users.models import User
 
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection
+    from redis.asyncio import Redis
+    from redis.commands.core import AsyncScript
     from sqlalchemy.ext.asyncio import AsyncSession
 
+# Returns the session value and, when asked to, slides its expiry in the same
+# round trip. The expiry is only rewritten once the remaining TTL has dropped
+# below ARGV[2] ms, so a burst of requests does not rewrite the key each time.
+LOOKUP_AND_REFRESH_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if not value then
+    return false
+end
+if ARGV[1] == '1' then
+    local ttl = redis.call('PTTL', KEYS[1])
+    if ttl >= 0 and ttl < tonumber(ARGV[2]) then
+        redis.call('PEXPIRE', KEYS[1], ARGV[3])
+    end
+end
+return value
+"""
+
 
 class SessionService:
-    def __init__(self, redis_url: str = settings.redis_url) -> None:
-        self.redis_client = Redis.from_url(redis_url, decode_responses=True)
+    """Server-side sessions stored in Redis, using the shared asyncio connection pool.
+
+    Example:
+        >>> session_id = await session_service.create_session(user.id)
+        >>> await session_service.get_user_id_from_session(session_id)
+        UUID('...')
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        refresh_after_fraction: float = settings.session_refresh_after_fraction,
+    ) -> None:
+        """Initialize the session service.
+
+        Args:
+            redis: Async Redis client. Defaults to a client on the shared pool.
+            refresh_after_fraction: Fraction of the session lifetime that must elapse
+                before a lookup slides the expiry forward again.
+        """
+        self._redis = redis
+        self._lookup_script: AsyncScript | None = None
         self.session_prefix = "session:"
+        self.expire_ms = settings.session_expire_minutes * 60 * 1000
+        self.refresh_below_ms = int(self.expire_ms * (1 - refresh_after_fraction))
+
+    @property
+    def redis_client(self) -> Redis:
+        if self._redis is None:
+            self._redis = get_redis()
+        return self._redis
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.session_prefix}{session_id}"
 
-    def create_session(self, user_id: UUID) -> str:
+    async def create_session(self, user_id: UUID) -> str:
         """Create a new session and return session ID."""
         session_id = secrets.token_urlsafe(32)
-        session_key = f"{self.session_prefix}{session_id}"
-        expire_seconds = settings.session_expire_minutes * 60
+        await self.redis_client.set(self._key(session_id), str(user_id), px=self.expire_ms)
+        return session_id
 
-        self.redis_client.setex(
-            session_key,
-            timedelta(seconds=expire_seconds),
-            str(user_id),
-        )
+    async def get_user_id_from_session(self, session_id: str, *, refresh: bool = True) -> UUID | None:
+        """Retrieve user ID from session, return None if invalid or expired.
 
-        return session_id
+        Lookup and sliding-expiry refresh happen in one Redis round trip. The
+        expiry is only extended once ``refresh_after_fraction`` of the session
+        lifetime has passed since it was last set.
 
-    def get_user_id_from_session(self, session_id: str) -> UUID | None:
-        """Retrieve user ID from session, return None if invalid or expired."""
-        session_key = f"{self.session_prefix}{session_id}"
-        user_id_str = self.redis_client.get(session_key)
+        Args:
+            session_id: The session ID from the session cookie.
+            refresh: Slide the session expiry forward if it is due.
+        """
+        if self._lookup_script is None:
+            self._lookup_script = self.redis_client.register_script(LOOKUP_AND_REFRESH_SCRIPT)
 
-        if not user_id_str:
+        raw_user_id = await self._lookup_script(
+            keys=[self._key(session_id)],
+            args=["1" if refresh else "0", self.refresh_below_ms, self.expire_ms],
+        )
+        if not raw_user_id:
             return None
 
         try:
-            return UUID(user_id_str)
+            return UUID(raw_user_id.decode() if isinstance(raw_user_id, bytes) else raw_user_id)
         except (TypeError, ValueError):
             return None
 
-    def refresh_session(self, session_id: str) -> bool:
-        """Extend session expiration time."""
-        session_key = f"{self.session_prefix}{session_id}"
-        expire_seconds = settings.session_expire_minutes * 60
+    async def refresh_session(self, session_id: str) -> bool:
+        """Extend session expiration time unconditionally."""
+        return bool(await self.redis_client.pexpire(self._key(session_id), self.expire_ms))
 
-        return bool(self.redis_client.expire(session_key, expire_seconds))
-
-    def destroy_session(self, session_id: str) -> bool:
+    async def destroy_session(self, session_id: str) -> bool:
         """Delete session from Redis."""
-        session_key = f"{self.session_prefix}{session_id}"
-        return bool(self.redis_client.delete(session_key))
+        return bool(await self.redis_client.delete(self._key(session_id)))
 
-    def validate_session(self, session_id: str) -> bool:
+    async def validate_session(self, session_id: str) -> bool:
         """Check if session exists and is valid."""
-        session_key = f"{self.session_prefix}{session_id}"
-        return bool(self.redis_client.exists(session_key))
+        return bool(await self.redis_client.exists(self._key(session_id)))
 
 
 class SessionAuthMiddleware(AbstractAuthenticationMiddleware):
@@ -77,8 +126,7 @@ class SessionAuthMiddleware(AbstractAuthenticationMiddleware):
         if not session_id:
             return AuthenticationResult(user=None, auth=None)
 
-        session_service = SessionService()
-        user_id = session_service.get_user_id_from_session(session_id)
+        user_id = await session_service.get_user_id_from_session(session_id)
 
         if not user_id:
             return AuthenticationResult(user=None, auth=None)
@@ -95,8 +143,6 @@ class SessionAuthMiddleware(AbstractAuthenticationMiddleware):
             if not user:
                 return AuthenticationResult(user=None, auth=None)
 
-            session_service.refresh_session(session_id)
-
             return AuthenticationResult(user=user, auth=session_id)
 
     @staticmethod
@@ -0,0 +1,213 @@
+"""Per-process cache of authenticated user snapshots.
+
+Every authenticated request needs the current ``User``. Rather than querying
+``users`` on each request, the auth middleware keeps a bounded TTL + LRU map of
+column snapshots keyed by user ID. A fresh detached ``User`` is rebuilt from the
+snapshot on every hit, so handlers that mutate ``request.user`` never leak
+changes into the cache or into other requests.
+
+Entries are invalidated when a ``User`` or its ``Membership`` is flushed and
+committed through the ORM. The committing process drops its local entry and
+publishes the user ID on a Redis channel so every other web process does the
+same. The TTL bounds staleness for writes that bypass the ORM unit of work.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from pydotorg.config import settings
+from pydotorg.core.changes import ChangeCollector, listen_for_changes, run_in_background
+from pydotorg.core.redis import get_redis
+from pydotorg.domains.users.models import Membership, User
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_CHANNEL = "pydotorg:auth:user-invalidated"
+INVALIDATE_ALL = "*"
+
+_SESSION_INFO_KEY = "pydotorg_invalidated_user_ids"
+
+
+def _column_values(instance: Any) -> dict[str, Any] | None:
+    """Copy loaded column attributes, or None if any column is unloaded."""
+    state = inspect(instance)
+    values: dict[str, Any] = {}
+    for attr in state.mapper.column_attrs:
+        if attr.key not in state.dict:
+            return None
+        values[attr.key] = state.dict[attr.key]
+    return values
+
+
+def _empty_noload_relationships(model: type[Any]) -> dict[str, Any]:
+    """Relationships declared ``lazy="noload"`` are always loaded empty by queries."""
+    return {rel.key: [] if rel.uselist else None for rel in inspect(model).relationships if rel.lazy == "noload"}
+
+
+class UserCache:
+    """Bounded TTL + LRU cache of user snapshots.
+
+    Example:
+        >>> cache = UserCache(maxsize=1000, ttl=60)
+        >>> cache.set(user)
+        >>> cache.get(user.id)  # detached copy of ``user``
+    """
+
+    def __init__(self, maxsize: int = settings.auth_user_cache_size, ttl: float = settings.auth_user_cache_ttl) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of users kept; least recently used are evicted first.
+            ttl: Seconds a snapshot stays valid. ``0`` disables caching.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[UUID, tuple[float, dict[str, Any], dict[str, Any] | None]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.ttl > 0 and self.maxsize > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: UUID) -> User | None:
+        """Return a detached copy of the cached user, or None on miss/expiry."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, user_values, membership_values = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(user_id, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return _restore_user(user_values, membership_values)
+
+    def set(self, user: User) -> None:
+        """Store a snapshot of an active user loaded with its membership."""
+        if not self.enabled or not user.is_active:
+            return
+
+        user_values = _column_values(user)
+        state = inspect(user)
+        if user_values is None or "membership" not in state.dict:
+            return
+
+        membership = state.dict["membership"]
+        membership_values = _column_values(membership) if membership is not None else None
+        if membership is not None and membership_values is None:
+            return
+
+        self._entries[user.id] = (time.monotonic() + self.ttl, user_values, membership_values)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[UUID]) -> None:
+        """Drop the given users from this process's cache."""
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached user."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _restore_user(user_values: dict[str, Any], membership_values: dict[str, Any] | None) -> User:
+    """Rebuild a detached ``User`` (and membership) equivalent to a fresh query result."""
+    user = User(**user_values, **_empty_noload_relationships(User))
+    membership = None
+    if membership_values is not None:
+        membership = Membership(**membership_values)
+        membership.user = user
+    user.membership = membership
+
+    if membership is not None:
+        make_transient_to_detached(membership)
+    make_transient_to_detached(user)
+    return user
+
+
+user_cache = UserCache()
+
+
+async def publish_user_invalidation(user_ids: Iterable[UUID | str]) -> None:
+    """Tell every web process to drop the given users from its cache.
+
+    Args:
+        user_ids: User IDs to invalidate, or ``[INVALIDATE_ALL]`` to clear everything.
+    """
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.publish(USER_CACHE_CHANNEL, str(user_id))
+            await pipe.execute()
+    except (RedisError, OSError):
+        logger.warning("Failed to publish user cache invalidation", exc_info=True)
+
+
+def _handle_invalidation_message(cache: UserCache, value: str) -> None:
+    if value == INVALIDATE_ALL:
+        cache.clear()
+    else:
+        cache.invalidate([UUID(value)])
+
+
+async def listen_for_user_invalidations(cache: UserCache = user_cache) -> None:
+    """Apply invalidations published by other processes until cancelled.
+
+    The cache is cleared whenever the subscription is (re)established.
+    """
+    await listen_for_changes(
+        USER_CACHE_CHANNEL,
+        lambda value: _handle_invalidation_message(cache, value),
+        on_subscribe=cache.clear,
+    )
+
+
+def _collect_changed_users(session: Session, changed: set[UUID] | None) -> set[UUID] | None:
+    """Remember users whose row or membership changed in this transaction."""
+    changed = changed or set()
+    for instance in (*session.dirty, *session.deleted):
+        if isinstance(instance, User) and instance.id is not None:
+            changed.add(instance.id)
+        elif isinstance(instance, Membership) and instance.user_id is not None:
+            changed.add(instance.user_id)
+    for instance in session.new:
+        if isinstance(instance, Membership) and instance.user_id is not None:
+            changed.add(instance.user_id)
+    return changed or None
+
+
+def _invalidate_changed_users(changed: set[UUID]) -> None:
+    user_cache.invalidate(changed)
+    run_in_background(publish_user_invalidation, changed)
+
+
+changed_users = ChangeCollector(_SESSION_INFO_KEY, _collect_changed_users, _invalidate_changed_users)
@@ -0,0 +1,277 @@
+"""Versioned per-process snapshot of the active banners.
+
+The banner middlewares run on every HTML and API request, but banners change
+a few times a month. Each process keeps a snapshot of today's active banners,
+indexed by path prefix, and only goes back to the database when:
+
+* a banner is written through the ORM in any process, which bumps a version
+  counter in Redis (and invalidates the local snapshot immediately),
+* the date rolls over, so ``start_date``/``end_date`` windows are re-evaluated,
+* ``settings.banner_snapshot_ttl`` elapses, which bounds staleness for writes
+  that bypass the ORM or happen while Redis is unreachable.
+
+The Redis counter is read at most once per ``settings.banner_version_check_interval``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from redis.exceptions import RedisError
+
+from pydotorg.config import settings
+from pydotorg.core.changes import ChangeCollector, run_in_background
+from pydotorg.core.redis import get_redis
+from pydotorg.domains.banners.models import Banner, BannerTarget
+from pydotorg.domains.banners.repositories import BannerRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from uuid import UUID
+
+    from litestar import Litestar
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+BANNER_VERSION_KEY = "pydotorg:banners:version"
+
+_SESSION_INFO_KEY = "pydotorg_banners_changed"
+
+
+class _TrieNode:
+    __slots__ = ("children", "exact", "prefix")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.prefix: list[int] = []
+        self.exact: list[int] = []
+
+
+class BannerPathIndex:
+    """Banners indexed by their ``paths`` prefixes for fast per-request matching.
+
+    A banner with no paths matches every request. Otherwise it matches when the
+    request path starts with one of its comma-separated prefixes, or equals a
+    prefix without its trailing slash (``/downloads/`` matches ``/downloads``).
+
+    Example:
+        >>> index = BannerPathIndex(banners)
+        >>> index.match("/downloads/release/")
+        [<Banner ...>]
+    """
+
+    def __init__(self, banners: Iterable[Banner]) -> None:
+        """Compile the path rules of ``banners``, keeping their order for matches."""
+        self.banners: tuple[Banner, ...] = tuple(banners)
+        self.fingerprint = _fingerprint(self.banners)
+        self._everywhere: list[int] = []
+        self._root = _TrieNode()
+
+        for position, banner in enumerate(self.banners):
+            prefixes = {p.strip() for p in (banner.paths or "").split(",") if p.strip()}
+            if not prefixes:
+                self._everywhere.append(position)
+                continue
+            for prefix in prefixes:
+                self._insert(prefix).prefix.append(position)
+                self._insert(prefix.rstrip("/")).exact.append(position)
+
+        self._all = tuple(range(len(self.banners)))
+
+    def __len__(self) -> int:
+        return len(self.banners)
+
+    def _insert(self, key: str) -> _TrieNode:
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        return node
+
+    def bucket(self, path: str) -> tuple[int, ...]:
+        """Return the sorted positions of the banners that apply to ``path``.
+
+        Paths with the same bucket get the same banners, so anything derived
+        from the matched banners can be cached per ``(fingerprint, bucket)``.
+        """
+        if not self.banners:
+            return ()
+
+        positions = set(self._everywhere)
+        node: _TrieNode | None = self._root
+        for char in path:
+            node = node.children.get(char)
+            if node is None:
+                break
+            positions.update(node.prefix)
+        if node is not None:
+            positions.update(node.exact)
+
+        if len(positions) == len(self.banners):
+            return self._all
+        return tuple(sorted(positions))
+
+    def banners_for(self, bucket: tuple[int, ...]) -> list[Banner]:
+        """Return the banners in ``bucket``, in snapshot order."""
+        return [self.banners[position] for position in bucket]
+
+    def match(self, path: str) -> list[Banner]:
+        """Return the banners that apply to ``path``, in snapshot order."""
+        return self.banners_for(self.bucket(path))
+
+
+def _fingerprint(banners: Sequence[Banner]) -> str:
+    """Identify a banner set by content, so equal sets share derived caches across reloads."""
+    digest = hashlib.blake2b(digest_size=16)
+    for banner in banners:
+        for value in (banner.id, banner.updated_at, banner.banner_type, banner.title, banner.message, banner.link):
+            digest.update(f"{value}\x1f".encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class BannerSnapshot:
+    """Active banners for one day, split by where they are shown."""
+
+    frontend: BannerPathIndex
+    api: BannerPathIndex
+    version: int | None = None
+    loaded_on: date | None = None
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(
+        cls, banners: Sequence[Banner], *, version: int | None = None, loaded_on: date | None = None
+    ) -> BannerSnapshot:
+        """Split active banners into the frontend and API indexes."""
+        return cls(
+            frontend=BannerPathIndex(b for b in banners if b.is_sitewide or b.target == BannerTarget.FRONTEND.value),
+            api=BannerPathIndex(b for b in banners if b.is_sitewide or b.target == BannerTarget.API.value),
+            version=version,
+            loaded_on=loaded_on,
+        )
+
+
+class BannerSnapshotCache:
+    """Holds the current :class:`BannerSnapshot` and decides when to reload it."""
+
+    def __init__(
+        self,
+        ttl: float = settings.banner_snapshot_ttl,
+        version_check_interval: float = settings.banner_version_check_interval,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Maximum seconds a snapshot is served before it is reloaded regardless of version.
+            version_check_interval: Minimum seconds between reads of the Redis version counter.
+        """
+        self.ttl = ttl
+        self.version_check_interval = version_check_interval
+        self.loads = 0
+        self._snapshot: BannerSnapshot | None = None
+        self._next_check = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Force the next request to reload banners from the database."""
+        self._snapshot = None
+
+    def _is_fresh(self, snapshot: BannerSnapshot | None, now: float, today: date) -> bool:
+        return (
+            snapshot is not None
+            and now < self._next_check
+            and snapshot.loaded_on == today
+            and now - snapshot.loaded_at < self.ttl
+        )
+
+    async def get(self, app: Litestar) -> BannerSnapshot:
+        """Return the current snapshot, reloading it if the version, date or TTL says so."""
+        today = datetime.now(UTC).date()
+        if self._is_fresh(self._snapshot, time.monotonic(), today):
+            return self._snapshot  # type: ignore[return-value]
+
+        async with self._lock:
+            now = time.monotonic()
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot, now, today):
+                return snapshot  # type: ignore[return-value]
+
+            version = await _read_version()
+            self._next_check = now + self.version_check_interval
+            if (
+                snapshot is not None
+                and version is not None
+                and version == snapshot.version
+                and snapshot.loaded_on == today
+                and now - snapshot.loaded_at < self.ttl
+            ):
+                return snapshot
+
+            try:
+                snapshot = await _load_snapshot(app, version=version, today=today)
+            except Exception:
+                if snapshot is None:
+                    raise
+                logger.exception("Failed to reload banners; serving the previous snapshot")
+                return snapshot
+
+            self._snapshot = snapshot
+            self.loads += 1
+            return snapshot
+
+
+banner_snapshot = BannerSnapshotCache()
+
+
+async def _read_version() -> int | None:
+    try:
+        raw = await get_redis().get(BANNER_VERSION_KEY)
+    except (RedisError, OSError):
+        logger.warning("Could not read banner version; relying on snapshot TTL", exc_info=True)
+        return None
+    return int(raw) if raw else 0
+
+
+async def _load_snapshot(app: Litestar, *, version: int | None, today: date) -> BannerSnapshot:
+    plugin = app.plugins.get(SQLAlchemyPlugin)
+    if plugin is None:
+        return BannerSnapshot.build([], version=version, loaded_on=today)
+    config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
+    async with config.get_session() as db_session:
+        banners = await BannerRepository(session=db_session).get_active_banners(current_date=today)
+        db_session.expunge_all()
+    banners.sort(key=lambda b: (b.created_at, b.id))
+    return BannerSnapshot.build(banners, version=version, loaded_on=today)
+
+
+async def bump_banner_version() -> None:
+    """Tell every web process that banners changed."""
+    try:
+        await get_redis().incr(BANNER_VERSION_KEY)
+    except (RedisError, OSError):
+        logger.warning("Failed to bump banner version", exc_info=True)
+
+
+def _collect_banner_changes(session: Session, changed: set[UUID] | None) -> set[UUID] | None:
+    """Remember the IDs of banners written in this transaction."""
+    changed = changed or set()
+    changed.update(
+        instance.id for instance in (*session.new, *session.dirty, *session.deleted) if isinstance(instance, Banner)
+    )
+    return changed or None
+
+
+def _invalidate_banner_snapshot(_banner_ids: set[UUID]) -> None:
+    banner_snapshot.invalidate()
+    run_in_background(bump_banner_version)
+
+
+banner_changes = ChangeCollector(_SESSION_INFO_KEY, _collect_banner_changes, _invalidate_banner_snapshot)
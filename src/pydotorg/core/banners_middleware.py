@@ -1,35 +1,22 @@
-"""Middleware for injecting banners into request scope and API responses."""
+"""Middleware for injecting banners into request scope and API responses.
+
+Banners come from the per-process :data:`~pydotorg.core.banner_snapshot.banner_snapshot`,
+so matching a request against the active banners costs no database I/O.
+"""
 
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
 from litestar.middleware import MiddlewareProtocol
-from sqlalchemy import or_, select
 
-from pydotorg.domains.banners.models import Banner
+from pydotorg.core.banner_snapshot import banner_snapshot
 
 if TYPE_CHECKING:
-    from litestar import Litestar
     from litestar.types import ASGIApp, Message, Receive, Scope, Send
-    from sqlalchemy.ext.asyncio import AsyncSession
-
-
-def _matches_path(banner: Banner, request_path: str) -> bool:
-    """Check if banner should show for the given path.
 
-    If banner.paths is empty/None, banner shows on all routes.
-    Otherwise, paths is a comma-separated list of path prefixes to match.
-    """
-    if not banner.paths:
-        return True
-    path_prefixes = [p.strip() for p in banner.paths.split(",") if p.strip()]
-    if not path_prefixes:
-        return True
-    return any(request_path.startswith(prefix) or request_path == prefix.rstrip("/") for prefix in path_prefixes)
+    from pydotorg.domains.banners.models import Banner
 
 
 class SitewideBannerMiddleware(MiddlewareProtocol):
@@ -55,24 +42,9 @@ class SitewideBannerMiddleware(MiddlewareProtocol):
 
     @staticmethod
     async def _get_frontend_banners(scope: Scope, request_path: str) -> list[Banner]:
-        """Fetch active banners for frontend pages (sitewide OR target=frontend)."""
-        app: Litestar = scope["app"]
-        plugin = app.plugins.get(SQLAlchemyPlugin)
-        if plugin is None:
-            return []
-        config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
-        async with config.get_session() as db_session:
-            db_session: AsyncSession
-            current_date = datetime.now(UTC).date()
-            statement = select(Banner).where(
-                Banner.is_active.is_(True),
-                or_(Banner.is_sitewide.is_(True), Banner.target == "frontend"),
-                (Banner.start_date.is_(None)) | (Banner.start_date <= current_date),
-                (Banner.end_date.is_(None)) | (Banner.end_date >= current_date),
-            )
-            result = await db_session.execute(statement)
-            all_banners = list(result.scalars().all())
-            return [b for b in all_banners if _matches_path(b, request_path)]
+        """Return active banners for frontend pages (sitewide OR target=frontend)."""
+        snapshot = await banner_snapshot.get(scope["app"])
+        return snapshot.frontend.match(request_path)
 
 
 class APIBannerMiddleware(MiddlewareProtocol):
@@ -80,6 +52,9 @@ class APIBannerMiddleware(MiddlewareProtocol):
 
     API banners (target=api or sitewide) are added as X-API-Notice headers.
     Useful for deprecation warnings, maintenance notices, etc.
+
+    The serialized header is built once per (banner-set fingerprint, path
+    bucket) and appended to the response headers as a ready-made bytes tuple.
     """
 
     def __init__(self, app: ASGIApp) -> None:
@@ -95,39 +70,44 @@ class APIBannerMiddleware(MiddlewareProtocol):
             await self.app(scope, receive, send)
             return
 
-        banners = await self._get_api_banners(scope, path)
-        if not banners:
+        header = await self._get_notice_header(scope, path)
+        if header is None:
             await self.app(scope, receive, send)
             return
 
-        notices = [{"type": b.banner_type, "title": b.title, "message": b.message, "link": b.link} for b in banners]
-
         async def send_with_banner(message: Message) -> None:
             if message["type"] == "http.response.start":
-                headers = list(message.get("headers", []))
-                headers.append((b"X-API-Notice", json.dumps(notices).encode()))
-                message["headers"] = headers
+                headers = message.get("headers")
+                if isinstance(headers, list):
+                    headers.append(header)
+                else:
+                    message["headers"] = [*(headers or ()), header]
             await send(message)
 
         await self.app(scope, receive, send_with_banner)
 
     @staticmethod
-    async def _get_api_banners(scope: Scope, request_path: str) -> list[Banner]:
-        """Fetch active banners for API routes (sitewide OR target=api)."""
-        app: Litestar = scope["app"]
-        plugin = app.plugins.get(SQLAlchemyPlugin)
-        if plugin is None:
-            return []
-        config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
-        async with config.get_session() as db_session:
-            db_session: AsyncSession
-            current_date = datetime.now(UTC).date()
-            statement = select(Banner).where(
-                Banner.is_active.is_(True),
-                or_(Banner.is_sitewide.is_(True), Banner.target == "api"),
-                (Banner.start_date.is_(None)) | (Banner.start_date <= current_date),
-                (Banner.end_date.is_(None)) | (Banner.end_date >= current_date),
-            )
-            result = await db_session.execute(statement)
-            all_banners = list(result.scalars().all())
-            return [b for b in all_banners if _matches_path(b, request_path)]
+    async def _get_notice_header(scope: Scope, request_path: str) -> tuple[bytes, bytes] | None:
+        """Return the prebuilt ``X-API-Notice`` header for the request path, if any banner applies."""
+        index = (await banner_snapshot.get(scope["app"])).api
+        bucket = index.bucket(request_path)
+        if not bucket:
+            return None
+
+        key = (index.fingerprint, bucket)
+        header = _notice_headers.get(key)
+        if header is None:
+            if len(_notice_headers) >= NOTICE_HEADER_CACHE_SIZE:
+                _notice_headers.clear()
+            header = _notice_headers[key] = _build_notice_header(index.banners_for(bucket))
+        return header
+
+
+NOTICE_HEADER_CACHE_SIZE = 1024
+
+_notice_headers: dict[tuple[str, tuple[int, ...]], tuple[bytes, bytes]] = {}
+
+
+def _build_notice_header(banners: list[Banner]) -> tuple[bytes, bytes]:
+    notices = [{"type": b.banner_type, "title": b.title, "message": b.message, "link": b.link} for b in banners]
+    return (b"X-API-Notice", json.dumps(notices).encode())
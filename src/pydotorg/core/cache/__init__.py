@@ -5,16 +5,23 @@ from pydotorg.core.cache.config import (
     CACHE_TTL_PAGES,
     CACHE_TTL_STATIC,
     create_response_cache_config,
+    create_response_cache_store,
     page_cache_key_builder,
 )
+from pydotorg.core.cache.local import LocalResponseCache, listen_for_response_cache_invalidations, local_response_cache
 from pydotorg.core.cache.middleware import (
     GLOBAL_SURROGATE_KEY,
     AdminNoCacheMiddleware,
     CacheControlMiddleware,
+    HeaderPolicy,
+    HeaderPolicyMiddleware,
+    HeaderRule,
     SurrogateKeyMiddleware,
     create_cache_middleware_stack,
+    create_header_policy,
 )
 from pydotorg.core.cache.service import PageCacheService
+from pydotorg.core.cache.store import TaggedRedisStore, domain_tag, page_tag, path_tag
 
 __all__ = [
     "CACHE_TTL_DEFAULT",
@@ -23,9 +30,21 @@ __all__ = [
     "GLOBAL_SURROGATE_KEY",
     "AdminNoCacheMiddleware",
     "CacheControlMiddleware",
+    "HeaderPolicy",
+    "HeaderPolicyMiddleware",
+    "HeaderRule",
+    "LocalResponseCache",
     "PageCacheService",
     "SurrogateKeyMiddleware",
+    "TaggedRedisStore",
     "create_cache_middleware_stack",
+    "create_header_policy",
     "create_response_cache_config",
+    "create_response_cache_store",
+    "domain_tag",
+    "listen_for_response_cache_invalidations",
+    "local_response_cache",
     "page_cache_key_builder",
+    "page_tag",
+    "path_tag",
 ]
@@ -18,10 +18,22 @@ from __future__ import annotations
 import hashlib
 from typing import TYPE_CHECKING
 
-from litestar.config.response_cache import ResponseCacheConfig
+from litestar import Request
+from litestar.config.response_cache import ResponseCacheConfig, default_do_cache_predicate
+from redis.asyncio import Redis
+
+from pydotorg.config import settings
+from pydotorg.core.cache.local import local_response_cache
+from pydotorg.core.cache.store import (
+    QUERY_SEPARATOR,
+    RESPONSE_CACHE_NAMESPACE,
+    TAGGED_KEY_PREFIX,
+    TaggedRedisStore,
+)
+from pydotorg.core.changes import run_in_background
 
 if TYPE_CHECKING:
-    from litestar import Request
+    from litestar.types import HTTPScope
 
 CACHE_TTL_DEFAULT = 60
 CACHE_TTL_PAGES = 300
@@ -34,24 +46,48 @@ def page_cache_key_builder(request: Request) -> str:
 
     Creates a unique cache key for each page URL, ensuring that:
     - Different pages have different cache keys
-    - Query parameters are included in the key
-    - The key is a fixed-length hash for consistent storage
+    - Query parameters are included in the key as a fixed-length hash
+    - The path stays readable, so the store can tag the entry by path and section
 
     Args:
         request: The Litestar request object.
 
     Returns:
-        A hex digest of the cache key suitable for Redis.
+        A ``page:<path>?<query digest>`` key; the digest is empty without a query string.
 
     Example:
         >>> # For URL /about/history?section=timeline
         >>> key = page_cache_key_builder(request)
-        >>> key  # 'page:a1b2c3d4e5f6...'
+        >>> key  # 'page:/about/history?a1b2c3d4e5f6...'
     """
     path = request.url.path
-    query = str(sorted(request.query_params.items())) if request.query_params else ""
-    raw_key = f"{path}:{query}"
-    return f"page:{hashlib.md5(raw_key.encode(), usedforsecurity=False).hexdigest()}"
+    query = ""
+    if request.query_params:
+        raw_query = str(sorted(request.query_params.items()))
+        query = hashlib.md5(raw_query.encode(), usedforsecurity=False).hexdigest()
+    return f"{TAGGED_KEY_PREFIX}{path}{QUERY_SEPARATOR}{query}"
+
+
+def page_cache_response_filter(scope: HTTPScope, status_code: int) -> bool:
+    """Decide whether to cache a response, releasing the refresh lock if not.
+
+    The request that recomputes a page holds a single-flight lock until the
+    store receives the new value. Error and 404 responses are never stored, so
+    the lock is dropped here instead of making other requests wait it out.
+
+    Args:
+        scope: The ASGI scope of the request.
+        status_code: Status code of the response.
+
+    Returns:
+        Whether the response should be cached.
+    """
+    if default_do_cache_predicate(scope, status_code):
+        return True
+    store = scope["litestar_app"].stores.get(CACHE_STORE_NAME)
+    if isinstance(store, TaggedRedisStore):
+        run_in_background(store.release, page_cache_key_builder(Request(scope)))
+    return False
 
 
 def create_response_cache_config() -> ResponseCacheConfig:
@@ -60,19 +96,41 @@ def create_response_cache_config() -> ResponseCacheConfig:
     Configures caching with:
     - Default TTL of 60 seconds for general routes
     - Redis store backend (configured separately)
-    - Custom key builder for page routes
+    - Path-based key builder, so cached entries can be invalidated by tag
+    - Route TTLs act as soft TTLs: the store keeps serving an expired page for
+      ``settings.response_cache_stale_ttl`` more seconds while a single request
+      recomputes it, so a hot page expiring never stampedes the database
 
     Note:
-        The Redis store must be configured in the Litestar app's `stores` parameter:
+        The tag-indexed store must be configured in the Litestar app's `stores` parameter:
 
-        >>> from litestar.stores.redis import RedisStore
-        >>> redis_store = RedisStore.with_client(url=settings.redis_url)
-        >>> app = Litestar(stores={"response_cache": redis_store}, ...)
+        >>> app = Litestar(stores={"response_cache": create_response_cache_store()}, ...)
 
     Returns:
         ResponseCacheConfig: Configured response cache instance.
     """
     return ResponseCacheConfig(
         default_expiration=CACHE_TTL_DEFAULT,
+        key_builder=page_cache_key_builder,
         store=CACHE_STORE_NAME,
+        cache_response_filter=page_cache_response_filter,
+    )
+
+
+def create_response_cache_store() -> TaggedRedisStore:
+    """Create the two-tier store backing the response cache.
+
+    Fresh pages are served from this process's :data:`~pydotorg.core.cache.local.local_response_cache`
+    when possible and from Redis otherwise. Run
+    :func:`~pydotorg.core.cache.local.listen_for_response_cache_invalidations`
+    in the app lifespan so the local tier sees invalidations from other processes.
+
+    Returns:
+        TaggedRedisStore: Store to register as ``stores["response_cache"]``.
+    """
+    return TaggedRedisStore(
+        Redis.from_url(settings.redis_url, decode_responses=False),
+        namespace=RESPONSE_CACHE_NAMESPACE,
+        handle_client_shutdown=True,
+        local=local_response_cache if settings.response_cache_local_max_bytes else None,
     )
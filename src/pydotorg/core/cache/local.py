@@ -0,0 +1,187 @@
+"""Per-process L1 tier in front of the Redis response cache.
+
+Hot pages are read far more often than they change, so each web process keeps
+the freshest responses it has seen in memory, bounded by a byte budget with
+LRU eviction. An L1 hit costs no Redis round trip and no network I/O.
+
+An entry is only served until its soft TTL (see :mod:`pydotorg.core.cache.store`).
+After that the request falls through to Redis, which serves the stale copy and
+coordinates the refresh. Invalidations by tag are published on a Redis channel
+by the store, whether they come from :class:`~pydotorg.core.cache.service.PageCacheService`,
+the SAQ invalidation task or the admin. Every web process drops the matching
+L1 entries when the message arrives.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple
+
+from redis.exceptions import RedisError
+
+from pydotorg.config import settings
+from pydotorg.core.changes import listen_for_changes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_CHANNEL = "pydotorg:cache:response-invalidated"
+INVALIDATE_ALL = "*"
+
+
+class _LocalEntry(NamedTuple):
+    value: bytes
+    fresh_until: float
+    tags: tuple[str, ...]
+
+
+class LocalResponseCache:
+    """Byte-bounded LRU of fresh response cache entries, indexed by tag.
+
+    Example:
+        >>> cache = LocalResponseCache(max_bytes=32 * 1024 * 1024)
+        >>> cache.set("page:/?", body, fresh_until=time.time() + 60, tags=["path:/"])
+        >>> cache.get("page:/?")
+        b'...'
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = settings.response_cache_local_max_bytes,
+        max_entry_bytes: int = settings.response_cache_local_max_entry_bytes,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Total size of cached values; least recently used are evicted first. ``0`` disables the cache.
+            max_entry_bytes: Values larger than this are never kept locally.
+        """
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.size_bytes = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value of ``key`` if it is cached and still fresh."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.fresh_until <= time.time():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(
+        self, key: str, value: bytes, *, fresh_until: float, tags: Iterable[str], generation: int | None = None
+    ) -> None:
+        """Keep ``value`` until ``fresh_until`` (epoch seconds).
+
+        Args:
+            key: Response cache key.
+            value: Cached response.
+            fresh_until: When the entry stops being served from memory.
+            tags: Tags the entry is registered under.
+            generation: :attr:`generation` observed before ``value`` was read from Redis.
+                If an invalidation arrived since, the value may be outdated and is dropped.
+        """
+        if len(value) > self.max_entry_bytes or (generation is not None and generation != self.generation):
+            return
+        self._remove(key)
+        entry = _LocalEntry(value, fresh_until, tuple(tags))
+        self._entries[key] = entry
+        self.size_bytes += len(value)
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while self.size_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size_bytes -= len(entry.value)
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Drop the given keys from this process's cache."""
+        self.generation += 1
+        for key in keys:
+            self._remove(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Drop every entry registered under any of ``tags``."""
+        self.generation += 1
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self.generation += 1
+        self._entries.clear()
+        self._tags.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {"entries": len(self._entries), "bytes": self.size_bytes, "hits": self.hits, "misses": self.misses}
+
+
+local_response_cache = LocalResponseCache()
+
+
+async def publish_response_cache_invalidation(redis: Redis, tags: Iterable[str]) -> None:
+    """Tell every web process to drop the given tags from its L1 cache.
+
+    Args:
+        redis: Client to publish with.
+        tags: Tags to invalidate, or ``[INVALIDATE_ALL]`` to clear everything.
+    """
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.publish(RESPONSE_CACHE_CHANNEL, tag)
+            await pipe.execute()
+    except (RedisError, OSError):
+        logger.warning("Failed to publish response cache invalidation", exc_info=True)
+
+
+def _handle_invalidation_message(cache: LocalResponseCache, tag: str) -> None:
+    if tag == INVALIDATE_ALL:
+        cache.clear()
+    else:
+        cache.invalidate_tags([tag])
+
+
+async def listen_for_response_cache_invalidations(cache: LocalResponseCache = local_response_cache) -> None:
+    """Apply invalidations published by any process until cancelled.
+
+    The cache is cleared whenever the subscription is (re)established.
+    """
+    await listen_for_changes(
+        RESPONSE_CACHE_CHANNEL,
+        lambda tag: _handle_invalidation_message(cache, tag),
+        on_subscribe=cache.clear,
+    )
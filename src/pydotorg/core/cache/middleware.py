@@ -1,158 +1,298 @@
 """Cache control middleware for HTTP headers.
 
-Provides middleware for:
-- Admin no-caching (private Cache-Control)
+All response caching headers are applied by a single
+:class:`HeaderPolicyMiddleware`, driven by a :class:`HeaderPolicy` compiled once
+at startup:
+
+- Admin no-caching (``private, no-store`` always wins under ``/admin``)
 - Surrogate-Key headers for CDN purging (Fastly)
 - Cache-Control headers for various content types
+
+Each path resolves to a precomputed rule with a single prefix-trie walk. The
+response-start headers are then rewritten in one pass, instead of one
+dict/list round trip per concern. ``AdminNoCacheMiddleware``,
+``CacheControlMiddleware`` and ``SurrogateKeyMiddleware`` remain available as
+single-concern policies.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
 
 from litestar.enums import ScopeType
-from litestar.middleware import AbstractMiddleware
+from litestar.middleware import AbstractMiddleware, DefineMiddleware
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from litestar.types import ASGIApp, Message, Receive, Scope, Send
 
 GLOBAL_SURROGATE_KEY = "pydotorg-app"
 
+STATIC_PATHS = ("/static/", "/media/", "/assets/")
+API_PATHS = ("/api/",)
+NO_CACHE_PATHS = ("/admin/", "/auth/")
+ADMIN_PREFIX = "/admin"
 
-class AdminNoCacheMiddleware(AbstractMiddleware):
-    """Middleware to prevent admin paths from being cached by CDN or browsers.
+STATIC_MAX_AGE = 31536000
+PAGE_MAX_AGE = 300
 
-    Admin pages should never be cached to ensure users always see fresh content
-    and prevent sensitive data from being stored in shared caches.
+NO_STORE_PRIVATE = "private, no-store"
+
+_CACHE_CONTROL = b"cache-control"
+_SURROGATE_KEY = b"surrogate-key"
+
+Headers = list[tuple[bytes, bytes]]
+
+
+@dataclass(frozen=True, slots=True)
+class HeaderRule:
+    """Caching headers for responses under a path prefix.
+
+    Attributes:
+        cache_control: Cache-Control value to add, or None to leave it alone.
+        force: Replace a Cache-Control set by the handler instead of deferring to it.
     """
 
-    scopes = {ScopeType.HTTP}
+    cache_control: str | None = None
+    force: bool = False
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        """Process the request and add Cache-Control: private for admin paths."""
-        path = scope.get("path", "")
 
-        async def send_wrapper(message: Message) -> None:
-            if message["type"] == "http.response.start" and path.startswith("/admin"):
-                headers = list(message.get("headers", []))
-                headers.append((b"cache-control", b"private, no-store"))
-                message["headers"] = headers
-            await send(message)
+class _CompiledRule:
+    """A :class:`HeaderRule` with the surrogate key folded in and values pre-encoded."""
 
-        await self.app(scope, receive, send_wrapper)
+    __slots__ = ("cache_control", "force", "is_noop", "surrogate_key")
 
+    def __init__(self, rule: HeaderRule | None, surrogate_key: bytes | None) -> None:
+        self.cache_control = rule.cache_control.encode() if rule and rule.cache_control else None
+        self.force = bool(rule and rule.force and self.cache_control)
+        self.surrogate_key = surrogate_key
+        self.is_noop = self.cache_control is None and surrogate_key is None
 
-class SurrogateKeyMiddleware(AbstractMiddleware):
-    """Middleware to add Surrogate-Key headers for CDN cache purging.
+    def apply(self, headers: Headers) -> Headers:
+        """Add this rule's headers to a response-start header list.
 
-    Fastly and similar CDNs use Surrogate-Key headers to enable targeted
-    cache invalidation. This middleware adds a global key to all responses
-    and preserves any route-specific keys.
+        The list is extended in place unless existing headers have to be removed.
+        """
+        has_cache_control = False
+        existing_surrogate: bytes | None = None
+        strip_cache_control = strip_surrogate = False
+        for name, value in headers:
+            lower = name.lower()
+            if lower == _CACHE_CONTROL:
+                has_cache_control = True
+                strip_cache_control = self.force
+            elif lower == _SURROGATE_KEY and self.surrogate_key is not None:
+                existing_surrogate = value
+                strip_surrogate = True
+
+        if strip_cache_control or strip_surrogate:
+            headers = [
+                (name, value)
+                for name, value in headers
+                if not (
+                    (strip_cache_control and name.lower() == _CACHE_CONTROL)
+                    or (strip_surrogate and name.lower() == _SURROGATE_KEY)
+                )
+            ]
+
+        if self.surrogate_key is not None:
+            key = self.surrogate_key + b" " + existing_surrogate if existing_surrogate else self.surrogate_key
+            headers.append((_SURROGATE_KEY, key))
+        if self.cache_control is not None and (self.force or not has_cache_control):
+            headers.append((_CACHE_CONTROL, self.cache_control))
+        return headers
+
+
+class _TrieNode:
+    __slots__ = ("children", "rule")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.rule: _CompiledRule | None = None
+
+
+class HeaderPolicy:
+    """Compiled table of path prefixes to caching headers; the longest prefix wins.
 
     Example:
-        A response with Surrogate-Key: page-123 will be sent as:
-        Surrogate-Key: pydotorg-app page-123
+        >>> policy = HeaderPolicy({"/api/": HeaderRule("no-store")}, surrogate_key="site")
+        >>> policy.resolve("/api/v1/users").apply([])
+        [(b'surrogate-key', b'site'), (b'cache-control', b'no-store')]
+    """
 
-        This allows purging all cached content with the global key,
-        or specific content with route-specific keys.
+    def __init__(
+        self,
+        rules: Mapping[str, HeaderRule],
+        *,
+        default: HeaderRule | None = None,
+        surrogate_key: str | None = None,
+    ) -> None:
+        """Compile the rule table.
+
+        Args:
+            rules: Path prefix to rule.
+            default: Rule for paths that match no prefix.
+            surrogate_key: Global Surrogate-Key prepended to every response, or None to disable.
+        """
+        encoded_key = surrogate_key.encode() if surrogate_key else None
+        self._root = _TrieNode()
+        self._root.rule = _CompiledRule(default, encoded_key)
+        for prefix, rule in rules.items():
+            node = self._root
+            for char in prefix:
+                node = node.children.setdefault(char, _TrieNode())
+            node.rule = _CompiledRule(rule, encoded_key)
+
+    def resolve(self, path: str) -> _CompiledRule:
+        """Return the compiled rule for the longest matching prefix of ``path``."""
+        node = self._root
+        rule = node.rule
+        for char in path:
+            node = node.children.get(char)  # type: ignore[assignment]
+            if node is None:
+                break
+            if node.rule is not None:
+                rule = node.rule
+        return rule  # type: ignore[return-value]
+
+
+def create_header_policy(*, surrogate_key: str | None = GLOBAL_SURROGATE_KEY) -> HeaderPolicy:
+    """Build the site-wide caching header policy.
+
+    Args:
+        surrogate_key: Global surrogate key, or None when no CDN purging is configured.
+
+    Returns:
+        The compiled policy used by :class:`HeaderPolicyMiddleware`.
+    """
+    rules: dict[str, HeaderRule] = {}
+    rules.update(dict.fromkeys(API_PATHS, HeaderRule("no-store")))
+    rules.update(dict.fromkeys(STATIC_PATHS, HeaderRule(f"public, max-age={STATIC_MAX_AGE}, immutable")))
+    rules.update(dict.fromkeys(NO_CACHE_PATHS, HeaderRule(NO_STORE_PRIVATE)))
+    rules[ADMIN_PREFIX] = HeaderRule(NO_STORE_PRIVATE, force=True)
+    rules[f"{ADMIN_PREFIX}/"] = rules[ADMIN_PREFIX]
+    return HeaderPolicy(rules, default=HeaderRule(f"public, max-age={PAGE_MAX_AGE}"), surrogate_key=surrogate_key)
+
+
+class HeaderPolicyMiddleware(AbstractMiddleware):
+    """Apply a compiled :class:`HeaderPolicy` to every HTTP response.
+
+    Handler-set Cache-Control values are kept, except under ``/admin`` where
+    ``private, no-store`` replaces them. When a surrogate key is configured, it
+    is prepended to any route-specific Surrogate-Key
+    (``Surrogate-Key: pydotorg-app page-123``).
     """
 
     scopes = {ScopeType.HTTP}
 
-    def __init__(self, app: ASGIApp, surrogate_key: str = GLOBAL_SURROGATE_KEY) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        policy: HeaderPolicy | None = None,
+        *,
+        surrogate_key: str | None = GLOBAL_SURROGATE_KEY,
+    ) -> None:
         """Initialize the middleware.
 
         Args:
             app: The ASGI application.
-            surrogate_key: Global surrogate key for all responses.
+            policy: Compiled header policy. Defaults to :func:`create_header_policy`.
+            surrogate_key: Global surrogate key used when building the default policy.
         """
         super().__init__(app)
-        self.surrogate_key = surrogate_key
+        self.policy = policy or self.create_policy(surrogate_key=surrogate_key)
+
+    def create_policy(self, *, surrogate_key: str | None) -> HeaderPolicy:
+        """Build the policy used when none is passed in."""
+        return create_header_policy(surrogate_key=surrogate_key)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        """Process the request and add Surrogate-Key header."""
+        """Process the request and rewrite the response-start headers once."""
+        rule = self.policy.resolve(scope.get("path", ""))
+        if rule.is_noop:
+            await self.app(scope, receive, send)
+            return
 
         async def send_wrapper(message: Message) -> None:
             if message["type"] == "http.response.start":
-                headers = dict(message.get("headers", []))
-                existing_key = headers.get(b"surrogate-key", b"").decode()
-
-                keys = [self.surrogate_key]
-                if existing_key:
-                    keys.append(existing_key)
-
-                new_headers = [(k, v) for k, v in message.get("headers", []) if k.lower() != b"surrogate-key"]
-                new_headers.append((b"surrogate-key", " ".join(keys).encode()))
-                message["headers"] = new_headers
-
+                headers = message.get("headers")
+                message["headers"] = rule.apply(headers if isinstance(headers, list) else list(headers or ()))
             await send(message)
 
         await self.app(scope, receive, send_wrapper)
 
 
-class CacheControlMiddleware(AbstractMiddleware):
-    """Middleware to add Cache-Control headers based on path patterns.
+class AdminNoCacheMiddleware(HeaderPolicyMiddleware):
+    """Middleware to prevent admin paths from being cached by CDN or browsers.
 
-    Applies appropriate caching directives for different content types:
-    - Static files: public, max-age=31536000 (1 year)
-    - API responses: no-store (unless route specifies otherwise)
-    - Pages: public, max-age=300 (5 minutes, overridable by route cache)
+    Admin pages should never be cached to ensure users always see fresh content
+    and prevent sensitive data from being stored in shared caches.
     """
 
-    scopes = {ScopeType.HTTP}
+    def create_policy(self, *, surrogate_key: str | None) -> HeaderPolicy:
+        return HeaderPolicy({ADMIN_PREFIX: HeaderRule(NO_STORE_PRIVATE, force=True)})
 
-    STATIC_PATHS = ("/static/", "/media/", "/assets/")
-    API_PATHS = ("/api/",)
-    NO_CACHE_PATHS = ("/admin/", "/auth/")
 
-    STATIC_MAX_AGE = 31536000
-    PAGE_MAX_AGE = 300
+class SurrogateKeyMiddleware(HeaderPolicyMiddleware):
+    """Middleware to add Surrogate-Key headers for CDN cache purging.
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        """Process the request and add appropriate Cache-Control header."""
-        path = scope.get("path", "")
+    Fastly and similar CDNs use Surrogate-Key headers to enable targeted
+    cache invalidation. This middleware adds a global key to all responses
+    and preserves any route-specific keys.
 
-        async def send_wrapper(message: Message) -> None:
-            if message["type"] == "http.response.start":
-                headers = dict(message.get("headers", []))
+    Example:
+        A response with Surrogate-Key: page-123 will be sent as:
+        Surrogate-Key: pydotorg-app page-123
+
+        This allows purging all cached content with the global key,
+        or specific content with route-specific keys.
+    """
 
-                if b"cache-control" not in headers:
-                    cache_control = self._get_cache_control(path)
-                    if cache_control:
-                        new_headers = list(message.get("headers", []))
-                        new_headers.append((b"cache-control", cache_control.encode()))
-                        message["headers"] = new_headers
+    def __init__(self, app: ASGIApp, surrogate_key: str = GLOBAL_SURROGATE_KEY) -> None:
+        """Initialize the middleware.
 
-            await send(message)
+        Args:
+            app: The ASGI application.
+            surrogate_key: Global surrogate key for all responses.
+        """
+        self.surrogate_key = surrogate_key
+        super().__init__(app, surrogate_key=surrogate_key)
 
-        await self.app(scope, receive, send_wrapper)
+    def create_policy(self, *, surrogate_key: str | None) -> HeaderPolicy:
+        return HeaderPolicy({}, surrogate_key=surrogate_key)
 
-    def _get_cache_control(self, path: str) -> str | None:
-        """Determine Cache-Control value based on path.
 
-        Args:
-            path: The request path.
+class CacheControlMiddleware(HeaderPolicyMiddleware):
+    """Middleware to add Cache-Control headers based on path patterns.
 
-        Returns:
-            Cache-Control header value or None if not applicable.
-        """
-        if any(path.startswith(p) for p in self.NO_CACHE_PATHS):
-            return "private, no-store"
+    Applies appropriate caching directives for different content types:
+    - Static files: public, max-age=31536000 (1 year)
+    - API responses: no-store (unless route specifies otherwise)
+    - Pages: public, max-age=300 (5 minutes, overridable by route cache)
+    """
 
-        if any(path.startswith(p) for p in self.STATIC_PATHS):
-            return f"public, max-age={self.STATIC_MAX_AGE}, immutable"
+    STATIC_PATHS: ClassVar[tuple[str, ...]] = STATIC_PATHS
+    API_PATHS: ClassVar[tuple[str, ...]] = API_PATHS
+    NO_CACHE_PATHS: ClassVar[tuple[str, ...]] = NO_CACHE_PATHS
 
-        if any(path.startswith(p) for p in self.API_PATHS):
-            return "no-store"
+    STATIC_MAX_AGE = STATIC_MAX_AGE
+    PAGE_MAX_AGE = PAGE_MAX_AGE
 
-        return f"public, max-age={self.PAGE_MAX_AGE}"
+    def create_policy(self, *, surrogate_key: str | None) -> HeaderPolicy:
+        rules: dict[str, HeaderRule] = {}
+        rules.update(dict.fromkeys(self.API_PATHS, HeaderRule("no-store")))
+        rules.update(dict.fromkeys(self.STATIC_PATHS, HeaderRule(f"public, max-age={self.STATIC_MAX_AGE}, immutable")))
+        rules.update(dict.fromkeys(self.NO_CACHE_PATHS, HeaderRule(NO_STORE_PRIVATE)))
+        return HeaderPolicy(rules, default=HeaderRule(f"public, max-age={self.PAGE_MAX_AGE}"))
 
 
 def create_cache_middleware_stack(
     *,
     enable_surrogate_keys: bool = True,
     surrogate_key: str = GLOBAL_SURROGATE_KEY,
-) -> list[type[AbstractMiddleware]]:
+) -> list[DefineMiddleware]:
     """Create the cache middleware stack for the application.
 
     Args:
@@ -160,14 +300,8 @@ def create_cache_middleware_stack(
         surrogate_key: Global surrogate key value.
 
     Returns:
-        List of middleware classes to add to the application.
+        List of middleware to add to the application.
     """
-    middleware: list[type[AbstractMiddleware]] = [
-        AdminNoCacheMiddleware,
-        CacheControlMiddleware,
+    return [
+        DefineMiddleware(HeaderPolicyMiddleware, surrogate_key=surrogate_key if enable_surrogate_keys else None),
     ]
-
-    if enable_surrogate_keys:
-        middleware.append(SurrogateKeyMiddleware)
-
-    return middleware
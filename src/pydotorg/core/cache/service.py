@@ -3,14 +3,27 @@
 This module provides a service for programmatic cache invalidation,
 used when pages are updated, published, or unpublished to ensure
 users see fresh content.
+
+Cached responses are indexed by tag in the response cache store (see
+:mod:`pydotorg.core.cache.store`), so invalidation deletes exactly the
+tagged entries, including query-string variants, without scanning Redis.
 """
 
 from __future__ import annotations
 
-import hashlib
 import logging
 from typing import TYPE_CHECKING
 
+from pydotorg.core.cache.store import (
+    QUERY_SEPARATOR,
+    RESPONSE_CACHE_NAMESPACE,
+    TAGGED_KEY_PREFIX,
+    TaggedRedisStore,
+    normalize_path,
+    page_tag,
+    path_tag,
+)
+
 if TYPE_CHECKING:
     from uuid import UUID
 
@@ -33,16 +46,18 @@ class PageCacheService:
         >>> await cache_service.invalidate_all_pages()
     """
 
-    def __init__(self, redis: Redis) -> None:
+    def __init__(self, redis: Redis, store: TaggedRedisStore | None = None) -> None:
         """Initialize the page cache service.
 
         Args:
             redis: Async Redis client instance.
+            store: Response cache store. Defaults to one over ``redis`` in the response cache namespace.
         """
         self.redis = redis
+        self.store = store or TaggedRedisStore(redis, namespace=RESPONSE_CACHE_NAMESPACE)
 
     def _make_cache_key(self, path: str) -> str:
-        """Create a cache key for a page path.
+        """Create the response cache key for the query-less variant of a page path.
 
         Args:
             path: The URL path of the page.
@@ -50,56 +65,65 @@ class PageCacheService:
         Returns:
             The cache key for the page.
         """
-        normalized_path = f"/{path.strip('/')}" if path else "/"
-        raw_key = f"{normalized_path}:"
-        return f"page:{hashlib.md5(raw_key.encode(), usedforsecurity=False).hexdigest()}"
+        return f"{TAGGED_KEY_PREFIX}{normalize_path(path)}{QUERY_SEPARATOR}"
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Invalidate every cached response registered under any of ``tags``.
+
+        Args:
+            *tags: Tags built with the helpers in :mod:`pydotorg.core.cache.store`.
+
+        Returns:
+            Number of cache entries deleted, or 0 if Redis failed.
+        """
+        try:
+            deleted = await self.store.invalidate_tags(*tags)
+        except Exception:
+            logger.exception(f"Failed to invalidate page cache tags: {', '.join(tags)}")
+            return 0
+        if deleted:
+            logger.info(f"Invalidated {deleted} page cache entries for {', '.join(tags)}")
+        return deleted
 
     async def invalidate_page(self, path: str) -> bool:
         """Invalidate the cache for a specific page path.
 
+        Every cached variant of the path is removed, including query strings
+        and a trailing slash.
+
         Args:
             path: The URL path of the page to invalidate.
 
         Returns:
-            True if the cache entry was deleted, False if it didn't exist.
+            True if any cache entry was deleted, False otherwise.
 
         Example:
             >>> await cache_service.invalidate_page("/about/history")
             True
         """
-        cache_key = self._make_cache_key(path)
-        try:
-            result = await self.redis.delete(cache_key)
-            if result:
-                logger.info(f"Invalidated page cache: {path} (key: {cache_key})")
-            return bool(result)
-        except Exception:
-            logger.exception(f"Failed to invalidate page cache: {path}")
-            return False
+        return bool(await self.invalidate_tags(path_tag(path)))
 
     async def invalidate_page_by_id(self, page_id: UUID, path: str | None = None) -> bool:
         """Invalidate the cache for a page by ID.
 
-        If path is provided, uses it directly. Otherwise, this method
-        cannot determine the path and returns False.
+        Removes every response tagged with the page's surrogate key, plus every
+        variant of ``path`` when it is given (for example the page's old path
+        after a move).
 
         Args:
             page_id: The UUID of the page.
-            path: Optional path of the page (for efficiency).
+            path: Optional path of the page.
 
         Returns:
-            True if cache was invalidated, False otherwise.
+            True if any cache entry was deleted, False otherwise.
         """
+        tags = [page_tag(page_id)]
         if path:
-            return await self.invalidate_page(path)
-
-        logger.warning(f"Cannot invalidate page {page_id} without path")
-        return False
+            tags.append(path_tag(path))
+        return bool(await self.invalidate_tags(*tags))
 
     async def invalidate_all_pages(self) -> int:
-        """Invalidate all cached pages using SCAN + DEL pattern.
-
-        Uses SCAN to avoid blocking Redis with large KEYS operations.
+        """Invalidate all cached pages using the entry index.
 
         Returns:
             Number of cache entries deleted.
@@ -108,43 +132,24 @@ class PageCacheService:
             >>> deleted = await cache_service.invalidate_all_pages()
             >>> print(f"Cleared {deleted} cached pages")
         """
-        pattern = "page:*"
-        deleted_count = 0
-        cursor = 0
-
         try:
-            while True:
-                cursor, keys = await self.redis.scan(cursor, match=pattern, count=100)
-                if keys:
-                    deleted_count += await self.redis.delete(*keys)
-                if cursor == 0:
-                    break
+            deleted_count = await self.store.invalidate_all()
         except Exception:
             logger.exception("Failed to invalidate all page caches")
             return 0
-        else:
-            if deleted_count > 0:
-                logger.info(f"Invalidated {deleted_count} page cache entries")
-            return deleted_count
+        if deleted_count > 0:
+            logger.info(f"Invalidated {deleted_count} page cache entries")
+        return deleted_count
 
     async def get_cache_stats(self) -> dict[str, int]:
         """Get statistics about cached pages.
 
         Returns:
-            Dictionary with cache statistics including count and memory usage.
+            Dictionary with the number of live cached pages.
         """
-        pattern = "page:*"
-        count = 0
-        cursor = 0
-
         try:
-            while True:
-                cursor, keys = await self.redis.scan(cursor, match=pattern, count=100)
-                count += len(keys)
-                if cursor == 0:
-                    break
+            count = await self.store.size()
         except Exception:
             logger.exception("Failed to get page cache stats")
             return {"cached_pages": 0, "error": 1}
-        else:
-            return {"cached_pages": count}
+        return {"cached_pages": count}
@@ -0,0 +1,373 @@
+"""Tag-indexed Redis store for the response cache.
+
+Every cached page response is registered in Redis sets keyed by surrogate
+tags, so invalidation never has to walk the keyspace:
+
+- ``path:/about/history``: every variant of a path, including query strings
+  and a trailing slash
+- ``domain:/downloads``: everything under a top-level section of the site
+- ``page-<uuid>``: any token the handler put in its ``Surrogate-Key`` header,
+  using the same names the CDN purges by
+
+A sorted set of entry keys scored by expiry time doubles as the cache-size
+counter and the list used to clear the whole cache.
+
+Tagged entries also have two lifetimes. The route's ``cache=`` expiry is the
+soft TTL. After it passes, the entry is served stale for another
+``settings.response_cache_stale_ttl`` seconds (the hard TTL) while exactly one
+request, across all processes, recomputes it. Single flight is a short Redis
+lock taken in the same round trip as the read. On a cold miss the other
+requests poll for the leader's result instead of all hitting the database.
+
+Example:
+    >>> store = TaggedRedisStore.with_client(url=settings.redis_url, namespace="cache")
+    >>> await store.invalidate_tags(path_tag("/about"), page_tag(page.id))
+    3
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from litestar.stores.redis import RedisStore
+from msgspec import DecodeError
+from msgspec.msgpack import decode as decode_msgpack
+from redis.exceptions import RedisError
+
+from pydotorg.config import settings
+from pydotorg.core.cache.local import INVALIDATE_ALL, publish_response_cache_invalidation
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+    from uuid import UUID
+
+    from litestar.types.empty import EmptyType
+    from redis.asyncio import Redis
+
+    from pydotorg.core.cache.local import LocalResponseCache
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_NAMESPACE = "cache"
+TAGGED_KEY_PREFIX = "page:"
+QUERY_SEPARATOR = "?"
+ENTRIES_KEY = "index:entries"
+TAG_KEY_PREFIX = "tag:"
+LOCK_KEY_PREFIX = "lock:"
+INVALIDATE_ALL_BATCH_SIZE = 500
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+FRESH_UNTIL_WIDTH = 16
+FRESH_FOREVER = b"9" * FRESH_UNTIL_WIDTH
+
+HIT_FRESH = 1
+HIT_STALE = 2
+LEAD_REFRESH = 3
+LEAD_MISS = 4
+WAIT_MISS = 5
+
+_SURROGATE_KEY = b"surrogate-key"
+
+SET_TAGGED_SCRIPT = b"""
+local ttl = tonumber(ARGV[2])
+if ttl > 0 then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ttl)
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+redis.call('DEL', KEYS[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', ARGV[4])
+redis.call('ZADD', KEYS[2], ARGV[3], KEYS[1])
+for i = 4, #KEYS do
+    local existed = redis.call('EXISTS', KEYS[i]) == 1
+    local current = redis.call('TTL', KEYS[i])
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if ttl <= 0 then
+        redis.call('PERSIST', KEYS[i])
+    elseif not existed or (current >= 0 and current < ttl) then
+        redis.call('EXPIRE', KEYS[i], ttl)
+    end
+end
+"""
+
+GET_OR_LEAD_SCRIPT = b"""
+local value = redis.call('GET', KEYS[1])
+local prefix = value and string.match(value, '^' .. string.rep('%%d', %d))
+if not prefix then
+    value = false
+elseif tonumber(prefix) > tonumber(ARGV[1]) then
+    return {%d, value}
+end
+local leader = redis.call('SET', KEYS[2], '1', 'NX', 'PX', ARGV[2])
+if value then
+    if leader then
+        return {%d}
+    end
+    return {%d, value}
+end
+if leader then
+    return {%d}
+end
+return {%d}
+""" % (FRESH_UNTIL_WIDTH, HIT_FRESH, LEAD_REFRESH, HIT_STALE, LEAD_MISS, WAIT_MISS)
+
+INVALIDATE_TAGS_SCRIPT = b"""
+local deleted = 0
+for i = 2, #KEYS do
+    for _, key in ipairs(redis.call('SMEMBERS', KEYS[i])) do
+        deleted = deleted + redis.call('UNLINK', key)
+        redis.call('ZREM', KEYS[1], key)
+    end
+    redis.call('DEL', KEYS[i])
+end
+return deleted
+"""
+
+
+def normalize_path(path: str) -> str:
+    """Normalize a URL path so ``/about``, ``/about/`` and ``about`` share tags."""
+    return f"/{path.strip('/')}" if path else "/"
+
+
+def path_tag(path: str) -> str:
+    """Tag for every cached variant of ``path``."""
+    return f"path:{normalize_path(path)}"
+
+
+def domain_tag(path: str) -> str:
+    """Tag for every cached page under the top-level section of ``path``."""
+    return f"domain:/{normalize_path(path)[1:].partition('/')[0]}"
+
+
+def page_tag(page_id: UUID | str) -> str:
+    """Tag (and Surrogate-Key token) for every cached response that renders a page."""
+    return f"page-{page_id}"
+
+
+def tags_for_key(key: str) -> list[str]:
+    """Return the path and domain tags encoded in a response cache key."""
+    path = key.removeprefix(TAGGED_KEY_PREFIX).rpartition(QUERY_SEPARATOR)[0]
+    return [path_tag(path), domain_tag(path)]
+
+
+def _split_entry(entry: bytes) -> tuple[int, bytes] | None:
+    """Split a tagged entry into its fresh-until time (ms) and value, or None without a valid prefix."""
+    prefix = entry[:FRESH_UNTIL_WIDTH]
+    if len(prefix) < FRESH_UNTIL_WIDTH or not prefix.isdigit():
+        return None
+    return int(prefix), entry[FRESH_UNTIL_WIDTH:]
+
+
+def surrogate_tags(value: bytes) -> list[str]:
+    """Return the ``Surrogate-Key`` tokens of a cached, msgpack-encoded response."""
+    try:
+        messages = decode_msgpack(value)
+        headers = messages[0].get("headers") or ()
+    except (DecodeError, IndexError, AttributeError, TypeError):
+        return []
+    return [
+        token.decode()
+        for name, header_value in headers
+        if name.lower() == _SURROGATE_KEY
+        for token in header_value.split()
+    ]
+
+
+class TaggedRedisStore(RedisStore):
+    """Redis store that indexes response cache entries by surrogate tag.
+
+    Keys built by :func:`~pydotorg.core.cache.config.page_cache_key_builder`
+    (``page:<path>?<query digest>``) are tagged on write and served with
+    stale-while-revalidate semantics; any other key is stored exactly like
+    :class:`~litestar.stores.redis.RedisStore` would.
+
+    With a ``local`` cache, fresh tagged entries are also kept in process
+    memory and served from there without touching Redis. Tag invalidations are
+    published so every process drops its local copies.
+    """
+
+    __slots__ = (
+        "_get_or_lead_script",
+        "_invalidate_tags_script",
+        "_set_tagged_script",
+        "local",
+        "lock_timeout",
+        "stale_ttl",
+    )
+
+    def __init__(
+        self,
+        redis: Redis,
+        namespace: str | None | EmptyType = RESPONSE_CACHE_NAMESPACE,
+        handle_client_shutdown: bool = False,  # noqa: FBT001, FBT002
+        *,
+        stale_ttl: int = settings.response_cache_stale_ttl,
+        lock_timeout: float = settings.response_cache_lock_timeout,
+        local: LocalResponseCache | None = None,
+    ) -> None:
+        """Initialize the store and register its Lua scripts.
+
+        Args:
+            redis: An async Redis client.
+            namespace: Key prefix for every entry.
+            handle_client_shutdown: Close ``redis`` when the app shuts down.
+            stale_ttl: Seconds a tagged entry is served stale after its soft TTL.
+            lock_timeout: Seconds one request may spend recomputing an entry before another may take over.
+            local: Per-process L1 cache consulted before Redis, or None to always read from Redis.
+        """
+        super().__init__(redis, namespace=namespace, handle_client_shutdown=handle_client_shutdown)
+        self.stale_ttl = stale_ttl
+        self.lock_timeout = lock_timeout
+        self.local = local
+        self._set_tagged_script = self._redis.register_script(SET_TAGGED_SCRIPT)
+        self._get_or_lead_script = self._redis.register_script(GET_OR_LEAD_SCRIPT)
+        self._invalidate_tags_script = self._redis.register_script(INVALIDATE_TAGS_SCRIPT)
+
+    def _tag_key(self, tag: str) -> str:
+        return self._make_key(f"{TAG_KEY_PREFIX}{tag}")
+
+    def _lock_key(self, key: str) -> str:
+        return self._make_key(f"{LOCK_KEY_PREFIX}{key}")
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        """Get a value, coalescing concurrent recomputes of tagged entries.
+
+        Returns the cached value while it is fresh, and while it is stale unless
+        this caller won the refresh lock. The lock winner gets ``None`` and
+        recomputes; :meth:`set` releases the lock. On a cold miss, callers that
+        lose the lock poll for the winner's value for up to ``lock_timeout``
+        seconds before recomputing themselves.
+        """
+        if not key.startswith(TAGGED_KEY_PREFIX):
+            return await super().get(key, renew_for)
+
+        local = self.local
+        if local is not None and (value := local.get(key)) is not None:
+            return value
+        generation = local.generation if local is not None else 0
+
+        keys = [self._make_key(key), self._lock_key(key)]
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            status, *entry = await self._get_or_lead_script(
+                keys=keys, args=[int(time.time() * 1000), int(self.lock_timeout * 1000)]
+            )
+            if status in (HIT_FRESH, HIT_STALE):
+                split = _split_entry(entry[0])
+                if split is None:
+                    return None
+                fresh_until, value = split
+                if status == HIT_FRESH and local is not None:
+                    local.set(
+                        key,
+                        value,
+                        fresh_until=fresh_until / 1000,
+                        tags=[*tags_for_key(key), *surrogate_tags(value)],
+                        generation=generation,
+                    )
+                return value
+            if status != WAIT_MISS or time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        """Set a value, registering tagged keys in their tag sets and the entry index.
+
+        For tagged keys, ``expires_in`` is the soft TTL; the entry is kept for
+        ``stale_ttl`` seconds longer so it can be served while it is refreshed.
+        """
+        if not key.startswith(TAGGED_KEY_PREFIX):
+            await super().set(key, value, expires_in)
+            return
+
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        soft_ttl = int(expires_in if isinstance(expires_in, int) else expires_in.total_seconds()) if expires_in else 0
+        ttl = soft_ttl + self.stale_ttl if soft_ttl else 0
+        now = time.time()
+        fresh_until = str(int((now + soft_ttl) * 1000)).zfill(FRESH_UNTIL_WIDTH).encode() if soft_ttl else FRESH_FOREVER
+        tags = dict.fromkeys([*tags_for_key(key), *surrogate_tags(value)])
+        await self._set_tagged_script(
+            keys=[
+                self._make_key(key),
+                self._make_key(ENTRIES_KEY),
+                self._lock_key(key),
+                *(self._tag_key(tag) for tag in tags),
+            ],
+            args=[fresh_until + value, ttl, now + ttl if ttl else "+inf", now],
+        )
+        if self.local is not None:
+            self.local.set(key, value, fresh_until=now + soft_ttl if soft_ttl else float("inf"), tags=tags)
+
+    async def release(self, key: str) -> None:
+        """Drop the refresh lock on ``key`` when its recompute did not produce a cacheable response."""
+        try:
+            await self._redis.delete(self._lock_key(key))
+        except (RedisError, OSError):
+            logger.warning(f"Failed to release response cache lock for {key}", exc_info=True)
+
+    async def delete(self, key: str) -> None:
+        """Delete a value and drop it from the entry index."""
+        full_key = self._make_key(key)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.delete(full_key)
+            pipe.zrem(self._make_key(ENTRIES_KEY), full_key)
+            await pipe.execute()
+        if self.local is not None:
+            self.local.invalidate([key])
+
+    async def delete_all(self) -> None:
+        """Delete every value in the namespace and clear every process's local cache."""
+        await super().delete_all()
+        if self.local is not None:
+            self.local.clear()
+        await publish_response_cache_invalidation(self._redis, [INVALIDATE_ALL])
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every entry registered under any of ``tags``, here and in every process's local cache.
+
+        Args:
+            *tags: Tags built with :func:`path_tag`, :func:`domain_tag` or :func:`page_tag`.
+
+        Returns:
+            Number of cache entries deleted.
+        """
+        if not tags:
+            return 0
+        unique_tags = list(dict.fromkeys(tags))
+        deleted = await self._invalidate_tags_script(
+            keys=[self._make_key(ENTRIES_KEY), *(self._tag_key(tag) for tag in unique_tags)],
+        )
+        if self.local is not None:
+            self.local.invalidate_tags(unique_tags)
+        await publish_response_cache_invalidation(self._redis, unique_tags)
+        return int(deleted)
+
+    async def invalidate_all(self) -> int:
+        """Delete every tagged entry, walking the entry index in batches.
+
+        Tag sets are left to expire; their stale members point at deleted keys.
+        Every process's local cache is cleared.
+
+        Returns:
+            Number of cache entries deleted.
+        """
+        entries_key = self._make_key(ENTRIES_KEY)
+        deleted = 0
+        while keys := await self._redis.zrange(entries_key, 0, INVALIDATE_ALL_BATCH_SIZE - 1):
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.unlink(*keys)
+                pipe.zrem(entries_key, *keys)
+                unlinked, _ = await pipe.execute()
+            deleted += unlinked
+        if self.local is not None:
+            self.local.clear()
+        await publish_response_cache_invalidation(self._redis, [INVALIDATE_ALL])
+        return deleted
+
+    async def size(self) -> int:
+        """Return the number of live tagged entries without scanning the keyspace."""
+        return int(await self._redis.zcount(self._make_key(ENTRIES_KEY), time.time(), "+inf"))
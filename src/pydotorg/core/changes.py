@@ -0,0 +1,179 @@
+"""ORM change tracking and cross-process change notifications.
+
+Several per-process caches are kept current the same way: writes detected in
+a transaction are applied to the local cache when it commits and announced to
+every other process, which apply them from a Redis pub/sub listener. This
+module holds the parts they share:
+
+* :class:`ChangeCollector` gathers changes per session after each flush and
+  applies them on commit; a rollback discards them.
+* :func:`run_in_background` runs fire-and-forget work, such as publishing
+  those changes, from synchronous ORM event handlers.
+* :func:`listen_for_changes` keeps a pub/sub subscription alive, reconnecting
+  after errors.
+
+Example::
+
+    def _collect(session: Session, changed: set[UUID] | None) -> set[UUID] | None:
+        changed = set(changed or ())
+        changed.update(i.id for i in session.dirty if isinstance(i, Widget))
+        return changed or None
+
+
+    def _apply(changed: set[UUID]) -> None:
+        widget_cache.invalidate(changed)
+        run_in_background(publish_widget_changes, changed)
+
+
+    widget_changes = ChangeCollector("pydotorg_widget_changes", _collect, _apply)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from pydotorg.core.redis import get_pubsub
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_DELAY_SECONDS = 5.0
+
+_collectors: list[ChangeCollector[Any]] = []
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+class ChangeCollector[T]:
+    """Changes of one kind gathered per transaction and applied on commit.
+
+    Creating a collector registers it with the session event listeners below.
+    Changes are kept in ``session.info[key]`` between flush and commit.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        collect: Callable[[Session, T | None], T | None],
+        apply: Callable[[T], None],
+    ) -> None:
+        """Register a collector.
+
+        Args:
+            key: ``session.info`` key holding the pending changes.
+            collect: Called after each flush with the session and the changes
+                pending so far (None if there are none); returns the changes
+                to keep pending, or None if there still are none.
+            apply: Called with the pending changes once the transaction commits.
+        """
+        self.key = key
+        self._collect = collect
+        self._apply = apply
+        _collectors.append(self)
+
+    def mark(self, session: Session | AsyncSession, changes: T) -> None:
+        """Set the pending changes by hand, for writes that bypass flush events (e.g. bulk UPDATE)."""
+        session.info[self.key] = changes
+
+    def flush(self, session: Session) -> None:
+        """Collect the changes made by the flush that just ran."""
+        changes = self._collect(session, session.info.get(self.key))
+        if changes is not None:
+            session.info[self.key] = changes
+
+    def commit(self, session: Session) -> None:
+        """Apply the changes of the committed transaction, if any."""
+        if self.key in session.info:
+            self._apply(session.info.pop(self.key))
+
+    def rollback(self, session: Session) -> None:
+        """Forget the changes of a rolled-back transaction."""
+        session.info.pop(self.key, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, _flush_context: Any) -> None:
+    for collector in _collectors:
+        collector.flush(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session: Session) -> None:
+    for collector in _collectors:
+        collector.commit(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changes(session: Session, _previous_transaction: Any) -> None:
+    for collector in _collectors:
+        collector.rollback(session)
+
+
+def run_in_background[*Ts](func: Callable[[*Ts], Coroutine[Any, Any, Any]], *args: *Ts) -> None:
+    """Run ``func(*args)`` as a task on the running loop without waiting for it.
+
+    Does nothing outside an event loop (e.g. in sync scripts and migrations).
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(func(*args))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def listen_for_changes(
+    channel: str,
+    on_message: Callable[[str], Awaitable[None] | None],
+    *,
+    on_subscribe: Callable[[], Awaitable[None] | None],
+    on_disconnect: Callable[[], None] | None = None,
+) -> None:
+    """Pass every message published on ``channel`` to ``on_message`` until cancelled.
+
+    Reconnects after Redis or database errors. Anything published while
+    disconnected is lost, so ``on_subscribe`` runs whenever a subscription is
+    (re)established, before any message is handled, to clear or reload the
+    local state. Messages ``on_message`` rejects with ``ValueError`` are logged
+    and skipped.
+
+    Args:
+        channel: Pub/sub channel to subscribe to.
+        on_message: Handler for each decoded message; may be async.
+        on_subscribe: Called after each (re)subscription; may be async.
+        on_disconnect: Called after the subscription is lost.
+    """
+    while True:
+        pubsub = get_pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            if (result := on_subscribe()) is not None:
+                await result
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = message["data"]
+                value = data.decode() if isinstance(data, bytes) else data
+                try:
+                    if (result := on_message(value)) is not None:
+                        await result
+                except ValueError:
+                    logger.warning(f"Ignoring malformed message on {channel}: {value!r}")
+        except (RedisError, OSError, SQLAlchemyError):
+            logger.warning(f"Listener for {channel} disconnected; retrying", exc_info=True)
+            if on_disconnect is not None:
+                on_disconnect()
+        finally:
+            await pubsub.aclose()
+        await asyncio.sleep(RECONNECT_DELAY_SECONDS)
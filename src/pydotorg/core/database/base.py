@@ -8,8 +8,10 @@ from uuid import UUID  # noqa: TC003 - needed for SQLAlchemy column type
 
 from advanced_alchemy.base import UUIDAuditBase, UUIDBase
 from slugify import slugify
-from sqlalchemy import DateTime, ForeignKey, String, event, func
-from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
+from sqlalchemy import DateTime, ForeignKey, String, Text, event, func, inspect
+from sqlalchemy.orm import Mapped, Session, declared_attr, mapped_column, relationship
+
+from pydotorg.core.markup import MARKDOWN, content_hash, markup_cache
 
 if TYPE_CHECKING:
     from pydotorg.domains.users.models import User
@@ -82,3 +84,56 @@ class ContentManageableMixin:
             foreign_keys=[self.last_modified_by_id],
             lazy="selectin",
         )
+
+
+class RenderedContentMixin:
+    """Stores ``content`` rendered to HTML next to the hash of the source it was rendered from.
+
+    ``content_html`` is refreshed on flush whenever ``content`` (or the markup it
+    is written in) changes, so reads never run the Markdown or RST renderer.
+    """
+
+    _rendered_from: tuple[str, ...] = ("content",)
+
+    content_html: Mapped[str | None] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    @property
+    def content_markup(self) -> str:
+        """Markup language of ``content``."""
+        return MARKDOWN
+
+    def refresh_rendered_content(self) -> bool:
+        """Re-render ``content`` if it changed since ``content_html`` was stored.
+
+        Returns:
+            Whether ``content_html`` was re-rendered.
+        """
+        content = getattr(self, "content", None) or ""
+        digest = content_hash(content, self.content_markup)
+        if digest == self.content_hash and self.content_html is not None:
+            return False
+        self.content_html = markup_cache.render(content, self.content_markup, digest=digest)
+        self.content_hash = digest
+        return True
+
+    @property
+    def rendered_content(self) -> str:
+        """HTML for ``content``, rendered through the markup cache for rows not backfilled yet."""
+        if self.content_html is not None:
+            return self.content_html
+        return markup_cache.render(getattr(self, "content", None) or "", self.content_markup)
+
+
+@event.listens_for(Session, "before_flush")
+def _render_changed_content(session: Session, _flush_context: Any, _instances: Any) -> None:
+    """Render the content of new rows and of rows whose source changed."""
+    for instance in session.new:
+        if isinstance(instance, RenderedContentMixin):
+            instance.refresh_rendered_content()
+    for instance in session.dirty:
+        if not isinstance(instance, RenderedContentMixin):
+            continue
+        attrs = inspect(instance).attrs
+        if any(attrs[name].history.has_changes() for name in instance._rendered_from):
+            instance.refresh_rendered_content()
@@ -0,0 +1,88 @@
+"""Loader options that project ORM queries onto API response schemas.
+
+Most models load their audit users and relationships with ``lazy="selectin"``,
+so a plain list query fires one extra SELECT per relationship and hydrates rows
+that list responses never serialize. :func:`schema_load` builds loader options
+from a Pydantic schema instead:
+
+* only the columns the schema reads are selected,
+* relationships are loaded only if the schema declares them (projected onto the
+  nested schema) or the caller opts in with ``include``,
+* every other column and relationship raises on access, so a schema that starts
+  needing more data fails loudly in tests instead of lazy loading.
+
+Example:
+    >>> load = schema_load(Release, ReleaseList)
+    >>> releases, total = await release_service.list_and_count(limit_offset, load=load)
+"""
+
+from __future__ import annotations
+
+import types
+from functools import cache
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+
+def schema_load(model: type[Any], schema: type[BaseModel], *, include: Iterable[str] = ()) -> list[_AbstractLoad]:
+    """Return loader options that load only what ``schema`` serializes from ``model``.
+
+    Schema fields backed by a plain Python attribute of the model (for example a
+    ``@property``) may read any column, so all columns are loaded for such schemas;
+    relationships are still projected.
+
+    Args:
+        model: Mapped class being queried.
+        schema: Pydantic schema the rows are validated into.
+        include: Extra relationship names to load in full.
+
+    Returns:
+        Options for ``select().options()`` or the ``load=`` argument of repositories and services.
+    """
+    return list(_schema_load(model, schema, tuple(sorted(include))))
+
+
+@cache
+def _schema_load(model: type[Any], schema: type[BaseModel], include: tuple[str, ...]) -> tuple[_AbstractLoad, ...]:
+    mapper = inspect(model)
+    columns = []
+    project_columns = True
+    options: list[_AbstractLoad] = []
+
+    for name, field in schema.model_fields.items():
+        if name in mapper.column_attrs:
+            columns.append(getattr(model, name))
+        elif name in mapper.relationships:
+            loader = selectinload(getattr(model, name))
+            nested = _nested_schema(field.annotation)
+            if nested is not None:
+                loader = loader.options(*_schema_load(mapper.relationships[name].mapper.class_, nested, ()))
+            options.append(loader)
+        elif hasattr(model, name):
+            project_columns = False
+
+    options.extend(selectinload(getattr(model, name)) for name in include if name not in schema.model_fields)
+    if project_columns and columns:
+        options.insert(0, load_only(*columns, raiseload=True))
+    options.append(raiseload("*"))
+    return tuple(options)
+
+
+def _nested_schema(annotation: Any) -> type[BaseModel] | None:
+    """Return the schema inside ``annotation`` (``Schema``, ``list[Schema]``, ``Schema | None``...)."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if get_origin(annotation) in (list, tuple, set, Union, types.UnionType):
+        for arg in get_args(annotation):
+            nested = _nested_schema(arg)
+            if nested is not None:
+                return nested
+    return None
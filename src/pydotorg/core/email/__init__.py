@@ -3,5 +3,6 @@
 from __future__ import annotations
 
 from pydotorg.core.email.service import email_service
+from pydotorg.core.email.transport import SMTPPool, smtp_pool
 
-__all__ = ["email_service"]
+__all__ = ["SMTPPool", "email_service", "smtp_pool"]
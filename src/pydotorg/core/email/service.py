@@ -15,12 +15,15 @@ from pydotorg.core.email.templates import (
     get_verification_email_html,
     get_verification_email_text,
 )
+from pydotorg.core.email.transport import smtp_pool
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from email.message import Message
 
+    from pydotorg.core.email.transport import SMTPPool
+
 
 class EmailService:
     def __init__(self) -> None:
@@ -73,6 +76,19 @@ class EmailService:
         except OSError:
             logger.exception("Network error while sending email")
 
+    async def send_message(self, msg: Message, pool: SMTPPool = smtp_pool) -> None:
+        """Send ``msg`` over a pooled SMTP connection.
+
+        Like :meth:`_send_email`, does nothing unless SMTP credentials are configured,
+        but leaves failures to the caller.
+
+        Raises:
+            aiosmtplib.SMTPException: If the server rejects the message or the connection fails.
+        """
+        if not self.smtp_user or not self.smtp_password:
+            return
+        await pool.send(msg)
+
     def send_verification_email(
         self,
         to_email: str,
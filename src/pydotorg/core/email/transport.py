@@ -0,0 +1,188 @@
+"""Pooled, asynchronous SMTP delivery.
+
+Opening an SMTP connection costs a TCP handshake, ``EHLO``, a ``STARTTLS``
+negotiation and ``AUTH`` before the first message; sending the message itself
+is a few round trips. :class:`SMTPPool` keeps up to ``settings.smtp_pool_size``
+authenticated connections per process and reuses them, so a bulk send pays the
+setup once per connection instead of once per recipient, and sends on several
+connections at once without blocking the event loop.
+
+Connections are replaced after ``settings.smtp_max_messages_per_connection``
+messages (many relays cap messages per session) and closed after
+``settings.smtp_idle_timeout`` seconds unused, before the server drops them.
+A pooled connection the server closed anyway is detected on the next send,
+which is retried once on a fresh connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+import aiosmtplib
+
+from pydotorg.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from email.message import Message
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Connection:
+    client: aiosmtplib.SMTP
+    sent: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SMTPPool:
+    """Bounded pool of reusable SMTP connections.
+
+    Example:
+        >>> async with SMTPPool(hostname="localhost", port=1025, start_tls=False) as pool:
+        ...     await asyncio.gather(*(pool.send(message) for message in messages))
+    """
+
+    def __init__(
+        self,
+        *,
+        hostname: str = settings.smtp_host,
+        port: int = settings.smtp_port,
+        username: str = settings.smtp_user,
+        password: str = settings.smtp_password,
+        start_tls: bool = settings.smtp_use_tls,
+        size: int = settings.smtp_pool_size,
+        timeout: float = settings.smtp_timeout,
+        max_messages_per_connection: int = settings.smtp_max_messages_per_connection,
+        idle_timeout: float = settings.smtp_idle_timeout,
+    ) -> None:
+        """Initialize an empty pool; connections are opened on demand.
+
+        Args:
+            hostname: SMTP server host.
+            port: SMTP server port.
+            username: Login user; no ``AUTH`` unless both user and password are set.
+            password: Login password.
+            start_tls: Upgrade connections with ``STARTTLS``.
+            size: Maximum connections open at once, and so messages in flight.
+            timeout: Seconds before an SMTP command times out.
+            max_messages_per_connection: Messages sent over a connection before it is replaced.
+            idle_timeout: Seconds an unused connection is kept.
+        """
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_timeout = idle_timeout
+        self.connections_opened = 0
+        self.messages_sent = 0
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: list[_Connection] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def send(
+        self, message: Message, *, sender: str | None = None, recipients: Sequence[str] | None = None
+    ) -> None:
+        """Send ``message`` over a pooled connection, waiting for one if all are busy.
+
+        Args:
+            message: Message to send.
+            sender: Envelope sender; defaults to the message's ``From``.
+            recipients: Envelope recipients; default to the message's ``To``, ``Cc`` and ``Bcc``.
+
+        Raises:
+            aiosmtplib.SMTPException: If the server rejects the message or the connection fails.
+        """
+        async with self._semaphore:
+            connection = await self._acquire()
+            try:
+                await connection.client.send_message(message, sender=sender, recipients=recipients)
+            except aiosmtplib.SMTPServerDisconnected:
+                connection.client.close()
+                if not connection.sent:
+                    raise
+                logger.debug("Pooled SMTP connection was closed by the server; reconnecting")
+                connection = await self._connect()
+                try:
+                    await connection.client.send_message(message, sender=sender, recipients=recipients)
+                except BaseException:
+                    connection.client.close()
+                    raise
+            except BaseException:
+                connection.client.close()
+                raise
+            connection.sent += 1
+            self.messages_sent += 1
+            await self._release(connection)
+
+    async def aclose(self) -> None:
+        """Close every idle connection."""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._quit(connection) for connection in idle))
+
+    def stats(self) -> dict[str, int]:
+        """Return connection/message counters and the number of idle connections."""
+        return {
+            "connections_opened": self.connections_opened,
+            "messages_sent": self.messages_sent,
+            "idle": len(self._idle),
+        }
+
+    async def _acquire(self) -> _Connection:
+        now = time.monotonic()
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.client.is_connected and now - connection.last_used < self.idle_timeout:
+                return connection
+            await self._quit(connection)
+        return await self._connect()
+
+    async def _connect(self) -> _Connection:
+        credentials = self.username and self.password
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username if credentials else None,
+            password=self.password if credentials else None,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        self.connections_opened += 1
+        return _Connection(client)
+
+    async def _release(self, connection: _Connection) -> None:
+        if connection.sent >= self.max_messages_per_connection:
+            await self._quit(connection)
+            return
+        connection.last_used = time.monotonic()
+        self._idle.append(connection)
+
+    async def _quit(self, connection: _Connection) -> None:
+        try:
+            if connection.client.is_connected:
+                await connection.client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            connection.client.close()
+
+
+smtp_pool = SMTPPool()
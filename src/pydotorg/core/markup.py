@@ -0,0 +1,153 @@
+"""Rendering of Markdown and reStructuredText content to HTML.
+
+Rendering is expensive: cmarkgfm is fast but still linear in the document, and
+docutils ``publish_parts`` takes tens of milliseconds for long RST pages. Models
+with the :class:`~pydotorg.core.database.base.RenderedContentMixin` store their
+HTML and a :func:`content_hash` when they are written. Everything else goes
+through :data:`markup_cache`, a bounded LRU keyed by content hash, so the same
+document is rendered once per process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+
+from pydotorg.config import settings
+
+try:
+    import cmarkgfm
+
+    CMARKGFM_AVAILABLE = True
+except ImportError:
+    CMARKGFM_AVAILABLE = False
+
+try:
+    import markdown
+
+    MARKDOWN_AVAILABLE = True
+except ImportError:
+    MARKDOWN_AVAILABLE = False
+
+try:
+    import docutils.core
+
+    DOCUTILS_AVAILABLE = True
+except ImportError:
+    DOCUTILS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN = "markdown"
+RESTRUCTUREDTEXT = "restructuredtext"
+
+
+def content_hash(content: str, markup: str = MARKDOWN) -> str:
+    """Return the hex SHA-256 of ``content`` rendered as ``markup``."""
+    return hashlib.sha256(f"{markup}\0{content}".encode()).hexdigest()
+
+
+def render_markdown(content: str) -> str:
+    """Render GitHub-flavored Markdown to HTML.
+
+    Raises:
+        ImportError: If neither cmarkgfm nor markdown is available.
+    """
+    if CMARKGFM_AVAILABLE:
+        return cmarkgfm.github_flavored_markdown_to_html(content)
+    if MARKDOWN_AVAILABLE:
+        return markdown.markdown(content, extensions=["extra", "codehilite"])
+    msg = "Neither cmarkgfm nor markdown library is installed"
+    raise ImportError(msg)
+
+
+def render_rst(content: str) -> str:
+    """Render reStructuredText to an HTML fragment.
+
+    Raises:
+        ImportError: If docutils is not available.
+    """
+    if not DOCUTILS_AVAILABLE:
+        msg = "docutils library is not installed"
+        raise ImportError(msg)
+    parts = docutils.core.publish_parts(content, writer_name="html")
+    return parts["html_body"]
+
+
+def render_markup(content: str, markup: str = MARKDOWN) -> str:
+    """Render ``content`` to HTML; markup other than Markdown or RST is returned as is."""
+    if markup == MARKDOWN:
+        return render_markdown(content)
+    if markup == RESTRUCTUREDTEXT:
+        return render_rst(content)
+    return content
+
+
+class MarkupCache:
+    """LRU of rendered documents keyed by :func:`content_hash`.
+
+    Example:
+        >>> cache = MarkupCache(max_entries=1024)
+        >>> cache.render("# Title")
+        '<h1>Title</h1>\\n'
+    """
+
+    def __init__(self, max_entries: int = settings.markup_cache_size) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Documents kept; least recently used are evicted first. ``0`` disables the cache.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str) -> str | None:
+        """Return the HTML stored under ``digest``, if any."""
+        html = self._entries.get(digest)
+        if html is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return html
+
+    def set(self, digest: str, html: str) -> None:
+        """Remember ``html`` under ``digest``."""
+        if not self.max_entries:
+            return
+        self._entries[digest] = html
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def render(self, content: str, markup: str = MARKDOWN, *, digest: str | None = None) -> str:
+        """Return ``content`` rendered as ``markup``, rendering it only on a cache miss.
+
+        Args:
+            content: Source document.
+            markup: ``"markdown"``, ``"restructuredtext"``, or anything else for raw HTML.
+            digest: Precomputed :func:`content_hash` of ``content``.
+        """
+        digest = digest or content_hash(content, markup)
+        html = self.get(digest)
+        if html is None:
+            html = render_markup(content, markup)
+            self.set(digest, html)
+        return html
+
+    def clear(self) -> None:
+        """Drop every rendered document."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+markup_cache = MarkupCache()
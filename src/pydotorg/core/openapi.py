@@ -41,20 +41,18 @@ def get_openapi_plugins() -> list[ScalarRenderPlugin | SwaggerRenderPlugin]:
     ]
 
 
-def _require_admin_session(connection: ASGIConnection, _: BaseRouteHandler) -> None:
+async def _require_admin_session(connection: ASGIConnection, _: BaseRouteHandler) -> None:
     """Guard that requires admin session (same as SQLAdmin).
 
     Checks for valid Litestar session with superuser privileges.
     """
-    from pydotorg.core.auth.session import SessionService
-
-    session_service = SessionService()
+    from pydotorg.core.auth.session import session_service
 
     session_id = connection.cookies.get(settings.session_cookie_name)
     if not session_id:
         raise NotAuthorizedException("Admin authentication required")
 
-    user_id = session_service.get_user_id_from_session(session_id)
+    user_id = await session_service.get_user_id_from_session(session_id)
     if not user_id:
         raise NotAuthorizedException("Invalid or expired session")
 
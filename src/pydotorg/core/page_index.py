@@ -0,0 +1,203 @@
+"""Per-process set of published page paths.
+
+``PageRenderController`` is a catch-all route, so every unknown URL (bot scans
+for ``/wp-login.php`` and the like) used to cost a database query, and 404s are
+never response-cached. Each web process instead keeps the set of published page
+paths and answers unknown paths with a 404 straight away. Known paths still load
+the page from the database, behind the response cache.
+
+The set is loaded when the change listener subscribes (at startup and after
+every reconnect) and kept current by ORM events: pages created, deleted,
+published, unpublished or moved through the ORM update the local set on commit
+and are published on a Redis channel for every other process. Until the set is
+loaded, every path is looked up in the database.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from redis.exceptions import RedisError
+from sqlalchemy import inspect, select
+
+from pydotorg.core.changes import ChangeCollector, listen_for_changes, run_in_background
+from pydotorg.core.redis import get_redis
+from pydotorg.domains.pages.models import Page
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from litestar import Litestar
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PAGE_PATH_CHANNEL = "pydotorg:pages:paths-changed"
+RELOAD_ALL = "*"
+
+_SESSION_INFO_KEY = "pydotorg_page_path_changes"
+
+
+class PageIndex:
+    """In-memory set of published page paths.
+
+    Example:
+        >>> index = PageIndex()
+        >>> index.replace(["/about/"])
+        >>> index.excludes("/wp-login.php")
+        True
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, unloaded index."""
+        self.loaded = False
+        self.generation = 0
+        self.hits = 0
+        self.rejections = 0
+        self._paths: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._paths
+
+    def excludes(self, path: str) -> bool:
+        """Return True if ``path`` is known not to be a published page.
+
+        Always False until the index is loaded, so callers fall back to the database.
+        """
+        if not self.loaded:
+            return False
+        if path in self._paths:
+            self.hits += 1
+            return False
+        self.rejections += 1
+        return True
+
+    def replace(self, paths: Iterable[str]) -> None:
+        """Swap in a freshly loaded set."""
+        self.generation += 1
+        self._paths = set(paths)
+        self.loaded = True
+
+    def update(self, changes: dict[str, bool]) -> None:
+        """Apply path changes; True adds a published path, False removes it."""
+        self.generation += 1
+        for path, published in changes.items():
+            if published:
+                self._paths.add(path)
+            else:
+                self._paths.discard(path)
+
+    def clear(self) -> None:
+        """Forget every path until the next load."""
+        self.generation += 1
+        self._paths = set()
+        self.loaded = False
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/rejection counters and current size."""
+        return {"size": len(self._paths), "hits": self.hits, "rejections": self.rejections}
+
+
+page_index = PageIndex()
+
+
+async def load_page_index(app: Litestar, index: PageIndex = page_index) -> None:
+    """Load every published page path into ``index``.
+
+    Changes applied while the query runs would be overwritten by its older
+    result, so the load is repeated until none arrive in between.
+    """
+    plugin = app.plugins.get(SQLAlchemyPlugin)
+    if plugin is None:
+        return
+    config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
+    statement = select(Page.path).where(Page.is_published.is_(True))
+    while True:
+        generation = index.generation
+        async with config.get_session() as db_session:
+            paths = (await db_session.scalars(statement)).all()
+        if generation == index.generation:
+            index.replace(paths)
+            logger.debug(f"Loaded {len(paths)} published page paths into the index")
+            return
+
+
+async def publish_page_path_changes(changes: dict[str, bool] | None) -> None:
+    """Tell every web process about page path changes.
+
+    Args:
+        changes: ``path -> published`` (False for removed paths), or None to reload everything.
+    """
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            if changes is None:
+                pipe.publish(PAGE_PATH_CHANNEL, RELOAD_ALL)
+            else:
+                for path, published in changes.items():
+                    pipe.publish(PAGE_PATH_CHANNEL, f"{'+' if published else '-'}{path}")
+            await pipe.execute()
+    except (RedisError, OSError):
+        logger.warning("Failed to publish page path changes", exc_info=True)
+
+
+def _parse_change(value: str) -> dict[str, bool]:
+    sign, path = value[:1], value[1:]
+    if sign not in {"+", "-"} or not path:
+        msg = f"Invalid page path change: {value!r}"
+        raise ValueError(msg)
+    return {path: sign == "+"}
+
+
+async def listen_for_page_path_changes(app: Litestar, index: PageIndex = page_index) -> None:
+    """Load the index, then apply changes published by any process until cancelled.
+
+    The index is reloaded whenever the subscription is (re)established, and
+    treated as unloaded while disconnected.
+    """
+
+    async def apply(value: str) -> None:
+        if value == RELOAD_ALL:
+            await load_page_index(app, index)
+        else:
+            index.update(_parse_change(value))
+
+    await listen_for_changes(
+        PAGE_PATH_CHANNEL,
+        apply,
+        on_subscribe=lambda: load_page_index(app, index),
+        on_disconnect=index.clear,
+    )
+
+
+def _collect_page_path_changes(session: Session, changes: dict[str, bool] | None) -> dict[str, bool] | None:
+    """Remember pages created, deleted, moved, published or unpublished in this transaction."""
+    changes = changes or {}
+    for instance in session.deleted:
+        if isinstance(instance, Page):
+            changes[instance.path] = False
+    for instance in session.new:
+        if isinstance(instance, Page):
+            changes[instance.path] = instance.is_published is not False
+    for instance in session.dirty:
+        if not isinstance(instance, Page):
+            continue
+        attrs = inspect(instance).attrs
+        if not (attrs.path.history.has_changes() or attrs.is_published.history.has_changes()):
+            continue
+        for old_path in attrs.path.history.deleted:
+            changes[old_path] = False
+        changes[instance.path] = bool(instance.is_published)
+    return changes or None
+
+
+def _apply_page_path_changes(changes: dict[str, bool]) -> None:
+    page_index.update(changes)
+    run_in_background(publish_page_path_changes, changes)
+
+
+page_path_changes = ChangeCollector(_SESSION_INFO_KEY, _collect_page_path_changes, _apply_page_path_changes)
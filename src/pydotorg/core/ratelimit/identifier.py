@@ -24,7 +24,7 @@ async def get_rate_limit_identifier(request: Request) -> str:
 
     Args:
         request: The incoming Litestar request object. User is populated by
-            UserPopulationMiddleware if authenticated.
+            JWTAuthMiddleware if authenticated.
 
     Returns:
         String identifier in format ``prefix:value`` for rate limit tracking.
@@ -0,0 +1,65 @@
+"""Shared asyncio Redis client with lazy initialization.
+
+The web process uses a single connection pool for everything that talks to
+Redis directly (sessions, cache invalidation, pub/sub). Like the database
+engine, the client is created on first use rather than at import time.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
+
+from redis.asyncio import ConnectionPool, Redis
+
+from pydotorg.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Mapping
+
+    from redis.asyncio.client import PubSub
+
+
+@lru_cache(maxsize=1)
+def get_redis_pool() -> ConnectionPool:
+    """Get or create the shared Redis connection pool (lazy singleton)."""
+    return ConnectionPool.from_url(settings.redis_url, max_connections=settings.redis_max_connections)
+
+
+def get_redis() -> Redis:
+    """Get a Redis client bound to the shared connection pool.
+
+    Clients are cheap wrappers around the pool, so callers may create one per
+    use without opening new connections.
+    """
+    return Redis(connection_pool=get_redis_pool())
+
+
+def get_context_redis(ctx: Mapping[str, Any]) -> Redis:
+    """Get the worker context's Redis client, or a client on the shared pool."""
+    redis: Redis | None = ctx.get("redis")
+    return redis or get_redis()
+
+
+def awaitable[T](result: Awaitable[T] | T) -> Awaitable[T]:
+    """Narrow a redis-py command result to the awaitable the asyncio client returns.
+
+    redis-py annotates hash and set commands as ``Awaitable[T] | T`` because the
+    sync and asyncio clients share their signatures.
+
+    Example:
+        >>> values = await awaitable(redis.hmget("key", ["a", "b"]))
+    """
+    return cast("Awaitable[T]", result)
+
+
+def get_pubsub() -> PubSub:
+    """Get a pub/sub handle backed by the shared connection pool."""
+    return get_redis().pubsub(ignore_subscribe_messages=True)
+
+
+async def close_redis() -> None:
+    """Disconnect the shared pool so it is recreated on next use."""
+    if get_redis_pool.cache_info().currsize:
+        await get_redis_pool().aclose()
+        get_redis_pool.cache_clear()
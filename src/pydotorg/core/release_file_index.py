@@ -0,0 +1,222 @@
+"""Per-process map of release file IDs to the release they belong to.
+
+Tracking a download only needs to know that the file exists and which release
+it belongs to. Loading the ``ReleaseFile`` for that also pulls in its OS and
+creator/modifier users, so each web process keeps a ``file_id -> release_id``
+map instead. The map is loaded when the change listener subscribes (at startup
+and after every reconnect) and kept current by ORM events:
+
+* release files added, moved or deleted through the ORM update the local map
+  on commit and are published on a Redis channel for every other process,
+* deleting a release or OS, which cascades to its files in the database, makes
+  every process reload the map.
+
+Once the map is loaded, an ID missing from it is rejected without touching the
+database, so a flood of random IDs costs nothing. Until then (at startup, or
+after a cascade delete cleared it) misses are looked up in the database.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from redis.exceptions import RedisError
+from sqlalchemy import inspect, select
+
+from pydotorg.core.changes import ChangeCollector, listen_for_changes, run_in_background
+from pydotorg.core.redis import get_redis
+from pydotorg.domains.downloads.models import OS, Release, ReleaseFile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from litestar import Litestar
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+RELEASE_FILE_CHANNEL = "pydotorg:downloads:release-files-changed"
+RELOAD_ALL = "*"
+
+_SESSION_INFO_KEY = "pydotorg_release_file_changes"
+
+
+class ReleaseFileIndex:
+    """In-memory ``file_id -> release_id`` map with database fallback until it is loaded.
+
+    Example:
+        >>> index = ReleaseFileIndex()
+        >>> index.replace([(file_id, release_id)])
+        >>> await index.resolve(file_id, session)
+        UUID('...')
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, unloaded index."""
+        self.loaded = False
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.rejections = 0
+        self._release_ids: dict[UUID, UUID] = {}
+
+    def __len__(self) -> int:
+        return len(self._release_ids)
+
+    def get(self, file_id: UUID) -> UUID | None:
+        """Return the release ID of ``file_id`` if it is in the map."""
+        return self._release_ids.get(file_id)
+
+    async def resolve(self, file_id: UUID, session: AsyncSession) -> UUID | None:
+        """Return the release ID of ``file_id``, or None if the file does not exist.
+
+        Args:
+            file_id: Release file to look up.
+            session: Session used to query the database while the map is not loaded.
+        """
+        release_id = self._release_ids.get(file_id)
+        if release_id is not None:
+            self.hits += 1
+            return release_id
+        if self.loaded:
+            self.rejections += 1
+            return None
+
+        self.misses += 1
+        generation = self.generation
+        release_id = await session.scalar(select(ReleaseFile.release_id).where(ReleaseFile.id == file_id))
+        if release_id is not None and generation == self.generation:
+            self._release_ids[file_id] = release_id
+        return release_id
+
+    def replace(self, release_ids: Iterable[tuple[UUID, UUID]]) -> None:
+        """Swap in a freshly loaded map."""
+        self.generation += 1
+        self._release_ids = dict(release_ids)
+        self.loaded = True
+
+    def update(self, changes: dict[UUID, UUID | None]) -> None:
+        """Apply file changes; a None release ID removes the file."""
+        self.generation += 1
+        for file_id, release_id in changes.items():
+            if release_id is None:
+                self._release_ids.pop(file_id, None)
+            else:
+                self._release_ids[file_id] = release_id
+
+    def clear(self) -> None:
+        """Forget every file until the next load."""
+        self.generation += 1
+        self._release_ids = {}
+        self.loaded = False
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/rejection counters and current size."""
+        return {
+            "size": len(self._release_ids),
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejections": self.rejections,
+        }
+
+
+release_file_index = ReleaseFileIndex()
+
+
+async def load_release_file_index(app: Litestar, index: ReleaseFileIndex = release_file_index) -> None:
+    """Load every ``(file_id, release_id)`` pair into ``index``.
+
+    Changes applied while the query runs would be overwritten by its older
+    result, so the load is repeated until none arrive in between.
+    """
+    plugin = app.plugins.get(SQLAlchemyPlugin)
+    if plugin is None:
+        return
+    config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
+    while True:
+        generation = index.generation
+        async with config.get_session() as db_session:
+            rows = (await db_session.execute(select(ReleaseFile.id, ReleaseFile.release_id))).tuples().all()
+        if generation == index.generation:
+            index.replace(rows)
+            logger.debug(f"Loaded {len(rows)} release files into the index")
+            return
+
+
+async def publish_release_file_changes(changes: dict[UUID, UUID | None] | None) -> None:
+    """Tell every web process about release file changes.
+
+    Args:
+        changes: ``file_id -> release_id`` (None for deleted files), or None to reload everything.
+    """
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            if changes is None:
+                pipe.publish(RELEASE_FILE_CHANNEL, RELOAD_ALL)
+            else:
+                for file_id, release_id in changes.items():
+                    pipe.publish(RELEASE_FILE_CHANNEL, f"{file_id} {release_id or ''}".rstrip())
+            await pipe.execute()
+    except (RedisError, OSError):
+        logger.warning("Failed to publish release file changes", exc_info=True)
+
+
+def _parse_change(value: str) -> dict[UUID, UUID | None]:
+    file_id, _, release_id = value.partition(" ")
+    return {UUID(file_id): UUID(release_id) if release_id else None}
+
+
+async def listen_for_release_file_changes(app: Litestar, index: ReleaseFileIndex = release_file_index) -> None:
+    """Load the index, then apply changes published by any process until cancelled.
+
+    The index is reloaded whenever the subscription is (re)established.
+    """
+
+    async def apply(value: str) -> None:
+        if value == RELOAD_ALL:
+            await load_release_file_index(app, index)
+        else:
+            index.update(_parse_change(value))
+
+    await listen_for_changes(RELEASE_FILE_CHANNEL, apply, on_subscribe=lambda: load_release_file_index(app, index))
+
+
+def _collect_release_file_changes(
+    session: Session, changes: dict[UUID, UUID | None] | str | None
+) -> dict[UUID, UUID | None] | str | None:
+    """Remember release files added, moved or deleted in this transaction.
+
+    Deleting a release or OS cascades to its files in the database, so the
+    changes become :data:`RELOAD_ALL`.
+    """
+    if isinstance(changes, str):
+        return changes
+    changes = changes or {}
+    for instance in session.deleted:
+        if isinstance(instance, (Release, OS)):
+            return RELOAD_ALL
+        if isinstance(instance, ReleaseFile):
+            changes[instance.id] = None
+    for instance in session.new:
+        if isinstance(instance, ReleaseFile):
+            changes[instance.id] = instance.release_id
+    for instance in session.dirty:
+        if isinstance(instance, ReleaseFile) and inspect(instance).attrs.release_id.history.has_changes():
+            changes[instance.id] = instance.release_id
+    return changes or None
+
+
+def _apply_release_file_changes(changes: dict[UUID, UUID | None] | str) -> None:
+    if isinstance(changes, str):
+        release_file_index.clear()
+        run_in_background(publish_release_file_changes, None)
+    else:
+        release_file_index.update(changes)
+        run_in_background(publish_release_file_changes, changes)
+
+
+release_file_changes = ChangeCollector(_SESSION_INFO_KEY, _collect_release_file_changes, _apply_release_file_changes)
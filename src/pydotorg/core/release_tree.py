@@ -0,0 +1,270 @@
+"""Versioned per-process release tree for the downloads index page.
+
+``/downloads/`` shows the latest Python 3 and Python 2 releases and every
+download-page release grouped by major and minor version. Building that from
+``Release`` rows hydrates their files, page and creator, and re-parses each
+name to group and sort it. Each process instead keeps an immutable
+:class:`ReleaseTree` of compact :class:`ReleaseSummary` records, with version
+parts parsed once, and only rebuilds it when:
+
+* a release is written through the ORM in any process, which bumps a version
+  counter in Redis (and invalidates the local tree immediately),
+* ``settings.release_tree_ttl`` elapses, which bounds staleness for writes that
+  bypass the ORM or happen while Redis is unreachable.
+
+The Redis counter is read at most once per ``settings.release_tree_version_check_interval``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from redis.exceptions import RedisError
+from sqlalchemy import or_, select
+
+from pydotorg.config import settings
+from pydotorg.core.changes import ChangeCollector, run_in_background
+from pydotorg.core.redis import get_redis
+from pydotorg.domains.downloads.models import (
+    PythonVersion,
+    Release,
+    ReleaseStatus,
+    ReleaseStatusMixin,
+    parse_major_version,
+    parse_minor_version,
+)
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Iterable, Mapping, Sequence
+    from uuid import UUID
+
+    from litestar import Litestar
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+RELEASE_VERSION_KEY = "pydotorg:downloads:releases:version"
+DOWNLOAD_PAGE_LIMIT = 500
+
+_SESSION_INFO_KEY = "pydotorg_releases_changed"
+
+_SUMMARY_COLUMNS = (
+    Release.id,
+    Release.name,
+    Release.slug,
+    Release.version,
+    Release.status,
+    Release.is_latest,
+    Release.pre_release,
+    Release.show_on_download_page,
+    Release.release_date,
+    Release.eol_date,
+    Release.release_notes_url,
+)
+
+
+def _major_sort_key(major: str) -> tuple[int, int | str]:
+    return (0, -int(major)) if major.isdigit() else (1, major)
+
+
+def _minor_sort_key(minor: str) -> tuple[int, ...]:
+    return tuple(-int(part) if part.isdigit() else 0 for part in minor.split("."))
+
+
+@dataclass(frozen=True, slots=True)
+class ReleaseSummary(ReleaseStatusMixin):
+    """The columns of a ``Release`` the downloads index renders, with its version parsed once.
+
+    Exposes the same attributes and status properties as :class:`Release`, so
+    templates can render either.
+    """
+
+    id: UUID
+    name: str
+    slug: str
+    version: PythonVersion
+    status: ReleaseStatus
+    is_latest: bool
+    pre_release: bool
+    show_on_download_page: bool
+    release_date: datetime.date | None
+    eol_date: datetime.date | None
+    release_notes_url: str
+    major_version: str
+    minor_version: str
+
+    @classmethod
+    def from_row(cls, row: Any) -> ReleaseSummary:
+        """Build a summary from a row of :data:`_SUMMARY_COLUMNS`."""
+        return cls(
+            **row._asdict(),
+            major_version=parse_major_version(row.name),
+            minor_version=parse_minor_version(row.name),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ReleaseTree:
+    """Latest releases and download-page releases grouped by major, then minor version.
+
+    ``grouped`` lists majors newest first (non-numeric names last), minors
+    newest first within each major, and releases by release date, newest first.
+    """
+
+    latest: Mapping[PythonVersion, ReleaseSummary]
+    grouped: Mapping[str, Mapping[str, tuple[ReleaseSummary, ...]]]
+    version: int | None = None
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(cls, releases: Sequence[ReleaseSummary], *, version: int | None = None) -> ReleaseTree:
+        """Group published releases, given newest first by release date."""
+        latest: dict[PythonVersion, ReleaseSummary] = {}
+        for release in releases:
+            if release.is_latest:
+                latest.setdefault(release.version, release)
+
+        groups: dict[str, dict[str, list[ReleaseSummary]]] = {}
+        for release in [r for r in releases if r.show_on_download_page][:DOWNLOAD_PAGE_LIMIT]:
+            groups.setdefault(release.major_version, {}).setdefault(release.minor_version, []).append(release)
+
+        grouped = {
+            major: MappingProxyType(
+                {minor: tuple(groups[major][minor]) for minor in sorted(groups[major], key=_minor_sort_key)}
+            )
+            for major in sorted(groups, key=_major_sort_key)
+        }
+        return cls(latest=MappingProxyType(latest), grouped=MappingProxyType(grouped), version=version)
+
+
+class ReleaseTreeCache:
+    """Holds the current :class:`ReleaseTree` and decides when to rebuild it."""
+
+    def __init__(
+        self,
+        ttl: float = settings.release_tree_ttl,
+        version_check_interval: float = settings.release_tree_version_check_interval,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Maximum seconds a tree is served before it is rebuilt regardless of version.
+            version_check_interval: Minimum seconds between reads of the Redis version counter.
+        """
+        self.ttl = ttl
+        self.version_check_interval = version_check_interval
+        self.loads = 0
+        self._tree: ReleaseTree | None = None
+        self._next_check = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Force the next request to rebuild the tree from the database."""
+        self._tree = None
+
+    def _is_fresh(self, tree: ReleaseTree | None, now: float) -> bool:
+        return tree is not None and now < self._next_check and now - tree.loaded_at < self.ttl
+
+    async def get(self, app: Litestar) -> ReleaseTree:
+        """Return the current tree, rebuilding it if the version or TTL says so."""
+        if self._is_fresh(self._tree, time.monotonic()):
+            return self._tree  # type: ignore[return-value]
+
+        async with self._lock:
+            now = time.monotonic()
+            tree = self._tree
+            if self._is_fresh(tree, now):
+                return tree  # type: ignore[return-value]
+
+            version = await _read_version()
+            self._next_check = now + self.version_check_interval
+            if tree is not None and version is not None and version == tree.version and now - tree.loaded_at < self.ttl:
+                return tree
+
+            try:
+                tree = await _load_tree(app, version=version)
+            except Exception:
+                if tree is None:
+                    raise
+                logger.exception("Failed to rebuild the release tree; serving the previous one")
+                return tree
+
+            self._tree = tree
+            self.loads += 1
+            return tree
+
+
+release_tree = ReleaseTreeCache()
+
+
+async def _read_version() -> int | None:
+    try:
+        raw = await get_redis().get(RELEASE_VERSION_KEY)
+    except (RedisError, OSError):
+        logger.warning("Could not read release version; relying on release tree TTL", exc_info=True)
+        return None
+    return int(raw) if raw else 0
+
+
+async def _load_tree(app: Litestar, *, version: int | None) -> ReleaseTree:
+    plugin = app.plugins.get(SQLAlchemyPlugin)
+    if plugin is None:
+        return ReleaseTree.build([], version=version)
+    config = plugin.config[0] if isinstance(plugin.config, list) else plugin.config
+    statement = (
+        select(*_SUMMARY_COLUMNS)
+        .where(
+            Release.is_published.is_(True),
+            or_(Release.show_on_download_page.is_(True), Release.is_latest.is_(True)),
+        )
+        .order_by(Release.release_date.desc())
+    )
+    async with config.get_session() as db_session:
+        rows = (await db_session.execute(statement)).all()
+    return ReleaseTree.build([ReleaseSummary.from_row(row) for row in rows], version=version)
+
+
+async def bump_release_version() -> None:
+    """Tell every web process that releases changed."""
+    try:
+        await get_redis().incr(RELEASE_VERSION_KEY)
+    except (RedisError, OSError):
+        logger.warning("Failed to bump release version", exc_info=True)
+
+
+def _collect_release_changes(session: Session, changed: set[UUID] | None) -> set[UUID] | None:
+    """Remember the IDs of releases written in this transaction."""
+    changed = changed or set()
+    changed.update(
+        instance.id for instance in (*session.new, *session.dirty, *session.deleted) if isinstance(instance, Release)
+    )
+    return changed or None
+
+
+def _invalidate_release_tree(_release_ids: set[UUID]) -> None:
+    release_tree.invalidate()
+    run_in_background(bump_release_version)
+
+
+release_changes = ChangeCollector(_SESSION_INFO_KEY, _collect_release_changes, _invalidate_release_tree)
+
+
+def mark_releases_changed(session: Session | AsyncSession, release_ids: Iterable[UUID] = ()) -> None:
+    """Rebuild release trees when ``session`` commits.
+
+    Needed after bulk UPDATE/DELETE statements on releases, which bypass the
+    flush events that normally detect release changes.
+
+    Args:
+        session: Session the statements ran in.
+        release_ids: IDs of the releases known to be affected, if any.
+    """
+    release_changes.mark(session, {*session.info.get(release_changes.key, ()), *release_ids})
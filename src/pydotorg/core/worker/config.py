@@ -11,6 +11,8 @@ from saq import CronJob
 
 from pydotorg.config import settings
 from pydotorg.core.database.base import AuditBase
+from pydotorg.core.email.transport import smtp_pool
+from pydotorg.tasks.api_keys import flush_api_key_usage
 from pydotorg.tasks.cache import (
     clear_cache as cache_clear,
 )
@@ -100,6 +102,9 @@ async def shutdown(ctx: dict[str, Any]) -> None:
         await engine.dispose()
         logger.info("Database engine disposed")
 
+    await smtp_pool.aclose()
+    logger.info("SMTP connections closed")
+
     logger.info("SAQ worker shutdown complete")
 
 
@@ -160,6 +165,7 @@ TASK_FUNCTIONS = [
     expire_jobs,
     archive_old_jobs,
     cleanup_draft_jobs,
+    flush_api_key_usage,
     send_verification_email,
     send_password_reset_email,
     send_job_approved_email,
@@ -212,6 +218,12 @@ SCHEDULED_TASKS = [
         timeout=300,
         unique=True,
     ),
+    CronJob(
+        function=flush_api_key_usage,
+        cron="* * * * *",
+        timeout=60,
+        unique=True,
+    ),
     CronJob(
         function=warm_homepage_cache,
         cron="*/5 * * * *",
@@ -0,0 +1,47 @@
+"""add_unique_latest_release_per_version
+
+Revision ID: b7e2c94d1f03
+Revises: afda74ceaa73
+Create Date: 2026-10-16 10:12:44.318204
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "b7e2c94d1f03"
+down_revision: str | None = "afda74ceaa73"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Keep only the most recently released latest release per version before enforcing uniqueness.
+    op.execute(
+        """
+        UPDATE releases SET is_latest = false
+        WHERE is_latest AND id NOT IN (
+            SELECT DISTINCT ON (version) id FROM releases
+            WHERE is_latest
+            ORDER BY version, release_date DESC NULLS LAST, created_at DESC
+        )
+        """
+    )
+    op.create_index(
+        "uq_releases_latest_per_version",
+        "releases",
+        ["version"],
+        unique=True,
+        postgresql_where=sa.text("is_latest"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_releases_latest_per_version", table_name="releases", postgresql_where=sa.text("is_latest"))
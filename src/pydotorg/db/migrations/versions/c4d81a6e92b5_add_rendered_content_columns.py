@@ -0,0 +1,37 @@
+"""add_rendered_content_columns
+
+Revision ID: c4d81a6e92b5
+Revises: b7e2c94d1f03
+Create Date: 2026-10-16 14:02:17.530661
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "c4d81a6e92b5"
+down_revision: str | None = "b7e2c94d1f03"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+TABLES = ("pages", "releases")
+
+
+def upgrade() -> None:
+    # Existing rows are rendered by the render_stale_content task; until then they render on read.
+    for table in TABLES:
+        op.add_column(table, sa.Column("content_html", sa.Text(), nullable=True))
+        op.add_column(table, sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "content_hash")
+        op.drop_column(table, "content_html")
@@ -0,0 +1,32 @@
+"""add_feed_validators
+
+Revision ID: d2a7f35b8c14
+Revises: c4d81a6e92b5
+Create Date: 2026-10-16 15:21:43.107392
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "d2a7f35b8c14"
+down_revision: str | None = "c4d81a6e92b5"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("feeds", sa.Column("etag", sa.String(length=500), nullable=True))
+    op.add_column("feeds", sa.Column("last_modified", sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("feeds", "last_modified")
+    op.drop_column("feeds", "etag")
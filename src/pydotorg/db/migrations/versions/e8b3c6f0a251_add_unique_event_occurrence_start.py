@@ -0,0 +1,41 @@
+"""add_unique_event_occurrence_start
+
+Revision ID: e8b3c6f0a251
+Revises: d2a7f35b8c14
+Create Date: 2026-10-16 16:40:05.281937
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "e8b3c6f0a251"
+down_revision: str | None = "d2a7f35b8c14"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Keep one occurrence per (event, start) before enforcing uniqueness; the sync tasks upsert on it.
+    op.execute(
+        """
+        DELETE FROM event_occurrences a
+        USING event_occurrences b
+        WHERE a.event_id = b.event_id AND a.dt_start = b.dt_start AND a.id > b.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_event_occurrences_event_start",
+        "event_occurrences",
+        ["event_id", "dt_start"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_event_occurrences_event_start", "event_occurrences", type_="unique")
@@ -11,6 +11,7 @@ from litestar.response import Redirect, Response, Template
 from litestar.stores.redis import RedisStore
 
 from pydotorg.core.auth.guards import require_staff
+from pydotorg.core.auth.password import password_service
 from pydotorg.domains.admin import urls
 from pydotorg.lib.tasks import enqueue_task
 
@@ -67,7 +68,7 @@ class AdminSettingsController(Controller):
         """Render cache management page with live stats.
 
         Returns:
-            Cache management template with Redis stats
+            Cache management template with Redis stats and this process's password hashing pool stats
         """
         cache_stats = await self._get_cache_stats(request)
         return Template(
@@ -76,6 +77,7 @@ class AdminSettingsController(Controller):
                 "title": "Cache Management",
                 "description": "View cache statistics and clear cached data",
                 "stats": cache_stats,
+                "password_hashing": password_service.stats(),
             },
         )
 
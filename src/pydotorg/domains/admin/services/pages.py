@@ -133,7 +133,7 @@ class PageAdminService:
         await self.session.refresh(page)
 
         await enqueue_task("index_page", page_id=str(page.id))
-        await enqueue_task("invalidate_page_response_cache", page_path=page.path)
+        await enqueue_task("invalidate_page_response_cache", page_path=page.path, page_id=str(page.id))
 
         return page
 
@@ -155,7 +155,7 @@ class PageAdminService:
         await self.session.refresh(page)
 
         await enqueue_task("index_page", page_id=str(page.id))
-        await enqueue_task("invalidate_page_response_cache", page_path=page.path)
+        await enqueue_task("invalidate_page_response_cache", page_path=page.path, page_id=str(page.id))
 
         return page
 
@@ -216,6 +216,6 @@ class PageAdminService:
         await self.session.commit()
 
         await enqueue_task("remove_page_from_index", page_id=str(page_id))
-        await enqueue_task("invalidate_page_response_cache", page_path=page_path)
+        await enqueue_task("invalidate_page_response_cache", page_path=page_path, page_id=str(page_id))
 
         return True
@@ -0,0 +1,147 @@
+"""Concurrent, conditional HTTP fetching of blog feeds.
+
+A :class:`FeedFetcher` is one :class:`~pydotorg.lib.http.BoundedHTTPClient` for
+a whole refresh run. Fetches are bounded by ``settings.feed_fetch_concurrency``
+overall and by ``settings.feed_fetch_per_host`` per host, so one slow or
+rate-limited host cannot hold every slot. Requests carry the ``ETag`` and ``Last-Modified``
+validators stored on the :class:`~pydotorg.domains.blogs.models.Feed`, so an
+unchanged feed costs a ``304`` and no parsing. Parsing runs in a worker thread,
+off the event loop.
+
+Fetching never touches the database; persisting results is left to
+:meth:`~pydotorg.domains.blogs.services.FeedService.store_feed`, which callers
+run one feed at a time on their session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID  # noqa: TC003 - dataclass field type
+
+import feedparser
+import httpx
+
+from pydotorg.config import settings
+from pydotorg.lib.http import BoundedHTTPClient
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from pydotorg.domains.blogs.models import Feed
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "pydotorg-feed-aggregator (+https://www.python.org)"
+
+
+@dataclass(slots=True)
+class FetchedFeed:
+    """Result of fetching one feed.
+
+    ``entries`` holds ``BlogEntry`` column values (without ``feed_id``) and is
+    empty when the server answered ``304 Not Modified``.
+    """
+
+    feed_id: UUID
+    not_modified: bool = False
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def parse_feed(content: bytes) -> list[dict[str, Any]]:
+    """Parse a feed document into ``BlogEntry`` column values.
+
+    CPU-bound; :class:`FeedFetcher` runs it in a worker thread.
+    """
+    parsed = feedparser.parse(content)
+    if parsed.bozo:
+        logger.warning(f"Feed has errors: {parsed.bozo_exception}")
+
+    entries = []
+    for entry in parsed.entries:
+        link = getattr(entry, "link", None)
+        guid = getattr(entry, "id", link)
+        if not guid or not link:
+            continue
+        pub_date_struct = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
+        entries.append(
+            {
+                "title": getattr(entry, "title", "Untitled"),
+                "summary": getattr(entry, "summary", None),
+                "content": entry.content[0].get("value") if getattr(entry, "content", None) else None,
+                "url": link,
+                "pub_date": datetime(*pub_date_struct[:6], tzinfo=UTC) if pub_date_struct else datetime.now(UTC),
+                "guid": guid,
+            }
+        )
+    return entries
+
+
+class FeedFetcher(BoundedHTTPClient):
+    """Shared HTTP client and concurrency limits for fetching many feeds.
+
+    Example:
+        >>> async with FeedFetcher() as fetcher:
+        ...     results = await asyncio.gather(*(fetcher.fetch(feed) for feed in feeds))
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = settings.feed_fetch_concurrency,
+        per_host: int = settings.feed_fetch_per_host,
+        timeout: float = settings.feed_fetch_timeout,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            concurrency: Maximum feeds fetched at once.
+            per_host: Maximum concurrent requests to one host.
+            timeout: Request timeout in seconds.
+            transport: Custom transport, mainly for tests.
+        """
+        super().__init__(
+            concurrency=concurrency,
+            timeout=timeout,
+            per_host=per_host,
+            headers={"User-Agent": USER_AGENT},
+            transport=transport,
+        )
+
+    def fetch(self, feed: Feed) -> Coroutine[Any, Any, FetchedFeed]:
+        """Return a coroutine fetching ``feed``, conditionally if it has stored validators.
+
+        The feed's attributes are read when this is called, so the coroutine can
+        run while the session that loaded ``feed`` commits other work.
+        """
+        return self._fetch(feed.id, feed.feed_url, etag=feed.etag, last_modified=feed.last_modified)
+
+    async def _fetch(self, feed_id: UUID, url: str, *, etag: str | None, last_modified: str | None) -> FetchedFeed:
+        """Fetch and parse one feed URL.
+
+        Raises:
+            httpx.HTTPError: If the request fails or the server answers with an error status.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = await self.get(url, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return FetchedFeed(feed_id=feed_id, not_modified=True, etag=etag, last_modified=last_modified)
+
+        entries = await asyncio.to_thread(parse_feed, response.content)
+        return FetchedFeed(
+            feed_id=feed_id,
+            entries=entries,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
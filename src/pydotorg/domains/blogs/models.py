@@ -28,6 +28,8 @@ class Feed(AuditBase):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
     is_official: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
     priority: Mapped[int] = mapped_column(default=0, index=True)
+    etag: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
     entries: Mapped[list[BlogEntry]] = relationship(
         "BlogEntry",
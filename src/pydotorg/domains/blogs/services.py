@@ -6,10 +6,10 @@ import logging
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-import feedparser
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
-from sqlalchemy import select
+from sqlalchemy import select, update
 
+from pydotorg.domains.blogs.fetcher import FeedFetcher
 from pydotorg.domains.blogs.models import BlogEntry, Feed, FeedAggregate, RelatedBlog
 from pydotorg.domains.blogs.repositories import (
     BlogEntryRepository,
@@ -22,6 +22,8 @@ from pydotorg.lib.tasks import enqueue_task
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from pydotorg.domains.blogs.fetcher import FetchedFeed
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,72 +66,74 @@ class FeedService(SQLAlchemyAsyncRepositoryService[Feed]):
         """
         return await self.repository.get_feeds_needing_update(cutoff_time=cutoff_time, limit=limit)
 
-    async def fetch_feed(self, feed: Feed) -> list[BlogEntry]:
+    async def fetch_feed(self, feed: Feed, fetcher: FeedFetcher | None = None) -> list[BlogEntry]:
         """Fetch and parse a feed, creating or updating blog entries.
 
         Args:
             feed: The feed to fetch.
+            fetcher: Shared fetcher to use; a single-use one is created if omitted.
 
         Returns:
-            List of blog entries created or updated.
+            List of blog entries created or updated (empty if the feed is unchanged).
         """
         try:
-            parsed = feedparser.parse(feed.feed_url)
-
-            if parsed.bozo:
-                logger.warning(f"Feed {feed.name} has errors: {parsed.bozo_exception}")
-
-            entries = []
-            for entry in parsed.entries:
-                guid = getattr(entry, "id", entry.link)
-                pub_date_struct = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
-
-                pub_date = datetime(*pub_date_struct[:6], tzinfo=UTC) if pub_date_struct else datetime.now(UTC)
-
-                entry_data = {
-                    "feed_id": feed.id,
-                    "title": getattr(entry, "title", "Untitled"),
-                    "summary": getattr(entry, "summary", None),
-                    "content": getattr(entry, "content", [{}])[0].get("value") if hasattr(entry, "content") else None,
-                    "url": entry.link,
-                    "pub_date": pub_date,
-                    "guid": guid,
-                }
-
-                try:
-                    existing_entry = await self.repository.session.scalar(
-                        select(BlogEntry).where(BlogEntry.guid == guid)
-                    )
-
-                    if existing_entry:
-                        for key, value in entry_data.items():
-                            if key not in {"feed_id", "guid"}:
-                                setattr(existing_entry, key, value)
-                        entries.append(existing_entry)
-                    else:
-                        new_entry = BlogEntry(**entry_data)
-                        self.repository.session.add(new_entry)
-                        entries.append(new_entry)
-
-                except Exception:
-                    logger.exception(f"Error processing entry {guid}")
-                    continue
-
-            feed.last_fetched = datetime.now(UTC)
-            await self.repository.update(feed)
-            await self.repository.session.commit()
-
-            for entry in entries:
-                await self.repository.session.refresh(entry)
-                index_key = await enqueue_task("index_blog_entry", entry_id=str(entry.id))
-                if not index_key:
-                    logger.warning(f"Failed to enqueue search indexing for blog entry {entry.id}")
-
+            if fetcher is None:
+                async with FeedFetcher() as single_use_fetcher:
+                    fetched = await single_use_fetcher.fetch(feed)
+            else:
+                fetched = await fetcher.fetch(feed)
+            return await self.store_feed(fetched)
         except Exception:
             logger.exception(f"Error fetching feed {feed.name}")
             return []
-        else:
-            return entries
+
+    async def store_feed(self, fetched: FetchedFeed) -> list[BlogEntry]:
+        """Persist a fetched feed, creating or updating its blog entries.
+
+        Only ``fetched`` is read, never the ``Feed`` instance, so feeds loaded
+        before an earlier commit can be stored without reloading them.
+
+        Args:
+            fetched: Result of :meth:`FeedFetcher.fetch`.
+
+        Returns:
+            List of blog entries created or updated (empty if the feed is unchanged).
+        """
+        session = self.repository.session
+        stored: dict[str, BlogEntry] = {}
+        if fetched.entries:
+            guids = [entry_data["guid"] for entry_data in fetched.entries]
+            existing = {
+                entry.guid: entry for entry in await session.scalars(select(BlogEntry).where(BlogEntry.guid.in_(guids)))
+            }
+            for entry_data in fetched.entries:
+                guid = entry_data["guid"]
+                entry = stored.get(guid) or existing.get(guid)
+                if entry is None:
+                    entry = BlogEntry(feed_id=fetched.feed_id, **entry_data)
+                    session.add(entry)
+                else:
+                    for key, value in entry_data.items():
+                        if key != "guid":
+                            setattr(entry, key, value)
+                stored[guid] = entry
+
+        await session.execute(
+            update(Feed)
+            .where(Feed.id == fetched.feed_id)
+            .values(last_fetched=datetime.now(UTC), etag=fetched.etag, last_modified=fetched.last_modified)
+        )
+        await session.flush()
+        entries = list(stored.values())
+        entry_ids = [entry.id for entry in entries]
+        await session.commit()
+
+        for entry_id in entry_ids:
+            index_key = await enqueue_task("index_blog_entry", entry_id=str(entry_id))
+            if not index_key:
+                logger.warning(f"Failed to enqueue search indexing for blog entry {entry_id}")
+
+        return entries
 
     async def mark_feed_as_updated(self, feed_id: UUID) -> Feed:
         """Mark a feed as updated.
@@ -11,9 +11,11 @@ from litestar import Controller, delete, get, post, put
 from litestar.exceptions import NotFoundException
 from litestar.params import Body, Parameter
 from litestar.response import Template
-from litestar.stores.redis import RedisStore
 
-from pydotorg.domains.downloads.models import PythonVersion
+from pydotorg.core.database.projections import schema_load
+from pydotorg.core.release_file_index import release_file_index
+from pydotorg.core.release_tree import release_tree
+from pydotorg.domains.downloads.models import PythonVersion, Release
 from pydotorg.domains.downloads.schemas import (
     OSCreate,
     OSRead,
@@ -179,7 +181,7 @@ class ReleaseController(Controller):
         Returns:
             List of releases with version and status information.
         """
-        releases, _total = await release_service.list_and_count(limit_offset)
+        releases, _total = await release_service.list_and_count(limit_offset, load=schema_load(Release, ReleaseList))
         return [ReleaseList.model_validate(release) for release in releases]
 
     @get("/{release_id:uuid}")
@@ -308,7 +310,9 @@ class ReleaseController(Controller):
         Returns:
             List of published releases sorted by release date.
         """
-        releases = await release_service.get_published(limit=limit, offset=offset)
+        releases = await release_service.get_published(
+            limit=limit, offset=offset, load=schema_load(Release, ReleaseList)
+        )
         return [ReleaseList.model_validate(release) for release in releases]
 
     @get("/download-page")
@@ -329,7 +333,7 @@ class ReleaseController(Controller):
         Returns:
             List of releases suitable for the downloads page.
         """
-        releases = await release_service.get_for_download_page(limit=limit)
+        releases = await release_service.get_for_download_page(limit=limit, load=schema_load(Release, ReleaseList))
         return [ReleaseList.model_validate(release) for release in releases]
 
     @post("/")
@@ -353,7 +357,11 @@ class ReleaseController(Controller):
         Raises:
             ConflictError: If a release with the same slug exists.
         """
-        release = await release_service.create(data.model_dump())
+        payload = data.model_dump()
+        is_latest = payload.pop("is_latest", False)
+        release = await release_service.create(payload)
+        if is_latest:
+            release = await release_service.mark_as_latest(release.id, release.version)
         return ReleaseRead.model_validate(release)
 
     @put("/{release_id:uuid}")
@@ -380,7 +388,12 @@ class ReleaseController(Controller):
             NotFoundException: If no release with the given ID exists.
         """
         update_data = data.model_dump(exclude_unset=True)
+        is_latest = update_data.get("is_latest") is True
+        if is_latest:
+            del update_data["is_latest"]
         release = await release_service.update(update_data, item_id=release_id)
+        if is_latest:
+            release = await release_service.mark_as_latest(release.id, release.version)
         return ReleaseRead.model_validate(release)
 
     @delete("/{release_id:uuid}")
@@ -551,18 +564,20 @@ class ReleaseFileController(Controller):
     @post("/{file_id:uuid}/track")
     async def track_download(
         self,
-        request: Request,
         release_file_service: ReleaseFileService,
+        download_stats_service: DownloadStatsService,
         file_id: Annotated[UUID, Parameter(title="File ID", description="The file ID")],
     ) -> dict:
         """Track a download event for a release file.
 
         Records a download event in Redis for analytics tracking.
         This endpoint is typically called when a user clicks a download link.
+        The file is looked up in the per-process release file index, so known
+        files cost no database query.
 
         Args:
-            request: The current HTTP request.
             release_file_service: Service for release file database operations.
+            download_stats_service: Service for download counters in Redis.
             file_id: The unique UUID identifier of the file being downloaded.
 
         Returns:
@@ -571,25 +586,13 @@ class ReleaseFileController(Controller):
         Raises:
             NotFoundException: If no file with the given ID exists.
         """
-        file = await release_file_service.get(file_id)
-        if not file:
+        release_id = await release_file_index.resolve(file_id, release_file_service.repository.session)
+        if release_id is None:
             raise NotFoundException(f"File with ID {file_id} not found")
 
-        try:
-            store = request.app.stores.get("response_cache")
-            if store and isinstance(store, RedisStore):
-                redis = store._redis
-                stats_service = DownloadStatsService(redis)
-                await stats_service.track_download(
-                    file_id=str(file_id),
-                    release_id=str(file.release_id) if file.release_id else None,
-                )
-                return {"success": True, "file_id": str(file_id)}
-        except Exception as e:
-            logger.exception(f"Failed to track download for file {file_id}")
-            return {"success": False, "error": str(e)}
-
-        return {"success": False, "error": "Redis not available"}
+        if not await download_stats_service.track_downloads([(str(file_id), str(release_id))]):
+            return {"success": False, "error": "Failed to record download"}
+        return {"success": True, "file_id": str(file_id)}
 
 
 class DownloadsPageController(Controller):
@@ -599,18 +602,16 @@ class DownloadsPageController(Controller):
     include_in_schema = False
 
     @get("/")
-    async def downloads_index(self, release_service: ReleaseService) -> Template:
-        """Render the main downloads page."""
-        latest_python3 = await release_service.get_latest(PythonVersion.PYTHON3)
-        latest_python2 = await release_service.get_latest(PythonVersion.PYTHON2)
-        grouped_releases = await release_service.get_releases_grouped_by_minor_version()
+    async def downloads_index(self, request: Request) -> Template:
+        """Render the main downloads page from the per-process release tree."""
+        tree = await release_tree.get(request.app)
 
         return Template(
             template_name="downloads/index.html.jinja2",
             context={
-                "latest_python3": latest_python3,
-                "latest_python2": latest_python2,
-                "grouped_releases": grouped_releases,
+                "latest_python3": tree.latest.get(PythonVersion.PYTHON3),
+                "latest_python2": tree.latest.get(PythonVersion.PYTHON2),
+                "grouped_releases": tree.grouped,
             },
         )
 
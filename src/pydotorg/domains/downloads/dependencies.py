@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pydotorg.core.redis import get_redis
 from pydotorg.domains.downloads.repositories import OSRepository, ReleaseFileRepository, ReleaseRepository
 from pydotorg.domains.downloads.services import OSService, ReleaseFileService, ReleaseService
+from pydotorg.tasks.downloads import DownloadStatsService
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -41,6 +43,11 @@ async def provide_release_file_service(db_session: AsyncSession) -> ReleaseFileS
     return ReleaseFileService(session=db_session)
 
 
+async def provide_download_stats_service() -> DownloadStatsService:
+    """Provide a DownloadStatsService on the shared Redis connection pool."""
+    return DownloadStatsService(get_redis())
+
+
 def get_downloads_dependencies() -> dict:
     """Get all downloads domain dependency providers."""
     return {
@@ -50,4 +57,5 @@ def get_downloads_dependencies() -> dict:
         "release_service": provide_release_service,
         "release_file_repository": provide_release_file_repository,
         "release_file_service": provide_release_file_service,
+        "download_stats_service": provide_download_stats_service,
     }
@@ -7,10 +7,28 @@ from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import BigInteger, Boolean, Date, Enum, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from pydotorg.core.database.base import AuditBase, ContentManageableMixin, NameSlugMixin, UUIDAuditBase
+from pydotorg.core.database.base import (
+    AuditBase,
+    ContentManageableMixin,
+    NameSlugMixin,
+    RenderedContentMixin,
+    UUIDAuditBase,
+)
 
 if TYPE_CHECKING:
     from pydotorg.domains.pages.models import Page
@@ -40,8 +58,89 @@ class OS(AuditBase, ContentManageableMixin, NameSlugMixin):
     )
 
 
-class Release(AuditBase, ContentManageableMixin, NameSlugMixin):
+def parse_major_version(name: str) -> str:
+    """Extract the major version (e.g., '3' from '3.12.1') from a release name.
+
+    Returns:
+        Major version string, or ``name`` if it does not start with one.
+    """
+    major = name.split(".")[0].lstrip("Python ").strip()
+    return major if major.isdigit() else name
+
+
+def parse_minor_version(name: str) -> str:
+    """Extract the minor version (e.g., '3.12' from '3.12.1') from a release name.
+
+    Returns:
+        Minor version string, or ``name`` if it does not start with one.
+    """
+    parts = name.split(".")
+    if len(parts) >= 2:
+        major = parts[0].lstrip("Python ").strip()
+        if major.isdigit() and parts[1].isdigit():
+            return f"{major}.{parts[1]}"
+    return name
+
+
+class ReleaseStatusMixin:
+    """Status properties shared by :class:`Release` and its cached summaries."""
+
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        status: ReleaseStatus
+        pre_release: bool
+        eol_date: datetime.date | None
+
+    @property
+    def is_eol(self) -> bool:
+        """Check if this release series has reached end of life.
+
+        Returns:
+            True if status is EOL or eol_date has passed.
+        """
+        if self.status == ReleaseStatus.EOL:
+            return True
+        return bool(self.eol_date and self.eol_date < datetime.datetime.now(tz=datetime.UTC).date())
+
+    @property
+    def is_prerelease(self) -> bool:
+        """Check if this is a pre-release version (alpha, beta, RC).
+
+        Returns:
+            True if status is prerelease or pre_release flag is set.
+        """
+        return self.pre_release or self.status == ReleaseStatus.PRERELEASE
+
+    @property
+    def status_label(self) -> str:
+        """Get human-readable status label.
+
+        Returns:
+            Status label string.
+        """
+        if self.is_eol:
+            return "End of Life"
+        if self.is_prerelease:
+            return "Pre-release"
+        if self.status == ReleaseStatus.SECURITY:
+            return "Security"
+        if self.status == ReleaseStatus.BUGFIX:
+            return "Active"
+        return self.status.value.title()
+
+
+class Release(AuditBase, ContentManageableMixin, NameSlugMixin, RenderedContentMixin, ReleaseStatusMixin):
     __tablename__ = "releases"
+    __table_args__ = (
+        Index(
+            "uq_releases_latest_per_version",
+            "version",
+            unique=True,
+            postgresql_where=text("is_latest"),
+            sqlite_where=text("is_latest"),
+        ),
+    )
 
     version: Mapped[PythonVersion] = mapped_column(
         Enum(PythonVersion, values_callable=lambda x: [e.value for e in x]),
@@ -100,16 +199,7 @@ class Release(AuditBase, ContentManageableMixin, NameSlugMixin):
         Returns:
             Minor version string or full name if parsing fails.
         """
-        try:
-            parts = self.name.split(".")
-            if len(parts) >= 2:
-                major = parts[0].lstrip("Python ").strip()
-                minor = parts[1]
-                if major.isdigit() and minor.isdigit():
-                    return f"{major}.{minor}"
-        except (ValueError, IndexError):
-            pass  # Fall through to return full name as fallback
-        return self.name
+        return parse_minor_version(self.name)
 
     @property
     def major_version(self) -> str:
@@ -118,52 +208,7 @@ class Release(AuditBase, ContentManageableMixin, NameSlugMixin):
         Returns:
             Major version string or full name if parsing fails.
         """
-        try:
-            parts = self.name.split(".")
-            if len(parts) >= 1:
-                major = parts[0].lstrip("Python ").strip()
-                if major.isdigit():
-                    return major
-        except (ValueError, IndexError):
-            pass  # Fall through to return full name as fallback
-        return self.name
-
-    @property
-    def is_eol(self) -> bool:
-        """Check if this release series has reached end of life.
-
-        Returns:
-            True if status is EOL or eol_date has passed.
-        """
-        if self.status == ReleaseStatus.EOL:
-            return True
-        return bool(self.eol_date and self.eol_date < datetime.datetime.now(tz=datetime.UTC).date())
-
-    @property
-    def is_prerelease(self) -> bool:
-        """Check if this is a pre-release version (alpha, beta, RC).
-
-        Returns:
-            True if status is prerelease or pre_release flag is set.
-        """
-        return self.pre_release or self.status == ReleaseStatus.PRERELEASE
-
-    @property
-    def status_label(self) -> str:
-        """Get human-readable status label.
-
-        Returns:
-            Status label string.
-        """
-        if self.is_eol:
-            return "End of Life"
-        if self.is_prerelease:
-            return "Pre-release"
-        if self.status == ReleaseStatus.SECURITY:
-            return "Security"
-        if self.status == ReleaseStatus.BUGFIX:
-            return "Active"
-        return self.status.value.title()
+        return parse_major_version(self.name)
 
     def files_for_os(self, os_slug: str) -> list[ReleaseFile]:
         return [f for f in self.files if f.os.slug == os_slug]
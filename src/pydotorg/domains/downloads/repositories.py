@@ -5,13 +5,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from pydotorg.domains.downloads.models import OS, PythonVersion, Release, ReleaseFile
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from uuid import UUID
 
+    from sqlalchemy.orm.interfaces import ORMOption
+
 
 class OSRepository(SQLAlchemyAsyncRepository[OS]):
     """Repository for OS database operations."""
@@ -72,12 +75,15 @@ class ReleaseRepository(SQLAlchemyAsyncRepository[Release]):
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
-    async def get_published(self, limit: int = 100, offset: int = 0) -> list[Release]:
+    async def get_published(
+        self, limit: int = 100, offset: int = 0, *, load: Sequence[ORMOption] = ()
+    ) -> list[Release]:
         """Get all published releases.
 
         Args:
             limit: Maximum number of releases to return.
             offset: Number of releases to skip.
+            load: Loader options for the query, e.g. from :func:`~pydotorg.core.database.projections.schema_load`.
 
         Returns:
             List of published releases ordered by release date descending.
@@ -88,15 +94,17 @@ class ReleaseRepository(SQLAlchemyAsyncRepository[Release]):
             .order_by(Release.release_date.desc())
             .limit(limit)
             .offset(offset)
+            .options(*load)
         )
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
-    async def get_for_download_page(self, limit: int = 100) -> list[Release]:
+    async def get_for_download_page(self, limit: int = 100, *, load: Sequence[ORMOption] = ()) -> list[Release]:
         """Get releases marked to show on the download page.
 
         Args:
             limit: Maximum number of releases to return.
+            load: Loader options for the query, e.g. from :func:`~pydotorg.core.database.projections.schema_load`.
 
         Returns:
             List of releases for download page ordered by release date descending.
@@ -109,6 +117,7 @@ class ReleaseRepository(SQLAlchemyAsyncRepository[Release]):
             )
             .order_by(Release.release_date.desc())
             .limit(limit)
+            .options(*load)
         )
         result = await self.session.execute(statement)
         return list(result.scalars().all())
@@ -132,6 +141,30 @@ class ReleaseRepository(SQLAlchemyAsyncRepository[Release]):
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
+    async def set_latest(self, release_id: UUID, version: PythonVersion) -> bool:
+        """Make a release the only latest release of its Python version.
+
+        Runs two set-based UPDATEs instead of one per release. The partial unique
+        index ``uq_releases_latest_per_version`` is checked row by row, so the
+        previous latest release is cleared before the new one is set.
+
+        Args:
+            release_id: The release to mark as latest.
+            version: The Python version whose latest release changes.
+
+        Returns:
+            True if the release was marked, False if it is not a release of ``version``.
+        """
+        await self.session.execute(
+            update(Release)
+            .where(Release.version == version, Release.is_latest.is_(True), Release.id != release_id)
+            .values(is_latest=False)
+        )
+        result = await self.session.execute(
+            update(Release).where(Release.id == release_id, Release.version == version).values(is_latest=True)
+        )
+        return bool(result.rowcount)
+
 
 class ReleaseFileRepository(SQLAlchemyAsyncRepository[ReleaseFile]):
     """Repository for ReleaseFile database operations."""
@@ -6,12 +6,20 @@ from typing import TYPE_CHECKING
 
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
 
+from pydotorg.core.cache.store import domain_tag, path_tag
+from pydotorg.core.release_tree import mark_releases_changed
 from pydotorg.domains.downloads.models import OS, PythonVersion, Release, ReleaseFile
 from pydotorg.domains.downloads.repositories import OSRepository, ReleaseFileRepository, ReleaseRepository
+from pydotorg.lib.tasks import enqueue_task
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from uuid import UUID
 
+    from sqlalchemy.orm.interfaces import ORMOption
+
+DOWNLOADS_PATH = "/downloads/"
+
 
 class OSService(SQLAlchemyAsyncRepositoryService[OS]):
     """Service for OS business logic."""
@@ -59,28 +67,32 @@ class ReleaseService(SQLAlchemyAsyncRepositoryService[Release]):
         """
         return await self.repository.get_latest(version)
 
-    async def get_published(self, limit: int = 100, offset: int = 0) -> list[Release]:
+    async def get_published(
+        self, limit: int = 100, offset: int = 0, *, load: Sequence[ORMOption] = ()
+    ) -> list[Release]:
         """Get all published releases.
 
         Args:
             limit: Maximum number of releases to return.
             offset: Number of releases to skip.
+            load: Loader options for the query.
 
         Returns:
             List of published releases.
         """
-        return await self.repository.get_published(limit=limit, offset=offset)
+        return await self.repository.get_published(limit=limit, offset=offset, load=load)
 
-    async def get_for_download_page(self, limit: int = 100) -> list[Release]:
+    async def get_for_download_page(self, limit: int = 100, *, load: Sequence[ORMOption] = ()) -> list[Release]:
         """Get releases marked to show on the download page.
 
         Args:
             limit: Maximum number of releases to return.
+            load: Loader options for the query.
 
         Returns:
             List of releases for download page.
         """
-        return await self.repository.get_for_download_page(limit=limit)
+        return await self.repository.get_for_download_page(limit=limit, load=load)
 
     async def get_by_version(self, version: PythonVersion, limit: int = 100) -> list[Release]:
         """Get all releases for a specific Python version.
@@ -166,7 +178,8 @@ class ReleaseService(SQLAlchemyAsyncRepositoryService[Release]):
     async def mark_as_latest(self, release_id: UUID, version: PythonVersion) -> Release:
         """Mark a release as the latest for its Python version.
 
-        This will unmark any other releases as latest for the same version.
+        This will unmark any other releases as latest for the same version,
+        commit, and invalidate the cached download pages and homepage.
 
         Args:
             release_id: The release ID to mark as latest.
@@ -175,13 +188,14 @@ class ReleaseService(SQLAlchemyAsyncRepositoryService[Release]):
         Returns:
             The updated release instance.
         """
-        all_releases = await self.repository.get_by_version(version, limit=1000)
-        for release in all_releases:
-            if release.id == release_id:
-                release.is_latest = True
-            else:
-                release.is_latest = False
-            await self.repository.update(release)
+        await self.repository.set_latest(release_id, version)
+        mark_releases_changed(self.repository.session, [release_id])
+        await self.repository.session.commit()
+
+        await enqueue_task(
+            "invalidate_page_response_cache",
+            tags=[path_tag("/"), domain_tag(DOWNLOADS_PATH)],
+        )
 
         return await self.get(release_id)
 
@@ -14,8 +14,10 @@ from litestar.openapi import ResponseSpec
 from litestar.params import Body, Parameter
 from litestar.response import Response, Template
 
+from pydotorg.core.database.projections import schema_load
 from pydotorg.core.feeds import AtomFeedService, RSSFeedService
 from pydotorg.core.ical import ICalendarService
+from pydotorg.domains.events.models import Event
 from pydotorg.domains.events.schemas import (
     CalendarCreate,
     CalendarRead,
@@ -518,7 +520,7 @@ class EventController(Controller):
         Returns:
             List of events with summary information.
         """
-        events, _total = await event_service.list_and_count(limit_offset)
+        events, _total = await event_service.list_and_count(limit_offset, load=schema_load(Event, EventList))
         return [EventList.model_validate(event) for event in events]
 
     @get(
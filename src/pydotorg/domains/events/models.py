@@ -7,7 +7,18 @@ from enum import IntEnum
 from uuid import UUID
 
 from dateutil.rrule import DAILY, MONTHLY, WEEKLY, YEARLY
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Interval, SmallInteger, String, Table, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Interval,
+    SmallInteger,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from pydotorg.core.database.base import AuditBase, Base, ContentManageableMixin, NameSlugMixin
@@ -114,6 +125,7 @@ class Event(AuditBase, ContentManageableMixin, NameSlugMixin):
 
 class EventOccurrence(Base):
     __tablename__ = "event_occurrences"
+    __table_args__ = (UniqueConstraint("event_id", "dt_start", name="uq_event_occurrences_event_start"),)
 
     event_id: Mapped[UUID] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"))
     dt_start: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), index=True)
@@ -14,7 +14,8 @@ from litestar.response import Template
 from litestar.status_codes import HTTP_200_OK
 
 from pydotorg.core.auth.guards import require_authenticated, require_staff
-from pydotorg.domains.jobs.models import JobStatus
+from pydotorg.core.database.projections import schema_load
+from pydotorg.domains.jobs.models import Job, JobStatus
 from pydotorg.domains.jobs.schemas import (
     JobCategoryCreate,
     JobCategoryRead,
@@ -346,11 +347,14 @@ class JobController(Controller):
         Returns:
             List of job postings with full details.
         """
+        load = schema_load(Job, JobRead)
         if status:
-            jobs = await job_service.list_by_status(status, limit=limit_offset.limit, offset=limit_offset.offset)
+            jobs = await job_service.list_by_status(
+                status, limit=limit_offset.limit, offset=limit_offset.offset, load=load
+            )
             return [JobRead.model_validate(job) for job in jobs]
 
-        jobs, _total = await job_service.list_and_count(limit_offset)
+        jobs, _total = await job_service.list_and_count(limit_offset, load=load)
         return [JobRead.model_validate(job) for job in jobs]
 
     @get("/mine", guards=[require_authenticated])
@@ -11,8 +11,11 @@ from sqlalchemy import select
 from pydotorg.domains.jobs.models import Job, JobCategory, JobReviewComment, JobStatus, JobType
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from uuid import UUID
 
+    from sqlalchemy.orm.interfaces import ORMOption
+
 
 class JobTypeRepository(SQLAlchemyAsyncRepository[JobType]):
     """Repository for JobType database operations."""
@@ -97,6 +100,8 @@ class JobRepository(SQLAlchemyAsyncRepository[Job]):
         status: JobStatus,
         limit: int = 100,
         offset: int = 0,
+        *,
+        load: Sequence[ORMOption] = (),
     ) -> list[Job]:
         """List jobs by status.
 
@@ -104,11 +109,19 @@ class JobRepository(SQLAlchemyAsyncRepository[Job]):
             status: The job status to filter by.
             limit: Maximum number of jobs to return.
             offset: Number of jobs to skip.
+            load: Loader options for the query, e.g. from :func:`~pydotorg.core.database.projections.schema_load`.
 
         Returns:
             List of jobs with the specified status.
         """
-        statement = select(Job).where(Job.status == status).order_by(Job.created_at.desc()).limit(limit).offset(offset)
+        statement = (
+            select(Job)
+            .where(Job.status == status)
+            .order_by(Job.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+            .options(*load)
+        )
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
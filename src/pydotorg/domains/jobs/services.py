@@ -19,8 +19,11 @@ from pydotorg.domains.jobs.repositories import (
 from pydotorg.lib.tasks import enqueue_task
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from uuid import UUID
 
+    from sqlalchemy.orm.interfaces import ORMOption
+
     from pydotorg.domains.jobs.schemas import JobCreate, JobSearchFilters
 
 logger = logging.getLogger(__name__)
@@ -161,6 +164,8 @@ class JobService(SQLAlchemyAsyncRepositoryService[Job]):
         status: JobStatus,
         limit: int = 100,
         offset: int = 0,
+        *,
+        load: Sequence[ORMOption] = (),
     ) -> list[Job]:
         """List jobs by status.
 
@@ -168,11 +173,12 @@ class JobService(SQLAlchemyAsyncRepositoryService[Job]):
             status: The job status to filter by.
             limit: Maximum number of jobs to return.
             offset: Number of jobs to skip.
+            load: Loader options for the query.
 
         Returns:
             List of jobs with the specified status.
         """
-        return await self.repository.list_by_status(status, limit, offset)
+        return await self.repository.list_by_status(status, limit, offset, load=load)
 
     async def search_jobs(self, filters: JobSearchFilters, limit: int = 100, offset: int = 0) -> list[Job]:
         """Search jobs with filters.
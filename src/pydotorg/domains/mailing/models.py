@@ -3,22 +3,32 @@
 This module provides database-driven email templates that can be rendered
 with context variables using Jinja2. Templates can be managed via the admin
 interface and used for newsletters, notifications, and transactional emails.
+
+Compiling a template is far more expensive than rendering it, and a bulk send
+renders the same template once per recipient. Compiled templates are kept in
+:data:`email_template_cache`, an LRU keyed by template id, ``updated_at`` and
+field, so every caller in the process (the mailing service, the admin preview
+and the bulk email task) compiles each template revision once.
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any
 
 from jinja2 import Environment, TemplateSyntaxError, UndefinedError
 from sqlalchemy import Boolean, String, Text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
+from pydotorg.config import settings
 from pydotorg.core.database.base import AuditBase
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Hashable, Mapping
+
+    from jinja2 import Template
 
 
 class EmailTemplateType(StrEnum):
@@ -31,6 +41,70 @@ class EmailTemplateType(StrEnum):
     SYSTEM = "system"
 
 
+class CompiledTemplateCache:
+    """LRU of compiled Jinja2 templates.
+
+    Entries are keyed by ``(template id, updated_at, field)`` and also remember
+    their source, so a template edited in memory but not yet saved is compiled
+    afresh instead of served stale.
+
+    Example:
+        >>> cache = CompiledTemplateCache(max_entries=256)
+        >>> cache.get_template("Hello {{ name }}", key=("welcome", "subject")).render(name="Guido")
+        'Hello Guido'
+    """
+
+    def __init__(self, max_entries: int = settings.email_template_cache_size) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Compiled templates kept; least recently used are evicted first. ``0`` disables the cache.
+        """
+        self.max_entries = max_entries
+        self.environment = Environment(autoescape=True)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[str, Template]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_template(self, source: str, *, key: Hashable | None = None) -> Template:
+        """Return ``source`` compiled, compiling it only on a cache miss.
+
+        Args:
+            source: Jinja2 template source.
+            key: Cache key; without one the template is compiled and not cached.
+
+        Raises:
+            TemplateSyntaxError: If the template syntax is invalid.
+        """
+        entry = self._entries.get(key) if key is not None else None
+        if entry is not None and entry[0] == source:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        template = self.environment.from_string(source)
+        if key is not None and self.max_entries:
+            self._entries[key] = (source, template)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        """Drop every compiled template."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+email_template_cache = CompiledTemplateCache()
+
+
 class EmailTemplate(AuditBase):
     """Database-driven email template.
 
@@ -64,14 +138,12 @@ class EmailTemplate(AuditBase):
     content_html: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
 
-    _jinja_env: ClassVar[Environment | None] = None
-
-    @classmethod
-    def _get_jinja_env(cls) -> Environment:
-        """Get or create Jinja2 environment for template rendering."""
-        if cls._jinja_env is None:
-            cls._jinja_env = Environment(autoescape=True)
-        return cls._jinja_env
+    def _compile(self, field_name: str) -> Template:
+        """Return the compiled template for ``field_name`` from :data:`email_template_cache`."""
+        key = None
+        if self.id is not None and self.updated_at is not None:
+            key = (self.id, self.updated_at, field_name)
+        return email_template_cache.get_template(getattr(self, field_name), key=key)
 
     def render_subject(self, context: Mapping[str, Any] | None = None) -> str:
         """Render the email subject with context variables.
@@ -85,9 +157,7 @@ class EmailTemplate(AuditBase):
         Raises:
             TemplateSyntaxError: If template syntax is invalid
         """
-        env = self._get_jinja_env()
-        template = env.from_string(self.subject)
-        return template.render(context or {})
+        return self._compile("subject").render(context or {})
 
     def render_content_text(self, context: Mapping[str, Any] | None = None) -> str:
         """Render plain text email content with context variables.
@@ -103,9 +173,7 @@ class EmailTemplate(AuditBase):
         """
         if not self.content_text or self.content_text == "None":
             return ""
-        env = self._get_jinja_env()
-        template = env.from_string(self.content_text)
-        return template.render(context or {})
+        return self._compile("content_text").render(context or {})
 
     def render_content_html(self, context: Mapping[str, Any] | None = None) -> str | None:
         """Render HTML email content with context variables.
@@ -121,9 +189,7 @@ class EmailTemplate(AuditBase):
         """
         if not self.content_html or self.content_html == "None":
             return None
-        env = self._get_jinja_env()
-        template = env.from_string(self.content_html)
-        return template.render(context or {})
+        return self._compile("content_html").render(context or {})
 
     def validate_templates(self) -> list[str]:
         """Validate all template strings for syntax errors.
@@ -132,15 +198,13 @@ class EmailTemplate(AuditBase):
             List of error messages (empty if valid)
         """
         errors: list[str] = []
-        env = self._get_jinja_env()
 
         for field_name in ("subject", "content_text", "content_html"):
             content = getattr(self, field_name)
             if not content:
                 continue
             try:
-                template = env.from_string(content)
-                template.render({})
+                self._compile(field_name).render({})
             except TemplateSyntaxError as e:
                 errors.append(f"{field_name}: Template syntax error - {e}")
             except UndefinedError:
@@ -7,17 +7,19 @@ for actual SMTP delivery.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import TYPE_CHECKING, Any
 
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
+from aiosmtplib import SMTPException
 from jinja2 import TemplateSyntaxError, UndefinedError
 from sqlalchemy import select
 
 from pydotorg.config import settings
+from pydotorg.core.email.transport import smtp_pool
 from pydotorg.domains.mailing.models import EmailLog, EmailTemplate, EmailTemplateType
 from pydotorg.domains.mailing.repositories import EmailLogRepository, EmailTemplateRepository
 
@@ -260,27 +262,17 @@ class MailingService:
 
         return msg
 
-    def _send_smtp(self, msg: MIMEMultipart, to_addrs: list[str]) -> None:
-        """Send email via SMTP.
+    async def _send_smtp(self, msg: MIMEMultipart, to_addrs: list[str]) -> None:
+        """Send email over a pooled SMTP connection.
 
         Args:
             msg: The email message
             to_addrs: All recipient addresses (To, CC, BCC)
 
         Raises:
-            smtplib.SMTPException: If sending fails
+            aiosmtplib.SMTPException: If sending fails
         """
-        if self.use_tls:
-            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-            server.starttls()
-        else:
-            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-
-        if self.smtp_user and self.smtp_password:
-            server.login(self.smtp_user, self.smtp_password)
-
-        server.sendmail(self.from_email, to_addrs, msg.as_string())
-        server.quit()
+        await smtp_pool.send(msg, sender=self.from_email, recipients=to_addrs)
 
     async def send_email(
         self,
@@ -352,13 +344,13 @@ class MailingService:
             if bcc:
                 all_recipients.extend(bcc)
 
-            self._send_smtp(msg, all_recipients)
+            await self._send_smtp(msg, all_recipients)
 
             log.status = "sent"
             await self.log_service.update(log, auto_commit=True)
             logger.info("Email sent successfully to %s using template %s", to_email, template_name)
 
-        except smtplib.SMTPException as e:
+        except SMTPException as e:
             log.status = "failed"
             log.error_message = f"SMTP error: {e}"
             await self.log_service.update(log, auto_commit=True)
@@ -381,6 +373,10 @@ class MailingService:
     ) -> list[EmailLog]:
         """Send bulk emails using a database template.
 
+        The template is loaded once, every log is written in one commit, and the
+        messages are sent concurrently over pooled SMTP connections before the
+        final statuses are committed together.
+
         Args:
             template_name: Internal name of the template
             recipients: List of recipient email addresses
@@ -390,14 +386,73 @@ class MailingService:
         Returns:
             List of EmailLog entries
         """
-        logs = []
+        template = await self.template_service.get_active_by_name(template_name)
+        logs: list[EmailLog] = []
+        deliveries: list[tuple[EmailLog, MIMEMultipart, str]] = []
         for recipient in recipients:
             recipient_context = dict(context or {})
             if per_recipient_context and recipient in per_recipient_context:
                 recipient_context.update(per_recipient_context[recipient])
 
-            log = await self.send_email(template_name, recipient, recipient_context)
+            if not template:
+                logs.append(
+                    EmailLog(
+                        template_name=template_name,
+                        recipient_email=recipient,
+                        subject="[Template not found]",
+                        status="failed",
+                        error_message=f"Template '{template_name}' not found or inactive",
+                    )
+                )
+                continue
+
+            try:
+                subject = template.render_subject(recipient_context) or "[No Subject]"
+                text_content = template.render_content_text(recipient_context) or ""
+                html_content = template.render_content_html(recipient_context)
+            except (TemplateSyntaxError, UndefinedError) as e:
+                logs.append(
+                    EmailLog(
+                        template_name=template_name,
+                        recipient_email=recipient,
+                        subject="[Render error]",
+                        status="failed",
+                        error_message=f"Template render error: {e}",
+                    )
+                )
+                continue
+
+            log = EmailLog(template_name=template_name, recipient_email=recipient, subject=subject, status="pending")
             logs.append(log)
+            deliveries.append((log, self._create_message(recipient, subject, text_content, html_content), recipient))
+
+        self.session.add_all(logs)
+        await self.session.commit()
+
+        results = await asyncio.gather(
+            *(self._send_smtp(msg, [recipient]) for _log, msg, recipient in deliveries),
+            return_exceptions=True,
+        )
+        for (log, _msg, recipient), result in zip(deliveries, results, strict=True):
+            if isinstance(result, SMTPException):
+                log.status = "failed"
+                log.error_message = f"SMTP error: {result}"
+                logger.error("Failed to send email to %s", recipient, exc_info=result)
+            elif isinstance(result, OSError):
+                log.status = "failed"
+                log.error_message = f"Network error: {result}"
+                logger.error("Network error sending email to %s", recipient, exc_info=result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                log.status = "sent"
+        await self.session.commit()
+        logger.info(
+            "Bulk email using template %s: %d of %d sent",
+            template_name,
+            sum(1 for log in logs if log.status == "sent"),
+            len(logs),
+        )
 
         return logs
 
@@ -441,13 +496,13 @@ class MailingService:
             if bcc:
                 all_recipients.extend(bcc)
 
-            self._send_smtp(msg, all_recipients)
+            await self._send_smtp(msg, all_recipients)
 
             log.status = "sent"
             await self.log_service.update(log, auto_commit=True)
             logger.info("Custom email sent successfully to %s", to_email)
 
-        except (smtplib.SMTPException, OSError) as e:
+        except (SMTPException, OSError) as e:
             log.status = "failed"
             log.error_message = str(e)
             await self.log_service.update(log, auto_commit=True)
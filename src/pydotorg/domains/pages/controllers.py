@@ -11,6 +11,10 @@ from litestar.exceptions import NotFoundException
 from litestar.params import Body, Parameter
 from litestar.response import Template
 
+from pydotorg.core.cache.store import page_tag
+from pydotorg.core.database.projections import schema_load
+from pydotorg.core.page_index import page_index
+from pydotorg.domains.pages.models import Page
 from pydotorg.domains.pages.schemas import (
     DocumentFileCreate,
     DocumentFileRead,
@@ -37,7 +41,7 @@ class PageController(Controller):
         limit_offset: LimitOffset,
     ) -> list[PagePublic]:
         """List all pages."""
-        results, _total = await page_service.list_and_count(limit_offset)
+        results, _total = await page_service.list_and_count(limit_offset, load=schema_load(Page, PagePublic))
         return [PagePublic.model_validate(page) for page in results]
 
     @get("/{page_id:uuid}")
@@ -210,7 +214,11 @@ class PageRenderController(Controller):
 
     Pages are cached in Redis for 5 minutes (300 seconds) to reduce
     database load. Cache is automatically invalidated when pages are
-    updated or published/unpublished via the admin interface.
+    updated or published/unpublished via the admin interface: cached
+    responses carry a ``page-<id>`` Surrogate-Key and are tagged by it.
+
+    Paths missing from the per-process index of published pages are
+    answered with a 404 without querying the database.
     """
 
     path = "/{page_path:path}"
@@ -228,6 +236,8 @@ class PageRenderController(Controller):
         full URL path including any query parameters.
         """
         path = f"/{page_path.lstrip('/')}" if page_path else "/"
+        if page_index.excludes(path):
+            raise NotFoundException(f"Page not found: {path}")
         page = await page_service.get_one_or_none(path=path, is_published=True)
         if page is None:
             raise NotFoundException(f"Page not found: {path}")
@@ -235,4 +245,5 @@ class PageRenderController(Controller):
         return Template(
             template_name=page.template_name or "pages/default.html.jinja2",
             context={"page": page},
+            headers={"Surrogate-Key": page_tag(page.id)},
         )
@@ -8,7 +8,7 @@ from uuid import UUID
 from sqlalchemy import Boolean, Enum, ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from pydotorg.core.database.base import AuditBase, ContentManageableMixin
+from pydotorg.core.database.base import AuditBase, ContentManageableMixin, RenderedContentMixin
 
 
 class ContentType(StrEnum):
@@ -17,7 +17,7 @@ class ContentType(StrEnum):
     HTML = "html"
 
 
-class Page(AuditBase, ContentManageableMixin):
+class Page(AuditBase, ContentManageableMixin, RenderedContentMixin):
     __tablename__ = "pages"
 
     title: Mapped[str] = mapped_column(String(500))
@@ -32,6 +32,8 @@ class Page(AuditBase, ContentManageableMixin):
     is_published: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
     template_name: Mapped[str] = mapped_column(String(255), default="pages/default.html")
 
+    _rendered_from = ("content", "content_type")
+
     images: Mapped[list[Image]] = relationship(
         "Image",
         back_populates="page",
@@ -45,6 +47,11 @@ class Page(AuditBase, ContentManageableMixin):
         lazy="selectin",
     )
 
+    @property
+    def content_markup(self) -> str:
+        """Markup language of ``content``."""
+        return (self.content_type or ContentType.MARKDOWN).value
+
 
 class Image(AuditBase):
     __tablename__ = "page_images"
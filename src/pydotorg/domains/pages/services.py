@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
 
-from pydotorg.domains.pages.models import ContentType, DocumentFile, Image, Page
+from pydotorg.domains.pages.models import DocumentFile, Image, Page
 from pydotorg.domains.pages.repositories import DocumentFileRepository, ImageRepository, PageRepository
 from pydotorg.lib.tasks import enqueue_task
 
@@ -15,27 +15,6 @@ if TYPE_CHECKING:
 
     from pydotorg.domains.pages.schemas import DocumentFileCreate, ImageCreate, PageCreate
 
-try:
-    import cmarkgfm
-
-    CMARKGFM_AVAILABLE = True
-except ImportError:
-    CMARKGFM_AVAILABLE = False
-
-try:
-    import markdown
-
-    MARKDOWN_AVAILABLE = True
-except ImportError:
-    MARKDOWN_AVAILABLE = False
-
-try:
-    import docutils.core
-
-    DOCUTILS_AVAILABLE = True
-except ImportError:
-    DOCUTILS_AVAILABLE = False
-
 
 class PageService(SQLAlchemyAsyncRepositoryService[Page]):
     """Service for Page business logic."""
@@ -73,7 +52,7 @@ class PageService(SQLAlchemyAsyncRepositoryService[Page]):
         await self.session.commit()
 
         await enqueue_task("index_page", page_id=str(page.id))
-        await enqueue_task("invalidate_page_response_cache", page_path=page.path)
+        await enqueue_task("invalidate_page_response_cache", page_path=page.path, page_id=str(page.id))
 
         return page
 
@@ -143,55 +122,16 @@ class PageService(SQLAlchemyAsyncRepositoryService[Page]):
     async def render_content(self, page: Page) -> str:
         """Render page content based on content type.
 
+        Uses the HTML stored when the page was last written, falling back to the
+        markup cache for pages rendered before ``content_html`` existed.
+
         Args:
             page: The page to render.
 
         Returns:
             Rendered HTML content.
         """
-        if page.content_type == ContentType.MARKDOWN:
-            return self._render_markdown(page.content)
-        if page.content_type == ContentType.RESTRUCTUREDTEXT:
-            return self._render_rst(page.content)
-        return page.content
-
-    def _render_markdown(self, content: str) -> str:
-        """Render markdown content to HTML.
-
-        Args:
-            content: The markdown content.
-
-        Returns:
-            HTML string.
-
-        Raises:
-            ImportError: If neither cmarkgfm nor markdown is available.
-        """
-        if CMARKGFM_AVAILABLE:
-            return cmarkgfm.github_flavored_markdown_to_html(content)
-        if MARKDOWN_AVAILABLE:
-            return markdown.markdown(content, extensions=["extra", "codehilite"])
-        msg = "Neither cmarkgfm nor markdown library is installed"
-        raise ImportError(msg)
-
-    def _render_rst(self, content: str) -> str:
-        """Render reStructuredText content to HTML.
-
-        Args:
-            content: The RST content.
-
-        Returns:
-            HTML string.
-
-        Raises:
-            ImportError: If docutils is not available.
-        """
-        if not DOCUTILS_AVAILABLE:
-            msg = "docutils library is not installed"
-            raise ImportError(msg)
-
-        parts = docutils.core.publish_parts(content, writer_name="html")
-        return parts["html_body"]
+        return page.rendered_content
 
 
 class ImageService(SQLAlchemyAsyncRepositoryService[Image]):
@@ -11,9 +11,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from pydotorg.config import settings
+from pydotorg.core.auth.password import password_service
 from pydotorg.core.auth.session import SessionService
 from pydotorg.domains.users.models import User
-from pydotorg.domains.users.security import verify_password
 
 if TYPE_CHECKING:
     from starlette.requests import Request
@@ -59,9 +59,14 @@ class AdminAuthBackend(AuthenticationBackend):
             if not user.password_hash:
                 return False
 
-            if not verify_password(password, user.password_hash):
+            is_valid, new_hash = await password_service.verify_and_update(password, user.password_hash)
+            if not is_valid:
                 return False
 
+            if new_hash:
+                user.password_hash = new_hash
+                await db_session.commit()
+
             request.session.update({"user_id": str(user.id), "is_admin": True})
             return True
 
@@ -80,7 +85,7 @@ class AdminAuthBackend(AuthenticationBackend):
         if not litestar_session_id:
             return None
 
-        user_id = self._litestar_session_service.get_user_id_from_session(litestar_session_id)
+        user_id = await self._litestar_session_service.get_user_id_from_session(litestar_session_id)
         if not user_id:
             return None
 
@@ -106,7 +106,7 @@ class AuthController(Controller):
         user = User(
             username=data.username,
             email=data.email,
-            password_hash=password_service.hash_password(data.password),
+            password_hash=await password_service.hash(data.password),
             first_name=data.first_name,
             last_name=data.last_name,
             is_active=True,
@@ -168,12 +168,19 @@ class AuthController(Controller):
         if user.oauth_provider:
             raise PermissionDeniedException(f"This account uses {user.oauth_provider} login")
 
-        if not user.password_hash or not password_service.verify_password(data.password, user.password_hash):
+        if not user.password_hash:
+            raise PermissionDeniedException("Invalid credentials")
+
+        is_valid, new_hash = await password_service.verify_and_update(data.password, user.password_hash)
+        if not is_valid:
             raise PermissionDeniedException("Invalid credentials")
 
         if not user.is_active:
             raise PermissionDeniedException("Account is inactive")
 
+        if new_hash:
+            user.password_hash = new_hash
+
         user_id = user.id
         user.last_login = datetime.now(UTC)
         await db_session.commit()
@@ -270,17 +277,24 @@ class AuthController(Controller):
         if user.oauth_provider:
             raise PermissionDeniedException(f"This account uses {user.oauth_provider} login")
 
-        if not user.password_hash or not password_service.verify_password(data.password, user.password_hash):
+        if not user.password_hash:
+            raise PermissionDeniedException("Invalid credentials")
+
+        is_valid, new_hash = await password_service.verify_and_update(data.password, user.password_hash)
+        if not is_valid:
             raise PermissionDeniedException("Invalid credentials")
 
         if not user.is_active:
             raise PermissionDeniedException("Account is inactive")
 
+        if new_hash:
+            user.password_hash = new_hash
+
         user_id = user.id  # Capture before commit to avoid lazy load
         user.last_login = datetime.now(UTC)
         await db_session.commit()
 
-        session_id = session_service.create_session(user_id)
+        session_id = await session_service.create_session(user_id)
 
         response = Response(
             content={"message": "Successfully logged in"},
@@ -311,7 +325,7 @@ class AuthController(Controller):
         session_id = request.cookies.get(settings.session_cookie_name)
 
         if session_id:
-            session_service.destroy_session(session_id)
+            await session_service.destroy_session(session_id)
 
         response = Response(
             content={"message": "Successfully logged out"},
@@ -703,7 +717,7 @@ class AuthController(Controller):
         if not is_valid:
             raise PermissionDeniedException(error_message or "Password does not meet requirements")
 
-        user.password_hash = password_service.hash_password(data.new_password)
+        user.password_hash = await password_service.hash(data.new_password)
         await db_session.commit()
 
         return VerifyEmailResponse(message="Password reset successfully")
@@ -782,7 +796,7 @@ class AuthController(Controller):
         if current_user.oauth_provider:
             raise PermissionDeniedException(f"This account uses {current_user.oauth_provider} login")
 
-        if not current_user.password_hash or not password_service.verify_password(
+        if not current_user.password_hash or not await password_service.verify(
             data.current_password, current_user.password_hash
         ):
             return Response(
@@ -803,7 +817,7 @@ class AuthController(Controller):
                 media_type="text/html",
             )
 
-        current_user.password_hash = password_service.hash_password(data.new_password)
+        current_user.password_hash = await password_service.hash(data.new_password)
         await db_session.commit()
 
         return Response(
@@ -1,35 +0,0 @@
-"""User security utilities for password hashing and verification."""
-
-from __future__ import annotations
-
-import bcrypt
-
-
-def hash_password(password: str) -> str:
-    """Hash a plain-text password using bcrypt.
-
-    Args:
-        password: The plain-text password to hash.
-
-    Returns:
-        The hashed password string.
-    """
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode("utf-8")
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain-text password against a hashed password.
-
-    Args:
-        plain_password: The plain-text password to verify.
-        hashed_password: The hashed password to compare against.
-
-    Returns:
-        True if the password matches, False otherwise.
-    """
-    password_bytes = plain_password.encode("utf-8")
-    hashed_bytes = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
 
+from pydotorg.core.auth.password import password_service
 from pydotorg.domains.users.api_keys import APIKey
 from pydotorg.domains.users.api_keys import APIKeyService as APIKeyGenerator
 from pydotorg.domains.users.models import Membership, User, UserGroup
@@ -15,7 +16,6 @@ from pydotorg.domains.users.repositories import (
     UserGroupRepository,
     UserRepository,
 )
-from pydotorg.domains.users.security import hash_password
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -50,7 +50,7 @@ class UserService(SQLAlchemyAsyncRepositoryService[User]):
             raise ValueError(msg)
 
         user_data = data.model_dump(exclude={"password"})
-        user_data["password_hash"] = hash_password(data.password)
+        user_data["password_hash"] = await password_service.hash(data.password)
 
         return await self.create(user_data)
 
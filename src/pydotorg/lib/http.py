@@ -0,0 +1,88 @@
+"""Pooled, bounded HTTP client for fetching many upstream documents.
+
+Feed refreshes and external content syncs both fetch a batch of URLs at once.
+:class:`BoundedHTTPClient` gives such a run one pooled ``httpx.AsyncClient``
+(so connections to the same host are reused) and caps the requests in flight,
+overall and optionally per host, so one slow host cannot hold every slot.
+
+Example::
+
+    from pydotorg.lib.http import BoundedHTTPClient
+
+    async with BoundedHTTPClient(concurrency=8, timeout=30.0) as client:
+        responses = await asyncio.gather(*(client.get(url) for url in urls))
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING, Self
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import TracebackType
+
+
+class BoundedHTTPClient:
+    """Shared HTTP client with limits on concurrent requests."""
+
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        timeout: float,
+        per_host: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            concurrency: Maximum requests in flight at once.
+            timeout: Request timeout in seconds.
+            per_host: Maximum concurrent requests to one host; None for no per-host limit.
+            headers: Headers sent with every request.
+            transport: Custom transport, mainly for tests.
+        """
+        self.per_host = per_host
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host or concurrency)
+        )
+        self._client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            headers=headers,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def get(self, url: str, *, headers: Mapping[str, str] | None = None) -> httpx.Response:
+        """Fetch ``url`` once a slot is free.
+
+        Raises:
+            httpx.HTTPError: If the request fails or the server answers with a 4xx/5xx status.
+        """
+        async with self._host_semaphores[httpx.URL(url).host], self._semaphore:
+            response = await self._client.get(url, headers=headers)
+        if response.is_error:
+            response.raise_for_status()
+        return response
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -42,21 +43,27 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from pydotorg.config import log_startup_banner, settings, validate_production_settings
 from pydotorg.core.admin import AdminController
-from pydotorg.core.auth.middleware import JWTAuthMiddleware, UserPopulationMiddleware
+from pydotorg.core.auth.middleware import JWTAuthMiddleware
+from pydotorg.core.auth.password import password_service
+from pydotorg.core.auth.user_cache import listen_for_user_invalidations
 from pydotorg.core.banners_middleware import APIBannerMiddleware, SitewideBannerMiddleware
 from pydotorg.core.cache import (
-    AdminNoCacheMiddleware,
-    CacheControlMiddleware,
-    SurrogateKeyMiddleware,
+    create_cache_middleware_stack,
     create_response_cache_config,
+    create_response_cache_store,
+    listen_for_response_cache_invalidations,
 )
 from pydotorg.core.database.base import AuditBase
 from pydotorg.core.dependencies import get_core_dependencies
+from pydotorg.core.email.transport import smtp_pool
 from pydotorg.core.exceptions import get_exception_handlers
 from pydotorg.core.features import FeatureFlags
 from pydotorg.core.logging import configure_structlog
 from pydotorg.core.openapi import AdminOpenAPIController, get_openapi_plugins
+from pydotorg.core.page_index import listen_for_page_path_changes
 from pydotorg.core.ratelimit import create_rate_limit_config, rate_limit_exception_handler
+from pydotorg.core.redis import close_redis
+from pydotorg.core.release_file_index import listen_for_release_file_changes
 from pydotorg.core.security.csrf import create_csrf_config
 from pydotorg.core.worker import saq_plugin
 from pydotorg.core.workflows import get_workflow_plugin
@@ -193,7 +200,7 @@ from pydotorg.domains.work_groups import (
 from pydotorg.lib.api_versioning import APIVersionMiddleware
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -366,7 +373,7 @@ def configure_template_engine(engine: JinjaTemplateEngine) -> None:  # noqa: PLR
     """Configure the Jinja2 template engine with global context."""
     from datetime import UTC, datetime
 
-    import cmarkgfm
+    from pydotorg.core.markup import markup_cache
 
     ms_threshold = 1e12
     minute = 60
@@ -490,6 +497,8 @@ def configure_template_engine(engine: JinjaTemplateEngine) -> None:  # noqa: PLR
     def render_markdown(content: str | None) -> str:
         """Render markdown content to HTML using GitHub-flavored markdown.
 
+        Rendered documents are memoized by content hash in the per-process markup cache.
+
         Args:
             content: The markdown content to render.
 
@@ -498,7 +507,7 @@ def configure_template_engine(engine: JinjaTemplateEngine) -> None:  # noqa: PLR
         """
         if not content:
             return ""
-        return cmarkgfm.github_flavored_markdown_to_html(content)
+        return markup_cache.render(content)
 
     engine.engine.filters["friendly_date"] = friendly_date
     engine.engine.filters["time_ago"] = time_ago
@@ -546,6 +555,17 @@ def on_app_init(app_config: AppConfig) -> AppConfig:
     return app_config
 
 
+async def _shutdown_process_resources(listeners: Iterable[asyncio.Task[None]]) -> None:
+    """Stop the change listeners and release per-process pools and clients."""
+    for listener in listeners:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+    await smtp_pool.aclose()
+    password_service.shutdown()
+    await close_redis()
+
+
 @asynccontextmanager
 async def lifespan(app: Litestar) -> AsyncGenerator[None]:
     """Application lifespan hook for startup and shutdown tasks."""
@@ -596,11 +616,20 @@ async def lifespan(app: Litestar) -> AsyncGenerator[None]:
             sys.stderr.flush()
             raise
 
+    user_cache_listener = asyncio.create_task(listen_for_user_invalidations())
+    response_cache_listener = asyncio.create_task(listen_for_response_cache_invalidations())
+    release_file_listener = asyncio.create_task(listen_for_release_file_changes(app))
+    page_path_listener = asyncio.create_task(listen_for_page_path_changes(app))
+
     yield
 
     sys.stdout.write("\n\033[93m⏹ Shutting down application...\033[0m\n")
     sys.stdout.flush()
 
+    await _shutdown_process_resources(
+        (user_cache_listener, response_cache_listener, release_file_listener, page_path_listener)
+    )
+
 
 app = Litestar(
     route_handlers=[
@@ -705,16 +734,13 @@ app = Litestar(
         APIVersionMiddleware,
         SitewideBannerMiddleware,
         APIBannerMiddleware,
-        UserPopulationMiddleware,
         JWTAuthMiddleware,
-        CacheControlMiddleware,
-        AdminNoCacheMiddleware,
-        *([SurrogateKeyMiddleware] if settings.fastly_api_key else []),
+        *create_cache_middleware_stack(enable_surrogate_keys=bool(settings.fastly_api_key)),
         rate_limit_config.middleware,
     ],
     stores={
         "rate_limit": RedisStore.with_client(url=settings.redis_url),
-        "response_cache": RedisStore.with_client(url=settings.redis_url, namespace="cache"),
+        "response_cache": create_response_cache_store(),
     },
     response_cache_config=response_cache_config,
     template_config=template_config,
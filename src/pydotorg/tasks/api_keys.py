@@ -0,0 +1,49 @@
+"""Background tasks for API key bookkeeping."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from saq import CronJob
+
+from pydotorg.core.auth.api_key_cache import flush_api_key_last_used
+from pydotorg.core.redis import get_redis
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+async def flush_api_key_usage(ctx: dict[str, Any]) -> dict[str, int]:
+    """Write buffered API key ``last_used_at`` timestamps to the database.
+
+    Args:
+        ctx: SAQ worker context with database session maker and optional Redis client
+
+    Returns:
+        dict with number of keys updated
+    """
+    redis = ctx.get("redis") or get_redis()
+    session_maker = ctx["session_maker"]
+
+    async with session_maker() as session:
+        session: AsyncSession
+        try:
+            count = await flush_api_key_last_used(redis, session)
+        except Exception:
+            logger.exception("Failed to flush API key usage")
+            raise
+
+    if count:
+        logger.info(f"Flushed last_used_at for {count} API keys")
+    return {"count": count}
+
+
+cron_flush_api_key_usage = CronJob(
+    function=flush_api_key_usage,
+    cron="* * * * *",
+    timeout=60,
+    unique=True,
+)
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any
 
 from saq import CronJob
 
+from pydotorg.core.cache.store import RESPONSE_CACHE_NAMESPACE, TaggedRedisStore, page_tag, path_tag
 from pydotorg.domains.admin.services.pages import PageAdminService
 from pydotorg.domains.blogs.services import BlogEntryService
 from pydotorg.domains.downloads.services import ReleaseService
@@ -549,50 +550,44 @@ async def invalidate_page_response_cache(
     ctx: Context,
     *,
     page_path: str | None = None,
+    page_id: str | None = None,
+    tags: list[str] | None = None,
 ) -> dict[str, int | str]:
-    """Invalidate page response cache for a specific path or all pages.
+    """Invalidate page response cache for a specific page, a set of tags, or all pages.
 
-    This task clears the Litestar response cache for rendered pages.
-    The response cache uses a different key pattern than the warm cache.
+    This task clears the Litestar response cache for rendered pages through
+    the store's tag index, so every query-string variant of the page is
+    removed without scanning Redis.
 
     Args:
         ctx: SAQ context.
-        page_path: Optional page path to invalidate. If None, clears all page caches.
+        page_path: Optional page path to invalidate.
+        page_id: Optional page ID whose tagged responses should be invalidated.
+        tags: Optional extra response cache tags to invalidate (see :mod:`pydotorg.core.cache.store`).
+            If none of these are given, clears all page caches.
 
     Returns:
         Dictionary with invalidation results.
     """
     redis = await _get_redis(ctx)
-    cleared = 0
+    store = TaggedRedisStore(redis, namespace=RESPONSE_CACHE_NAMESPACE)
+    target = page_path or (f"page {page_id}" if page_id else ", ".join(tags) if tags else "all")
 
     try:
-        if page_path:
-            import hashlib
-
-            normalized_path = f"/{page_path.strip('/')}" if page_path else "/"
-            raw_key = f"{normalized_path}:"
-            cache_key = (
-                f"LITESTAR_RESPONSE_CACHE_cache:page:{hashlib.md5(raw_key.encode(), usedforsecurity=False).hexdigest()}"
-            )
-
-            result = await redis.delete(cache_key)
-            cleared = int(result)
-            logger.info(f"Invalidated page response cache: {page_path} (key: {cache_key}, deleted: {cleared})")
+        if page_path or page_id or tags:
+            targeted = [path_tag(page_path)] if page_path else []
+            if page_id:
+                targeted.append(page_tag(page_id))
+            targeted.extend(tags or ())
+            cleared = await store.invalidate_tags(*targeted)
+            logger.info(f"Invalidated page response cache: {target} (tags: {', '.join(targeted)}, deleted: {cleared})")
         else:
-            pattern = "LITESTAR_RESPONSE_CACHE_cache:*"
-            cursor = 0
-            while True:
-                cursor, keys = await redis.scan(cursor, match=pattern, count=100)
-                if keys:
-                    await redis.delete(*keys)
-                    cleared += len(keys)
-                if cursor == 0:
-                    break
+            cleared = await store.invalidate_all()
             logger.info(f"Invalidated all page response caches: {cleared} keys cleared")
 
         return {"cleared": cleared, "path": page_path or "all"}
     except Exception:
-        logger.exception(f"Failed to invalidate page response cache: {page_path or 'all'}")
+        logger.exception(f"Failed to invalidate page response cache: {target}")
         return {"cleared": 0, "path": page_path or "all", "error": "failed"}
 
 
@@ -0,0 +1,64 @@
+"""Background tasks for pre-rendered Markdown/RST content."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+
+from pydotorg.domains.downloads.models import Release
+from pydotorg.domains.pages.models import Page
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+RENDERED_MODELS: tuple[type[Page | Release], ...] = (Page, Release)
+
+
+async def render_stale_content(ctx: dict[str, Any], *, full: bool = False, batch_size: int = 200) -> dict[str, int]:
+    """Store rendered HTML for rows that have none, or whose content changed outside the ORM.
+
+    Writes through the ORM render content on flush; this task backfills rows
+    created before ``content_html`` existed and, with ``full``, rows updated by
+    raw SQL since they were last rendered.
+
+    Args:
+        ctx: SAQ worker context with database session maker
+        full: Re-check the content hash of every row instead of only rows without one
+        batch_size: Rows rendered per commit
+
+    Returns:
+        dict with count of re-rendered rows per table
+    """
+    session_maker = ctx["session_maker"]
+    rendered: dict[str, int] = {}
+
+    async with session_maker() as session:
+        session: AsyncSession
+        for model in RENDERED_MODELS:
+            statement = select(model).order_by(model.id).limit(batch_size)
+            if not full:
+                statement = statement.where(model.content_hash.is_(None))
+
+            count = 0
+            last_id = None
+            try:
+                while True:
+                    batch_statement = statement if last_id is None else statement.where(model.id > last_id)
+                    rows = (await session.scalars(batch_statement)).all()
+                    if not rows:
+                        break
+                    count += sum(row.refresh_rendered_content() for row in rows)
+                    last_id = rows[-1].id
+                    await session.commit()
+            except Exception:
+                logger.exception(f"Failed to render {model.__tablename__} content")
+                raise
+
+            rendered[model.__tablename__] = count
+            logger.info(f"Rendered content of {count} {model.__tablename__} rows")
+
+    return rendered
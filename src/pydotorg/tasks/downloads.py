@@ -1,25 +1,116 @@
 """Download statistics tracking service and background tasks.
 
 This module provides Redis-based download tracking with periodic PostgreSQL aggregation.
-Uses atomic Redis INCR for real-time counting with background flush to database.
+Every tracked download increments its counters in one Lua script call, with a
+background flush to the database.
+
+Key layout under ``<namespace>:downloads:stats``:
+
+- ``total:all`` / ``daily:<day>``: downloads across all files (strings)
+- ``files:total`` / ``releases:total``: all-time counts per id (sorted sets)
+- ``files:daily:<day>`` / ``releases:daily:<day>``: per-day counts per id (hashes)
+
+Before this layout every id had its own ``file:<id>:total`` and
+``file:<id>:daily:<day>`` strings; :func:`migrate_download_stats` folds those in.
+Daily keys from before they had a TTL are removed by :func:`cleanup_download_stats`.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime, timedelta
+from collections import Counter
+from datetime import UTC, date, datetime, timedelta
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from redis.exceptions import ResponseError
+from saq import CronJob
+
+from pydotorg.config import settings
+from pydotorg.core.redis import awaitable
 
 if TYPE_CHECKING:
-    from datetime import date
+    from collections.abc import Iterable
 
     from redis.asyncio import Redis
+    from redis.commands.core import AsyncScript
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
-_MIN_KEY_PARTS_TOTAL = 5
-_MIN_KEY_PARTS_DAILY = 7
+_LEGACY_KEY_PARTS_TOTAL = 6
+_LEGACY_KEY_PARTS_DAILY = 7
+
+# KEYS: [total:all, daily:<day>, files:total, files:daily:<day>, releases:total, releases:daily:<day>,
+#        files:pending]
+# ARGV: [daily TTL, downloads, day, file count, (file_id, n)..., release count, (release_id, n)...]
+# Daily keys get their TTL when created, so old days expire even if cleanup never runs.
+# files:pending collects "<day>:<file_id>" deltas until the next database flush.
+TRACK_DOWNLOADS_SCRIPT = """
+redis.call('INCRBY', KEYS[1], ARGV[2])
+redis.call('INCRBY', KEYS[2], ARGV[2])
+local i = 4
+for k = 3, 5, 2 do
+    local members = tonumber(ARGV[i])
+    i = i + 1
+    for _ = 1, members do
+        redis.call('ZINCRBY', KEYS[k], ARGV[i + 1], ARGV[i])
+        redis.call('HINCRBY', KEYS[k + 1], ARGV[i], ARGV[i + 1])
+        if k == 3 then
+            redis.call('HINCRBY', KEYS[7], ARGV[3] .. ':' .. ARGV[i], ARGV[i + 1])
+        end
+        i = i + 2
+    end
+end
+for _, key in ipairs({KEYS[2], KEYS[4], KEYS[6]}) do
+    if redis.call('TTL', key) == -1 then
+        redis.call('EXPIRE', key, ARGV[1])
+    end
+end
+return ARGV[2]
+"""
+
+# KEYS: [legacy counter, sorted set or hash it moves into, optional files:pending]
+# ARGV: [member, daily TTL or "" for the all-time sorted set, files:pending field]
+# Legacy daily file counts are also queued for the next database flush.
+MIGRATE_LEGACY_KEY_SCRIPT = """
+local count = redis.call('GET', KEYS[1])
+if not count then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+if ARGV[2] == '' then
+    redis.call('ZINCRBY', KEYS[2], count, ARGV[1])
+else
+    redis.call('HINCRBY', KEYS[2], ARGV[1], count)
+    if redis.call('TTL', KEYS[2]) == -1 then
+        redis.call('EXPIRE', KEYS[2], ARGV[2])
+    end
+    if KEYS[3] then
+        redis.call('HINCRBY', KEYS[3], ARGV[3], count)
+    end
+end
+return tonumber(count)
+"""
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _parse_pending(pending: dict[bytes | str, bytes | str]) -> list[dict[str, Any]]:
+    """Turn ``<day>:<file_id>`` -> count fields into ``download_statistics`` rows."""
+    rows = []
+    for field, count in pending.items():
+        day, _, file_id = _decode(field).partition(":")
+        try:
+            rows.append(
+                {"release_file_id": UUID(file_id), "date": date.fromisoformat(day), "download_count": int(count)}
+            )
+        except ValueError:
+            logger.warning(f"Skipping malformed pending download count {_decode(field)!r}")
+    return rows
 
 
 class DownloadStatsService:
@@ -29,15 +120,27 @@ class DownloadStatsService:
     Stats are periodically flushed to PostgreSQL for durable storage.
     """
 
-    def __init__(self, redis: Redis, namespace: str = "pydotorg") -> None:
+    def __init__(
+        self, redis: Redis, namespace: str = "pydotorg", daily_ttl: int = settings.download_stats_daily_ttl
+    ) -> None:
         """Initialize the download stats service.
 
         Args:
             redis: Redis client instance
             namespace: Redis key namespace prefix (default: "pydotorg")
+            daily_ttl: Seconds a daily counter lives after its first increment
         """
         self.redis = redis
         self.namespace = namespace
+        self.daily_ttl = daily_ttl
+
+    @cached_property
+    def _track_script(self) -> AsyncScript:
+        return self.redis.register_script(TRACK_DOWNLOADS_SCRIPT)
+
+    @cached_property
+    def _migrate_script(self) -> AsyncScript:
+        return self.redis.register_script(MIGRATE_LEGACY_KEY_SCRIPT)
 
     def _key(self, *parts: str) -> str:
         """Build a namespaced Redis key.
@@ -57,20 +160,54 @@ class DownloadStatsService:
             file_id: UUID of the release file being downloaded
             release_id: Optional UUID of the release
         """
-        try:
-            today = datetime.now(UTC).date().isoformat()
-            await self.redis.incr(self._key("file", file_id, "total"))
-            await self.redis.incr(self._key("file", file_id, "daily", today))
-            await self.redis.incr(self._key("total", "all"))
-            await self.redis.incr(self._key("daily", today))
+        if await self.track_downloads([(file_id, release_id)]):
+            logger.debug(f"Tracked download for file {file_id}")
+
+    async def track_downloads(self, events: Iterable[tuple[str, str | None]]) -> int:
+        """Track many downloads in a single Redis round trip.
+
+        Events for the same file or release are coalesced into one increment,
+        and all counters are updated atomically by one script call.
+
+        Args:
+            events: ``(file_id, release_id)`` pairs, ``release_id`` may be ``None``
 
+        Returns:
+            Number of downloads recorded, 0 if Redis failed
+        """
+        files: Counter[str] = Counter()
+        releases: Counter[str] = Counter()
+        for file_id, release_id in events:
+            files[file_id] += 1
             if release_id:
-                await self.redis.incr(self._key("release", release_id, "total"))
-                await self.redis.incr(self._key("release", release_id, "daily", today))
+                releases[release_id] += 1
+        tracked = files.total()
+        if not tracked:
+            return 0
 
-            logger.debug(f"Tracked download for file {file_id}")
+        today = datetime.now(UTC).date().isoformat()
+        args: list[str | int] = [self.daily_ttl, tracked, today]
+        for counts in (files, releases):
+            args.append(len(counts))
+            for member, count in counts.items():
+                args.extend((member, count))
+        try:
+            await self._track_script(
+                keys=[
+                    self._key("total", "all"),
+                    self._key("daily", today),
+                    self._key("files", "total"),
+                    self._key("files", "daily", today),
+                    self._key("releases", "total"),
+                    self._key("releases", "daily", today),
+                    self._key("files", "pending"),
+                ],
+                args=args,
+            )
         except Exception:
-            logger.exception(f"Failed to track download for file {file_id}")
+            logger.exception(f"Failed to track {tracked} downloads")
+            return 0
+        return tracked
 
     async def get_file_downloads(self, file_id: str) -> int:
         """Get total download count for a file.
@@ -82,7 +219,7 @@ class DownloadStatsService:
             Total download count
         """
         try:
-            count = await self.redis.get(self._key("file", file_id, "total"))
+            count = await self.redis.zscore(self._key("files", "total"), file_id)
             return int(count) if count else 0
         except Exception:
             logger.exception(f"Failed to get download count for file {file_id}")
@@ -100,7 +237,7 @@ class DownloadStatsService:
         """
         try:
             day = day or datetime.now(UTC).date()
-            count = await self.redis.get(self._key("file", file_id, "daily", day.isoformat()))
+            count = await awaitable(self.redis.hget(self._key("files", "daily", day.isoformat()), file_id))
             return int(count) if count else 0
         except Exception:
             logger.exception(f"Failed to get daily download count for file {file_id}")
@@ -116,7 +253,7 @@ class DownloadStatsService:
             Total download count for all files in release
         """
         try:
-            count = await self.redis.get(self._key("release", release_id, "total"))
+            count = await self.redis.zscore(self._key("releases", "total"), release_id)
             return int(count) if count else 0
         except Exception:
             logger.exception(f"Failed to get download count for release {release_id}")
@@ -161,21 +298,11 @@ class DownloadStatsService:
         Returns:
             List of (file_id, count) tuples sorted by count descending
         """
+        if limit <= 0:
+            return []
         try:
-            pattern = self._key("file", "*", "total")
-            results: list[tuple[str, int]] = []
-
-            async for key in self.redis.scan_iter(match=pattern):
-                key_str = key.decode() if isinstance(key, bytes) else key
-                parts = key_str.split(":")
-                if len(parts) >= _MIN_KEY_PARTS_TOTAL:
-                    file_id = parts[4]
-                    count = await self.redis.get(key)
-                    if count:
-                        results.append((file_id, int(count)))
-
-            results.sort(key=lambda x: x[1], reverse=True)
-            return results[:limit]
+            top = await self.redis.zrevrange(self._key("files", "total"), 0, limit - 1, withscores=True)
+            return [(_decode(file_id), int(count)) for file_id, count in top]
         except Exception:
             logger.exception("Failed to get top downloads")
             return []
@@ -187,23 +314,29 @@ class DownloadStatsService:
             Dict mapping file_id to download count
         """
         try:
-            pattern = self._key("file", "*", "total")
-            stats: dict[str, int] = {}
-
-            async for key in self.redis.scan_iter(match=pattern):
-                key_str = key.decode() if isinstance(key, bytes) else key
-                parts = key_str.split(":")
-                if len(parts) >= _MIN_KEY_PARTS_TOTAL:
-                    file_id = parts[4]
-                    count = await self.redis.get(key)
-                    if count:
-                        stats[file_id] = int(count)
-
-            return stats
+            stats = await self.redis.zrange(self._key("files", "total"), 0, -1, withscores=True)
+            return {_decode(file_id): int(count) for file_id, count in stats}
         except Exception:
             logger.exception("Failed to get all file stats")
             return {}
 
+    async def get_file_stats_daily(self, day: date | None = None) -> dict[str, int]:
+        """Get download stats for all files on a specific day.
+
+        Args:
+            day: Date to get stats for (default: today)
+
+        Returns:
+            Dict mapping file_id to download count for the day
+        """
+        try:
+            day = day or datetime.now(UTC).date()
+            stats = await awaitable(self.redis.hgetall(self._key("files", "daily", day.isoformat())))
+            return {_decode(file_id): int(count) for file_id, count in stats.items()}
+        except Exception:
+            logger.exception("Failed to get daily file stats")
+            return {}
+
     async def get_stats_summary(self) -> dict[str, Any]:
         """Get overall download statistics summary.
 
@@ -228,56 +361,73 @@ class DownloadStatsService:
             }
 
     async def flush_to_database(self, session: AsyncSession) -> int:
-        """Flush Redis counters to PostgreSQL database.
+        """Add the downloads counted since the last flush to ``download_statistics``.
 
-        This method aggregates daily stats and stores them in the database
-        for long-term storage and analytics queries.
+        Tracking also increments a pending hash of per-(day, file) deltas. The
+        hash is renamed aside before reading, so downloads tracked during the
+        flush land in a fresh hash for the next run, and its rows are added to
+        the stored counts with a single ``INSERT ... ON CONFLICT DO UPDATE``.
+        If a previous flush failed after the rename, its batch is retried first.
+        The cost depends on the files downloaded since the last run, not on the
+        history kept in Redis.
 
         Args:
             session: SQLAlchemy async session
 
         Returns:
-            Number of records flushed
+            Number of (file, day) rows written
         """
-        from pydotorg.domains.downloads.models import DownloadStatistic
+        from sqlalchemy import select
+        from sqlalchemy.dialects.postgresql import insert
+
+        from pydotorg.domains.downloads.models import DownloadStatistic, ReleaseFile
 
+        pending = self._key("files", "pending")
+        flushing = self._key("files", "pending", "flushing")
         try:
-            pattern = self._key("file", "*", "daily", "*")
-            flushed = 0
-
-            async for key in self.redis.scan_iter(match=pattern):
-                key_str = key.decode() if isinstance(key, bytes) else key
-                parts = key_str.split(":")
-                if len(parts) >= _MIN_KEY_PARTS_DAILY:
-                    file_id = parts[4]
-                    day_str = parts[6]
-
-                    count = await self.redis.get(key)
-                    if count and int(count) > 0:
-                        try:
-                            from datetime import date as date_type
-
-                            day = date_type.fromisoformat(day_str)
-                            stat = DownloadStatistic(
-                                release_file_id=file_id,
-                                date=day,
-                                download_count=int(count),
-                            )
-                            session.add(stat)
-                            flushed += 1
-                        except (ValueError, TypeError) as e:
-                            logger.warning(f"Invalid date format {day_str}: {e}")
-
-            await session.commit()
-            logger.info(f"Flushed {flushed} download statistics to database")
-            return flushed
+            if not await self.redis.exists(flushing):
+                try:
+                    await self.redis.rename(pending, flushing)
+                except ResponseError:
+                    return 0
+
+            rows = _parse_pending(await awaitable(self.redis.hgetall(flushing)))
+            if rows:
+                file_ids = {row["release_file_id"] for row in rows}
+                existing = set(await session.scalars(select(ReleaseFile.id).where(ReleaseFile.id.in_(file_ids))))
+                if missing := file_ids - existing:
+                    logger.warning(f"Dropping download counts for {len(missing)} deleted release files")
+                    rows = [row for row in rows if row["release_file_id"] in existing]
+
+            if rows:
+                stmt = insert(DownloadStatistic)
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[DownloadStatistic.release_file_id, DownloadStatistic.date],
+                        set_={
+                            "download_count": DownloadStatistic.download_count + stmt.excluded.download_count,
+                            "updated_at": stmt.excluded.updated_at,
+                        },
+                    ),
+                    rows,
+                )
+                await session.commit()
+
+            await self.redis.delete(flushing)
+            logger.info(f"Flushed {len(rows)} download statistics to database")
+            return len(rows)
         except Exception:
             logger.exception("Failed to flush stats to database")
             await session.rollback()
             return 0
 
     async def cleanup_old_daily_keys(self, days_to_keep: int = 7) -> int:
-        """Clean up old daily Redis keys after flushing to database.
+        """Delete daily Redis keys older than ``days_to_keep`` days.
+
+        Daily keys expire on their own. This scans the whole keyspace for the
+        ones created before the TTL was set (or restored without one), so it
+        runs as a one-off maintenance task, never on the flush schedule.
+        Matching keys are unlinked in one call.
 
         Args:
             days_to_keep: Number of days of daily stats to retain in Redis
@@ -287,30 +437,53 @@ class DownloadStatsService:
         """
         try:
             cutoff = datetime.now(UTC).date() - timedelta(days=days_to_keep)
-            pattern = self._key("*", "daily", "*")
-            deleted = 0
-
-            async for key in self.redis.scan_iter(match=pattern):
-                key_str = key.decode() if isinstance(key, bytes) else key
-                parts = key_str.split(":")
-                if len(parts) >= _MIN_KEY_PARTS_DAILY:
-                    try:
-                        from datetime import date as date_type
-
-                        day_str = parts[-1]
-                        day = date_type.fromisoformat(day_str)
-                        if day < cutoff:
-                            await self.redis.delete(key)
-                            deleted += 1
-                    except ValueError:
-                        continue
+            old_keys = []
+
+            async for key in self.redis.scan_iter(match=self._key("*daily", "*")):
+                try:
+                    day = date.fromisoformat(_decode(key).rpartition(":")[2])
+                except ValueError:
+                    continue
+                if day < cutoff:
+                    old_keys.append(key)
 
+            deleted = await self.redis.unlink(*old_keys) if old_keys else 0
             logger.info(f"Cleaned up {deleted} old daily keys (older than {days_to_keep} days)")
             return deleted
         except Exception:
             logger.exception("Failed to cleanup old daily keys")
             return 0
 
+    async def migrate_legacy_keys(self) -> int:
+        """Fold per-id counters from the old key layout into the sorted sets and hashes.
+
+        Each legacy key is read, deleted and added to its new home atomically,
+        so the migration is safe to run while downloads are being tracked and
+        to run again after an interruption.
+
+        Returns:
+            Number of legacy keys migrated
+        """
+        migrated = 0
+        for kind, new_kind in (("file", "files"), ("release", "releases")):
+            async for key in self.redis.scan_iter(match=self._key(kind, "*")):
+                parts = _decode(key).split(":")
+                if len(parts) == _LEGACY_KEY_PARTS_TOTAL and parts[5] == "total":
+                    keys, args = [key, self._key(new_kind, "total")], [parts[4], ""]
+                elif len(parts) == _LEGACY_KEY_PARTS_DAILY and parts[5] == "daily":
+                    keys = [key, self._key(new_kind, "daily", parts[6])]
+                    args = [parts[4], str(self.daily_ttl)]
+                    if kind == "file":
+                        keys.append(self._key("files", "pending"))
+                        args.append(f"{parts[6]}:{parts[4]}")
+                else:
+                    continue
+                await self._migrate_script(keys=keys, args=args)
+                migrated += 1
+
+        logger.info(f"Migrated {migrated} legacy download stats keys")
+        return migrated
+
 
 async def get_download_stats_service(ctx: dict[str, Any]) -> DownloadStatsService | None:
     """Get or create download stats service from worker context.
@@ -327,8 +500,6 @@ async def get_download_stats_service(ctx: dict[str, Any]) -> DownloadStatsServic
         return None
 
     if "download_stats_service" not in ctx:
-        from pydotorg.config import settings
-
         namespace = getattr(settings, "redis_stats_namespace", "pydotorg")
         ctx["download_stats_service"] = DownloadStatsService(redis, namespace=namespace)
 
@@ -338,7 +509,7 @@ async def get_download_stats_service(ctx: dict[str, Any]) -> DownloadStatsServic
 async def flush_download_stats(ctx: dict[str, Any]) -> dict[str, Any]:
     """SAQ task to flush download stats from Redis to PostgreSQL.
 
-    This task should be scheduled to run periodically (e.g., every 15 minutes).
+    Scheduled every 15 minutes by :data:`cron_flush_download_stats`.
 
     Args:
         ctx: SAQ worker context
@@ -350,17 +521,16 @@ async def flush_download_stats(ctx: dict[str, Any]) -> dict[str, Any]:
     if not stats_service:
         return {"success": False, "error": "Stats service unavailable"}
 
-    session = ctx.get("db_session")
-    if not session:
+    session_maker = ctx.get("session_maker")
+    if not session_maker:
         return {"success": False, "error": "Database session unavailable"}
 
-    flushed = await stats_service.flush_to_database(session)
-    cleaned = await stats_service.cleanup_old_daily_keys(days_to_keep=7)
+    async with session_maker() as session:
+        flushed = await stats_service.flush_to_database(session)
 
     return {
         "success": True,
         "flushed": flushed,
-        "cleaned_keys": cleaned,
     }
 
 
@@ -384,3 +554,63 @@ async def aggregate_download_stats(ctx: dict[str, Any]) -> dict[str, Any]:
         "success": True,
         "summary": summary,
     }
+
+
+async def migrate_download_stats(ctx: dict[str, Any]) -> dict[str, Any]:
+    """SAQ task to move download counters from the old per-id key layout.
+
+    Run once after deploying the sorted set and hash layout. Counts recorded
+    under the old keys are folded into the new structures and the old keys
+    are removed.
+
+    Args:
+        ctx: SAQ worker context
+
+    Returns:
+        Task result with the number of migrated keys
+    """
+    stats_service = await get_download_stats_service(ctx)
+    if not stats_service:
+        return {"success": False, "error": "Stats service unavailable"}
+
+    try:
+        migrated = await stats_service.migrate_legacy_keys()
+    except Exception:
+        logger.exception("Failed to migrate download stats")
+        return {"success": False, "error": "Migration failed"}
+
+    return {
+        "success": True,
+        "migrated_keys": migrated,
+    }
+
+
+async def cleanup_download_stats(ctx: dict[str, Any], *, days_to_keep: int = 7) -> dict[str, Any]:
+    """SAQ task to delete daily download keys created before daily keys had a TTL.
+
+    Run once after deploying the TTL on daily hashes; newer keys expire on
+    their own. It scans the whole Redis keyspace, so it is not scheduled.
+
+    Args:
+        ctx: SAQ worker context
+        days_to_keep: Number of days of daily stats to retain in Redis
+
+    Returns:
+        Task result with the number of deleted keys
+    """
+    stats_service = await get_download_stats_service(ctx)
+    if not stats_service:
+        return {"success": False, "error": "Stats service unavailable"}
+
+    return {
+        "success": True,
+        "cleaned_keys": await stats_service.cleanup_old_daily_keys(days_to_keep=days_to_keep),
+    }
+
+
+cron_flush_download_stats = CronJob(
+    function=flush_download_stats,
+    cron="*/15 * * * *",
+    timeout=300,
+    unique=True,
+)
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
+from uuid import uuid4
 
+from redis.exceptions import RedisError
+from sqlalchemy import select
+
+from pydotorg.config import settings
 from pydotorg.core.email.service import EmailService
+from pydotorg.core.redis import awaitable, get_context_redis
+from pydotorg.domains.mailing.models import EmailTemplate
+from pydotorg.lib.tasks import enqueue_task
 
 logger = logging.getLogger(__name__)
 
+BULK_PROGRESS_PREFIX = "pydotorg:email:bulk:sent:"
+BULK_PROGRESS_TTL_SECONDS = 7 * 24 * 60 * 60
+
 
 async def send_verification_email(
     ctx: Any,
@@ -686,46 +698,85 @@ async def send_bulk_email(
     subject: str,
     template: str,
     context: dict[str, Any],
+    batch_id: str | None = None,
 ) -> dict[str, Any]:
     """Send same email to multiple recipients.
 
+    Lists longer than ``settings.email_bulk_chunk_size`` are split into one job
+    per chunk. Messages go out concurrently over pooled SMTP connections. Each
+    chunk job records the recipients it has sent to, so a retried job resumes
+    where the previous attempt stopped instead of emailing everyone again.
+
+    The email is rendered once per job: ``template`` names an active
+    :class:`~pydotorg.domains.mailing.models.EmailTemplate`, rendered from the
+    shared compiled-template cache, or is raw HTML formatted with ``context``.
+
     Args:
         ctx: SAQ job context
         recipients: List of recipient email addresses
-        subject: Email subject line
-        template: Email template identifier or raw content
+        subject: Email subject line; a named template's own subject is used when empty
+        template: Email template internal name or raw content
         context: Template context variables
+        batch_id: Identifier of this chunk's progress; set when the job is a chunk of a larger send
 
     Returns:
         Dict with success status and metadata
     """
-    logger.info("Sending bulk email", extra={"recipient_count": len(recipients), "subject": subject})
-
-    email_service = EmailService()
-    sent_count = 0
-    failed_count = 0
-    errors: list[str] = []
+    if batch_id is None and len(recipients) > settings.email_bulk_chunk_size:
+        return await _enqueue_bulk_chunks(recipients=recipients, subject=subject, template=template, context=context)
 
-    for to_email in recipients:
-        try:
-            html_content = template.format(**context)
-            text_content = html_content
+    logger.info(
+        "Sending bulk email", extra={"recipient_count": len(recipients), "subject": subject, "batch_id": batch_id}
+    )
 
-            msg = email_service._create_message(to_email, subject, text_content, html_content)
-            email_service._send_email(msg)
+    already_sent = await _load_bulk_progress(ctx, batch_id) if batch_id else set()
+    pending = [to_email for to_email in recipients if to_email not in already_sent]
 
-            sent_count += 1
-            logger.debug("Bulk email sent to recipient", extra={"to_email": to_email})
+    try:
+        subject, text_content, html_content = await _render_bulk_email(
+            ctx, template=template, subject=subject, context=context
+        )
+    except Exception as e:
+        logger.exception("Failed to render bulk email", extra={"template": template[:128], "error": str(e)})
+        return {
+            "success": False,
+            "email_type": "bulk",
+            "subject": subject,
+            "total": len(recipients),
+            "sent": 0,
+            "failed": len(pending),
+            "skipped": len(recipients) - len(pending),
+            "errors": [f"render: {e!s}"],
+        }
 
-        except Exception as e:
-            failed_count += 1
-            error_msg = f"{to_email}: {e!s}"
-            errors.append(error_msg)
-            logger.exception("Failed to send bulk email to recipient", extra={"to_email": to_email, "error": str(e)})
+    email_service = EmailService()
+    errors: list[str] = []
 
+    async def deliver(to_email: str) -> None:
+        msg = email_service._create_message(to_email, subject, text_content, html_content)
+        await email_service.send_message(msg)
+        if batch_id:
+            await _record_bulk_progress(ctx, batch_id, to_email)
+        logger.debug("Bulk email sent to recipient", extra={"to_email": to_email})
+
+    results = await asyncio.gather(*(deliver(to_email) for to_email in pending), return_exceptions=True)
+    for to_email, result in zip(pending, results, strict=True):
+        if isinstance(result, Exception):
+            errors.append(f"{to_email}: {result!s}")
+            logger.error(
+                "Failed to send bulk email to recipient",
+                extra={"to_email": to_email, "error": str(result)},
+                exc_info=result,
+            )
+        elif isinstance(result, BaseException):
+            raise result
+
+    failed_count = len(errors)
+    sent_count = len(pending) - failed_count
+    skipped_count = len(recipients) - len(pending)
     logger.info(
         "Bulk email task completed",
-        extra={"total": len(recipients), "sent": sent_count, "failed": failed_count},
+        extra={"total": len(recipients), "sent": sent_count, "failed": failed_count, "skipped": skipped_count},
     )
 
     return {
@@ -735,5 +786,105 @@ async def send_bulk_email(
         "total": len(recipients),
         "sent": sent_count,
         "failed": failed_count,
+        "skipped": skipped_count,
         "errors": errors,
     }
+
+
+async def _render_bulk_email(
+    ctx: Any,
+    *,
+    template: str,
+    subject: str,
+    context: dict[str, Any],
+) -> tuple[str, str, str | None]:
+    """Return the subject, text and HTML content every recipient of a bulk job receives."""
+    session_maker = ctx.get("session_maker")
+    if session_maker is not None:
+        async with session_maker() as session:
+            email_template = await session.scalar(
+                select(EmailTemplate).where(EmailTemplate.internal_name == template, EmailTemplate.is_active.is_(True))
+            )
+        if email_template is not None:
+            return (
+                subject or email_template.render_subject(context),
+                email_template.render_content_text(context),
+                email_template.render_content_html(context),
+            )
+    html_content = template.format(**context)
+    return subject, html_content, html_content
+
+
+async def _enqueue_bulk_chunks(
+    *,
+    recipients: list[str],
+    subject: str,
+    template: str,
+    context: dict[str, Any],
+) -> dict[str, Any]:
+    """Split a bulk send into one ``send_bulk_email`` job per chunk of recipients."""
+    batch = uuid4().hex
+    chunk_size = settings.email_bulk_chunk_size
+    chunks = [recipients[start : start + chunk_size] for start in range(0, len(recipients), chunk_size)]
+    job_keys: list[str] = []
+    errors: list[str] = []
+    failed_count = 0
+    for index, chunk in enumerate(chunks):
+        job_key = await enqueue_task(
+            "send_bulk_email",
+            recipients=chunk,
+            subject=subject,
+            template=template,
+            context=context,
+            batch_id=f"{batch}:{index}",
+        )
+        if job_key is None:
+            errors.append(f"chunk {index}: failed to enqueue {len(chunk)} recipients")
+            failed_count += len(chunk)
+        else:
+            job_keys.append(job_key)
+
+    logger.info(
+        "Bulk email split into chunk jobs",
+        extra={"total": len(recipients), "chunks": len(chunks), "queued": len(job_keys), "batch": batch},
+    )
+    return {
+        "success": not errors,
+        "email_type": "bulk",
+        "subject": subject,
+        "total": len(recipients),
+        "sent": 0,
+        "failed": failed_count,
+        "errors": errors,
+        "batch": batch,
+        "chunks": len(chunks),
+        "job_keys": job_keys,
+    }
+
+
+def _bulk_progress_key(batch_id: str) -> str:
+    return f"{BULK_PROGRESS_PREFIX}{batch_id}"
+
+
+async def _load_bulk_progress(ctx: Any, batch_id: str) -> set[str]:
+    """Return the recipients an earlier attempt of this chunk already sent to."""
+    redis = get_context_redis(ctx)
+    try:
+        members = await awaitable(redis.smembers(_bulk_progress_key(batch_id)))
+    except (RedisError, OSError):
+        logger.warning("Failed to load bulk email progress", extra={"batch_id": batch_id}, exc_info=True)
+        return set()
+    return {member.decode() if isinstance(member, bytes) else member for member in members}
+
+
+async def _record_bulk_progress(ctx: Any, batch_id: str, to_email: str) -> None:
+    """Remember that this chunk has sent to ``to_email``."""
+    redis = get_context_redis(ctx)
+    key = _bulk_progress_key(batch_id)
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(key, to_email)
+            pipe.expire(key, BULK_PROGRESS_TTL_SECONDS)
+            await pipe.execute()
+    except (RedisError, OSError):
+        logger.warning("Failed to record bulk email progress", extra={"batch_id": batch_id}, exc_info=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
@@ -10,17 +11,65 @@ from uuid import UUID
 from saq.job import CronJob
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
     from typing import Any
 
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from pydotorg.domains.blogs.models import Feed
+    from pydotorg.domains.blogs.services import FeedService
+
 logger = logging.getLogger(__name__)
 
 
+async def _refresh_feeds(
+    session: AsyncSession, feed_service: FeedService, feeds: Sequence[Feed], label: str
+) -> tuple[int, int]:
+    """Fetch ``feeds`` concurrently and store each result as its fetch completes.
+
+    Network requests and parsing overlap across feeds; database writes run one
+    feed at a time on ``session``, in the order the feeds were given.
+
+    Returns:
+        Tuple of (success_count, error_count).
+    """
+    from pydotorg.domains.blogs.fetcher import FeedFetcher
+
+    success_count = 0
+    error_count = 0
+    feed_names = [feed.name for feed in feeds]
+
+    async with FeedFetcher() as fetcher:
+        fetches = [asyncio.create_task(fetcher.fetch(feed)) for feed in feeds]
+        try:
+            for feed_name, fetch in zip(feed_names, fetches, strict=True):
+                try:
+                    fetched = await fetch
+                    entries = await feed_service.store_feed(fetched)
+                except Exception:
+                    error_count += 1
+                    logger.exception(f"Failed to refresh {label} '{feed_name}'")
+                    await session.rollback()
+                    continue
+                success_count += 1
+                if fetched.not_modified:
+                    logger.info(f"{label.capitalize()} '{feed_name}' not modified")
+                else:
+                    logger.info(f"Successfully refreshed {label} '{feed_name}' - {len(entries)} entries")
+        finally:
+            for fetch in fetches:
+                fetch.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
+
+    return success_count, error_count
+
+
 async def refresh_all_feeds(ctx: Mapping[str, Any]) -> dict[str, int]:
     """Refresh all active feeds.
 
-    This task fetches and parses all active RSS feeds, creating or updating
-    BlogEntry records for each feed item.
+    This task fetches and parses all active RSS feeds concurrently, creating or
+    updating BlogEntry records for each feed item. Feeds answering 304 Not
+    Modified count as successes without being parsed.
 
     Args:
         ctx: Task context containing dependencies (session_maker, etc.).
@@ -38,18 +87,7 @@ async def refresh_all_feeds(ctx: Mapping[str, Any]) -> dict[str, int]:
             feeds = await feed_service.get_active_feeds(limit=1000)
             logger.info(f"Refreshing {len(feeds)} active feeds")
 
-            success_count = 0
-            error_count = 0
-
-            for feed in feeds:
-                feed_name = feed.name
-                try:
-                    entries = await feed_service.fetch_feed(feed)
-                    success_count += 1
-                    logger.info(f"Successfully refreshed feed '{feed_name}' - {len(entries)} entries")
-                except Exception:
-                    error_count += 1
-                    logger.exception(f"Failed to refresh stale feed '{feed_name}'")
+            success_count, error_count = await _refresh_feeds(session, feed_service, feeds, "feed")
 
             logger.info(f"Feed refresh complete: {success_count} successful, {error_count} errors")
 
@@ -92,18 +130,7 @@ async def refresh_stale_feeds(ctx: Mapping[str, Any], *, max_age_hours: int = 1)
                 f"Refreshing {len(feeds)} stale feeds (older than {max_age_hours}h, cutoff: {cutoff_time.isoformat()})"
             )
 
-            success_count = 0
-            error_count = 0
-
-            for feed in feeds:
-                feed_name = feed.name
-                try:
-                    entries = await feed_service.fetch_feed(feed)
-                    success_count += 1
-                    logger.info(f"Successfully refreshed stale feed '{feed_name}' - {len(entries)} entries")
-                except Exception:
-                    error_count += 1
-                    logger.exception(f"Failed to refresh stale feed '{feed_name}'")
+            success_count, error_count = await _refresh_feeds(session, feed_service, feeds, "stale feed")
 
             logger.info(f"Stale feed refresh complete: {success_count} successful, {error_count} errors")
 
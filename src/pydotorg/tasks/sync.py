@@ -6,24 +6,41 @@ This module provides SAQ tasks for periodically importing:
 - Success stories from python.org/success-stories/
 
 These tasks reuse the logic from the scripts in scripts/ directory
-but are designed to run as background workers.
+but are designed to run as background workers. Each task fetches and parses
+everything first, then writes it with :func:`~pydotorg.core.database.bulk.bulk_upsert`
+(one prefetch and a few batched upserts per entity type) and reports how long
+each stage took under ``"timings"`` in its result.
+
+Requests go through one :class:`~pydotorg.lib.http.BoundedHTTPClient`, a pooled
+client with bounded concurrency, and HTML/ICS/RSS parsing runs in worker threads, off the event
+loop. The SHA-256 of every upstream document imported is stored in a Redis
+hash once its rows are committed; a document whose hash is unchanged on the
+next run is neither parsed nor written. Pass ``full=True`` to ignore these
+checkpoints.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import re
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from itertools import batched
 from typing import TYPE_CHECKING, Any
 
 import feedparser
-import httpx
 from bs4 import BeautifulSoup
 from icalendar import Calendar as ICalendar
+from redis.exceptions import RedisError
 from saq import CronJob
 from slugify import slugify
 from sqlalchemy import select
 
+from pydotorg.config import settings
+from pydotorg.core.database.bulk import PREFETCH_BATCH_SIZE, StageTimer, bulk_upsert
+from pydotorg.core.redis import awaitable, get_context_redis
 from pydotorg.domains.blogs.models import BlogEntry, Feed
 from pydotorg.domains.events.models import (
     Calendar,
@@ -36,10 +53,13 @@ from pydotorg.domains.jobs.models import Job, JobCategory, JobStatus
 from pydotorg.domains.pages.models import ContentType
 from pydotorg.domains.successstories.models import Story, StoryCategory
 from pydotorg.domains.users.models import User
+from pydotorg.lib.http import BoundedHTTPClient
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import AsyncIterator, Mapping, Sequence
+    from uuid import UUID
 
+    import httpx
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -65,6 +85,8 @@ BASE_URL = "https://www.python.org"
 STORIES_URL = f"{BASE_URL}/success-stories/"
 JOBS_RSS_URL = f"{BASE_URL}/jobs/feed/rss/"
 
+CHECKPOINTS_KEY = "pydotorg:sync:checkpoints"
+
 CATEGORY_PATTERNS = {
     "conference": [r"pycon", r"europython", r"scipy", r"pydata", r"djangocon", r"pycascades"],
     "meetup": [r"meetup", r"user group", r"usergroup"],
@@ -177,30 +199,160 @@ async def _get_admin_user(session: AsyncSession) -> User:
     return user
 
 
-async def sync_events_from_ics(ctx: Mapping[str, Any]) -> dict[str, int]:  # noqa: PLR0912, PLR0915
+def sync_http_client(*, transport: httpx.AsyncBaseTransport | None = None) -> BoundedHTTPClient:
+    """Return a pooled HTTP client bounded to ``settings.sync_fetch_concurrency`` requests.
+
+    :func:`sync_all_external_content` shares one client between every task it
+    runs; a task run on its own opens its own.
+
+    Args:
+        transport: Custom transport, mainly for tests.
+    """
+    return BoundedHTTPClient(
+        concurrency=settings.sync_fetch_concurrency,
+        timeout=settings.sync_fetch_timeout,
+        transport=transport,
+    )
+
+
+@asynccontextmanager
+async def _sync_fetcher(ctx: Mapping[str, Any]) -> AsyncIterator[BoundedHTTPClient]:
+    """Yield the client shared through ``ctx``, or a new one closed on exit."""
+    fetcher = ctx.get("sync_fetcher")
+    if fetcher is not None:
+        yield fetcher
+        return
+    async with sync_http_client() as fetcher:
+        yield fetcher
+
+
+def _digest(*parts: str | bytes) -> str:
+    """Return the hex SHA-256 of ``parts``."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def _load_checkpoints(ctx: Mapping[str, Any], sources: Sequence[str]) -> dict[str, str]:
+    """Return the content hash recorded for each of ``sources`` by the last successful sync."""
+    if not sources:
+        return {}
+    redis = get_context_redis(ctx)
+    try:
+        values = await awaitable(redis.hmget(CHECKPOINTS_KEY, list(sources)))
+    except (RedisError, OSError):
+        logger.warning("Failed to load sync checkpoints", exc_info=True)
+        return {}
+    return {
+        source: value.decode() if isinstance(value, bytes) else value
+        for source, value in zip(sources, values, strict=True)
+        if value
+    }
+
+
+async def _save_checkpoints(ctx: Mapping[str, Any], digests: Mapping[str, str]) -> None:
+    """Record the content hashes of sources whose content was committed."""
+    if not digests:
+        return
+    redis = get_context_redis(ctx)
+    try:
+        await awaitable(redis.hset(CHECKPOINTS_KEY, mapping=dict(digests)))
+    except (RedisError, OSError):
+        logger.warning("Failed to save sync checkpoints", exc_info=True)
+
+
+async def _foreign_event_slugs(session: AsyncSession, calendar_id: UUID, slugs: Sequence[str]) -> set[str]:
+    """Return the ``slugs`` already used by events of calendars other than ``calendar_id``."""
+    foreign: set[str] = set()
+    for chunk in batched(slugs, PREFETCH_BATCH_SIZE, strict=False):
+        result = await session.execute(
+            select(Event.slug).where(Event.slug.in_(chunk), Event.calendar_id != calendar_id)
+        )
+        foreign.update(result.scalars())
+    return foreign
+
+
+def _parse_ics_events(ical_data: bytes) -> tuple[list[dict[str, Any]], int]:
+    """Parse the VEVENTs of an iCalendar document.
+
+    Returns:
+        Parsed events and the number of VEVENTs skipped for lacking a UID.
+    """
+    events = []
+    skipped = 0
+    for component in ICalendar.from_ical(ical_data).walk():
+        if component.name != "VEVENT":
+            continue
+
+        uid = str(component.get("UID", ""))
+        if not uid:
+            skipped += 1
+            continue
+
+        summary = str(component.get("SUMMARY", "Untitled Event"))
+        description = str(component.get("DESCRIPTION", "")) or None
+        dtstart = component.get("DTSTART")
+        events.append(
+            {
+                "slug": slugify(summary)[:100] or slugify(uid)[:100],
+                "title": summary,
+                "description": description,
+                "category": _detect_category(summary, description),
+                "location": _parse_location(str(component.get("LOCATION", "")) or None),
+                "dt_start": _parse_datetime(dtstart),
+                "dt_end": _parse_datetime(component.get("DTEND")),
+                "all_day": _is_all_day(dtstart),
+            }
+        )
+    return events, skipped
+
+
+async def sync_events_from_ics(ctx: Mapping[str, Any], *, full: bool = False) -> dict[str, Any]:
     """Sync events from Python.org's Google Calendar ICS feed.
 
-    Fetches the iCalendar feed and creates/updates Event records.
+    Fetches the iCalendar feed and upserts categories, locations, events and
+    occurrences, each with one prefetch and batched writes. Nothing is parsed
+    or written when the feed is unchanged since the last successful sync.
 
     Args:
         ctx: Task context containing dependencies.
+        full: Ignore the checkpoint and import the feed even if it is unchanged.
 
     Returns:
-        Dict with created/updated/skipped counts.
+        Dict with created/updated/unchanged/skipped/conflicts/occurrences/not_modified counts and stage timings.
     """
     session_maker = ctx["session_maker"]
-    stats = {"created": 0, "updated": 0, "skipped": 0, "occurrences": 0}
+    timer = StageTimer()
+    stats: dict[str, Any] = {
+        "created": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": 0,
+        "conflicts": 0,
+        "occurrences": 0,
+        "not_modified": 0,
+    }
 
     logger.info(f"Fetching events from {PYTHON_EVENTS_CALENDAR_URL}")
 
+    checkpoints = {} if full else await _load_checkpoints(ctx, [PYTHON_EVENTS_CALENDAR_URL])
     try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(PYTHON_EVENTS_CALENDAR_URL)
-            response.raise_for_status()
-            ical_data = response.content
+        with timer.stage("fetch"):
+            async with _sync_fetcher(ctx) as fetcher:
+                response = await fetcher.get(PYTHON_EVENTS_CALENDAR_URL)
     except Exception:
         logger.exception("Failed to fetch ICS feed")
-        return stats
+        return {**stats, "timings": timer.timings}
+
+    digest = _digest(response.content)
+    if checkpoints.get(PYTHON_EVENTS_CALENDAR_URL) == digest:
+        logger.info("Events calendar unchanged since last sync")
+        return {**stats, "not_modified": 1, "timings": timer.timings}
+
+    with timer.stage("parse"):
+        parsed, stats["skipped"] = await asyncio.to_thread(_parse_ics_events, response.content)
 
     async with session_maker() as session:
         admin_user = await _get_admin_user(session)
@@ -214,133 +366,168 @@ async def sync_events_from_ics(ctx: Mapping[str, Any]) -> dict[str, int]:  # noq
             await session.flush()
             logger.info("Created calendar: Python Events")
 
-        ical = ICalendar.from_ical(ical_data)
-        category_cache: dict[str, EventCategory] = {}
-        location_cache: dict[str, EventLocation] = {}
-
-        for component in ical.walk():
-            if component.name != "VEVENT":
-                continue
-
-            uid = str(component.get("UID", ""))
-            summary = str(component.get("SUMMARY", "Untitled Event"))
-            description = str(component.get("DESCRIPTION", "")) or None
-            location_str = str(component.get("LOCATION", "")) or None
-            dtstart = component.get("DTSTART")
-            dtend = component.get("DTEND")
-
-            if not uid:
-                stats["skipped"] += 1
-                continue
-
-            slug = slugify(summary)[:100]
-            if not slug:
-                slug = slugify(uid)[:100]
-
-            result = await session.execute(select(Event).where(Event.slug == slug, Event.calendar_id == calendar.id))
-            existing_event = result.scalar_one_or_none()
-
-            category_name = _detect_category(summary, description)
-            if category_name not in category_cache:
-                cat_slug = slugify(category_name)
-                result = await session.execute(
-                    select(EventCategory).where(
-                        EventCategory.slug == cat_slug, EventCategory.calendar_id == calendar.id
-                    )
-                )
-                category = result.scalar_one_or_none()
-                if category is None:
-                    category = EventCategory(name=category_name.title(), slug=cat_slug, calendar_id=calendar.id)
-                    session.add(category)
-                    await session.flush()
-                category_cache[category_name] = category
-            _ = category_cache[category_name]
-
-            loc_name, loc_address, loc_url = _parse_location(location_str)
-            loc_key = slugify(loc_name)[:50]
-            if loc_key not in location_cache:
-                result = await session.execute(select(EventLocation).where(EventLocation.slug == loc_key))
-                location = result.scalar_one_or_none()
-                if location is None:
-                    location = EventLocation(name=loc_name[:200], slug=loc_key, address=loc_address, url=loc_url)
-                    session.add(location)
-                    await session.flush()
-                location_cache[loc_key] = location
-            location = location_cache[loc_key]
-
-            start_dt = _parse_datetime(dtstart)
-            end_dt = _parse_datetime(dtend)
-            all_day = _is_all_day(dtstart)
-
-            if existing_event:
-                existing_event.title = summary
-                existing_event.description = description
-                existing_event.venue_id = location.id
-                stats["updated"] += 1
-                event = existing_event
-            else:
-                event = Event(
-                    name=slug,
-                    slug=slug,
-                    title=summary,
-                    description=description,
-                    calendar_id=calendar.id,
-                    venue_id=location.id,
-                    featured=False,
-                    creator_id=admin_user.id,
-                )
-                session.add(event)
-                await session.flush()
-                stats["created"] += 1
-
-            if start_dt:
-                result = await session.execute(
-                    select(EventOccurrence).where(
-                        EventOccurrence.event_id == event.id,
-                        EventOccurrence.dt_start == start_dt,
-                    )
-                )
-                existing_occurrence = result.scalar_one_or_none()
-
-                if not existing_occurrence:
-                    occurrence = EventOccurrence(
-                        event_id=event.id,
-                        dt_start=start_dt,
-                        dt_end=end_dt,
-                        all_day=all_day,
-                    )
-                    session.add(occurrence)
-                    stats["occurrences"] += 1
-
-        await session.commit()
-
+        # Event slugs are unique across calendars; never take over another calendar's event.
+        with timer.stage("prefetch"):
+            foreign = await _foreign_event_slugs(session, calendar.id, list({item["slug"] for item in parsed}))
+        if foreign:
+            logger.warning(f"Skipping {len(foreign)} events whose slugs belong to another calendar")
+            parsed = [item for item in parsed if item["slug"] not in foreign]
+            stats["conflicts"] = len(foreign)
+
+        await bulk_upsert(
+            session,
+            EventCategory,
+            [
+                {"name": item["category"].title(), "slug": slugify(item["category"]), "calendar_id": calendar.id}
+                for item in parsed
+            ],
+            key=("slug",),
+            timer=timer,
+        )
+
+        location_rows = []
+        for item in parsed:
+            loc_name, loc_address, loc_url = item["location"]
+            item["venue_slug"] = slugify(loc_name)[:50]
+            location_rows.append(
+                {"name": loc_name[:200], "slug": item["venue_slug"], "address": loc_address, "url": loc_url}
+            )
+        locations = await bulk_upsert(session, EventLocation, location_rows, key=("slug",), timer=timer)
+
+        events = await bulk_upsert(
+            session,
+            Event,
+            [
+                {
+                    "name": item["slug"],
+                    "slug": item["slug"],
+                    "title": item["title"],
+                    "description": item["description"],
+                    "calendar_id": calendar.id,
+                    "venue_id": locations.ids[item["venue_slug"],],
+                    "featured": False,
+                    "creator_id": admin_user.id,
+                }
+                for item in parsed
+            ],
+            key=("slug",),
+            update=("title", "description", "venue_id"),
+            timer=timer,
+        )
+
+        occurrences = await bulk_upsert(
+            session,
+            EventOccurrence,
+            [
+                {
+                    "event_id": events.ids[item["slug"],],
+                    "dt_start": item["dt_start"],
+                    "dt_end": item["dt_end"],
+                    "all_day": item["all_day"],
+                }
+                for item in parsed
+                if item["dt_start"]
+            ],
+            key=("event_id", "dt_start"),
+            timer=timer,
+        )
+
+        with timer.stage("commit"):
+            await session.commit()
+
+    await _save_checkpoints(ctx, {PYTHON_EVENTS_CALENDAR_URL: digest})
+
+    stats.update(
+        created=events.created,
+        updated=events.updated,
+        unchanged=events.unchanged,
+        occurrences=occurrences.created,
+        timings=timer.timings,
+    )
     logger.info(
         f"Events sync complete: {stats['created']} created, {stats['updated']} updated, "
-        f"{stats['occurrences']} occurrences"
+        f"{stats['occurrences']} occurrences in {timer.timings}"
     )
     return stats
 
 
-async def sync_news_from_feeds(ctx: Mapping[str, Any]) -> dict[str, int]:  # noqa: PLR0915
+def _parse_news_entries(content: bytes, feed_url: str) -> list[dict[str, Any]]:
+    """Parse an RSS/Atom document into ``BlogEntry`` column values (without ``feed_id``)."""
+    entries = []
+    for entry in feedparser.parse(content).entries:
+        title = entry.get("title", "Untitled")
+
+        content_value = None
+        if entry.get("content"):
+            content_value = entry["content"][0].get("value", "")
+        elif "summary" in entry:
+            content_value = entry["summary"]
+
+        pub_date = datetime.now(UTC)
+        if entry.get("published_parsed"):
+            pub_date = datetime(*entry["published_parsed"][:6], tzinfo=UTC)
+        elif entry.get("updated_parsed"):
+            pub_date = datetime(*entry["updated_parsed"][:6], tzinfo=UTC)
+
+        entries.append(
+            {
+                "title": title,
+                "summary": entry.get("summary", ""),
+                "content": content_value,
+                "url": entry.get("link", ""),
+                "pub_date": pub_date,
+                "guid": entry.get("id") or entry.get("link") or f"{feed_url}#{title}",
+            }
+        )
+    return entries
+
+
+async def sync_news_from_feeds(ctx: Mapping[str, Any], *, full: bool = False) -> dict[str, Any]:
     """Sync news/blog entries from official Python.org RSS feeds.
 
-    Fetches RSS feeds and creates/updates BlogEntry records.
+    Fetches the feeds concurrently and upserts BlogEntry records in batches.
+    Feeds unchanged since the last successful sync are not parsed.
 
     Args:
         ctx: Task context containing dependencies.
+        full: Ignore checkpoints and import every feed even if it is unchanged.
 
     Returns:
-        Dict with created/updated counts.
+        Dict with created/updated/unchanged/not_modified counts and stage timings.
     """
     session_maker = ctx["session_maker"]
-    stats = {"created": 0, "updated": 0}
+    timer = StageTimer()
+    stats: dict[str, Any] = {"created": 0, "updated": 0, "unchanged": 0, "not_modified": 0}
+    feed_urls = [feed_data["feed_url"] for feed_data in OFFICIAL_FEEDS]
+
+    checkpoints = {} if full else await _load_checkpoints(ctx, feed_urls)
+    logger.info(f"Fetching {len(feed_urls)} feeds")
+    with timer.stage("fetch"):
+        async with _sync_fetcher(ctx) as fetcher:
+            responses = await asyncio.gather(*(fetcher.get(url) for url in feed_urls), return_exceptions=True)
+
+    fetched_urls: list[str] = []
+    digests: dict[str, str] = {}
+    entries: dict[str, list[dict[str, Any]]] = {}
+    for feed_url, response in zip(feed_urls, responses, strict=True):
+        if isinstance(response, BaseException):
+            logger.error(f"Failed to fetch {feed_url}", exc_info=response)
+            continue
+        fetched_urls.append(feed_url)
+        digest = _digest(response.content)
+        if checkpoints.get(feed_url) == digest:
+            stats["not_modified"] += 1
+            continue
+        digests[feed_url] = digest
+        with timer.stage("parse"):
+            entries[feed_url] = await asyncio.to_thread(_parse_news_entries, response.content, feed_url)
 
     async with session_maker() as session:
-        for feed_data in OFFICIAL_FEEDS:
-            result = await session.execute(select(Feed).where(Feed.feed_url == feed_data["feed_url"]))
-            feed = result.scalar_one_or_none()
+        result = await session.execute(select(Feed).where(Feed.feed_url.in_(feed_urls)))
+        feeds = {feed.feed_url: feed for feed in result.scalars()}
 
-            if feed is None:
+        for feed_data in OFFICIAL_FEEDS:
+            if feed_data["feed_url"] not in feeds:
                 feed = Feed(
                     name=feed_data["name"],
                     website_url=feed_data["website_url"],
@@ -348,97 +535,36 @@ async def sync_news_from_feeds(ctx: Mapping[str, Any]) -> dict[str, int]:  # noq
                     is_active=True,
                 )
                 session.add(feed)
-                await session.flush()
+                feeds[feed.feed_url] = feed
                 logger.info(f"Created feed: {feed_data['name']}")
+        await session.flush()
 
-            logger.info(f"Fetching: {feed.name}")
-
-            try:
-                async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-                    response = await client.get(feed.feed_url)
-                    response.raise_for_status()
-                    parsed = feedparser.parse(response.content)
-            except Exception:
-                logger.exception(f"Failed to fetch {feed.feed_url}")
-                continue
-
-            if not parsed.entries:
-                continue
-
-            for entry in parsed.entries:
-                title = entry.get("title", "Untitled")
-                link = entry.get("link", "")
-                guid = entry.get("id") or entry.get("link") or f"{feed.feed_url}#{title}"
-                summary = entry.get("summary", "")
-
-                content = None
-                if entry.get("content"):
-                    content = entry["content"][0].get("value", "")
-                elif "summary" in entry:
-                    content = entry["summary"]
-
-                pub_date = datetime.now(UTC)
-                if entry.get("published_parsed"):
-                    pub_date = datetime(*entry["published_parsed"][:6], tzinfo=UTC)
-                elif entry.get("updated_parsed"):
-                    pub_date = datetime(*entry["updated_parsed"][:6], tzinfo=UTC)
-
-                result = await session.execute(select(BlogEntry).where(BlogEntry.guid == guid))
-                existing = result.scalar_one_or_none()
-
-                if existing:
-                    existing.title = title
-                    existing.summary = summary
-                    existing.content = content
-                    existing.url = link
-                    existing.pub_date = pub_date
-                    stats["updated"] += 1
-                else:
-                    blog_entry = BlogEntry(
-                        feed_id=feed.id,
-                        title=title,
-                        summary=summary,
-                        content=content,
-                        url=link,
-                        pub_date=pub_date,
-                        guid=guid,
-                    )
-                    session.add(blog_entry)
-                    stats["created"] += 1
-
-            feed.last_fetched = datetime.now(UTC)
-
-        await session.commit()
-
-    logger.info(f"News sync complete: {stats['created']} created, {stats['updated']} updated")
-    return stats
-
+        for feed_url in fetched_urls:
+            feeds[feed_url].last_fetched = datetime.now(UTC)
 
-async def sync_success_stories(ctx: Mapping[str, Any]) -> dict[str, int]:  # noqa: PLR0912, PLR0915
-    """Sync success stories from python.org/success-stories/.
+        upserted = await bulk_upsert(
+            session,
+            BlogEntry,
+            [{**entry, "feed_id": feeds[feed_url].id} for feed_url, rows in entries.items() for entry in rows],
+            key=("guid",),
+            update=("title", "summary", "content", "url", "pub_date"),
+            timer=timer,
+        )
 
-    Scrapes the stories index and individual pages.
-
-    Args:
-        ctx: Task context containing dependencies.
+        with timer.stage("commit"):
+            await session.commit()
 
-    Returns:
-        Dict with created/updated/error counts.
-    """
-    session_maker = ctx["session_maker"]
-    stats = {"created": 0, "updated": 0, "errors": 0}
+    await _save_checkpoints(ctx, digests)
 
-    logger.info(f"Fetching success stories index: {STORIES_URL}")
+    stats.update(
+        created=upserted.created, updated=upserted.updated, unchanged=upserted.unchanged, timings=timer.timings
+    )
+    logger.info(f"News sync complete: {stats['created']} created, {stats['updated']} updated in {timer.timings}")
+    return stats
 
-    try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(STORIES_URL)
-            response.raise_for_status()
-            index_html = response.text
-    except Exception:
-        logger.exception("Failed to fetch stories index")
-        return stats
 
+def _parse_story_index(index_html: str) -> list[dict[str, str]]:
+    """Collect the title, URL and category of every story linked from the stories index."""
     soup = BeautifulSoup(index_html, "lxml")
     stories = []
 
@@ -466,242 +592,336 @@ async def sync_success_stories(ctx: Mapping[str, Any]) -> dict[str, int]:  # noq
                         full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
                         stories.append({"title": title, "url": full_url, "category": "General"})
 
-    logger.info(f"Found {len(stories)} story links")
+    return stories
+
+
+def _parse_story_page(story_html: str, story_info: Mapping[str, str]) -> dict[str, Any] | None:
+    """Extract ``Story`` column values from a story page, or None if it yields no slug."""
+    story_soup = BeautifulSoup(story_html, "lxml")
+
+    title_tag = story_soup.find("h1")
+    title = title_tag.get_text(strip=True) if title_tag else story_info["title"]
+
+    company_name = "Unknown Company"
+    company_url = None
+    author_section = story_soup.find(class_="author-info") or story_soup.find(class_="company-info")
+    if author_section:
+        company_link = author_section.find("a", href=True)
+        if company_link:
+            company_name = company_link.get_text(strip=True)
+            company_url = company_link["href"]
+        else:
+            company_text = author_section.get_text(strip=True)
+            if company_text:
+                company_name = company_text
+
+    article = story_soup.find("article") or story_soup.find(class_="article-content") or story_soup.find("main")
+    content = ""
+    if article:
+        for tag in article.find_all(["script", "style", "nav", "footer"]):
+            tag.decompose()
+        content = article.get_text(separator="\n", strip=True)
+
+    blockquote = story_soup.find("blockquote")
+    if blockquote:
+        pull_quote = blockquote.get_text(strip=True)
+        content = f"> {pull_quote}\n\n{content}"
+
+    image = None
+    og_image = story_soup.find("meta", property="og:image")
+    if og_image:
+        image = og_image.get("content")
+
+    slug = slugify(title)[:100]
+    if not slug:
+        return None
+
+    return {
+        "name": title,
+        "slug": slug,
+        "company_name": company_name,
+        "company_url": company_url,
+        "category": story_info["category"],
+        "content": content,
+        "image": image,
+    }
+
+
+async def sync_success_stories(ctx: Mapping[str, Any], *, full: bool = False) -> dict[str, Any]:
+    """Sync success stories from python.org/success-stories/.
+
+    Scrapes the stories index, fetches the story pages concurrently, parses
+    them in worker threads and upserts categories and stories in batches.
+    Pages unchanged since the last successful sync are not parsed.
+
+    Args:
+        ctx: Task context containing dependencies.
+        full: Ignore checkpoints and import every story page even if it is unchanged.
+
+    Returns:
+        Dict with created/updated/unchanged/error/not_modified counts and stage timings.
+    """
+    session_maker = ctx["session_maker"]
+    timer = StageTimer()
+    stats: dict[str, Any] = {"created": 0, "updated": 0, "unchanged": 0, "errors": 0, "not_modified": 0}
+
+    logger.info(f"Fetching success stories index: {STORIES_URL}")
+
+    async with _sync_fetcher(ctx) as fetcher:
+        try:
+            with timer.stage("fetch"):
+                response = await fetcher.get(STORIES_URL)
+        except Exception:
+            logger.exception("Failed to fetch stories index")
+            return {**stats, "timings": timer.timings}
+
+        with timer.stage("parse"):
+            stories = (await asyncio.to_thread(_parse_story_index, response.text))[:50]
+        logger.info(f"Found {len(stories)} story links")
+
+        checkpoints = {} if full else await _load_checkpoints(ctx, [story["url"] for story in stories])
+        with timer.stage("fetch"):
+            responses = await asyncio.gather(*(fetcher.get(story["url"]) for story in stories), return_exceptions=True)
+
+    digests: dict[str, str] = {}
+    pages: list[tuple[str, Mapping[str, str]]] = []
+    for story_info, response in zip(stories, responses, strict=True):
+        if isinstance(response, BaseException):
+            logger.warning(f"Failed to fetch {story_info['url']}")
+            stats["errors"] += 1
+            continue
+        # The category comes from the index, so a story moved between sections is re-imported.
+        digest = _digest(story_info["category"], response.content)
+        if checkpoints.get(story_info["url"]) == digest:
+            stats["not_modified"] += 1
+            continue
+        digests[story_info["url"]] = digest
+        pages.append((response.text, story_info))
+
+    with timer.stage("parse"):
+        parsed = [
+            story
+            for story in await asyncio.gather(*(asyncio.to_thread(_parse_story_page, *page) for page in pages))
+            if story is not None
+        ]
 
     async with session_maker() as session:
         admin_user = await _get_admin_user(session)
-        category_cache: dict[str, StoryCategory] = {}
-
-        for story_info in stories[:50]:
-            try:
-                async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-                    response = await client.get(story_info["url"])
-                    response.raise_for_status()
-                    story_html = response.text
-            except Exception:  # noqa: BLE001
-                logger.warning(f"Failed to fetch {story_info['url']}")
-                stats["errors"] += 1
-                continue
-
-            story_soup = BeautifulSoup(story_html, "lxml")
-
-            title_tag = story_soup.find("h1")
-            title = title_tag.get_text(strip=True) if title_tag else story_info["title"]
-
-            company_name = "Unknown Company"
-            company_url = None
-            author_section = story_soup.find(class_="author-info") or story_soup.find(class_="company-info")
-            if author_section:
-                company_link = author_section.find("a", href=True)
-                if company_link:
-                    company_name = company_link.get_text(strip=True)
-                    company_url = company_link["href"]
-                else:
-                    company_text = author_section.get_text(strip=True)
-                    if company_text:
-                        company_name = company_text
-
-            article = story_soup.find("article") or story_soup.find(class_="article-content") or story_soup.find("main")
-            content = ""
-            if article:
-                for tag in article.find_all(["script", "style", "nav", "footer"]):
-                    tag.decompose()
-                content = article.get_text(separator="\n", strip=True)
-
-            blockquote = story_soup.find("blockquote")
-            if blockquote:
-                pull_quote = blockquote.get_text(strip=True)
-                content = f"> {pull_quote}\n\n{content}"
-
-            image = None
-            og_image = story_soup.find("meta", property="og:image")
-            if og_image:
-                image = og_image.get("content")
-
-            slug = slugify(title)[:100]
-            if not slug:
-                continue
-
-            result = await session.execute(select(Story).where(Story.slug == slug))
-            existing = result.scalar_one_or_none()
-
-            category_name = story_info["category"]
-            if category_name not in category_cache:
-                cat_slug = slugify(category_name)[:50]
-                result = await session.execute(select(StoryCategory).where(StoryCategory.slug == cat_slug))
-                category = result.scalar_one_or_none()
-                if category is None:
-                    category = StoryCategory(name=category_name, slug=cat_slug)
-                    session.add(category)
-                    await session.flush()
-                category_cache[category_name] = category
-            category = category_cache[category_name]
-
-            if existing:
-                existing.name = title
-                existing.company_name = company_name
-                existing.company_url = company_url
-                existing.category_id = category.id
-                existing.content = content
-                existing.is_published = True
-                if image:
-                    existing.image = image
-                stats["updated"] += 1
-            else:
-                story = Story(
-                    name=title,
-                    slug=slug,
-                    company_name=company_name,
-                    company_url=company_url,
-                    category_id=category.id,
-                    content=content,
-                    content_type=ContentType.MARKDOWN,
-                    is_published=True,
-                    featured=False,
-                    image=image,
-                    creator_id=admin_user.id,
-                )
-                session.add(story)
-                stats["created"] += 1
-
-        await session.commit()
 
-    logger.info(f"Stories sync complete: {stats['created']} created, {stats['updated']} updated")
+        for story in parsed:
+            story["category_slug"] = slugify(story["category"])[:50]
+        categories = await bulk_upsert(
+            session,
+            StoryCategory,
+            [{"name": story["category"], "slug": story["category_slug"]} for story in parsed],
+            key=("slug",),
+            timer=timer,
+        )
+
+        upserted = await bulk_upsert(
+            session,
+            Story,
+            [
+                {
+                    "name": story["name"],
+                    "slug": story["slug"],
+                    "company_name": story["company_name"],
+                    "company_url": story["company_url"],
+                    "category_id": categories.ids[story["category_slug"],],
+                    "content": story["content"],
+                    "content_type": ContentType.MARKDOWN,
+                    "is_published": True,
+                    "featured": False,
+                    "image": story["image"],
+                    "creator_id": admin_user.id,
+                }
+                for story in parsed
+            ],
+            key=("slug",),
+            update=("name", "company_name", "company_url", "category_id", "content", "is_published", "image"),
+            keep_existing_if_null=("image",),
+            timer=timer,
+        )
+
+        with timer.stage("commit"):
+            await session.commit()
+
+    await _save_checkpoints(ctx, digests)
+
+    stats.update(
+        created=upserted.created, updated=upserted.updated, unchanged=upserted.unchanged, timings=timer.timings
+    )
+    logger.info(f"Stories sync complete: {stats['created']} created, {stats['updated']} updated in {timer.timings}")
     return stats
 
 
-async def sync_jobs_from_rss(ctx: Mapping[str, Any]) -> dict[str, int]:  # noqa: PLR0912, PLR0915
+def _parse_job_entries(content: bytes) -> tuple[list[dict[str, Any]], int]:
+    """Parse the jobs RSS feed into ``Job`` column values plus a ``category`` name.
+
+    Returns:
+        Parsed jobs and the number of entries skipped for lacking a usable title.
+    """
+    jobs = []
+    skipped = 0
+    for entry in feedparser.parse(content).entries:
+        title = entry.get("title", "").strip()
+        slug = slugify(title)[:200]
+        if not slug:
+            skipped += 1
+            continue
+
+        category_name = None
+        for tag in entry.get("tags", []):
+            term = tag.get("term", "").lower()
+            if term in ("python", "django", "web", "data", "ml", "ai"):
+                category_name = term.title()
+                break
+
+        jobs.append(
+            {
+                "slug": slug,
+                "job_title": title[:200],
+                "company_name": _extract_company_name(title)[:200],
+                "description": entry.get("summary", "") or entry.get("description", ""),
+                "url": entry.get("link", ""),
+                "category": category_name,
+            }
+        )
+    return jobs, skipped
+
+
+async def sync_jobs_from_rss(ctx: Mapping[str, Any], *, full: bool = False) -> dict[str, Any]:
     """Sync job postings from python.org/jobs/feed/rss/.
 
-    Fetches job listings from the RSS feed and creates/updates Job records.
+    Fetches job listings from the RSS feed and upserts Job records in batches.
+    Nothing is parsed or written when the feed is unchanged since the last
+    successful sync.
 
     Args:
         ctx: Task context containing dependencies.
+        full: Ignore the checkpoint and import the feed even if it is unchanged.
 
     Returns:
-        Dict with created/updated/skipped counts.
+        Dict with created/updated/unchanged/skipped/not_modified counts and stage timings.
     """
     session_maker = ctx["session_maker"]
-    stats = {"created": 0, "updated": 0, "skipped": 0}
+    timer = StageTimer()
+    stats: dict[str, Any] = {"created": 0, "updated": 0, "unchanged": 0, "skipped": 0, "not_modified": 0}
 
     logger.info(f"Fetching jobs from {JOBS_RSS_URL}")
 
+    checkpoints = {} if full else await _load_checkpoints(ctx, [JOBS_RSS_URL])
     try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(JOBS_RSS_URL)
-            response.raise_for_status()
-            parsed = feedparser.parse(response.content)
+        with timer.stage("fetch"):
+            async with _sync_fetcher(ctx) as fetcher:
+                response = await fetcher.get(JOBS_RSS_URL)
     except Exception:
         logger.exception("Failed to fetch jobs RSS feed")
-        return stats
+        return {**stats, "timings": timer.timings}
+
+    digest = _digest(response.content)
+    if checkpoints.get(JOBS_RSS_URL) == digest:
+        logger.info("Jobs feed unchanged since last sync")
+        return {**stats, "not_modified": 1, "timings": timer.timings}
+
+    with timer.stage("parse"):
+        parsed, stats["skipped"] = await asyncio.to_thread(_parse_job_entries, response.content)
 
-    if not parsed.entries:
+    if not parsed and not stats["skipped"]:
         logger.warning("No job entries found in feed")
-        return stats
+        return {**stats, "timings": timer.timings}
 
-    logger.info(f"Found {len(parsed.entries)} job entries")
+    logger.info(f"Found {len(parsed) + stats['skipped']} job entries")
 
     async with session_maker() as session:
         admin_user = await _get_admin_user(session)
-        category_cache: dict[str, JobCategory] = {}
-
-        for entry in parsed.entries:
-            title = entry.get("title", "").strip()
-            if not title:
-                stats["skipped"] += 1
-                continue
-
-            link = entry.get("link", "")
-            description = entry.get("summary", "") or entry.get("description", "")
-
-            slug = slugify(title)[:200]
-            if not slug:
-                stats["skipped"] += 1
-                continue
-
-            result = await session.execute(select(Job).where(Job.slug == slug))
-            existing = result.scalar_one_or_none()
-
-            company_name = _extract_company_name(title)
-            location_parts = {"city": None, "region": None, "country": "Remote"}
-
-            categories = entry.get("tags", [])
-            category_name = None
-            for tag in categories:
-                term = tag.get("term", "").lower()
-                if term in ("python", "django", "web", "data", "ml", "ai"):
-                    category_name = term.title()
-                    break
-
-            if category_name:
-                if category_name not in category_cache:
-                    cat_slug = slugify(category_name)[:50]
-                    result = await session.execute(select(JobCategory).where(JobCategory.slug == cat_slug))
-                    category = result.scalar_one_or_none()
-                    if category is None:
-                        category = JobCategory(name=category_name, slug=cat_slug)
-                        session.add(category)
-                        await session.flush()
-                    category_cache[category_name] = category
-                category = category_cache[category_name]
-            else:
-                category = None
-
-            if existing:
-                existing.description = description
-                existing.url = link
-                stats["updated"] += 1
-            else:
-                job = Job(
-                    slug=slug,
-                    job_title=title[:200],
-                    company_name=company_name[:200],
-                    description=description,
-                    city=location_parts["city"],
-                    region=location_parts["region"],
-                    country=location_parts["country"],
-                    email="jobs@python.org",
-                    url=link,
-                    status=JobStatus.APPROVED,
-                    telecommuting=True,
-                    creator_id=admin_user.id,
-                    category_id=category.id if category else None,
-                )
-                session.add(job)
-                stats["created"] += 1
-
-        await session.commit()
 
-    logger.info(f"Jobs sync complete: {stats['created']} created, {stats['updated']} updated")
+        for job in parsed:
+            job["category_slug"] = slugify(job["category"])[:50] if job["category"] else None
+        categories = await bulk_upsert(
+            session,
+            JobCategory,
+            [{"name": job["category"], "slug": job["category_slug"]} for job in parsed if job["category"]],
+            key=("slug",),
+            timer=timer,
+        )
+
+        upserted = await bulk_upsert(
+            session,
+            Job,
+            [
+                {
+                    "slug": job["slug"],
+                    "job_title": job["job_title"],
+                    "company_name": job["company_name"],
+                    "description": job["description"],
+                    "city": None,
+                    "region": None,
+                    "country": "Remote",
+                    "email": "jobs@python.org",
+                    "url": job["url"],
+                    "status": JobStatus.APPROVED,
+                    "telecommuting": True,
+                    "creator_id": admin_user.id,
+                    "category_id": categories.ids[job["category_slug"],] if job["category_slug"] else None,
+                }
+                for job in parsed
+            ],
+            key=("slug",),
+            update=("description", "url"),
+            timer=timer,
+        )
+
+        with timer.stage("commit"):
+            await session.commit()
+
+    await _save_checkpoints(ctx, {JOBS_RSS_URL: digest})
+
+    stats.update(
+        created=upserted.created, updated=upserted.updated, unchanged=upserted.unchanged, timings=timer.timings
+    )
+    logger.info(f"Jobs sync complete: {stats['created']} created, {stats['updated']} updated in {timer.timings}")
     return stats
 
 
-async def sync_all_external_content(ctx: Mapping[str, Any]) -> dict[str, Any]:
+async def sync_all_external_content(ctx: Mapping[str, Any], *, full: bool = False) -> dict[str, Any]:
     """Sync all external content (events, news, stories, jobs).
 
-    This is a convenience task that runs all sync tasks.
+    Runs every sync task concurrently over one shared HTTP client, so
+    they reuse its connection pool and stay within one concurrency limit. A
+    failing task does not stop the others.
 
     Args:
         ctx: Task context containing dependencies.
+        full: Ignore checkpoints and import every source even if it is unchanged.
 
     Returns:
-        Dict with results from all sync tasks.
+        Dict with results from all sync tasks; a failed task maps to ``{"error": ...}``.
     """
     logger.info("Starting full external content sync")
 
-    events_stats = await sync_events_from_ics(ctx)
-    news_stats = await sync_news_from_feeds(ctx)
-    stories_stats = await sync_success_stories(ctx)
-    jobs_stats = await sync_jobs_from_rss(ctx)
+    tasks = {
+        "events": sync_events_from_ics,
+        "news": sync_news_from_feeds,
+        "stories": sync_success_stories,
+        "jobs": sync_jobs_from_rss,
+    }
+    async with sync_http_client() as fetcher:
+        task_ctx = {**ctx, "sync_fetcher": fetcher}
+        results = await asyncio.gather(*(task(task_ctx, full=full) for task in tasks.values()), return_exceptions=True)
+
+    summary: dict[str, Any] = {}
+    for name, result in zip(tasks, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error(f"{name.title()} sync failed", exc_info=result)
+            summary[name] = {"error": str(result)}
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            summary[name] = result
 
     logger.info("Full external content sync complete")
-
-    return {
-        "events": events_stats,
-        "news": news_stats,
-        "stories": stories_stats,
-        "jobs": jobs_stats,
-    }
+    return summary
 
 
 cron_sync_events = CronJob(
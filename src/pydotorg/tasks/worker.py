@@ -126,6 +126,11 @@ async def shutdown(ctx: dict[str, Any]) -> None:
         await redis.aclose()
         logger.debug("Redis connection closed")
 
+    from pydotorg.core.email.transport import smtp_pool
+
+    await smtp_pool.aclose()
+    logger.debug("SMTP connections closed")
+
     sys.stdout.write("\033[92m✓ Worker shutdown complete\033[0m\n")
     sys.stdout.flush()
 
@@ -237,6 +242,7 @@ async def test_failing_task(ctx: dict[str, Any]) -> dict[str, Any]:
 
 def get_task_functions() -> list[Callable[..., Any]]:
     """Get all task functions dynamically to avoid circular imports."""
+    from pydotorg.tasks.api_keys import flush_api_key_usage
     from pydotorg.tasks.cache import (
         clear_cache,
         get_cache_stats,
@@ -247,9 +253,12 @@ def get_task_functions() -> list[Callable[..., Any]]:
         warm_pages_cache,
         warm_releases_cache,
     )
+    from pydotorg.tasks.content import render_stale_content
     from pydotorg.tasks.downloads import (
         aggregate_download_stats,
+        cleanup_download_stats,
         flush_download_stats,
+        migrate_download_stats,
     )
     from pydotorg.tasks.email import (
         send_bulk_email,
@@ -295,10 +304,12 @@ def get_task_functions() -> list[Callable[..., Any]]:
         flush_download_stats,
         archive_old_jobs,
         check_event_reminders,
+        cleanup_download_stats,
         cleanup_draft_jobs,
         cleanup_past_occurrences,
         clear_cache,
         expire_jobs,
+        flush_api_key_usage,
         get_cache_stats,
         index_all_blogs,
         index_all_events,
@@ -310,11 +321,13 @@ def get_task_functions() -> list[Callable[..., Any]]:
         index_job,
         index_page,
         invalidate_page_response_cache,
+        migrate_download_stats,
         rebuild_search_index,
         refresh_all_feeds,
         refresh_single_feed,
         refresh_stale_feeds,
         remove_job_from_index,
+        render_stale_content,
         send_bulk_email,
         send_event_approved_email,
         send_event_created_email,
@@ -340,10 +353,12 @@ def get_task_functions() -> list[Callable[..., Any]]:
 
 def get_cron_jobs() -> list[Any]:
     """Get all cron jobs dynamically to avoid circular imports."""
+    from pydotorg.tasks.api_keys import cron_flush_api_key_usage
     from pydotorg.tasks.cache import (
         cron_warm_homepage_cache,
         cron_warm_releases_cache,
     )
+    from pydotorg.tasks.downloads import cron_flush_download_stats
     from pydotorg.tasks.events import (
         cron_cleanup_past_occurrences,
         cron_event_reminders,
@@ -368,6 +383,8 @@ def get_cron_jobs() -> list[Any]:
         cron_cleanup_past_occurrences,
         cron_event_reminders,
         cron_expire_jobs,
+        cron_flush_api_key_usage,
+        cron_flush_download_stats,
         cron_rebuild_indexes,
         cron_refresh_feeds,
         cron_sync_events,
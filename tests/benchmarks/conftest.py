@@ -0,0 +1,74 @@
+"""Shared fixtures for performance benchmarks.
+
+Benchmarks are marked ``slow`` and skipped by default. Run them with::
+
+    make test-benchmarks
+
+Results are printed as a table per benchmark, so run with ``-s`` to see them.
+Each benchmark also asserts the structural win it measures (query counts,
+round trips, allocations) so regressions fail loudly without relying on timings.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class StatementCounter:
+    """Counts SQL statements executed on an engine."""
+
+    count: int = 0
+    statements: list[str] = field(default_factory=list)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.statements.clear()
+
+
+@pytest.fixture
+def count_statements() -> Iterator[Callable[[AsyncEngine], StatementCounter]]:
+    """Attach a statement counter to an async engine for the duration of a test."""
+    attached: list[tuple[AsyncEngine, Callable]] = []
+
+    def _attach(engine: AsyncEngine) -> StatementCounter:
+        counter = StatementCounter()
+
+        def _before_cursor_execute(_conn, _cursor, statement, *_args) -> None:
+            counter.count += 1
+            counter.statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+        attached.append((engine, _before_cursor_execute))
+        return counter
+
+    yield _attach
+
+    for engine, listener in attached:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+
+
+async def time_per_call(func: Callable[[], Awaitable[object]], iterations: int) -> float:
+    """Return the mean wall time of ``func`` in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def print_table(title: str, header: tuple[str, ...], rows: list[tuple[object, ...]]) -> None:
+    """Print benchmark results as an aligned table."""
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *rows, strict=True)]
+    lines = [f"\n{title}", "  ".join(h.ljust(w) for h, w in zip(header, widths, strict=True))]
+    lines.extend("  ".join(str(c).ljust(w) for c, w in zip(row, widths, strict=True)) for row in rows)
+    print("\n".join(lines))  # noqa: T201
@@ -0,0 +1,174 @@
+"""Benchmark: single-pass auth resolver vs. the former two-middleware stack.
+
+The former stack ran ``UserPopulationMiddleware`` and then ``JWTAuthMiddleware``.
+Each built its own ``Request`` and resolved credentials independently; the second
+pass was skipped only when the first one found a user. ``_LegacyPopulation`` and
+``_LegacyAuth`` below reproduce that control flow on top of the current
+credential resolution so both stacks do identical per-credential work.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig, SQLAlchemyPlugin
+from litestar import Litestar, get
+from litestar.connection import Request
+from litestar.middleware import AbstractAuthenticationMiddleware, AuthenticationResult, MiddlewareProtocol
+from litestar.testing import AsyncTestClient
+
+from pydotorg.config import settings
+from pydotorg.core.auth.api_key_cache import APIKeyCache
+from pydotorg.core.auth.guards import require_authenticated
+from pydotorg.core.auth.jwt import jwt_service
+from pydotorg.core.auth.middleware import JWTAuthMiddleware, _extract_credentials
+from pydotorg.core.auth.user_cache import UserCache
+from pydotorg.core.database.base import AuditBase
+from pydotorg.domains.users.api_keys import APIKey, APIKeyService
+from pydotorg.domains.users.models import Membership, User
+from tests.benchmarks.conftest import print_table, time_per_call
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from litestar.types import ASGIApp, Receive, Scope, Send
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ITERATIONS = 200
+
+
+class _LegacyPopulation(MiddlewareProtocol):
+    """Former UserPopulationMiddleware: its own Request, its own resolution."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope)
+        _ = request.headers, request.cookies
+        result = await JWTAuthMiddleware._resolve_credentials(scope, _extract_credentials(scope))
+        if result.user:
+            scope["user"] = result.user
+            scope["legacy_auth"] = result.auth
+        await self.app(scope, receive, send)
+
+
+class _LegacyAuth(AbstractAuthenticationMiddleware):
+    """Former JWTAuthMiddleware: short-circuits on a populated user, otherwise resolves again."""
+
+    async def authenticate_request(self, connection) -> AuthenticationResult:
+        if connection.scope.get("user"):
+            return AuthenticationResult(user=connection.scope["user"], auth=connection.scope.get("legacy_auth"))
+        _ = connection.headers, connection.cookies
+        result = await JWTAuthMiddleware._resolve_credentials(connection.scope, _extract_credentials(connection.scope))
+        return AuthenticationResult(user=result.user, auth=result.auth)
+
+
+@get("/protected", guards=[require_authenticated], sync_to_thread=False)
+def protected() -> dict[str, str]:
+    return {"ok": "yes"}
+
+
+@get("/public", exclude_from_auth=True, sync_to_thread=False)
+def public() -> dict[str, str]:
+    return {"ok": "yes"}
+
+
+@pytest.fixture
+async def sqlalchemy_config(tmp_path: Path) -> AsyncIterator[SQLAlchemyAsyncConfig]:
+    config = SQLAlchemyAsyncConfig(connection_string=f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+    tables = [User.__table__, Membership.__table__, APIKey.__table__]
+    async with config.get_engine().begin() as conn:
+        await conn.run_sync(lambda sync_conn: AuditBase.metadata.create_all(sync_conn, tables=tables))
+    yield config
+    await config.get_engine().dispose()
+
+
+@pytest.fixture
+async def credentials(sqlalchemy_config: SQLAlchemyAsyncConfig) -> dict[str, dict[str, str]]:
+    async with sqlalchemy_config.get_session() as session:
+        user = User(username="bench", email="bench@example.com")
+        session.add(user)
+        await session.flush()
+        token = jwt_service.create_access_token(user.id)
+        api_key, raw_key = APIKeyService.create_key(user.id, "bench")
+        session.add(api_key)
+        await session.commit()
+
+    return {
+        "valid api key": {"X-API-Key": raw_key},
+        "invalid api key": {"X-API-Key": "pyorg_not-a-real-key"},
+        "valid jwt": {"Authorization": f"Bearer {token}"},
+        "stale session": {"Cookie": f"{settings.session_cookie_name}=expired"},
+        "anonymous": {},
+    }
+
+
+def _app(config: SQLAlchemyAsyncConfig, *, legacy: bool) -> Litestar:
+    middleware = [_LegacyPopulation, _LegacyAuth] if legacy else [JWTAuthMiddleware]
+    return Litestar(
+        route_handlers=[protected, public],
+        plugins=[SQLAlchemyPlugin(config=config)],
+        middleware=middleware,
+    )
+
+
+async def test_auth_resolver_queries_and_latency(
+    sqlalchemy_config: SQLAlchemyAsyncConfig,
+    credentials: dict[str, dict[str, str]],
+    count_statements,
+) -> None:
+    counter = count_statements(sqlalchemy_config.get_engine())
+    rows = []
+    results: dict[tuple[str, bool], int] = {}
+
+    with (
+        patch("pydotorg.core.auth.middleware.user_cache", UserCache(ttl=0)),
+        patch("pydotorg.core.auth.middleware.api_key_cache", APIKeyCache(ttl=0, negative_ttl=0)),
+        patch("pydotorg.core.auth.middleware.record_api_key_use", AsyncMock()),
+        patch(
+            "pydotorg.core.auth.middleware.session_service.get_user_id_from_session",
+            AsyncMock(return_value=None),
+        ),
+    ):
+        for name, headers in credentials.items():
+            for legacy in (True, False):
+                async with AsyncTestClient(app=_app(sqlalchemy_config, legacy=legacy)) as client:
+
+                    async def request(client=client, headers=headers):
+                        return await client.get("/protected", headers=headers)
+
+                    await request()
+                    counter.reset()
+                    micros = await time_per_call(request, ITERATIONS)
+                    queries = counter.count / ITERATIONS
+                results[name, legacy] = counter.count
+                rows.append((name, "legacy" if legacy else "single-pass", f"{queries:.1f}", f"{micros:.0f}"))
+
+    print_table("Auth resolution per /protected request", ("credential", "stack", "SQL/request", "µs/request"), rows)
+
+    for name in credentials:
+        assert results[name, False] <= results[name, True], name
+    assert results["invalid api key", False] * 2 == results["invalid api key", True]
+
+
+async def test_excluded_route_still_populates_user(
+    sqlalchemy_config: SQLAlchemyAsyncConfig,
+    credentials: dict[str, dict[str, str]],
+    count_statements,
+) -> None:
+    counter = count_statements(sqlalchemy_config.get_engine())
+    with patch("pydotorg.core.auth.middleware.user_cache", UserCache(ttl=60)):
+        async with AsyncTestClient(app=_app(sqlalchemy_config, legacy=False)) as client:
+            await client.get("/public", headers=credentials["valid jwt"])
+            counter.reset()
+            response = await client.get("/public", headers=credentials["valid jwt"])
+            protected_response = await client.get("/protected", headers=credentials["valid jwt"])
+
+    assert response.status_code == 200
+    assert protected_response.status_code == 200
+    assert counter.count == 0
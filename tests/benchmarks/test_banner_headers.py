@@ -0,0 +1,142 @@
+"""Benchmark: X-API-Notice injection on the ASGI send path.
+
+Compares the former per-response work (build the notices list, ``json.dumps``,
+copy the header list) with appending a header prebuilt per banner-set
+fingerprint and path bucket. Banner lookup comes from the snapshot in both
+cases, so only the send path differs.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from pydotorg.core import banners_middleware
+from pydotorg.core.banner_snapshot import BannerSnapshot
+from pydotorg.core.banners_middleware import APIBannerMiddleware
+from pydotorg.domains.banners.models import Banner
+from tests.benchmarks.conftest import print_table, time_per_call
+
+if TYPE_CHECKING:
+    from litestar.types import Message, Receive, Scope, Send
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ITERATIONS = 20_000
+BANNER_COUNTS = (0, 1, 10)
+RESPONSE_HEADERS = [(b"content-type", b"application/json"), (b"content-length", b"2"), (b"x-request-id", b"abc")]
+
+
+def _banners(count: int) -> list[Banner]:
+    return [
+        Banner(
+            id=uuid4(),
+            name=f"banner-{i}",
+            title=f"Notice {i}",
+            message="The v1 API is deprecated and will be removed on 2027-01-01.",
+            link="https://www.python.org/api/v2/",
+            banner_type="warning",
+            target="api",
+            paths="/api/v1/" if i % 2 else None,
+            is_active=True,
+            is_sitewide=False,
+        )
+        for i in range(count)
+    ]
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _discard(_message: Message) -> None:
+    return None
+
+
+def _snapshot_getter(snapshot: BannerSnapshot):
+    async def get(_app: object) -> BannerSnapshot:
+        return snapshot
+
+    return get
+
+
+async def _endpoint(_scope: Scope, _receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": list(RESPONSE_HEADERS)})
+    await send({"type": "http.response.body", "body": b"{}", "more_body": False})
+
+
+class _LegacyAPIBannerMiddleware(APIBannerMiddleware):
+    """Former send path: rebuild notices, serialize and copy headers on every response."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        banners = (await banners_middleware.banner_snapshot.get(scope["app"])).api.match(scope["path"])
+        if not banners:
+            await self.app(scope, receive, send)
+            return
+
+        notices = [{"type": b.banner_type, "title": b.title, "message": b.message, "link": b.link} for b in banners]
+
+        async def send_with_banner(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"X-API-Notice", json.dumps(notices).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_banner)
+
+
+async def test_api_notice_send_path() -> None:
+    scope = {"type": "http", "path": "/api/v1/releases", "headers": [], "app": MagicMock()}
+    rows = []
+
+    for count in BANNER_COUNTS:
+        snapshot = BannerSnapshot.build(_banners(count))
+        timings: dict[str, float] = {}
+        headers_seen: dict[str, list] = {}
+
+        with patch.object(banners_middleware.banner_snapshot, "get", _snapshot_getter(snapshot)):
+            for name, middleware_cls in (("legacy", _LegacyAPIBannerMiddleware), ("prebuilt", APIBannerMiddleware)):
+                middleware = middleware_cls(_endpoint)
+                sent: list[Message] = []
+
+                async def send(message: Message, sent=sent) -> None:
+                    sent.append(message)
+
+                async def request(middleware=middleware, send=send, sent=sent) -> None:
+                    sent.clear()
+                    await middleware(dict(scope), _receive, send)
+
+                await request()
+                headers_seen[name] = sent[0]["headers"]
+                timings[name] = await time_per_call(request, ITERATIONS)
+
+        assert headers_seen["legacy"] == headers_seen["prebuilt"]
+        speedup = timings["legacy"] / timings["prebuilt"]
+        rows.append((count, f"{timings['legacy']:.2f}", f"{timings['prebuilt']:.2f}", f"{speedup:.2f}x"))
+
+    print_table(
+        "APIBannerMiddleware per API response",
+        ("banners", "legacy µs", "prebuilt µs", "speedup"),
+        rows,
+    )
+
+
+async def test_notice_header_serialized_once() -> None:
+    snapshot = BannerSnapshot.build(_banners(10))
+    scope = {"type": "http", "path": "/api/v1/releases", "headers": [], "app": MagicMock()}
+    banners_middleware._notice_headers.clear()
+
+    with (
+        patch.object(banners_middleware.banner_snapshot, "get", _snapshot_getter(snapshot)),
+        patch.object(banners_middleware.json, "dumps", wraps=json.dumps) as mock_dumps,
+    ):
+        middleware = APIBannerMiddleware(_endpoint)
+        for _ in range(100):
+            await middleware(dict(scope), _receive, _discard)
+
+    assert mock_dumps.call_count == 1
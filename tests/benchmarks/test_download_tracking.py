@@ -0,0 +1,91 @@
+"""Benchmark: download tracking throughput against an in-process Redis stand-in.
+
+``_legacy_track_download`` is the former implementation: up to six
+sequential ``INCR`` awaits per download. fakeredis has no network hop, so the
+gap here understates the saving from round trips against a real server.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from pydotorg.tasks.downloads import DownloadStatsService
+from tests.benchmarks.conftest import print_table, time_per_call
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ITERATIONS = 2_000
+BATCH_SIZE = 100
+FILES = [(f"file-{n}", f"release-{n % 5}") for n in range(50)]
+
+
+async def _legacy_track_download(service: DownloadStatsService, file_id: str, release_id: str) -> None:
+    today = datetime.now(UTC).date().isoformat()
+    await service.redis.incr(service._key("file", file_id, "total"))
+    await service.redis.incr(service._key("file", file_id, "daily", today))
+    await service.redis.incr(service._key("total", "all"))
+    await service.redis.incr(service._key("daily", today))
+    await service.redis.incr(service._key("release", release_id, "total"))
+    await service.redis.incr(service._key("release", release_id, "daily", today))
+
+
+async def test_download_tracking_throughput() -> None:
+    service = DownloadStatsService(FakeAsyncRedis())
+    position = 0
+
+    def next_event() -> tuple[str, str]:
+        nonlocal position
+        position = (position + 1) % len(FILES)
+        return FILES[position]
+
+    async def legacy() -> None:
+        await _legacy_track_download(service, *next_event())
+
+    async def scripted() -> None:
+        await service.track_download(*next_event())
+
+    async def batched() -> None:
+        await service.track_downloads([next_event() for _ in range(BATCH_SIZE)])
+
+    rows = []
+    for name, func, per_call, iterations in (
+        ("sequential INCR", legacy, 1, ITERATIONS),
+        ("one script call", scripted, 1, ITERATIONS),
+        (f"batch of {BATCH_SIZE}", batched, BATCH_SIZE, ITERATIONS // 10),
+    ):
+        await func()
+        micros = await time_per_call(func, iterations)
+        rows.append((name, f"{micros / per_call:.1f}", f"{per_call * 1_000_000 / micros:,.0f}"))
+
+    print_table("Download tracking (fakeredis)", ("variant", "us/download", "downloads/s"), rows)
+
+
+async def _legacy_get_top_downloads(service: DownloadStatsService, limit: int) -> list[tuple[str, int]]:
+    results = []
+    async for key in service.redis.scan_iter(match=service._key("file", "*", "total")):
+        count = await service.redis.get(key)
+        results.append((key.decode().split(":")[4], int(count)))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:limit]
+
+
+async def test_top_downloads_leaderboard() -> None:
+    redis = FakeAsyncRedis()
+    service = DownloadStatsService(redis)
+    rows = []
+    for file_count in (100, 1_000, 5_000):
+        await redis.flushall()
+        async with redis.pipeline(transaction=False) as pipe:
+            for n in range(file_count):
+                pipe.set(service._key("file", f"file-{n}", "total"), n)
+            await pipe.execute()
+        await service.track_downloads((f"file-{n}", None) for n in range(file_count))
+
+        legacy = await time_per_call(lambda: _legacy_get_top_downloads(service, 10), 5)
+        leaderboard = await time_per_call(lambda: service.get_top_downloads(10), 200)
+        rows.append((file_count, f"{legacy:,.0f}", f"{leaderboard:,.1f}"))
+
+    print_table("Top 10 downloads", ("files", "SCAN+GET us", "ZREVRANGE us"), rows)
@@ -0,0 +1,175 @@
+"""Benchmark: one compiled header-policy middleware vs. the former three-middleware stack.
+
+``_LegacyCacheControl``, ``_LegacyAdminNoCache`` and ``_LegacySurrogateKey`` are
+the former implementations. Each wrapped ``send``, rebuilt the header list
+and scanned path prefixes linearly. Both stacks are driven directly at the
+ASGI level so only the middleware work is measured.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pydotorg.core.cache.middleware import GLOBAL_SURROGATE_KEY, HeaderPolicyMiddleware
+from tests.benchmarks.conftest import print_table, time_per_call
+
+if TYPE_CHECKING:
+    from litestar.types import ASGIApp, Message, Receive, Scope, Send
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ITERATIONS = 20_000
+PATHS = ("/", "/about/psf/", "/static/css/site.css", "/api/v1/releases", "/admin/pages", "/auth/login")
+RESPONSE_HEADERS = [
+    (b"content-type", b"text/html; charset=utf-8"),
+    (b"content-length", b"5120"),
+    (b"vary", b"Accept-Encoding"),
+    (b"surrogate-key", b"page-123"),
+]
+
+
+class _LegacyAdminNoCache:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and path.startswith("/admin"):
+                headers = list(message.get("headers", []))
+                headers.append((b"cache-control", b"private, no-store"))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class _LegacySurrogateKey:
+    def __init__(self, app: ASGIApp, surrogate_key: str = GLOBAL_SURROGATE_KEY) -> None:
+        self.app = app
+        self.surrogate_key = surrogate_key
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = dict(message.get("headers", []))
+                existing_key = headers.get(b"surrogate-key", b"").decode()
+                keys = [self.surrogate_key]
+                if existing_key:
+                    keys.append(existing_key)
+                new_headers = [(k, v) for k, v in message.get("headers", []) if k.lower() != b"surrogate-key"]
+                new_headers.append((b"surrogate-key", " ".join(keys).encode()))
+                message["headers"] = new_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class _LegacyCacheControl:
+    STATIC_PATHS = ("/static/", "/media/", "/assets/")
+    API_PATHS = ("/api/",)
+    NO_CACHE_PATHS = ("/admin/", "/auth/")
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = dict(message.get("headers", []))
+                if b"cache-control" not in headers:
+                    cache_control = self._get_cache_control(path)
+                    if cache_control:
+                        new_headers = list(message.get("headers", []))
+                        new_headers.append((b"cache-control", cache_control.encode()))
+                        message["headers"] = new_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _get_cache_control(self, path: str) -> str | None:
+        if any(path.startswith(p) for p in self.NO_CACHE_PATHS):
+            return "private, no-store"
+        if any(path.startswith(p) for p in self.STATIC_PATHS):
+            return "public, max-age=31536000, immutable"
+        if any(path.startswith(p) for p in self.API_PATHS):
+            return "no-store"
+        return "public, max-age=300"
+
+
+async def _endpoint(_scope: Scope, _receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": list(RESPONSE_HEADERS)})
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+def _legacy_stack() -> ASGIApp:
+    # Same nesting as the former main.py list: CacheControl is outermost.
+    return _LegacyCacheControl(_LegacyAdminNoCache(_LegacySurrogateKey(_endpoint)))
+
+
+def _policy_stack() -> ASGIApp:
+    return HeaderPolicyMiddleware(_endpoint, surrogate_key=GLOBAL_SURROGATE_KEY)
+
+
+async def _response_headers(app: ASGIApp, path: str) -> list[tuple[bytes, bytes]]:
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app({"type": "http", "path": path, "headers": []}, _receive, send)
+    return sent[0]["headers"]
+
+
+async def test_header_policy_send_path() -> None:
+    legacy, policy = _legacy_stack(), _policy_stack()
+    rows = []
+
+    for path in PATHS:
+        legacy_headers = await _response_headers(legacy, path)
+        policy_headers = await _response_headers(policy, path)
+        assert sorted(policy_headers) == sorted(legacy_headers), path
+
+        timings = {}
+        for name, app in (("legacy", legacy), ("policy", policy)):
+
+            async def request(app=app, path=path) -> None:
+                await _response_headers(app, path)
+
+            timings[name] = await time_per_call(request, ITERATIONS)
+
+        rows.append(
+            (
+                path,
+                f"{timings['legacy']:.2f}",
+                f"{timings['policy']:.2f}",
+                f"{timings['legacy'] / timings['policy']:.2f}x",
+            )
+        )
+
+    print_table("Caching headers per response", ("path", "3 middlewares µs", "policy µs", "speedup"), rows)
+
+
+async def test_admin_private_no_store_wins() -> None:
+    async def endpoint(_scope: Scope, _receive: Receive, send: Send) -> None:
+        headers = [(b"cache-control", b"public, max-age=600")]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+
+    legacy = _LegacyCacheControl(_LegacyAdminNoCache(_LegacySurrogateKey(endpoint)))
+    policy = HeaderPolicyMiddleware(endpoint)
+
+    legacy_values = [v for k, v in await _response_headers(legacy, "/admin/pages") if k == b"cache-control"]
+    policy_values = [v for k, v in await _response_headers(policy, "/admin/pages") if k == b"cache-control"]
+
+    # The former stack appended a second Cache-Control; the policy replaces the handler's.
+    assert legacy_values == [b"public, max-age=600", b"private, no-store"]
+    assert policy_values == [b"private, no-store"]
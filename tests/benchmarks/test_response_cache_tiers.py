@@ -0,0 +1,43 @@
+"""Benchmark: response cache reads served from the L1 tier vs. Redis.
+
+fakeredis runs in-process, so the Redis column is a lower bound. It counts
+the Lua script and msgpack round trip but not the network hop a real
+deployment pays on every hit.
+"""
+
+from __future__ import annotations
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from pydotorg.core.cache.local import LocalResponseCache
+from pydotorg.core.cache.store import TaggedRedisStore
+from tests.benchmarks.conftest import print_table, time_per_call
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ITERATIONS = 5_000
+BODY = b"<html>" + b"x" * 20_000 + b"</html>"
+KEYS = [f"page:/hot-{n}?" for n in range(50)]
+
+
+async def test_local_tier_vs_redis() -> None:
+    redis = FakeAsyncRedis()
+    redis_only = TaggedRedisStore(redis, namespace="cache", stale_ttl=300)
+    two_tier = TaggedRedisStore(redis, namespace="cache", stale_ttl=300, local=LocalResponseCache())
+    for key in KEYS:
+        await redis_only.set(key, BODY, expires_in=3600)
+
+    rows = []
+    for name, store in (("redis", redis_only), ("l1 + redis", two_tier)):
+        position = 0
+
+        async def read(store: TaggedRedisStore = store) -> None:
+            nonlocal position
+            position = (position + 1) % len(KEYS)
+            assert await store.get(KEYS[position]) == BODY
+
+        await read()
+        rows.append((name, f"{await time_per_call(read, ITERATIONS):.1f}"))
+
+    print_table("Response cache hit (50 hot keys, 20 KiB bodies)", ("tier", "us/get"), rows)
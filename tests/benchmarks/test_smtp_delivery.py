@@ -0,0 +1,119 @@
+"""Benchmark: bulk email delivery against a local aiosmtpd server.
+
+``_legacy_send`` is the former implementation: a blocking ``smtplib`` session
+per message (connect, ``EHLO``, send, ``QUIT``), one message after another.
+The sink answers ``DATA`` after a short delay to stand in for a relay's
+latency; there is no TLS or ``AUTH`` here, so the per-connection setup saved
+by the pool is understated compared to a real relay.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import smtplib
+import socket
+import time
+from email.message import EmailMessage
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from pydotorg.core.email.transport import SMTPPool
+from tests.benchmarks.conftest import print_table
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+MESSAGES = 200
+POOL_SIZES = (1, 4, 8)
+SERVER_LATENCY_SECONDS = 0.002
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.delivered = 0
+        self.sessions = 0
+
+    async def handle_EHLO(
+        self, server: Any, session: Any, envelope: Any, hostname: str, responses: list[str]
+    ) -> list[str]:
+        self.sessions += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        await asyncio.sleep(SERVER_LATENCY_SECONDS)
+        self.delivered += 1
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def sink() -> Iterator[tuple[_Sink, int]]:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    handler = _Sink()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def _messages() -> list[EmailMessage]:
+    messages = []
+    for n in range(MESSAGES):
+        message = EmailMessage()
+        message["From"] = "noreply@python.org"
+        message["To"] = f"member-{n}@example.com"
+        message["Subject"] = "Python Software Foundation newsletter"
+        message.set_content("Hello from python.org\n" * 20)
+        messages.append(message)
+    return messages
+
+
+def _legacy_send(port: int, messages: list[EmailMessage]) -> None:
+    for message in messages:
+        with smtplib.SMTP("127.0.0.1", port) as server:
+            server.send_message(message)
+
+
+async def test_bulk_delivery_throughput(sink: tuple[_Sink, int]) -> None:
+    handler, port = sink
+    messages = _messages()
+    rows = []
+
+    start = time.perf_counter()
+    await asyncio.to_thread(_legacy_send, port, messages)
+    elapsed = time.perf_counter() - start
+    rows.append(("connection per message", MESSAGES, f"{elapsed * 1000:.0f}", f"{MESSAGES / elapsed:,.0f}"))
+    assert handler.sessions == MESSAGES
+
+    for size in POOL_SIZES:
+        handler.sessions = 0
+        pool = SMTPPool(
+            hostname="127.0.0.1",
+            port=port,
+            username="",
+            password="",
+            start_tls=False,
+            size=size,
+            max_messages_per_connection=MESSAGES,
+        )
+        start = time.perf_counter()
+        async with pool:
+            await asyncio.gather(*(pool.send(message) for message in messages))
+        elapsed = time.perf_counter() - start
+        rows.append((f"pool of {size}", pool.connections_opened, f"{elapsed * 1000:.0f}", f"{MESSAGES / elapsed:,.0f}"))
+        assert pool.messages_sent == MESSAGES
+        assert pool.connections_opened <= size
+        assert handler.sessions == pool.connections_opened
+
+    assert handler.delivered == MESSAGES * (1 + len(POOL_SIZES))
+    print_table(
+        f"Bulk SMTP delivery ({MESSAGES} messages, {SERVER_LATENCY_SECONDS * 1000:.0f} ms server latency)",
+        ("variant", "connections", "total ms", "messages/s"),
+        rows,
+    )
@@ -29,7 +29,14 @@ from typing import TYPE_CHECKING
 import pytest
 from sqlalchemy import text
 
+from pydotorg.core.auth.api_key_cache import api_key_cache
+from pydotorg.core.auth.user_cache import user_cache
+from pydotorg.core.banner_snapshot import banner_snapshot
+from pydotorg.core.cache.local import local_response_cache
 from pydotorg.core.database.base import AuditBase
+from pydotorg.core.page_index import page_index
+from pydotorg.core.release_file_index import release_file_index
+from pydotorg.core.release_tree import release_tree
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine
@@ -69,3 +76,12 @@ async def _integration_truncate_tables(async_engine: AsyncEngine, request: pytes
         if tables_with_data:
             tables_str = ", ".join(f'"{t}"' for t in tables_with_data)
             await conn.execute(text(f"TRUNCATE TABLE {tables_str} CASCADE"))
+
+    # Raw TRUNCATE bypasses the ORM events that invalidate per-process caches
+    user_cache.clear()
+    api_key_cache.clear()
+    banner_snapshot.invalidate()
+    local_response_cache.clear()
+    page_index.clear()
+    release_file_index.clear()
+    release_tree.invalidate()
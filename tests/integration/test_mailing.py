@@ -393,13 +393,13 @@ class TestMailingService:
 
     async def test_send_email_smtp_failure(self, async_session_factory: async_sessionmaker) -> None:
         """Test email sending with SMTP failure."""
-        import smtplib
+        from aiosmtplib import SMTPException
 
         async with async_session_factory() as session:
             sample_template = await _create_sample_template(async_session_factory)
             service = MailingService(session=session)
 
-            with patch.object(service, "_send_smtp", side_effect=smtplib.SMTPException("Connection refused")):
+            with patch.object(service, "_send_smtp", side_effect=SMTPException("Connection refused")):
                 log = await service.send_email(
                     template_name=sample_template.internal_name,
                     to_email="recipient@example.com",
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -57,33 +57,31 @@ class TestCacheInvalidationTask:
 
     @pytest.mark.anyio
     async def test_invalidate_page_response_cache_with_path(self) -> None:
-        """Test invalidation with specific path."""
+        """Test invalidation with specific path and page ID."""
+        from pydotorg.core.cache.store import TaggedRedisStore
         from pydotorg.tasks.cache import invalidate_page_response_cache
 
-        mock_redis = AsyncMock()
-        mock_redis.delete.return_value = 1
-        ctx = {"redis": mock_redis}
+        ctx = {"redis": MagicMock()}
 
-        result = await invalidate_page_response_cache(ctx, page_path="/about")
+        with patch.object(TaggedRedisStore, "invalidate_tags", AsyncMock(return_value=2)) as mock_invalidate:
+            result = await invalidate_page_response_cache(ctx, page_path="/about", page_id="123")
 
-        assert result["path"] == "/about"
-        assert "cleared" in result
-        mock_redis.delete.assert_called_once()
+        assert result == {"cleared": 2, "path": "/about"}
+        mock_invalidate.assert_awaited_once_with("path:/about", "page-123")
 
     @pytest.mark.anyio
     async def test_invalidate_page_response_cache_all_pages(self) -> None:
         """Test invalidating all page caches."""
+        from pydotorg.core.cache.store import TaggedRedisStore
         from pydotorg.tasks.cache import invalidate_page_response_cache
 
-        mock_redis = AsyncMock()
-        mock_redis.scan.return_value = (0, ["key1", "key2"])
-        mock_redis.delete.return_value = 2
-        ctx = {"redis": mock_redis}
+        ctx = {"redis": MagicMock()}
 
-        result = await invalidate_page_response_cache(ctx, page_path=None)
+        with patch.object(TaggedRedisStore, "invalidate_all", AsyncMock(return_value=2)):
+            result = await invalidate_page_response_cache(ctx, page_path=None)
 
         assert result["path"] == "all"
-        assert "cleared" in result
+        assert result["cleared"] == 2
 
 
 class TestTaskRegistration:
@@ -7,6 +7,8 @@ from unittest.mock import patch
 
 import pytest
 
+from pydotorg.core.auth.session import session_service
+
 if TYPE_CHECKING:
     from litestar.testing import AsyncTestClient
 
@@ -250,14 +252,12 @@ class TestSessionAuthentication:
 
 @pytest.mark.asyncio
 class TestSessionRefresh:
-    @patch("pydotorg.core.auth.session.session_service.refresh_session")
     async def test_session_auto_refresh_on_request(
         self,
-        mock_refresh,
         client: AsyncTestClient,
         session_registered_user: dict,
     ) -> None:
-        """Test session TTL is refreshed on authenticated requests."""
+        """Test session TTL is slid forward once it has run down past the refresh threshold."""
         login_response = await client.post(
             "/api/auth/session/login",
             json={
@@ -268,9 +268,13 @@ class TestSessionRefresh:
         session_cookie = login_response.cookies.get("session_id")
         client.cookies["session_id"] = session_cookie
 
+        redis = session_service.redis_client
+        key = f"{session_service.session_prefix}{session_cookie}"
+        await redis.pexpire(key, 60_000)
+
         await client.post("/api/auth/me")
 
-        mock_refresh.assert_called()
+        assert await redis.pttl(key) > session_service.refresh_below_ms
 
     async def test_multiple_session_requests_extend_session(
         self,
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
 
 import pytest
+from fakeredis import FakeAsyncRedis
+from litestar import Litestar, get
+from litestar.exceptions import NotFoundException
+from litestar.testing import TestClient
 
 from pydotorg.core.cache.config import (
     CACHE_STORE_NAME,
@@ -14,6 +20,10 @@ from pydotorg.core.cache.config import (
     create_response_cache_config,
     page_cache_key_builder,
 )
+from pydotorg.core.cache.store import TaggedRedisStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class TestCacheConstants:
@@ -50,8 +60,15 @@ class TestPageCacheKeyBuilder:
     def test_basic_path_key(self, mock_request: MagicMock) -> None:
         """Should create cache key from path only."""
         key = page_cache_key_builder(mock_request)
-        assert key.startswith("page:")
-        assert len(key) == len("page:") + 32
+        assert key == "page:/about/history?"
+
+    def test_query_is_hashed(self, mock_request: MagicMock) -> None:
+        """Query strings should become a fixed-length digest after the path."""
+        mock_request.query_params = {"section": "timeline" * 100}
+        key = page_cache_key_builder(mock_request)
+        path, _, digest = key.rpartition("?")
+        assert path == "page:/about/history"
+        assert len(digest) == 32
 
     def test_different_paths_different_keys(self, mock_request: MagicMock) -> None:
         """Different paths should produce different cache keys."""
@@ -120,3 +137,63 @@ class TestCreateResponseCacheConfig:
         """Should use 'response_cache' store name."""
         config = create_response_cache_config()
         assert config.store == CACHE_STORE_NAME
+
+    def test_uses_page_key_builder(self) -> None:
+        """Should build tag-indexable page keys."""
+        config = create_response_cache_config()
+        assert config.key_builder is page_cache_key_builder
+
+
+class TestResponseCacheWithTaggedStore:
+    """End-to-end tests of the response cache config over the tag-indexed store."""
+
+    @pytest.fixture
+    def calls(self) -> dict[str, int]:
+        return {"page": 0, "missing": 0}
+
+    @pytest.fixture
+    def store(self) -> TaggedRedisStore:
+        return TaggedRedisStore(FakeAsyncRedis(), stale_ttl=300, lock_timeout=5)
+
+    @pytest.fixture
+    def client(self, calls: dict[str, int], store: TaggedRedisStore) -> Iterator[TestClient]:
+        @get("/page", cache=60)
+        async def page() -> str:
+            calls["page"] += 1
+            return f"render {calls['page']}"
+
+        @get("/missing", cache=60)
+        async def missing() -> str:
+            calls["missing"] += 1
+            raise NotFoundException
+
+        app = Litestar(
+            [page, missing],
+            response_cache_config=create_response_cache_config(),
+            stores={CACHE_STORE_NAME: store},
+        )
+        with TestClient(app) as client:
+            yield client
+
+    def test_second_request_is_served_from_cache(self, client: TestClient, calls: dict[str, int]) -> None:
+        assert client.get("/page").text == "render 1"
+        assert client.get("/page").text == "render 1"
+        assert client.get("/page", params={"q": "x"}).text == "render 2"
+        assert calls["page"] == 2
+
+    def test_stale_page_served_while_leader_refreshes(self, client: TestClient, calls: dict[str, int]) -> None:
+        client.get("/page")
+
+        with patch("pydotorg.core.cache.store.time.time", return_value=time.time() + 120):
+            assert client.get("/page").text == "render 2"
+
+        assert client.get("/page").text == "render 2"
+        assert calls["page"] == 2
+
+    def test_uncacheable_response_releases_lock(self, client: TestClient, calls: dict[str, int]) -> None:
+        started = time.monotonic()
+        for _ in range(3):
+            assert client.get("/missing").status_code == 404
+
+        assert calls["missing"] == 3
+        assert time.monotonic() - started < 1
@@ -0,0 +1,114 @@
+"""Unit tests for the per-process L1 tier of the response cache."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from pydotorg.core.cache import local as module
+from pydotorg.core.cache.local import (
+    INVALIDATE_ALL,
+    RESPONSE_CACHE_CHANNEL,
+    LocalResponseCache,
+    publish_response_cache_invalidation,
+)
+
+
+def _fresh() -> float:
+    return time.time() + 60
+
+
+class TestLocalResponseCache:
+    def test_get_returns_fresh_entries_only(self) -> None:
+        cache = LocalResponseCache(max_bytes=100, max_entry_bytes=100)
+        cache.set("page:/a?", b"a", fresh_until=_fresh(), tags=[])
+        cache.set("page:/b?", b"b", fresh_until=time.time() - 1, tags=["path:/b"])
+
+        assert cache.get("page:/a?") == b"a"
+        assert cache.get("page:/b?") is None
+        assert len(cache) == 1
+        assert cache.stats() == {"entries": 1, "bytes": 1, "hits": 1, "misses": 1}
+
+    def test_evicts_least_recently_used_to_fit_byte_budget(self) -> None:
+        cache = LocalResponseCache(max_bytes=10, max_entry_bytes=10)
+        cache.set("page:/a?", b"aaaa", fresh_until=_fresh(), tags=[])
+        cache.set("page:/b?", b"bbbb", fresh_until=_fresh(), tags=[])
+        cache.get("page:/a?")
+        cache.set("page:/c?", b"cccc", fresh_until=_fresh(), tags=[])
+
+        assert cache.get("page:/b?") is None
+        assert cache.get("page:/a?") == b"aaaa"
+        assert cache.size_bytes == 8
+
+    def test_replacing_an_entry_keeps_size_accurate(self) -> None:
+        cache = LocalResponseCache(max_bytes=10, max_entry_bytes=10)
+        cache.set("page:/a?", b"aaaa", fresh_until=_fresh(), tags=["path:/a"])
+        cache.set("page:/a?", b"aa", fresh_until=_fresh(), tags=["path:/a"])
+
+        assert cache.size_bytes == 2
+
+    def test_oversized_entries_and_disabled_cache_are_skipped(self) -> None:
+        cache = LocalResponseCache(max_bytes=10, max_entry_bytes=3)
+        cache.set("page:/a?", b"aaaa", fresh_until=_fresh(), tags=[])
+        assert cache.get("page:/a?") is None
+
+        disabled = LocalResponseCache(max_bytes=0, max_entry_bytes=100)
+        disabled.set("page:/a?", b"a", fresh_until=_fresh(), tags=[])
+        assert len(disabled) == 0
+
+    def test_invalidate_tags(self) -> None:
+        cache = LocalResponseCache(max_bytes=100, max_entry_bytes=100)
+        cache.set("page:/a?", b"a", fresh_until=_fresh(), tags=["path:/a", "domain:/a"])
+        cache.set("page:/a?x", b"a", fresh_until=_fresh(), tags=["path:/a", "domain:/a"])
+        cache.set("page:/b?", b"b", fresh_until=_fresh(), tags=["path:/b", "page-1"])
+
+        cache.invalidate_tags(["path:/a"])
+        assert len(cache) == 1
+        cache.invalidate_tags(["page-1", "unknown"])
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+        assert cache._tags == {}
+
+    def test_value_read_before_an_invalidation_is_not_kept(self) -> None:
+        cache = LocalResponseCache(max_bytes=100, max_entry_bytes=100)
+        generation = cache.generation
+        cache.invalidate_tags(["path:/a"])
+
+        cache.set("page:/a?", b"old", fresh_until=_fresh(), tags=["path:/a"], generation=generation)
+
+        assert cache.get("page:/a?") is None
+
+    def test_invalidation_messages(self) -> None:
+        cache = LocalResponseCache(max_bytes=100, max_entry_bytes=100)
+        cache.set("page:/a?", b"a", fresh_until=_fresh(), tags=["path:/a"])
+        cache.set("page:/b?", b"b", fresh_until=_fresh(), tags=["path:/b"])
+
+        module._handle_invalidation_message(cache, "path:/a")
+        assert cache.get("page:/a?") is None
+        assert cache.get("page:/b?") == b"b"
+
+        module._handle_invalidation_message(cache, INVALIDATE_ALL)
+        assert len(cache) == 0
+
+
+class TestPublishResponseCacheInvalidation:
+    async def test_publishes_each_tag(self) -> None:
+        redis = FakeAsyncRedis()
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(RESPONSE_CACHE_CHANNEL)
+
+        await publish_response_cache_invalidation(redis, ["path:/a", "page-1"])
+
+        messages = [await pubsub.get_message(timeout=0.1) for _ in range(3)]
+        received = [message["data"] for message in messages if message]
+        assert received == [b"path:/a", b"page-1"]
+        await pubsub.aclose()
+
+    async def test_redis_errors_are_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        redis = FakeAsyncRedis(connected=False)
+
+        await publish_response_cache_invalidation(redis, ["path:/a"])
+
+        assert "Failed to publish response cache invalidation" in caplog.text
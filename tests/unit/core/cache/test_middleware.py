@@ -223,32 +223,140 @@ class TestCacheMiddlewareStack:
     """Tests for the combined cache middleware stack."""
 
     def test_create_cache_middleware_stack_returns_middleware(self) -> None:
-        """create_cache_middleware_stack should return middleware list."""
+        """create_cache_middleware_stack should return a single header-policy middleware."""
         from pydotorg.core.cache.middleware import (
-            AdminNoCacheMiddleware,
-            CacheControlMiddleware,
-            SurrogateKeyMiddleware,
+            GLOBAL_SURROGATE_KEY,
+            HeaderPolicyMiddleware,
             create_cache_middleware_stack,
         )
 
         stack = create_cache_middleware_stack(enable_surrogate_keys=True)
-        assert AdminNoCacheMiddleware in stack
-        assert CacheControlMiddleware in stack
-        assert SurrogateKeyMiddleware in stack
+        assert len(stack) == 1
+        assert stack[0].middleware is HeaderPolicyMiddleware
+        assert stack[0].kwargs == {"surrogate_key": GLOBAL_SURROGATE_KEY}
 
     def test_create_cache_middleware_stack_without_surrogate_keys(self) -> None:
         """create_cache_middleware_stack without surrogate keys."""
-        from pydotorg.core.cache.middleware import (
-            AdminNoCacheMiddleware,
-            CacheControlMiddleware,
-            SurrogateKeyMiddleware,
-            create_cache_middleware_stack,
-        )
+        from pydotorg.core.cache.middleware import HeaderPolicyMiddleware, create_cache_middleware_stack
 
         stack = create_cache_middleware_stack(enable_surrogate_keys=False)
-        assert AdminNoCacheMiddleware in stack
-        assert CacheControlMiddleware in stack
-        assert SurrogateKeyMiddleware not in stack
+        assert len(stack) == 1
+        assert stack[0].middleware is HeaderPolicyMiddleware
+        assert stack[0].kwargs == {"surrogate_key": None}
+
+
+class TestHeaderPolicyMiddleware:
+    """Tests for the combined header-policy middleware."""
+
+    @staticmethod
+    def _client(*handlers, surrogate_key: str | None = "pydotorg-app") -> TestClient:
+        from litestar.middleware import DefineMiddleware
+
+        from pydotorg.core.cache.middleware import HeaderPolicyMiddleware
+
+        app = Litestar(
+            route_handlers=list(handlers),
+            middleware=[DefineMiddleware(HeaderPolicyMiddleware, surrogate_key=surrogate_key)],
+        )
+        return TestClient(app)
+
+    def test_admin_overrides_handler_cache_control(self) -> None:
+        """Under /admin, private, no-store replaces whatever the handler set."""
+
+        @get("/admin/pages", response_headers={"Cache-Control": "public, max-age=600"})
+        async def admin_handler() -> dict:
+            return {}
+
+        with self._client(admin_handler) as client:
+            response = client.get("/admin/pages")
+            assert response.headers.get_list("cache-control") == ["private, no-store"]
+
+    def test_admin_prefix_without_slash(self) -> None:
+        """The admin rule matches /admin itself, like the former AdminNoCacheMiddleware."""
+
+        @get("/admin")
+        async def admin_root() -> dict:
+            return {}
+
+        with self._client(admin_root) as client:
+            assert client.get("/admin").headers.get("cache-control") == "private, no-store"
+
+    def test_handler_cache_control_kept_outside_admin(self) -> None:
+        @get("/custom", response_headers={"Cache-Control": "public, max-age=600"})
+        async def custom_handler() -> dict:
+            return {}
+
+        with self._client(custom_handler) as client:
+            assert client.get("/custom").headers.get_list("cache-control") == ["public, max-age=600"]
+
+    def test_path_rules(self) -> None:
+        @get("/static/app.js")
+        async def static_handler() -> dict:
+            return {}
+
+        @get("/api/v1/users")
+        async def api_handler() -> dict:
+            return {}
+
+        @get("/auth/login")
+        async def auth_handler() -> dict:
+            return {}
+
+        @get("/about")
+        async def page_handler() -> dict:
+            return {}
+
+        with self._client(static_handler, api_handler, auth_handler, page_handler) as client:
+            assert client.get("/static/app.js").headers["cache-control"] == "public, max-age=31536000, immutable"
+            assert client.get("/api/v1/users").headers["cache-control"] == "no-store"
+            assert client.get("/auth/login").headers["cache-control"] == "private, no-store"
+            assert client.get("/about").headers["cache-control"] == "public, max-age=300"
+
+    def test_surrogate_key_merged_with_route_key(self) -> None:
+        @get("/page", response_headers={"Surrogate-Key": "page-123"})
+        async def page_handler() -> dict:
+            return {}
+
+        with self._client(page_handler) as client:
+            assert client.get("/page").headers.get_list("surrogate-key") == ["pydotorg-app page-123"]
+
+    def test_surrogate_key_disabled(self) -> None:
+        @get("/page")
+        async def page_handler() -> dict:
+            return {}
+
+        with self._client(page_handler, surrogate_key=None) as client:
+            response = client.get("/page")
+            assert "surrogate-key" not in response.headers
+            assert response.headers["cache-control"] == "public, max-age=300"
+
+
+class TestHeaderPolicy:
+    """Tests for compiled path-rule resolution."""
+
+    def test_longest_prefix_wins(self) -> None:
+        from pydotorg.core.cache.middleware import HeaderPolicy, HeaderRule
+
+        policy = HeaderPolicy(
+            {"/a": HeaderRule("short"), "/a/b/": HeaderRule("long")},
+            default=HeaderRule("default"),
+        )
+        assert policy.resolve("/a/b/c").apply([]) == [(b"cache-control", b"long")]
+        assert policy.resolve("/a/bc").apply([]) == [(b"cache-control", b"short")]
+        assert policy.resolve("/z").apply([]) == [(b"cache-control", b"default")]
+
+    def test_no_rule_is_noop(self) -> None:
+        from pydotorg.core.cache.middleware import HeaderPolicy
+
+        assert HeaderPolicy({}).resolve("/anything").is_noop
+
+    def test_extends_header_list_in_place(self) -> None:
+        from pydotorg.core.cache.middleware import create_header_policy
+
+        headers = [(b"content-type", b"text/html")]
+        result = create_header_policy().resolve("/about").apply(headers)
+        assert result is headers
+        assert result[-2:] == [(b"surrogate-key", b"pydotorg-app"), (b"cache-control", b"public, max-age=300")]
 
 
 class TestCacheMiddlewareExports:
@@ -2,45 +2,58 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
 from pydotorg.core.cache.service import PageCacheService
+from pydotorg.core.cache.store import TaggedRedisStore, page_tag, path_tag
 
 
 @pytest.fixture
-def mock_redis() -> AsyncMock:
+def mock_redis() -> MagicMock:
     """Create a mock async Redis client."""
-    redis = AsyncMock()
-    redis.delete = AsyncMock(return_value=1)
-    redis.scan = AsyncMock(return_value=(0, []))
-    return redis
+    return MagicMock()
 
 
 @pytest.fixture
-def cache_service(mock_redis: AsyncMock) -> PageCacheService:
+def mock_store() -> MagicMock:
+    """Create a mock tag-indexed response cache store."""
+    store = MagicMock(spec=TaggedRedisStore)
+    store.invalidate_tags = AsyncMock(return_value=1)
+    store.invalidate_all = AsyncMock(return_value=0)
+    store.size = AsyncMock(return_value=0)
+    return store
+
+
+@pytest.fixture
+def cache_service(mock_redis: MagicMock, mock_store: MagicMock) -> PageCacheService:
     """Create a PageCacheService with mock Redis."""
-    return PageCacheService(mock_redis)
+    return PageCacheService(mock_redis, store=mock_store)
 
 
 class TestPageCacheServiceInit:
     """Tests for PageCacheService initialization."""
 
-    def test_initializes_with_redis(self, mock_redis: AsyncMock) -> None:
+    def test_initializes_with_redis(self, mock_redis: MagicMock) -> None:
         """Should store Redis client on initialization."""
         service = PageCacheService(mock_redis)
         assert service.redis is mock_redis
 
+    def test_default_store_uses_response_cache_namespace(self, mock_redis: MagicMock) -> None:
+        """Should build a tag-indexed store over the same client."""
+        service = PageCacheService(mock_redis)
+        assert isinstance(service.store, TaggedRedisStore)
+        assert service.store.namespace == "cache"
+
 
 class TestMakeCacheKey:
     """Tests for the _make_cache_key method."""
 
     def test_normalizes_path_with_leading_slash(self, cache_service: PageCacheService) -> None:
         """Should ensure path starts with /."""
-        key = cache_service._make_cache_key("about/history")
-        assert "about/history" in key or key.startswith("page:")
+        assert cache_service._make_cache_key("about/history") == "page:/about/history?"
 
     def test_normalizes_path_strips_trailing_slash(self, cache_service: PageCacheService) -> None:
         """Should strip trailing slashes."""
@@ -48,47 +61,36 @@ class TestMakeCacheKey:
         key2 = cache_service._make_cache_key("/about")
         assert key1 == key2
 
-    def test_root_path(self, cache_service: PageCacheService) -> None:
-        """Should handle root path."""
-        key = cache_service._make_cache_key("/")
-        assert key.startswith("page:")
-
     def test_empty_path(self, cache_service: PageCacheService) -> None:
         """Should handle empty path as root."""
-        key = cache_service._make_cache_key("")
-        assert key.startswith("page:")
-
-    def test_consistent_keys(self, cache_service: PageCacheService) -> None:
-        """Same path should always produce same key."""
-        path = "/test/page"
-        keys = [cache_service._make_cache_key(path) for _ in range(5)]
-        assert len(set(keys)) == 1
+        assert cache_service._make_cache_key("") == cache_service._make_cache_key("/") == "page:/?"
 
 
 class TestInvalidatePage:
     """Tests for invalidate_page method."""
 
     @pytest.mark.anyio
-    async def test_invalidates_single_page(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
-        """Should delete cache entry for specific page."""
-        mock_redis.delete.return_value = 1
-        result = await cache_service.invalidate_page("/about/history")
+    async def test_invalidates_every_variant_of_path(
+        self, cache_service: PageCacheService, mock_store: MagicMock
+    ) -> None:
+        """Should invalidate the path tag, which covers query-string variants."""
+        result = await cache_service.invalidate_page("/about/history/")
 
         assert result is True
-        mock_redis.delete.assert_called_once()
+        mock_store.invalidate_tags.assert_awaited_once_with("path:/about/history")
 
     @pytest.mark.anyio
-    async def test_returns_false_when_not_cached(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
+    async def test_returns_false_when_not_cached(self, cache_service: PageCacheService, mock_store: MagicMock) -> None:
         """Should return False when page wasn't cached."""
-        mock_redis.delete.return_value = 0
+        mock_store.invalidate_tags.return_value = 0
         result = await cache_service.invalidate_page("/nonexistent")
 
         assert result is False
 
     @pytest.mark.anyio
-    async def test_handles_redis_errors(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
+    async def test_handles_redis_errors(self, cache_service: PageCacheService, mock_store: MagicMock) -> None:
         """Should return False on Redis errors."""
-        mock_redis.delete.side_effect = Exception("Connection refused")
+        mock_store.invalidate_tags.side_effect = Exception("Connection refused")
         result = await cache_service.invalidate_page("/about")
 
         assert result is False
@@ -98,70 +100,43 @@ class TestInvalidatePageById:
     """Tests for invalidate_page_by_id method."""
 
     @pytest.mark.anyio
-    async def test_with_path_delegates_to_invalidate_page(
-        self, cache_service: PageCacheService, mock_redis: AsyncMock
+    async def test_with_path_invalidates_page_and_path_tags(
+        self, cache_service: PageCacheService, mock_store: MagicMock
     ) -> None:
-        """Should use path when provided."""
-        mock_redis.delete.return_value = 1
+        """Should invalidate both the surrogate page tag and the path tag."""
         page_id = uuid4()
         result = await cache_service.invalidate_page_by_id(page_id, path="/about")
 
         assert result is True
-        mock_redis.delete.assert_called_once()
+        mock_store.invalidate_tags.assert_awaited_once_with(page_tag(page_id), path_tag("/about"))
 
     @pytest.mark.anyio
-    async def test_without_path_returns_false(self, cache_service: PageCacheService) -> None:
-        """Should return False when path is not provided."""
+    async def test_without_path_uses_page_tag(self, cache_service: PageCacheService, mock_store: MagicMock) -> None:
+        """Should not need the path to invalidate a page."""
         page_id = uuid4()
         result = await cache_service.invalidate_page_by_id(page_id)
 
-        assert result is False
+        assert result is True
+        mock_store.invalidate_tags.assert_awaited_once_with(f"page-{page_id}")
 
 
 class TestInvalidateAllPages:
     """Tests for invalidate_all_pages method."""
 
     @pytest.mark.anyio
-    async def test_clears_all_page_caches(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
-        """Should scan and delete all page:* keys."""
-        mock_redis.scan.return_value = (0, ["page:abc123", "page:def456"])
-        mock_redis.delete.return_value = 2
+    async def test_clears_all_page_caches(self, cache_service: PageCacheService, mock_store: MagicMock) -> None:
+        """Should clear the entries recorded in the index."""
+        mock_store.invalidate_all.return_value = 2
 
         result = await cache_service.invalidate_all_pages()
 
         assert result == 2
-        mock_redis.scan.assert_called()
-        mock_redis.delete.assert_called_once()
-
-    @pytest.mark.anyio
-    async def test_handles_empty_cache(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
-        """Should return 0 when no pages are cached."""
-        mock_redis.scan.return_value = (0, [])
-
-        result = await cache_service.invalidate_all_pages()
-
-        assert result == 0
-        mock_redis.delete.assert_not_called()
-
-    @pytest.mark.anyio
-    async def test_handles_multiple_scan_iterations(
-        self, cache_service: PageCacheService, mock_redis: AsyncMock
-    ) -> None:
-        """Should handle pagination through SCAN."""
-        mock_redis.scan.side_effect = [
-            (1, ["page:1", "page:2"]),
-            (0, ["page:3"]),
-        ]
-        mock_redis.delete.return_value = 3
-
-        result = await cache_service.invalidate_all_pages()
-
-        assert mock_redis.scan.call_count == 2
+        mock_store.invalidate_all.assert_awaited_once()
 
     @pytest.mark.anyio
-    async def test_handles_redis_errors(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
+    async def test_handles_redis_errors(self, cache_service: PageCacheService, mock_store: MagicMock) -> None:
         """Should return 0 on Redis errors."""
-        mock_redis.scan.side_effect = Exception("Connection refused")
+        mock_store.invalidate_all.side_effect = Exception("Connection refused")
 
         result = await cache_service.invalidate_all_pages()
 
@@ -172,27 +147,18 @@ class TestGetCacheStats:
     """Tests for get_cache_stats method."""
 
     @pytest.mark.anyio
-    async def test_returns_cached_page_count(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
-        """Should return count of cached pages."""
-        mock_redis.scan.return_value = (0, ["page:1", "page:2", "page:3"])
+    async def test_returns_cached_page_count(self, cache_service: PageCacheService, mock_store: MagicMock) -> None:
+        """Should return the size counter without scanning."""
+        mock_store.size.return_value = 3
 
         stats = await cache_service.get_cache_stats()
 
         assert stats["cached_pages"] == 3
 
     @pytest.mark.anyio
-    async def test_handles_empty_cache(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
-        """Should return 0 for empty cache."""
-        mock_redis.scan.return_value = (0, [])
-
-        stats = await cache_service.get_cache_stats()
-
-        assert stats["cached_pages"] == 0
-
-    @pytest.mark.anyio
-    async def test_handles_redis_errors(self, cache_service: PageCacheService, mock_redis: AsyncMock) -> None:
+    async def test_handles_redis_errors(self, cache_service: PageCacheService, mock_store: MagicMock) -> None:
         """Should return error stats on Redis errors."""
-        mock_redis.scan.side_effect = Exception("Connection refused")
+        mock_store.size.side_effect = Exception("Connection refused")
 
         stats = await cache_service.get_cache_stats()
 
@@ -0,0 +1,248 @@
+"""Unit tests for the tag-indexed response cache store."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from msgspec.msgpack import encode as encode_msgpack
+
+from pydotorg.core.cache.local import RESPONSE_CACHE_CHANNEL, LocalResponseCache
+from pydotorg.core.cache.store import (
+    INVALIDATE_ALL_BATCH_SIZE,
+    TaggedRedisStore,
+    _split_entry,
+    domain_tag,
+    page_tag,
+    path_tag,
+    surrogate_tags,
+    tags_for_key,
+)
+
+
+def _cached_response(*headers: tuple[bytes, bytes]) -> bytes:
+    return encode_msgpack(
+        [
+            {"type": "http.response.start", "status": 200, "headers": list(headers)},
+            {"type": "http.response.body", "body": b"<html></html>"},
+        ]
+    )
+
+
+@pytest.fixture
+def redis() -> FakeAsyncRedis:
+    return FakeAsyncRedis()
+
+
+@pytest.fixture
+def store(redis: FakeAsyncRedis) -> TaggedRedisStore:
+    return TaggedRedisStore(redis, namespace="cache", stale_ttl=300, lock_timeout=0.5)
+
+
+class TestTags:
+    def test_path_tag_normalizes(self) -> None:
+        assert path_tag("about/history/") == path_tag("/about/history") == "path:/about/history"
+        assert path_tag("") == "path:/"
+
+    def test_domain_tag_is_first_segment(self) -> None:
+        assert domain_tag("/downloads/release/python-3130/") == "domain:/downloads"
+        assert domain_tag("/") == "domain:/"
+
+    def test_page_tag_matches_surrogate_key_naming(self) -> None:
+        page_id = uuid4()
+        assert page_tag(page_id) == f"page-{page_id}"
+
+    def test_tags_for_key_ignore_query_digest(self) -> None:
+        assert tags_for_key("page:/about/?") == tags_for_key("page:/about?0123abcd") == ["path:/about", "domain:/about"]
+
+    def test_surrogate_tags_from_cached_response(self) -> None:
+        value = _cached_response((b"content-type", b"text/html"), (b"Surrogate-Key", b"page-1 section-2"))
+        assert surrogate_tags(value) == ["page-1", "section-2"]
+
+    def test_surrogate_tags_tolerate_garbage(self) -> None:
+        assert surrogate_tags(b"not msgpack") == []
+        assert surrogate_tags(_cached_response()) == []
+
+
+class TestTaggedRedisStore:
+    async def test_roundtrip_and_tag_registration(self, store: TaggedRedisStore, redis: FakeAsyncRedis) -> None:
+        page_id = uuid4()
+        value = _cached_response((b"surrogate-key", page_tag(page_id).encode()))
+
+        await store.set("page:/about/team?abc", value, expires_in=60)
+
+        assert await store.get("page:/about/team?abc") == value
+        for tag in ("path:/about/team", "domain:/about", f"page-{page_id}"):
+            assert await redis.smembers(f"cache:tag:{tag}") == {b"cache:page:/about/team?abc"}
+        assert 300 < await redis.ttl("cache:page:/about/team?abc") <= 360
+        assert await store.size() == 1
+
+    async def test_invalidate_path_covers_query_variants(self, store: TaggedRedisStore) -> None:
+        for key in ("page:/about?", "page:/about/?", "page:/about?abc", "page:/about/team?"):
+            await store.set(key, _cached_response(), expires_in=60)
+
+        assert await store.invalidate_tags(path_tag("/about"), path_tag("/about")) == 3
+        assert await store.get("page:/about?abc") is None
+        assert await store.get("page:/about/team?") is not None
+        assert await store.size() == 1
+
+    async def test_invalidate_by_surrogate_and_domain(self, store: TaggedRedisStore) -> None:
+        page_id = uuid4()
+        await store.set("page:/about?", _cached_response((b"Surrogate-Key", page_tag(page_id).encode())), 60)
+        await store.set("page:/downloads/release/?", _cached_response(), 60)
+        await store.set("page:/downloads/?", _cached_response(), 60)
+
+        assert await store.invalidate_tags(page_tag(page_id)) == 1
+        assert await store.invalidate_tags(domain_tag("/downloads")) == 2
+        assert await store.invalidate_tags() == 0
+        assert await store.size() == 0
+
+    async def test_invalidate_all_walks_index_in_batches(self, store: TaggedRedisStore) -> None:
+        for i in range(INVALIDATE_ALL_BATCH_SIZE + 3):
+            await store.set(f"page:/{i}?", b"x", expires_in=60)
+
+        assert await store.invalidate_all() == INVALIDATE_ALL_BATCH_SIZE + 3
+        assert await store.size() == 0
+
+    async def test_size_ignores_expired_entries(self, store: TaggedRedisStore, redis: FakeAsyncRedis) -> None:
+        await store.set("page:/a?", b"x", expires_in=60)
+        await redis.zadd("cache:index:entries", {"cache:page:/gone?": 1})
+
+        assert await store.size() == 1
+
+    async def test_delete_drops_entry_from_index(self, store: TaggedRedisStore) -> None:
+        await store.set("page:/a?", b"x", expires_in=timedelta(minutes=1))
+        await store.delete("page:/a?")
+
+        assert await store.get("page:/a?") is None
+        assert await store.size() == 0
+
+    async def test_untagged_keys_behave_like_redis_store(self, store: TaggedRedisStore, redis: FakeAsyncRedis) -> None:
+        await store.set("GET/api/v1/x", b"x", expires_in=60)
+
+        assert await redis.get("cache:GET/api/v1/x") == b"x"
+        assert await store.get("GET/api/v1/x") == b"x"
+        assert await store.size() == 0
+
+
+class TestStaleWhileRevalidate:
+    async def test_stale_entry_refreshed_by_one_caller(self, store: TaggedRedisStore) -> None:
+        await store.set("page:/?", b"old", expires_in=1)
+
+        with patch("pydotorg.core.cache.store.time.time", return_value=time.time() + 2):
+            leader = await store.get("page:/?")
+            followers = [await store.get("page:/?") for _ in range(3)]
+
+        assert leader is None
+        assert followers == [b"old"] * 3
+
+    async def test_set_releases_refresh_lock(self, store: TaggedRedisStore, redis: FakeAsyncRedis) -> None:
+        await store.set("page:/?", b"old", expires_in=1)
+        with patch("pydotorg.core.cache.store.time.time", return_value=time.time() + 2):
+            assert await store.get("page:/?") is None
+            assert await redis.exists("cache:lock:page:/?")
+
+        await store.set("page:/?", b"new", expires_in=60)
+
+        assert not await redis.exists("cache:lock:page:/?")
+        assert await store.get("page:/?") == b"new"
+
+    async def test_no_expiry_is_always_fresh(self, store: TaggedRedisStore, redis: FakeAsyncRedis) -> None:
+        await store.set("page:/?", b"x")
+
+        assert await store.get("page:/?") == b"x"
+        assert await redis.ttl("cache:page:/?") == -1
+
+    def test_split_entry_rejects_missing_prefix(self) -> None:
+        assert _split_entry(b"0000001700000000<html>") == (1_700_000_000, b"<html>")
+        assert _split_entry(b"<html></html>") is None
+        assert _split_entry(b"42") is None
+
+    @pytest.mark.parametrize("raw", [b"<html></html>", b"42", b"12345678901234ab<html>"])
+    async def test_entry_without_fresh_until_prefix_is_a_miss(
+        self, store: TaggedRedisStore, redis: FakeAsyncRedis, raw: bytes
+    ) -> None:
+        await redis.set("cache:page:/legacy/?", raw)
+
+        assert await store.get("page:/legacy/?") is None
+        assert await redis.exists("cache:lock:page:/legacy/?")
+
+        await store.set("page:/legacy/?", b"rendered", expires_in=60)
+        assert await store.get("page:/legacy/?") == b"rendered"
+
+    async def test_cold_miss_coalesces_on_leader(self, store: TaggedRedisStore) -> None:
+        assert await store.get("page:/events/?") is None
+
+        async def compute() -> None:
+            await asyncio.sleep(0.1)
+            await store.set("page:/events/?", b"rendered", expires_in=60)
+
+        *results, _ = await asyncio.gather(*(store.get("page:/events/?") for _ in range(5)), compute())
+
+        assert results == [b"rendered"] * 5
+
+    async def test_cold_miss_follower_gives_up_after_lock_timeout(
+        self, store: TaggedRedisStore, redis: FakeAsyncRedis
+    ) -> None:
+        assert await store.get("page:/events/?") is None
+
+        now = time.monotonic()
+        clock = [now, now, now + store.lock_timeout]
+        store_time = MagicMock(wraps=time)
+        store_time.monotonic.side_effect = clock
+        with patch("pydotorg.core.cache.store.time", store_time):
+            assert await asyncio.wait_for(store.get("page:/events/?"), 1) is None
+
+        assert store_time.monotonic.call_count == len(clock)
+        assert await redis.exists("cache:lock:page:/events/?")
+
+
+class TestLocalTier:
+    @pytest.fixture
+    def local(self) -> LocalResponseCache:
+        return LocalResponseCache(max_bytes=1024, max_entry_bytes=1024)
+
+    @pytest.fixture
+    def two_tier(self, redis: FakeAsyncRedis, local: LocalResponseCache) -> TaggedRedisStore:
+        return TaggedRedisStore(redis, namespace="cache", stale_ttl=300, lock_timeout=0.5, local=local)
+
+    async def test_fresh_hits_skip_redis(self, two_tier: TaggedRedisStore, store: TaggedRedisStore) -> None:
+        await store.set("page:/?", b"shared", expires_in=60)
+
+        assert await two_tier.get("page:/?") == b"shared"
+        with patch.object(two_tier, "_get_or_lead_script", side_effect=AssertionError("Redis was called")):
+            assert await two_tier.get("page:/?") == b"shared"
+
+    async def test_stale_entries_are_not_kept_locally(
+        self, two_tier: TaggedRedisStore, local: LocalResponseCache
+    ) -> None:
+        await two_tier.set("page:/?", b"old", expires_in=1)
+        with patch("pydotorg.core.cache.store.time.time", return_value=time.time() + 2):
+            assert await two_tier.get("page:/?") is None
+            assert await two_tier.get("page:/?") == b"old"
+            assert len(local) == 0
+
+    async def test_invalidation_clears_local_tier_and_publishes(
+        self, two_tier: TaggedRedisStore, redis: FakeAsyncRedis, local: LocalResponseCache
+    ) -> None:
+        page_id = uuid4()
+        await two_tier.set("page:/about?", _cached_response((b"surrogate-key", page_tag(page_id).encode())), 60)
+        await two_tier.set("page:/events/?", b"x", 60)
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(RESPONSE_CACHE_CHANNEL)
+
+        await two_tier.invalidate_tags(page_tag(page_id))
+        assert local.get("page:/about?") is None
+        assert local.get("page:/events/?") == b"x"
+
+        await two_tier.invalidate_all()
+        assert len(local) == 0
+
+        messages = [await pubsub.get_message(timeout=0.1) for _ in range(3)]
+        assert [m["data"] for m in messages if m] == [page_tag(page_id).encode(), b"*"]
+        await pubsub.aclose()
@@ -0,0 +1,210 @@
+"""Unit tests for the API key lookup cache and last-used write-behind buffer."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+from sqlalchemy.dialects import postgresql
+
+from pydotorg.core.auth import api_key_cache as module
+from pydotorg.core.auth.api_key_cache import (
+    LAST_USED_BUFFER_KEY,
+    LAST_USED_FLUSHING_KEY,
+    MISS,
+    APIKeyCache,
+    CachedAPIKey,
+    flush_api_key_last_used,
+    record_api_key_use,
+)
+from pydotorg.core.auth.middleware import JWTAuthMiddleware
+
+
+def _cached(expires_at: datetime | None = None) -> CachedAPIKey:
+    return CachedAPIKey(id=uuid4(), user_id=uuid4(), expires_at=expires_at)
+
+
+class TestAPIKeyCache:
+    def test_miss_then_hit(self) -> None:
+        cache = APIKeyCache(maxsize=10, ttl=60, negative_ttl=60)
+        entry = _cached()
+
+        assert cache.get("hash") is MISS
+        cache.set("hash", entry)
+        assert cache.get("hash") is entry
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    def test_negative_entry(self) -> None:
+        cache = APIKeyCache(maxsize=10, ttl=60, negative_ttl=60)
+        cache.set("unknown", None)
+        assert cache.get("unknown") is None
+
+    def test_negative_caching_disabled(self) -> None:
+        cache = APIKeyCache(maxsize=10, ttl=60, negative_ttl=0)
+        cache.set("unknown", None)
+        assert cache.get("unknown") is MISS
+
+    def test_expiry(self) -> None:
+        cache = APIKeyCache(maxsize=10, ttl=60, negative_ttl=60)
+        cache.set("hash", _cached())
+        with patch("pydotorg.core.auth.api_key_cache.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get("hash") is MISS
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        cache = APIKeyCache(maxsize=2, ttl=60, negative_ttl=60)
+        cache.set("a", None)
+        cache.set("b", None)
+        cache.get("a")
+        cache.set("c", None)
+        assert cache.get("b") is MISS
+        assert cache.get("a") is None
+
+    def test_invalidate(self) -> None:
+        cache = APIKeyCache(maxsize=10, ttl=60, negative_ttl=60)
+        cache.set("a", _cached())
+        cache.invalidate({"a"})
+        assert cache.get("a") is MISS
+
+    def test_cached_key_expiry(self) -> None:
+        assert not _cached().is_expired
+        assert _cached(datetime.now(tz=UTC) - timedelta(minutes=1)).is_expired
+
+
+class TestRecordAPIKeyUse:
+    @pytest.fixture(autouse=True)
+    def _reset(self) -> None:
+        module._last_recorded.clear()
+
+    async def test_buffers_once_per_resolution(self) -> None:
+        redis = AsyncMock()
+        key_id = uuid4()
+
+        await record_api_key_use(key_id, redis)
+        await record_api_key_use(key_id, redis)
+
+        redis.hset.assert_awaited_once()
+        name, field, _ = redis.hset.await_args.args
+        assert name == LAST_USED_BUFFER_KEY
+        assert field == str(key_id)
+
+    async def test_redis_failure_is_swallowed_and_retried(self) -> None:
+        redis = AsyncMock()
+        redis.hset.side_effect = RedisConnectionError("down")
+        key_id = uuid4()
+
+        await record_api_key_use(key_id, redis)
+        await record_api_key_use(key_id, redis)
+
+        assert redis.hset.await_count == 2
+
+
+class TestFlushAPIKeyLastUsed:
+    async def test_empty_buffer(self) -> None:
+        redis = AsyncMock()
+        redis.exists.return_value = 0
+        redis.rename.side_effect = ResponseError("no such key")
+        session = AsyncMock()
+
+        assert await flush_api_key_last_used(redis, session) == 0
+        session.execute.assert_not_awaited()
+
+    async def test_single_multi_row_update(self) -> None:
+        first, second = uuid4(), uuid4()
+        redis = AsyncMock()
+        redis.exists.return_value = 0
+        redis.hgetall.return_value = {
+            str(first).encode(): b"1700000000.5",
+            str(second).encode(): b"1700000100",
+            b"garbage": b"1",
+        }
+        session = AsyncMock()
+
+        assert await flush_api_key_last_used(redis, session) == 2
+
+        redis.rename.assert_awaited_once_with(LAST_USED_BUFFER_KEY, LAST_USED_FLUSHING_KEY)
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
+        redis.delete.assert_awaited_once_with(LAST_USED_FLUSHING_KEY)
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE api_keys SET last_used_at=greatest(")
+        assert "FROM (VALUES" in sql
+
+    async def test_retries_leftover_batch_before_renaming(self) -> None:
+        redis = AsyncMock()
+        redis.exists.return_value = 1
+        redis.hgetall.return_value = {str(uuid4()).encode(): b"1700000000"}
+        session = AsyncMock()
+
+        assert await flush_api_key_last_used(redis, session) == 1
+        redis.rename.assert_not_awaited()
+
+    async def test_failed_update_keeps_batch(self) -> None:
+        redis = AsyncMock()
+        redis.exists.return_value = 0
+        redis.hgetall.return_value = {str(uuid4()).encode(): b"1700000000"}
+        session = AsyncMock()
+        session.execute.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            await flush_api_key_last_used(redis, session)
+        redis.delete.assert_not_awaited()
+
+
+class TestMiddlewareAPIKeyLookup:
+    @pytest.fixture
+    def scope(self) -> dict:
+        return {"type": "http", "app": MagicMock()}
+
+    async def test_cached_key_skips_database_and_buffers_use(self, scope: dict) -> None:
+        entry = _cached()
+        user = MagicMock()
+        cache = APIKeyCache(maxsize=10, ttl=60, negative_ttl=60)
+        cache.set(module.APIKey.hash_key("pyorg_key"), entry)
+
+        with (
+            patch("pydotorg.core.auth.middleware.api_key_cache", cache),
+            patch("pydotorg.core.auth.middleware._get_sqlalchemy_config") as mock_config,
+            patch("pydotorg.core.auth.middleware.record_api_key_use", AsyncMock()) as mock_record,
+            patch.object(JWTAuthMiddleware, "_get_user", AsyncMock(return_value=user)) as mock_get_user,
+        ):
+            assert await JWTAuthMiddleware._get_user_from_api_key(scope, "pyorg_key") is user
+
+        mock_config.assert_not_called()
+        mock_record.assert_awaited_once_with(entry.id)
+        mock_get_user.assert_awaited_once_with(scope, entry.user_id)
+
+    async def test_unknown_key_is_negatively_cached(self, scope: dict) -> None:
+        db_session = AsyncMock()
+        db_session.execute.return_value.one_or_none = MagicMock(return_value=None)
+        config = MagicMock()
+        config.get_session.return_value.__aenter__ = AsyncMock(return_value=db_session)
+        config.get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+        cache = APIKeyCache(maxsize=10, ttl=60, negative_ttl=60)
+
+        with (
+            patch("pydotorg.core.auth.middleware.api_key_cache", cache),
+            patch("pydotorg.core.auth.middleware._get_sqlalchemy_config", return_value=config),
+        ):
+            assert await JWTAuthMiddleware._get_user_from_api_key(scope, "pyorg_bad") is None
+            assert await JWTAuthMiddleware._get_user_from_api_key(scope, "pyorg_bad") is None
+
+        db_session.execute.assert_awaited_once()
+
+    async def test_expired_key_rejected(self, scope: dict) -> None:
+        cache = APIKeyCache(maxsize=10, ttl=60, negative_ttl=60)
+        cache.set(module.APIKey.hash_key("pyorg_old"), _cached(datetime.now(tz=UTC) - timedelta(days=1)))
+
+        with (
+            patch("pydotorg.core.auth.middleware.api_key_cache", cache),
+            patch("pydotorg.core.auth.middleware.record_api_key_use", AsyncMock()) as mock_record,
+        ):
+            assert await JWTAuthMiddleware._get_user_from_api_key(scope, "pyorg_old") is None
+
+        mock_record.assert_not_awaited()
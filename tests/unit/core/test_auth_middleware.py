@@ -0,0 +1,161 @@
+"""Unit tests for the single-pass authentication resolver."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from pydotorg.config import settings
+from pydotorg.core.auth.guards import API_KEY_AUTH
+from pydotorg.core.auth.jwt import jwt_service
+from pydotorg.core.auth.middleware import (
+    AUTH_RESULT_SCOPE_KEY,
+    AuthMethod,
+    AuthResult,
+    JWTAuthMiddleware,
+    _extract_credentials,
+)
+
+
+def _scope(*headers: tuple[bytes, bytes]) -> dict:
+    return {"type": "http", "path": "/", "headers": list(headers), "app": MagicMock()}
+
+
+class TestExtractCredentials:
+    def test_no_credentials(self) -> None:
+        credentials = _extract_credentials(_scope())
+        assert credentials.api_key is None
+        assert credentials.bearer_token is None
+        assert credentials.cookie_token is None
+        assert credentials.session_id is None
+
+    def test_all_credentials_in_one_pass(self) -> None:
+        cookie = f"theme=dark; access_token=cookie-jwt; {settings.session_cookie_name}=sess-123"
+        credentials = _extract_credentials(
+            _scope(
+                (b"x-api-key", b"pyorg_abc"),
+                (b"authorization", b"Bearer header-jwt"),
+                (b"cookie", cookie.encode()),
+            )
+        )
+        assert credentials.api_key == "pyorg_abc"
+        assert credentials.bearer_token == "header-jwt"
+        assert credentials.cookie_token == "cookie-jwt"
+        assert credentials.session_id == "sess-123"
+
+    def test_non_bearer_authorization_ignored(self) -> None:
+        credentials = _extract_credentials(_scope((b"authorization", b"Basic dXNlcjpwYXNz")))
+        assert credentials.bearer_token is None
+
+    def test_empty_bearer_token_ignored(self) -> None:
+        credentials = _extract_credentials(_scope((b"authorization", b"Bearer ")))
+        assert credentials.bearer_token is None
+
+    def test_multiple_cookie_headers(self) -> None:
+        credentials = _extract_credentials(
+            _scope(
+                (b"cookie", b"access_token=jwt"),
+                (b"cookie", f"{settings.session_cookie_name}=sess".encode()),
+            )
+        )
+        assert credentials.cookie_token == "jwt"
+        assert credentials.session_id == "sess"
+
+
+class TestAuthResult:
+    def test_api_key_auth_value(self) -> None:
+        result = AuthResult(user=MagicMock(), method=AuthMethod.API_KEY)
+        assert result.auth == API_KEY_AUTH
+
+    def test_credential_auth_value(self) -> None:
+        result = AuthResult(user=MagicMock(), method=AuthMethod.SESSION, credential="sess")
+        assert result.auth == "sess"
+
+    def test_anonymous(self) -> None:
+        assert AuthResult().auth is None
+
+
+class TestResolve:
+    async def test_resolves_once_per_scope(self) -> None:
+        user = MagicMock()
+        user_id = uuid4()
+        token = jwt_service.create_access_token(user_id)
+        scope = _scope((b"authorization", f"Bearer {token}".encode()))
+
+        with patch.object(JWTAuthMiddleware, "_get_user", AsyncMock(return_value=user)) as mock_get_user:
+            first = await JWTAuthMiddleware.resolve(scope)
+            second = await JWTAuthMiddleware.resolve(scope)
+
+        assert first is second
+        assert first.user is user
+        assert first.method is AuthMethod.JWT
+        assert scope[AUTH_RESULT_SCOPE_KEY] is first
+        mock_get_user.assert_awaited_once_with(scope, user_id)
+
+    async def test_api_key_takes_precedence(self) -> None:
+        user = MagicMock()
+        token = jwt_service.create_access_token(uuid4())
+        scope = _scope((b"x-api-key", b"pyorg_key"), (b"authorization", f"Bearer {token}".encode()))
+
+        with (
+            patch.object(JWTAuthMiddleware, "_get_user_from_api_key", AsyncMock(return_value=user)),
+            patch.object(JWTAuthMiddleware, "_get_user", AsyncMock()) as mock_get_user,
+        ):
+            result = await JWTAuthMiddleware.resolve(scope)
+
+        assert result.method is AuthMethod.API_KEY
+        assert result.auth == API_KEY_AUTH
+        mock_get_user.assert_not_awaited()
+
+    async def test_invalid_token_falls_back_to_cookie_token(self) -> None:
+        user = MagicMock()
+        token = jwt_service.create_access_token(uuid4())
+        scope = _scope((b"authorization", b"Bearer not-a-jwt"), (b"cookie", f"access_token={token}".encode()))
+
+        with patch.object(JWTAuthMiddleware, "_get_user", AsyncMock(return_value=user)):
+            result = await JWTAuthMiddleware.resolve(scope)
+
+        assert result.user is user
+        assert result.credential == token
+
+    async def test_session_fallback(self) -> None:
+        user = MagicMock()
+        user_id = uuid4()
+        scope = _scope((b"cookie", f"{settings.session_cookie_name}=sess-1".encode()))
+
+        with (
+            patch("pydotorg.core.auth.middleware.session_service") as mock_sessions,
+            patch.object(JWTAuthMiddleware, "_get_user", AsyncMock(return_value=user)),
+        ):
+            mock_sessions.get_user_id_from_session = AsyncMock(return_value=user_id)
+            result = await JWTAuthMiddleware.resolve(scope)
+
+        assert result.method is AuthMethod.SESSION
+        assert result.credential == "sess-1"
+        mock_sessions.get_user_id_from_session.assert_awaited_once_with("sess-1")
+
+    async def test_anonymous_without_credentials(self) -> None:
+        result = await JWTAuthMiddleware.resolve(_scope())
+        assert result.user is None
+        assert result.auth is None
+
+
+class TestAuthenticateRequest:
+    @pytest.fixture
+    def middleware(self) -> JWTAuthMiddleware:
+        return JWTAuthMiddleware(app=AsyncMock())
+
+    async def test_reuses_populated_result(self, middleware: JWTAuthMiddleware) -> None:
+        user = MagicMock()
+        scope = _scope()
+        scope[AUTH_RESULT_SCOPE_KEY] = AuthResult(user=user, method=AuthMethod.API_KEY)
+        connection = MagicMock(scope=scope)
+
+        with patch.object(JWTAuthMiddleware, "_get_user_from_api_key", AsyncMock()) as mock_lookup:
+            result = await middleware.authenticate_request(connection)
+
+        assert result.user is user
+        assert result.auth == API_KEY_AUTH
+        mock_lookup.assert_not_awaited()
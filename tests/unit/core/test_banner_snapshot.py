@@ -0,0 +1,277 @@
+"""Unit tests for the versioned banner snapshot and its path index."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from pydotorg.core import banner_snapshot as module
+from pydotorg.core import banners_middleware
+from pydotorg.core.banner_snapshot import BannerPathIndex, BannerSnapshot, BannerSnapshotCache
+from pydotorg.core.banners_middleware import APIBannerMiddleware, SitewideBannerMiddleware
+from pydotorg.domains.banners.models import Banner
+
+
+def _banner(paths: str | None = None, *, target: str = "frontend", is_sitewide: bool = False, **kwargs) -> Banner:
+    return Banner(
+        id=uuid4(),
+        name="b",
+        title=kwargs.pop("title", "Notice"),
+        message="msg",
+        banner_type="info",
+        target=target,
+        paths=paths,
+        is_active=True,
+        is_sitewide=is_sitewide,
+        **kwargs,
+    )
+
+
+def _reference_match(banner: Banner, request_path: str) -> bool:
+    """The per-request matcher the path index replaces."""
+    if not banner.paths:
+        return True
+    path_prefixes = [p.strip() for p in banner.paths.split(",") if p.strip()]
+    if not path_prefixes:
+        return True
+    return any(request_path.startswith(prefix) or request_path == prefix.rstrip("/") for prefix in path_prefixes)
+
+
+class TestBannerPathIndex:
+    def test_no_paths_matches_everything(self) -> None:
+        banner = _banner(None)
+        index = BannerPathIndex([banner, _banner(" , ")])
+        assert index.match("/anything") == list(index.banners)
+        assert index.match("") == list(index.banners)
+
+    def test_prefix_and_trailing_slash_rules(self) -> None:
+        downloads = _banner("/downloads/, /about")
+        index = BannerPathIndex([downloads])
+
+        assert index.match("/downloads/release/") == [downloads]
+        assert index.match("/downloads") == [downloads]
+        assert index.match("/aboutus") == [downloads]
+        assert index.match("/download") == []
+        assert index.match("/") == []
+
+    def test_preserves_snapshot_order(self) -> None:
+        first, second, third = _banner("/a"), _banner(None), _banner("/a/b")
+        index = BannerPathIndex([first, second, third])
+        assert index.match("/a/b/c") == [first, second, third]
+        assert index.match("/x") == [second]
+
+    def test_matches_reference_implementation(self) -> None:
+        rng = random.Random(1234)
+        segments = ["", "/", "/a", "/a/", "/ab", "/a/b", "/a/b/", "/api", "/api/v1/", "/b"]
+        banners = [_banner(", ".join(rng.sample(segments, rng.randint(0, 3))) or None) for _ in range(30)]
+        index = BannerPathIndex(banners)
+        paths = [*segments, "/a/bc", "/api/v1/users", "/c", "/a/b/c/d"]
+
+        for path in paths:
+            assert index.match(path) == [b for b in banners if _reference_match(b, path)], path
+
+
+class TestBannerSnapshot:
+    def test_build_splits_by_target(self) -> None:
+        frontend = _banner(target="frontend")
+        api = _banner(target="api")
+        sitewide = _banner(target="api", is_sitewide=True)
+
+        snapshot = BannerSnapshot.build([frontend, api, sitewide])
+
+        assert snapshot.frontend.banners == (frontend, sitewide)
+        assert snapshot.api.banners == (api, sitewide)
+
+
+class TestBannerSnapshotCache:
+    @pytest.fixture
+    def load(self):
+        today = datetime.now(UTC).date()
+
+        async def _load(_app, *, version, today=today):
+            return BannerSnapshot.build([_banner()], version=version, loaded_on=today)
+
+        with patch.object(module, "_load_snapshot", AsyncMock(side_effect=_load)) as mock_load:
+            yield mock_load
+
+    async def test_reuses_snapshot_within_check_interval(self, load: AsyncMock) -> None:
+        cache = BannerSnapshotCache(ttl=300, version_check_interval=60)
+        with patch.object(module, "_read_version", AsyncMock(return_value=1)) as mock_version:
+            first = await cache.get(MagicMock())
+            second = await cache.get(MagicMock())
+
+        assert first is second
+        assert load.await_count == 1
+        assert mock_version.await_count == 1
+
+    async def test_unchanged_version_keeps_snapshot(self, load: AsyncMock) -> None:
+        cache = BannerSnapshotCache(ttl=300, version_check_interval=0)
+        with patch.object(module, "_read_version", AsyncMock(return_value=1)) as mock_version:
+            first = await cache.get(MagicMock())
+            second = await cache.get(MagicMock())
+
+        assert first is second
+        assert mock_version.await_count == 2
+        assert load.await_count == 1
+
+    async def test_version_bump_reloads(self, load: AsyncMock) -> None:
+        cache = BannerSnapshotCache(ttl=300, version_check_interval=0)
+        with patch.object(module, "_read_version", AsyncMock(side_effect=[1, 2])):
+            first = await cache.get(MagicMock())
+            second = await cache.get(MagicMock())
+
+        assert first is not second
+        assert second.version == 2
+
+    async def test_ttl_fallback_when_redis_unavailable(self, load: AsyncMock) -> None:
+        cache = BannerSnapshotCache(ttl=300, version_check_interval=0)
+        with patch.object(module, "_read_version", AsyncMock(return_value=None)):
+            await cache.get(MagicMock())
+            await cache.get(MagicMock())
+        assert load.await_count == 2
+
+        cache = BannerSnapshotCache(ttl=300, version_check_interval=60)
+        with patch.object(module, "_read_version", AsyncMock(return_value=None)):
+            await cache.get(MagicMock())
+            await cache.get(MagicMock())
+        assert load.await_count == 3
+
+    async def test_date_rollover_reloads(self, load: AsyncMock) -> None:
+        cache = BannerSnapshotCache(ttl=300, version_check_interval=60)
+        yesterday = datetime.now(UTC).date() - timedelta(days=1)
+        cache._snapshot = BannerSnapshot.build([], version=1, loaded_on=yesterday)
+        cache._next_check = float("inf")
+
+        with patch.object(module, "_read_version", AsyncMock(return_value=1)):
+            snapshot = await cache.get(MagicMock())
+
+        assert snapshot.loaded_on == datetime.now(UTC).date()
+        load.assert_awaited_once()
+
+    async def test_invalidate_forces_reload(self, load: AsyncMock) -> None:
+        cache = BannerSnapshotCache(ttl=300, version_check_interval=60)
+        with patch.object(module, "_read_version", AsyncMock(return_value=1)):
+            await cache.get(MagicMock())
+            cache.invalidate()
+            await cache.get(MagicMock())
+        assert load.await_count == 2
+
+    async def test_failed_reload_serves_previous_snapshot(self) -> None:
+        cache = BannerSnapshotCache(ttl=300, version_check_interval=0)
+        previous = BannerSnapshot.build([], version=1, loaded_on=date.today())
+        cache._snapshot = previous
+
+        with (
+            patch.object(module, "_read_version", AsyncMock(return_value=2)),
+            patch.object(module, "_load_snapshot", AsyncMock(side_effect=RuntimeError("db down"))),
+        ):
+            assert await cache.get(MagicMock()) is previous
+
+
+class TestBannerChangeEvents:
+    def test_commit_with_banner_change_invalidates_and_bumps(self) -> None:
+        session = MagicMock(spec=Session)
+        session.info = {}
+        session.new, session.dirty, session.deleted = [_banner()], [], []
+
+        with (
+            patch.object(module.banner_snapshot, "invalidate") as mock_invalidate,
+            patch.object(module, "run_in_background") as mock_run,
+        ):
+            module.banner_changes.flush(session)
+            module.banner_changes.commit(session)
+
+        mock_invalidate.assert_called_once()
+        mock_run.assert_called_once_with(module.bump_banner_version)
+
+    def test_commit_without_banner_change_is_ignored(self) -> None:
+        session = MagicMock(spec=Session)
+        session.info = {}
+        session.new, session.dirty, session.deleted = [object()], [], []
+
+        with patch.object(module.banner_snapshot, "invalidate") as mock_invalidate:
+            module.banner_changes.flush(session)
+            module.banner_changes.commit(session)
+
+        mock_invalidate.assert_not_called()
+
+
+class TestBannerMiddlewares:
+    @pytest.fixture
+    def snapshot(self) -> BannerSnapshot:
+        return BannerSnapshot.build(
+            [
+                _banner("/about", target="frontend", title="Frontend"),
+                _banner("/api/v1/", target="api", title="Deprecated"),
+            ]
+        )
+
+    async def test_sitewide_middleware_uses_snapshot(self, snapshot: BannerSnapshot) -> None:
+        app = AsyncMock()
+        scope = {"type": "http", "path": "/about/team", "headers": [(b"accept", b"text/html")], "app": MagicMock()}
+
+        with patch("pydotorg.core.banners_middleware.banner_snapshot.get", AsyncMock(return_value=snapshot)):
+            await SitewideBannerMiddleware(app)(scope, AsyncMock(), AsyncMock())
+
+        assert [b.title for b in scope["sitewide_banners"]] == ["Frontend"]
+
+    async def test_api_middleware_adds_notice_header(self, snapshot: BannerSnapshot) -> None:
+        sent: list[dict] = []
+
+        async def app(scope, receive, send) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        async def send(message) -> None:
+            sent.append(message)
+
+        scope = {"type": "http", "path": "/api/v1/users", "headers": [], "app": MagicMock()}
+        with patch("pydotorg.core.banners_middleware.banner_snapshot.get", AsyncMock(return_value=snapshot)):
+            await APIBannerMiddleware(app)(scope, AsyncMock(), send)
+
+        ((name, value),) = sent[0]["headers"]
+        assert name == b"X-API-Notice"
+        assert b"Deprecated" in value
+
+    async def test_api_notice_header_built_once_per_bucket(self, snapshot: BannerSnapshot) -> None:
+        scope = {"type": "http", "app": MagicMock()}
+        with (
+            patch("pydotorg.core.banners_middleware.banner_snapshot.get", AsyncMock(return_value=snapshot)),
+            patch(
+                "pydotorg.core.banners_middleware._build_notice_header",
+                wraps=banners_middleware._build_notice_header,
+            ) as mock_build,
+        ):
+            banners_middleware._notice_headers.clear()
+            first = await APIBannerMiddleware._get_notice_header(scope, "/api/v1/users")
+            second = await APIBannerMiddleware._get_notice_header(scope, "/api/v1/jobs")
+            none = await APIBannerMiddleware._get_notice_header(scope, "/api/v2/users")
+
+        assert first is second
+        assert none is None
+        mock_build.assert_called_once()
+
+    async def test_api_notice_header_keyed_by_banner_content(self) -> None:
+        banner = _banner(None, target="api", title="Before")
+        scope = {"type": "http", "app": MagicMock()}
+        banners_middleware._notice_headers.clear()
+
+        with patch(
+            "pydotorg.core.banners_middleware.banner_snapshot.get",
+            AsyncMock(return_value=BannerSnapshot.build([banner])),
+        ):
+            before = await APIBannerMiddleware._get_notice_header(scope, "/api/x")
+
+        banner.title = "After"
+        with patch(
+            "pydotorg.core.banners_middleware.banner_snapshot.get",
+            AsyncMock(return_value=BannerSnapshot.build([banner])),
+        ):
+            after = await APIBannerMiddleware._get_notice_header(scope, "/api/x")
+
+        assert b"Before" in before[1]
+        assert b"After" in after[1]
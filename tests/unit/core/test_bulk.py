@@ -0,0 +1,139 @@
+"""Tests for set-based upserts."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from pydotorg.core.database.base import AuditBase
+from pydotorg.core.database.bulk import StageTimer, bulk_upsert
+from pydotorg.domains.events.models import EventLocation, EventOccurrence
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+async def session_maker(tmp_path: Path) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(AuditBase.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def _location(slug: str, address: str | None = None, url: str | None = None) -> dict[str, str | None]:
+    return {"name": slug.title(), "slug": slug, "address": address, "url": url}
+
+
+async def test_bulk_upsert_creates_updates_and_skips_unchanged_rows(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_maker() as session:
+        first = await bulk_upsert(
+            session,
+            EventLocation,
+            [_location("berlin", "Berlin"), _location("online")],
+            key=("slug",),
+            update=("address",),
+        )
+        await session.commit()
+
+        second = await bulk_upsert(
+            session,
+            EventLocation,
+            [_location("berlin", "Berlin, Germany"), _location("online"), _location("tbd")],
+            key=("slug",),
+            update=("address",),
+        )
+        await session.commit()
+
+        rows = {row.slug: row for row in (await session.scalars(select(EventLocation))).all()}
+
+    assert (first.created, first.updated, first.unchanged) == (2, 0, 0)
+    assert (second.created, second.updated, second.unchanged) == (1, 1, 1)
+    assert second.ids["berlin",] == first.ids["berlin",] == rows["berlin"].id
+    assert second.ids["tbd",] == rows["tbd"].id
+    assert rows["berlin"].address == "Berlin, Germany"
+
+
+async def test_bulk_upsert_without_update_columns_never_modifies_rows(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_maker() as session:
+        await bulk_upsert(session, EventLocation, [_location("berlin", "Berlin")], key=("slug",))
+        result = await bulk_upsert(
+            session, EventLocation, [_location("berlin", "Elsewhere"), _location("online")], key=("slug",)
+        )
+        address = await session.scalar(select(EventLocation.address).where(EventLocation.slug == "berlin"))
+
+    assert (result.created, result.updated, result.unchanged) == (1, 0, 1)
+    assert set(result.ids) == {("berlin",), ("online",)}
+    assert address == "Berlin"
+
+
+async def test_bulk_upsert_keeps_existing_value_when_new_one_is_null(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_maker() as session:
+        await bulk_upsert(session, EventLocation, [_location("berlin", "Berlin", "https://example.com")], key=("slug",))
+        result = await bulk_upsert(
+            session,
+            EventLocation,
+            [_location("berlin", "Berlin, Germany", None)],
+            key=("slug",),
+            update=("address", "url"),
+            keep_existing_if_null=("url",),
+        )
+        location = await session.scalar(select(EventLocation))
+
+    assert result.updated == 1
+    assert (location.address, location.url) == ("Berlin, Germany", "https://example.com")
+
+
+async def test_bulk_upsert_with_composite_key_dedupes_rows(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    event_id = uuid4()
+    start = datetime(2026, 5, 14, 9, tzinfo=UTC)
+    rows = [
+        {"event_id": event_id, "dt_start": start, "dt_end": None, "all_day": False},
+        {"event_id": event_id, "dt_start": start, "dt_end": None, "all_day": True},
+    ]
+    timer = StageTimer()
+
+    async with session_maker() as session:
+        first = await bulk_upsert(session, EventOccurrence, rows, key=("event_id", "dt_start"), timer=timer)
+        second = await bulk_upsert(session, EventOccurrence, rows, key=("event_id", "dt_start"), timer=timer)
+        occurrences = (await session.scalars(select(EventOccurrence))).all()
+
+    assert (first.created, second.created, second.unchanged) == (1, 0, 1)
+    assert len(occurrences) == 1
+    assert occurrences[0].all_day is True
+    assert set(timer.timings) == {"prefetch", "diff", "write"}
+
+
+async def test_bulk_upsert_with_no_rows_runs_no_queries(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    timer = StageTimer()
+    async with session_maker() as session:
+        result = await bulk_upsert(session, EventLocation, [], key=("slug",), timer=timer)
+
+    assert (result.created, result.updated, result.unchanged, result.ids) == (0, 0, 0, {})
+    assert timer.timings == {}
+
+
+def test_stage_timer_accumulates_repeated_stages() -> None:
+    timer = StageTimer()
+    with timer.stage("fetch"):
+        pass
+    with timer.stage("fetch"), timer.stage("parse"):
+        pass
+
+    assert set(timer.timings) == {"fetch", "parse"}
+    assert timer.timings["fetch"] >= 0
@@ -0,0 +1,126 @@
+"""Unit tests for shared ORM change tracking and pub/sub listening."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.orm import Session
+
+from pydotorg.core import changes as module
+from pydotorg.core.changes import ChangeCollector, listen_for_changes, run_in_background
+
+
+def _session() -> MagicMock:
+    session = MagicMock(spec=Session)
+    session.info = {}
+    return session
+
+
+@pytest.fixture
+def collector() -> ChangeCollector[list[int]]:
+    def collect(session: Session, pending: list[int] | None) -> list[int] | None:
+        batch = session.info.pop("test_batch", [])
+        return [*(pending or []), *batch] or None
+
+    collector = ChangeCollector("test_changes", collect, MagicMock())
+    yield collector
+    module._collectors.remove(collector)
+
+
+class TestChangeCollector:
+    def test_changes_from_every_flush_are_applied_once_on_commit(self, collector: ChangeCollector) -> None:
+        session = _session()
+        for batch in ([1], [], [2, 3]):
+            session.info["test_batch"] = batch
+            module._collect_changes(session, None)
+
+        module._apply_changes(session)
+        module._apply_changes(session)
+
+        collector._apply.assert_called_once_with([1, 2, 3])
+        assert "test_changes" not in session.info
+
+    def test_commit_without_changes_is_ignored(self, collector: ChangeCollector) -> None:
+        session = _session()
+
+        module._collect_changes(session, None)
+        module._apply_changes(session)
+
+        collector._apply.assert_not_called()
+
+    def test_rollback_discards_changes(self, collector: ChangeCollector) -> None:
+        session = _session()
+        session.info["test_batch"] = [1]
+
+        module._collect_changes(session, None)
+        module._discard_changes(session, None)
+        module._apply_changes(session)
+
+        collector._apply.assert_not_called()
+
+    def test_marked_changes_are_applied_on_commit(self, collector: ChangeCollector) -> None:
+        session = _session()
+
+        collector.mark(session, [7])
+        module._apply_changes(session)
+
+        collector._apply.assert_called_once_with([7])
+
+
+class TestRunInBackground:
+    async def test_runs_coroutine_on_the_running_loop(self) -> None:
+        func = AsyncMock()
+
+        run_in_background(func, "value")
+        await asyncio.gather(*module._background_tasks)
+
+        func.assert_awaited_once_with("value")
+
+    def test_does_nothing_without_a_loop(self) -> None:
+        func = AsyncMock()
+
+        run_in_background(func, "value")
+
+        func.assert_not_called()
+
+
+class TestListenForChanges:
+    async def test_resubscribes_after_errors_and_skips_malformed_messages(self) -> None:
+        redis = FakeAsyncRedis()
+        received: list[str] = []
+        subscribed = asyncio.Event()
+        pubsubs = [MagicMock(subscribe=AsyncMock(side_effect=ConnectionError), aclose=AsyncMock())]
+
+        def on_message(value: str) -> None:
+            if value == "bad":
+                raise ValueError(value)
+            received.append(value)
+
+        def get_pubsub() -> object:
+            return pubsubs.pop() if pubsubs else redis.pubsub(ignore_subscribe_messages=True)
+
+        on_disconnect = MagicMock()
+        with (
+            patch.object(module, "get_pubsub", get_pubsub),
+            patch.object(module, "RECONNECT_DELAY_SECONDS", 0),
+        ):
+            listener = asyncio.create_task(
+                listen_for_changes("test-channel", on_message, on_subscribe=subscribed.set, on_disconnect=on_disconnect)
+            )
+            await asyncio.wait_for(subscribed.wait(), 1)
+            for value in ("bad", "good"):
+                await redis.publish("test-channel", value)
+            for _ in range(50):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
+
+        assert received == ["good"]
+        on_disconnect.assert_called_once_with()
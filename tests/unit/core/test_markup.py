@@ -0,0 +1,142 @@
+"""Tests for markup rendering, the markup cache and persisted rendered content."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from pydotorg.core.database.base import AuditBase
+from pydotorg.core.markup import MarkupCache, content_hash, markup_cache, render_markup
+from pydotorg.domains.downloads.models import Release
+from pydotorg.domains.pages.models import ContentType, Page
+from pydotorg.tasks.content import render_stale_content
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class TestRenderMarkup:
+    def test_markdown(self) -> None:
+        assert render_markup("# Title") == "<h1>Title</h1>\n"
+
+    def test_rst(self) -> None:
+        assert "<h1" in render_markup("Title\n=====\n\nBody", "restructuredtext")
+
+    def test_html_passes_through(self) -> None:
+        assert render_markup("<b>bold</b>", "html") == "<b>bold</b>"
+
+    def test_hash_depends_on_markup(self) -> None:
+        assert content_hash("text", "markdown") != content_hash("text", "restructuredtext")
+        assert len(content_hash("text")) == 64
+
+
+class TestMarkupCache:
+    def test_renders_once(self) -> None:
+        cache = MarkupCache(max_entries=8)
+        with patch("pydotorg.core.markup.render_markup", return_value="<p>x</p>") as render:
+            assert cache.render("x") == "<p>x</p>"
+            assert cache.render("x") == "<p>x</p>"
+
+        render.assert_called_once_with("x", "markdown")
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = MarkupCache(max_entries=2)
+        cache.render("a")
+        cache.render("b")
+        cache.render("a")
+        cache.render("c")
+
+        assert cache.get(content_hash("a")) is not None
+        assert cache.get(content_hash("b")) is None
+        assert len(cache) == 2
+
+    def test_zero_size_disables_cache(self) -> None:
+        cache = MarkupCache(max_entries=0)
+        cache.render("a")
+
+        assert len(cache) == 0
+
+
+class TestRenderedContentMixin:
+    def test_refresh_renders_and_skips_unchanged_content(self) -> None:
+        page = Page(content="Title\n=====", content_type=ContentType.RESTRUCTUREDTEXT)
+
+        assert page.refresh_rendered_content() is True
+        assert "<h1" in page.content_html
+        assert page.content_hash == content_hash(page.content, "restructuredtext")
+        assert page.refresh_rendered_content() is False
+
+    def test_html_pages_store_content_as_is(self) -> None:
+        page = Page(content="<p>raw</p>", content_type=ContentType.HTML)
+        page.refresh_rendered_content()
+
+        assert page.content_html == "<p>raw</p>"
+
+    def test_rendered_content_falls_back_to_cache(self) -> None:
+        markup_cache.clear()
+        release = Release(content="**bold**")
+
+        assert release.rendered_content == "<p><strong>bold</strong></p>\n"
+        assert len(markup_cache) == 1
+
+
+@pytest.fixture
+async def session_maker(tmp_path: Path) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'markup.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(AuditBase.metadata.create_all)
+    with (
+        patch("pydotorg.core.release_tree.run_in_background"),
+        patch("pydotorg.core.release_file_index.run_in_background"),
+    ):
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_content_is_rendered_on_write(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    async with session_maker() as session:
+        page = Page(title="About", path="/about/", content="# About")
+        session.add(page)
+        await session.commit()
+        assert page.content_html == "<h1>About</h1>\n"
+
+        page.content = "# About us"
+        await session.commit()
+        assert page.content_html == "<h1>About us</h1>\n"
+
+        page.content_type = ContentType.HTML
+        await session.commit()
+        assert page.content_html == "# About us"
+
+        with patch.object(Page, "refresh_rendered_content") as refresh:
+            page.title = "About Python"
+            await session.commit()
+        refresh.assert_not_called()
+
+
+async def test_render_stale_content_backfills_rows(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    async with session_maker() as session:
+        session.add_all([Page(title=f"Page {i}", path=f"/page-{i}/", content=f"# Page {i}") for i in range(3)])
+        session.add(Release(name="3.13.0", slug="python-3130", content="Notes"))
+        await session.commit()
+        await session.execute(update(Page).values(content_html=None, content_hash=None))
+        await session.execute(update(Release).values(content="Updated notes"))
+        await session.commit()
+
+    assert await render_stale_content({"session_maker": session_maker}, batch_size=2) == {"pages": 3, "releases": 0}
+    assert await render_stale_content({"session_maker": session_maker}, full=True) == {"pages": 0, "releases": 1}
+
+    async with session_maker() as session:
+        pages = (await session.scalars(select(Page).order_by(Page.path))).all()
+        release = await session.scalar(select(Release))
+
+    assert [page.content_html for page in pages] == [f"<h1>Page {i}</h1>\n" for i in range(3)]
+    assert release.content_html == "<p>Updated notes</p>\n"
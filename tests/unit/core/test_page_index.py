@@ -0,0 +1,182 @@
+"""Tests for the per-process index of published page paths."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from litestar.exceptions import NotFoundException
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from pydotorg.core import page_index as module
+from pydotorg.core.page_index import PageIndex
+from pydotorg.domains.pages.controllers import PageRenderController
+from pydotorg.domains.pages.models import Page
+
+
+def _page(path: str, *, published: bool = True, committed: bool = False) -> Page:
+    page = Page()
+    if committed:
+        set_committed_value(page, "path", path)
+        set_committed_value(page, "is_published", published)
+    else:
+        page.path = path
+        page.is_published = published
+    return page
+
+
+def _session(*, new: list | None = None, dirty: list | None = None, deleted: list | None = None) -> MagicMock:
+    session = MagicMock(spec=Session)
+    session.info = {}
+    session.new, session.dirty, session.deleted = new or [], dirty or [], deleted or []
+    return session
+
+
+class TestPageIndex:
+    def test_unloaded_index_excludes_nothing(self) -> None:
+        index = PageIndex()
+
+        assert index.excludes("/wp-login.php") is False
+        assert index.stats() == {"size": 0, "hits": 0, "rejections": 0}
+
+    def test_loaded_index_rejects_unknown_paths(self) -> None:
+        index = PageIndex()
+        index.replace(["/about/"])
+
+        assert index.excludes("/about/") is False
+        assert index.excludes("/wp-login.php") is True
+        assert index.stats() == {"size": 1, "hits": 1, "rejections": 1}
+
+    def test_update_and_clear(self) -> None:
+        index = PageIndex()
+        index.replace(["/about/", "/old/"])
+
+        index.update({"/new/": True, "/old/": False})
+        assert "/new/" in index
+        assert "/old/" not in index
+
+        index.clear()
+        assert len(index) == 0
+        assert index.loaded is False
+
+
+class TestPagePathChangeEvents:
+    @pytest.fixture
+    def index(self) -> PageIndex:
+        index = PageIndex()
+        with patch.object(module, "page_index", index):
+            yield index
+
+    def test_created_moved_unpublished_and_deleted_pages_update_index(self, index: PageIndex) -> None:
+        index.replace(["/moved-from/", "/unpublished/", "/deleted/", "/untouched/"])
+        moved = _page("/moved-from/", committed=True)
+        moved.path = "/moved-to/"
+        unpublished = _page("/unpublished/", committed=True)
+        unpublished.is_published = False
+        untouched = _page("/untouched/", committed=True)
+        untouched.title = "Renamed"
+        session = _session(
+            new=[_page("/created/"), _page("/draft/", published=False)],
+            dirty=[moved, unpublished, untouched],
+            deleted=[_page("/deleted/", committed=True)],
+        )
+
+        with patch.object(module, "run_in_background") as mock_run:
+            module.page_path_changes.flush(session)
+            module.page_path_changes.commit(session)
+
+        mock_run.assert_called_once_with(
+            module.publish_page_path_changes,
+            {
+                "/deleted/": False,
+                "/created/": True,
+                "/draft/": False,
+                "/moved-from/": False,
+                "/moved-to/": True,
+                "/unpublished/": False,
+            },
+        )
+        assert sorted(index._paths) == ["/created/", "/moved-to/", "/untouched/"]
+
+    def test_unrelated_commit_is_ignored(self, index: PageIndex) -> None:
+        page = _page("/about/", committed=True)
+        page.title = "About"
+        session = _session(new=[object()], dirty=[page])
+
+        with patch.object(module, "run_in_background") as mock_run:
+            module.page_path_changes.flush(session)
+            module.page_path_changes.commit(session)
+
+        mock_run.assert_not_called()
+
+    def test_rollback_discards_changes(self, index: PageIndex) -> None:
+        session = _session(new=[_page("/created/")])
+
+        module.page_path_changes.flush(session)
+        module.page_path_changes.rollback(session)
+
+        assert module._SESSION_INFO_KEY not in session.info
+
+
+class TestPagePathChangeListener:
+    async def test_applies_published_changes(self) -> None:
+        redis = FakeAsyncRedis()
+        index = PageIndex()
+
+        async def load(_app: object, target: PageIndex) -> None:
+            target.replace(["/stale/"])
+
+        with (
+            patch("pydotorg.core.changes.get_pubsub", lambda: redis.pubsub(ignore_subscribe_messages=True)),
+            patch.object(module, "get_redis", return_value=redis),
+            patch.object(module, "load_page_index", side_effect=load) as mock_load,
+        ):
+            listener = asyncio.create_task(module.listen_for_page_path_changes(MagicMock(), index))
+            for _ in range(50):
+                if index.loaded:
+                    break
+                await asyncio.sleep(0.01)
+
+            await module.publish_page_path_changes({"/about us/": True, "/stale/": False})
+            await redis.publish(module.PAGE_PATH_CHANNEL, "garbage")
+            for _ in range(50):
+                if "/about us/" in index:
+                    break
+                await asyncio.sleep(0.01)
+
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
+
+        assert "/about us/" in index
+        assert "/stale/" not in index
+        mock_load.assert_awaited_once()
+
+
+class TestRenderPage:
+    async def test_unknown_path_skips_database(self) -> None:
+        index = PageIndex()
+        index.replace(["/about/"])
+        page_service = AsyncMock()
+
+        with patch("pydotorg.domains.pages.controllers.page_index", index), pytest.raises(NotFoundException):
+            await PageRenderController.render_page.fn(MagicMock(), page_service=page_service, page_path="wp-login.php")
+
+        page_service.get_one_or_none.assert_not_called()
+
+    async def test_known_path_is_loaded(self) -> None:
+        index = PageIndex()
+        index.replace(["/about/"])
+        page_service = AsyncMock()
+        page_service.get_one_or_none.return_value = _page("/about/")
+
+        with patch("pydotorg.domains.pages.controllers.page_index", index):
+            response = await PageRenderController.render_page.fn(
+                MagicMock(), page_service=page_service, page_path="about/"
+            )
+
+        page_service.get_one_or_none.assert_awaited_once_with(path="/about/", is_published=True)
+        assert response.context["page"].path == "/about/"
@@ -0,0 +1,205 @@
+"""Tests for schema projections and the query counts of list endpoints."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from advanced_alchemy.config import EngineConfig
+from advanced_alchemy.extensions.litestar import SQLAlchemyPlugin
+from advanced_alchemy.extensions.litestar.plugins.init.config.asyncio import SQLAlchemyAsyncConfig
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+from pydantic import BaseModel
+from sqlalchemy import NullPool, event, select
+
+from pydotorg.core.database.base import AuditBase
+from pydotorg.core.database.projections import schema_load
+from pydotorg.core.dependencies import get_core_dependencies
+from pydotorg.domains.downloads.controllers import ReleaseController
+from pydotorg.domains.downloads.dependencies import get_downloads_dependencies
+from pydotorg.domains.downloads.models import OS, Release, ReleaseFile
+from pydotorg.domains.downloads.schemas import ReleaseList
+from pydotorg.domains.events.controllers import EventController
+from pydotorg.domains.events.dependencies import get_events_dependencies
+from pydotorg.domains.events.models import Calendar, Event, EventOccurrence
+from pydotorg.domains.jobs.controllers import JobController
+from pydotorg.domains.jobs.dependencies import get_jobs_dependencies
+from pydotorg.domains.jobs.models import Job, JobCategory, JobStatus, JobType
+from pydotorg.domains.pages.controllers import PageController
+from pydotorg.domains.pages.dependencies import get_page_dependencies
+from pydotorg.domains.pages.models import Image, Page
+from pydotorg.domains.users.models import User
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+class _ReleaseWithStatusLabel(BaseModel):
+    name: str
+    status_label: str
+
+
+def _selected_columns(model: type, schema: type[BaseModel], **kwargs: object) -> str:
+    statement = select(model).options(*schema_load(model, schema, **kwargs))
+    return str(statement.compile()).split(" FROM ")[0]
+
+
+class TestSchemaLoad:
+    def test_selects_only_schema_columns(self) -> None:
+        columns = _selected_columns(Release, ReleaseList)
+
+        assert "releases.release_date" in columns
+        assert "releases.content" not in columns
+        assert "releases.creator_id" not in columns
+
+    def test_property_fields_keep_every_column(self) -> None:
+        columns = _selected_columns(Release, _ReleaseWithStatusLabel)
+
+        assert "releases.content" in columns
+
+    def test_options_are_cached(self) -> None:
+        assert schema_load(Release, ReleaseList) == schema_load(Release, ReleaseList)
+        assert schema_load(Release, ReleaseList) is not schema_load(Release, ReleaseList)
+
+
+@pytest.fixture
+async def sqlalchemy_config(tmp_path: Path) -> AsyncIterator[SQLAlchemyAsyncConfig]:
+    config = SQLAlchemyAsyncConfig(
+        connection_string=f"sqlite+aiosqlite:///{tmp_path / 'projections.db'}",
+        engine_config=EngineConfig(poolclass=NullPool),
+    )
+    async with config.get_engine().begin() as conn:
+        await conn.run_sync(AuditBase.metadata.create_all)
+
+    with (
+        patch("pydotorg.core.release_tree.run_in_background"),
+        patch("pydotorg.core.release_file_index.run_in_background"),
+    ):
+        async with config.get_session() as session:
+            creator = User(username="creator", email="creator@example.com")
+            windows = OS(name="Windows", slug="windows")
+            session.add_all([creator, windows])
+            await session.flush()
+            for i in range(3):
+                page = Page(
+                    title=f"Page {i}", path=f"/page-{i}/", creator_id=creator.id, last_modified_by_id=creator.id
+                )
+                page.images = [Image(image=f"img-{i}.png")]
+                session.add(page)
+                release = Release(
+                    name=f"3.{i}.0",
+                    slug=f"python-3{i}0",
+                    is_published=True,
+                    release_date=datetime.date(2024, 1, i + 1),
+                    creator_id=creator.id,
+                )
+                release.files = [
+                    ReleaseFile(name=f"file-{i}", slug=f"file-{i}", os_id=windows.id, url=f"https://example.com/{i}")
+                ]
+                session.add(release)
+            calendar = Calendar(name="Python Events", slug="python-events", creator_id=creator.id)
+            session.add(calendar)
+            await session.flush()
+            for i in range(3):
+                event_ = Event(name=f"Event {i}", slug=f"event-{i}", title=f"Event {i}", calendar_id=calendar.id)
+                event_.occurrences = [EventOccurrence(dt_start=datetime.datetime(2025, 1, i + 1, tzinfo=datetime.UTC))]
+                session.add(event_)
+            category = JobCategory(name="Engineering", slug="engineering")
+            job_type = JobType(name="Remote", slug="remote")
+            for i in range(3):
+                session.add(
+                    Job(
+                        slug=f"job-{i}",
+                        creator_id=creator.id,
+                        company_name="PSF",
+                        job_title=f"Developer {i}",
+                        country="USA",
+                        description="Write Python",
+                        email="jobs@example.com",
+                        status=JobStatus.APPROVED,
+                        category=category,
+                        job_types=[job_type],
+                    )
+                )
+            await session.commit()
+
+    yield config
+    await config.get_engine().dispose()
+
+
+@pytest.fixture
+async def client(sqlalchemy_config: SQLAlchemyAsyncConfig) -> AsyncIterator[AsyncTestClient]:
+    app = Litestar(
+        route_handlers=[PageController, ReleaseController, EventController, JobController],
+        plugins=[SQLAlchemyPlugin(config=sqlalchemy_config)],
+        dependencies={
+            **get_core_dependencies(),
+            **get_page_dependencies(),
+            **get_downloads_dependencies(),
+            **get_events_dependencies(),
+            **get_jobs_dependencies(),
+        },
+    )
+    async with AsyncTestClient(app=app) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    ("url", "max_statements"),
+    [
+        ("/api/v1/pages/", 1),
+        ("/api/v1/releases/", 1),
+        ("/api/v1/releases/published", 1),
+        ("/api/v1/releases/download-page", 1),
+        ("/api/v1/events/", 1),
+        ("/api/v1/jobs/", 3),
+        ("/api/v1/jobs/?status=approved", 3),
+    ],
+)
+async def test_list_endpoint_query_count(
+    client: AsyncTestClient,
+    sqlalchemy_config: SQLAlchemyAsyncConfig,
+    url: str,
+    max_statements: int,
+) -> None:
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    engine = sqlalchemy_config.get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = await client.get(url)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 3
+    assert len(statements) <= max_statements, "\n\n".join(statements)
+    assert not any("FROM users" in statement for statement in statements)
+
+
+async def test_list_pages_selects_only_schema_columns(
+    client: AsyncTestClient, sqlalchemy_config: SQLAlchemyAsyncConfig
+) -> None:
+    statements: list[str] = []
+    engine = sqlalchemy_config.get_engine().sync_engine
+
+    def _capture(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        response = await client.get("/api/v1/pages/")
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert {page["title"] for page in response.json()} == {"Page 0", "Page 1", "Page 2"}
+    assert "creator_id" not in statements[0]
+    assert "is_published" not in statements[0].split("FROM")[0]
@@ -0,0 +1,194 @@
+"""Tests for the per-process release file index."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from pydotorg.core import release_file_index as module
+from pydotorg.core.release_file_index import ReleaseFileIndex
+from pydotorg.domains.downloads.models import Release, ReleaseFile
+
+
+def _release_file(*, committed: bool = False) -> ReleaseFile:
+    release_file = ReleaseFile(id=uuid4())
+    if committed:
+        set_committed_value(release_file, "release_id", uuid4())
+    else:
+        release_file.release_id = uuid4()
+    return release_file
+
+
+def _session(*, new: list | None = None, dirty: list | None = None, deleted: list | None = None) -> MagicMock:
+    session = MagicMock(spec=Session)
+    session.info = {}
+    session.new, session.dirty, session.deleted = new or [], dirty or [], deleted or []
+    return session
+
+
+class TestReleaseFileIndex:
+    async def test_known_file_skips_database(self) -> None:
+        index = ReleaseFileIndex()
+        file_id, release_id = uuid4(), uuid4()
+        index.replace([(file_id, release_id)])
+        session = AsyncMock()
+
+        assert await index.resolve(file_id, session) == release_id
+        session.scalar.assert_not_called()
+        assert index.stats() == {"size": 1, "hits": 1, "misses": 0, "rejections": 0}
+
+    async def test_loaded_index_rejects_unknown_file_without_database(self) -> None:
+        index = ReleaseFileIndex()
+        index.replace([(uuid4(), uuid4())])
+        session = AsyncMock()
+
+        for _ in range(3):
+            assert await index.resolve(uuid4(), session) is None
+        session.scalar.assert_not_called()
+        assert index.stats() == {"size": 1, "hits": 0, "misses": 0, "rejections": 3}
+
+    async def test_miss_before_load_falls_back_to_database_and_is_remembered(self) -> None:
+        index = ReleaseFileIndex()
+        file_id, release_id = uuid4(), uuid4()
+        session = AsyncMock()
+        session.scalar.return_value = release_id
+
+        assert await index.resolve(file_id, session) == release_id
+        assert await index.resolve(file_id, session) == release_id
+        session.scalar.assert_awaited_once()
+
+    async def test_unknown_file_is_not_remembered(self) -> None:
+        index = ReleaseFileIndex()
+        session = AsyncMock()
+        session.scalar.return_value = None
+
+        assert await index.resolve(uuid4(), session) is None
+        assert len(index) == 0
+
+    async def test_change_during_fallback_query_is_not_overwritten(self) -> None:
+        index = ReleaseFileIndex()
+        file_id = uuid4()
+        session = AsyncMock()
+
+        async def deleted_meanwhile(_statement: object) -> object:
+            index.update({file_id: None})
+            return uuid4()
+
+        session.scalar.side_effect = deleted_meanwhile
+
+        await index.resolve(file_id, session)
+        assert index.get(file_id) is None
+
+    def test_update_and_clear(self) -> None:
+        index = ReleaseFileIndex()
+        kept, moved, deleted = uuid4(), uuid4(), uuid4()
+        new_release = uuid4()
+        index.replace([(kept, uuid4()), (moved, uuid4()), (deleted, uuid4())])
+
+        index.update({moved: new_release, deleted: None})
+        assert index.get(moved) == new_release
+        assert index.get(deleted) is None
+        assert len(index) == 2
+
+        index.clear()
+        assert len(index) == 0
+        assert index.loaded is False
+
+
+class TestReleaseFileChangeEvents:
+    @pytest.fixture
+    def index(self) -> ReleaseFileIndex:
+        index = ReleaseFileIndex()
+        with patch.object(module, "release_file_index", index):
+            yield index
+
+    def test_new_moved_and_deleted_files_update_index(self, index: ReleaseFileIndex) -> None:
+        added, moved, removed, untouched = (
+            _release_file(),
+            _release_file(),
+            _release_file(committed=True),
+            _release_file(committed=True),
+        )
+        index.replace([(removed.id, removed.release_id), (untouched.id, untouched.release_id)])
+        session = _session(new=[added], dirty=[moved, untouched], deleted=[removed])
+
+        with patch.object(module, "run_in_background") as mock_run:
+            module.release_file_changes.flush(session)
+            module.release_file_changes.commit(session)
+
+        changes = {added.id: added.release_id, moved.id: moved.release_id, removed.id: None}
+        mock_run.assert_called_once_with(module.publish_release_file_changes, changes)
+        assert index.get(added.id) == added.release_id
+        assert index.get(removed.id) is None
+        assert index.get(untouched.id) == untouched.release_id
+
+    def test_deleting_a_release_reloads_everywhere(self, index: ReleaseFileIndex) -> None:
+        index.replace([(uuid4(), uuid4())])
+        session = _session(new=[_release_file()], deleted=[Release(id=uuid4())])
+
+        with patch.object(module, "run_in_background") as mock_run:
+            module.release_file_changes.flush(session)
+            module.release_file_changes.commit(session)
+
+        mock_run.assert_called_once_with(module.publish_release_file_changes, None)
+        assert index.loaded is False
+        assert len(index) == 0
+
+    def test_unrelated_commit_is_ignored(self, index: ReleaseFileIndex) -> None:
+        session = _session(new=[object()], dirty=[_release_file(committed=True)])
+
+        with patch.object(module, "run_in_background") as mock_run:
+            module.release_file_changes.flush(session)
+            module.release_file_changes.commit(session)
+
+        mock_run.assert_not_called()
+
+    def test_rollback_discards_changes(self, index: ReleaseFileIndex) -> None:
+        session = _session(new=[_release_file()])
+
+        module.release_file_changes.flush(session)
+        module.release_file_changes.rollback(session)
+
+        assert module._SESSION_INFO_KEY not in session.info
+
+
+class TestReleaseFileChangeListener:
+    async def test_applies_published_changes(self) -> None:
+        redis = FakeAsyncRedis()
+        index = ReleaseFileIndex()
+        file_id, release_id = uuid4(), uuid4()
+        stale_id = uuid4()
+
+        async def load(_app: object, target: ReleaseFileIndex) -> None:
+            target.replace([(stale_id, uuid4())])
+
+        with (
+            patch("pydotorg.core.changes.get_pubsub", lambda: redis.pubsub(ignore_subscribe_messages=True)),
+            patch.object(module, "get_redis", return_value=redis),
+            patch.object(module, "load_release_file_index", side_effect=load) as mock_load,
+        ):
+            listener = asyncio.create_task(module.listen_for_release_file_changes(MagicMock(), index))
+            for _ in range(50):
+                if index.loaded:
+                    break
+                await asyncio.sleep(0.01)
+
+            await module.publish_release_file_changes({file_id: release_id, stale_id: None})
+            for _ in range(50):
+                if index.get(file_id):
+                    break
+                await asyncio.sleep(0.01)
+
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
+
+        assert index.get(file_id) == release_id
+        assert index.get(stale_id) is None
+        mock_load.assert_awaited_once()
@@ -0,0 +1,210 @@
+"""Tests for the per-process downloads release tree."""
+
+from __future__ import annotations
+
+import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.orm import Session
+
+from pydotorg.core import release_tree as module
+from pydotorg.core.release_tree import ReleaseSummary, ReleaseTree, ReleaseTreeCache
+from pydotorg.domains.downloads.models import (
+    PythonVersion,
+    Release,
+    ReleaseStatus,
+    parse_major_version,
+    parse_minor_version,
+)
+from pydotorg.domains.downloads.services import ReleaseService
+
+
+def _summary(
+    name: str,
+    day: int,
+    *,
+    version: PythonVersion = PythonVersion.PYTHON3,
+    is_latest: bool = False,
+    show_on_download_page: bool = True,
+    status: ReleaseStatus = ReleaseStatus.BUGFIX,
+    pre_release: bool = False,
+    eol_date: datetime.date | None = None,
+) -> ReleaseSummary:
+    return ReleaseSummary(
+        id=uuid4(),
+        name=name,
+        slug=name.lower().replace(" ", "-"),
+        version=version,
+        status=status,
+        is_latest=is_latest,
+        pre_release=pre_release,
+        show_on_download_page=show_on_download_page,
+        release_date=datetime.date(2020, 1, 1) + datetime.timedelta(days=day),
+        eol_date=eol_date,
+        release_notes_url="",
+        major_version=parse_major_version(name),
+        minor_version=parse_minor_version(name),
+    )
+
+
+def _session(*, new: list | None = None, dirty: list | None = None, deleted: list | None = None) -> MagicMock:
+    session = MagicMock(spec=Session)
+    session.info = {}
+    session.new, session.dirty, session.deleted = new or [], dirty or [], deleted or []
+    return session
+
+
+class TestReleaseTree:
+    async def test_grouping_matches_release_service(self) -> None:
+        names = ["3.9.1", "Python 3.12.0", "3.12.1", "2.7.18", "3.10.0", "Legacy", "3.13.0a1", "10.0.0", "3.9.0"]
+        summaries = [_summary(name, day) for day, name in enumerate(names)]
+        newest_first = sorted(summaries, key=lambda s: s.release_date, reverse=True)
+        releases = [Release(name=s.name, release_date=s.release_date) for s in newest_first]
+        service = MagicMock()
+        service.repository.get_for_download_page = AsyncMock(return_value=releases)
+
+        expected = await ReleaseService.get_releases_grouped_by_minor_version(service)
+        tree = ReleaseTree.build(newest_first)
+
+        assert list(tree.grouped) == list(expected)
+        for major, minors in expected.items():
+            assert list(tree.grouped[major]) == list(minors)
+            for minor, group in minors.items():
+                assert [r.name for r in tree.grouped[major][minor]] == [r.name for r in group]
+
+    @pytest.mark.parametrize(
+        ("status", "pre_release", "eol_date"),
+        [
+            (ReleaseStatus.BUGFIX, False, None),
+            (ReleaseStatus.SECURITY, False, None),
+            (ReleaseStatus.BUGFIX, True, None),
+            (ReleaseStatus.PRERELEASE, False, None),
+            (ReleaseStatus.EOL, False, None),
+            (ReleaseStatus.SECURITY, False, datetime.date(2020, 1, 1)),
+        ],
+    )
+    def test_status_properties_match_release(
+        self, status: ReleaseStatus, pre_release: bool, eol_date: datetime.date | None
+    ) -> None:
+        summary = _summary("3.12.1", 1, status=status, pre_release=pre_release, eol_date=eol_date)
+        release = Release(name="3.12.1", status=status, pre_release=pre_release, eol_date=eol_date)
+
+        assert (summary.is_eol, summary.is_prerelease, summary.status_label) == (
+            release.is_eol,
+            release.is_prerelease,
+            release.status_label,
+        )
+        assert (summary.major_version, summary.minor_version) == (release.major_version, release.minor_version)
+
+    def test_latest_per_version_ignores_download_page_flag(self) -> None:
+        hidden_latest = _summary("3.13.1", 3, is_latest=True, show_on_download_page=False)
+        older_latest = _summary("3.12.5", 2, is_latest=True)
+        py2 = _summary("2.7.18", 1, version=PythonVersion.PYTHON2, is_latest=True)
+
+        tree = ReleaseTree.build([hidden_latest, older_latest, py2])
+
+        assert tree.latest[PythonVersion.PYTHON3] is hidden_latest
+        assert tree.latest[PythonVersion.PYTHON2] is py2
+        assert "3.13" not in tree.grouped["3"]
+
+    def test_summary_status_properties(self) -> None:
+        summary = _summary("3.8.20", 0)
+        assert summary.status_label == "Active"
+        past = datetime.date(2000, 1, 1)
+        eol = ReleaseSummary(**{**{f: getattr(summary, f) for f in summary.__slots__}, "eol_date": past})
+        assert eol.is_eol is True
+        assert eol.status_label == "End of Life"
+
+
+class TestReleaseTreeCache:
+    @pytest.fixture
+    def redis(self) -> FakeAsyncRedis:
+        redis = FakeAsyncRedis()
+        with patch.object(module, "get_redis", return_value=redis):
+            yield redis
+
+    @pytest.fixture
+    def load(self) -> MagicMock:
+        async def build(_app: object, *, version: int | None) -> ReleaseTree:
+            return ReleaseTree.build([], version=version)
+
+        with patch.object(module, "_load_tree", side_effect=build) as mock_load:
+            yield mock_load
+
+    async def test_reuses_tree_until_version_changes(self, redis: FakeAsyncRedis, load: MagicMock) -> None:
+        cache = ReleaseTreeCache(ttl=3600, version_check_interval=0)
+
+        first = await cache.get(MagicMock())
+        assert await cache.get(MagicMock()) is first
+        assert load.await_count == 1
+
+        await module.bump_release_version()
+        second = await cache.get(MagicMock())
+        assert second is not first
+        assert second.version == 1
+        assert load.await_count == 2
+
+    async def test_version_is_not_read_within_check_interval(self, redis: FakeAsyncRedis, load: MagicMock) -> None:
+        cache = ReleaseTreeCache(ttl=3600, version_check_interval=60)
+
+        first = await cache.get(MagicMock())
+        await module.bump_release_version()
+        assert await cache.get(MagicMock()) is first
+
+        cache.invalidate()
+        assert await cache.get(MagicMock()) is not first
+
+    async def test_reloads_after_ttl_without_redis(self, load: MagicMock) -> None:
+        cache = ReleaseTreeCache(ttl=0, version_check_interval=0)
+        with patch.object(module, "_read_version", return_value=None):
+            await cache.get(MagicMock())
+            await cache.get(MagicMock())
+        assert load.await_count == 2
+
+    async def test_keeps_previous_tree_when_reload_fails(self, redis: FakeAsyncRedis, load: MagicMock) -> None:
+        cache = ReleaseTreeCache(ttl=3600, version_check_interval=0)
+        first = await cache.get(MagicMock())
+
+        await module.bump_release_version()
+        load.side_effect = RuntimeError("database down")
+        assert await cache.get(MagicMock()) is first
+
+
+class TestReleaseChangeEvents:
+    @pytest.fixture
+    def cache(self) -> ReleaseTreeCache:
+        cache = ReleaseTreeCache()
+        cache._tree = ReleaseTree.build([])
+        with patch.object(module, "release_tree", cache):
+            yield cache
+
+    def test_release_write_invalidates_and_bumps(self, cache: ReleaseTreeCache) -> None:
+        session = _session(dirty=[Release(id=uuid4())])
+
+        with patch.object(module, "run_in_background") as mock_run:
+            module.release_changes.flush(session)
+            module.release_changes.commit(session)
+
+        mock_run.assert_called_once_with(module.bump_release_version)
+        assert cache._tree is None
+
+    def test_unrelated_commit_is_ignored(self, cache: ReleaseTreeCache) -> None:
+        session = _session(new=[object()])
+
+        with patch.object(module, "run_in_background") as mock_run:
+            module.release_changes.flush(session)
+            module.release_changes.commit(session)
+
+        mock_run.assert_not_called()
+        assert cache._tree is not None
+
+    def test_rollback_discards_changes(self, cache: ReleaseTreeCache) -> None:
+        session = _session(deleted=[Release(id=uuid4())])
+
+        module.release_changes.flush(session)
+        module.release_changes.rollback(session)
+
+        assert module._SESSION_INFO_KEY not in session.info
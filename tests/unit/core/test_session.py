@@ -0,0 +1,84 @@
+"""Unit tests for the Redis-backed session service."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from pydotorg.config import settings
+from pydotorg.core.auth.session import LOOKUP_AND_REFRESH_SCRIPT, SessionService
+
+
+@pytest.fixture
+def redis() -> MagicMock:
+    client = MagicMock()
+    client.set = AsyncMock(return_value=True)
+    client.pexpire = AsyncMock(return_value=True)
+    client.delete = AsyncMock(return_value=1)
+    client.exists = AsyncMock(return_value=1)
+    client.register_script.return_value = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def service(redis: MagicMock) -> SessionService:
+    return SessionService(redis=redis, refresh_after_fraction=0.25)
+
+
+class TestSessionService:
+    def test_refresh_threshold(self, service: SessionService) -> None:
+        expire_ms = settings.session_expire_minutes * 60 * 1000
+        assert service.expire_ms == expire_ms
+        assert service.refresh_below_ms == int(expire_ms * 0.75)
+
+    async def test_create_session_sets_expiry(self, service: SessionService, redis: MagicMock) -> None:
+        user_id = uuid4()
+        session_id = await service.create_session(user_id)
+
+        redis.set.assert_awaited_once_with(f"session:{session_id}", str(user_id), px=service.expire_ms)
+
+    async def test_lookup_and_refresh_in_one_script_call(self, service: SessionService, redis: MagicMock) -> None:
+        user_id = uuid4()
+        script = redis.register_script.return_value
+        script.return_value = str(user_id).encode()
+
+        assert await service.get_user_id_from_session("abc") == user_id
+
+        redis.register_script.assert_called_once_with(LOOKUP_AND_REFRESH_SCRIPT)
+        script.assert_awaited_once_with(
+            keys=["session:abc"],
+            args=["1", service.refresh_below_ms, service.expire_ms],
+        )
+        redis.pexpire.assert_not_awaited()
+
+    async def test_lookup_without_refresh(self, service: SessionService, redis: MagicMock) -> None:
+        script = redis.register_script.return_value
+        script.return_value = None
+
+        assert await service.get_user_id_from_session("abc", refresh=False) is None
+        assert script.await_args.kwargs["args"][0] == "0"
+
+    async def test_script_registered_once(self, service: SessionService, redis: MagicMock) -> None:
+        redis.register_script.return_value.return_value = None
+
+        await service.get_user_id_from_session("a")
+        await service.get_user_id_from_session("b")
+
+        redis.register_script.assert_called_once()
+
+    async def test_malformed_value_is_invalid(self, service: SessionService, redis: MagicMock) -> None:
+        redis.register_script.return_value.return_value = b"not-a-uuid"
+
+        assert await service.get_user_id_from_session("abc") is None
+
+    async def test_refresh_destroy_validate(self, service: SessionService, redis: MagicMock) -> None:
+        assert await service.refresh_session("abc") is True
+        redis.pexpire.assert_awaited_once_with("session:abc", service.expire_ms)
+
+        assert await service.destroy_session("abc") is True
+        redis.delete.assert_awaited_once_with("session:abc")
+
+        assert await service.validate_session("abc") is True
+        redis.exists.assert_awaited_once_with("session:abc")
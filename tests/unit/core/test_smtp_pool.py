@@ -0,0 +1,129 @@
+"""Tests for the pooled SMTP transport."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from email.message import EmailMessage
+from typing import TYPE_CHECKING, Any
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+
+from pydotorg.core.email.transport import SMTPPool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _Sink:
+    """aiosmtpd handler that records delivered messages and can reject recipients."""
+
+    def __init__(self) -> None:
+        self.messages: list[bytes] = []
+        self.rejected: set[str] = set()
+
+    async def handle_RCPT(self, server: Any, session: Any, envelope: Any, address: str, rcpt_options: list) -> str:
+        if address in self.rejected:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        self.messages.append(envelope.content)
+        return "250 Message accepted for delivery"
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def sink() -> Iterator[tuple[_Sink, int]]:
+    handler = _Sink()
+    port = _free_port()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def _pool(port: int, **overrides: Any) -> SMTPPool:
+    options = {"hostname": "127.0.0.1", "port": port, "username": "", "password": "", "start_tls": False, "size": 2}
+    return SMTPPool(**(options | overrides))
+
+
+def _message(to: str = "user@example.com") -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "noreply@python.org"
+    message["To"] = to
+    message["Subject"] = "Hello"
+    message.set_content("Hello from python.org")
+    return message
+
+
+async def test_sequential_sends_reuse_one_connection(sink: tuple[_Sink, int]) -> None:
+    handler, port = sink
+    async with _pool(port) as pool:
+        for _ in range(5):
+            await pool.send(_message())
+        stats = pool.stats()
+
+    assert len(handler.messages) == 5
+    assert stats == {"connections_opened": 1, "messages_sent": 5, "idle": 1}
+
+
+async def test_concurrent_sends_are_bounded_by_pool_size(sink: tuple[_Sink, int]) -> None:
+    handler, port = sink
+    async with _pool(port, size=2) as pool:
+        await asyncio.gather(*(pool.send(_message(f"user{i}@example.com")) for i in range(10)))
+
+    assert len(handler.messages) == 10
+    assert pool.connections_opened == 2
+    assert pool.stats()["idle"] == 0
+
+
+async def test_connection_is_replaced_after_message_limit(sink: tuple[_Sink, int]) -> None:
+    handler, port = sink
+    async with _pool(port, max_messages_per_connection=2) as pool:
+        for _ in range(5):
+            await pool.send(_message())
+
+    assert len(handler.messages) == 5
+    assert pool.connections_opened == 3
+
+
+async def test_idle_connection_is_replaced_after_idle_timeout(sink: tuple[_Sink, int]) -> None:
+    _, port = sink
+    async with _pool(port, idle_timeout=0.01) as pool:
+        await pool.send(_message())
+        await asyncio.sleep(0.05)
+        await pool.send(_message())
+
+    assert pool.connections_opened == 2
+
+
+async def test_rejected_recipient_raises_and_pool_keeps_working(sink: tuple[_Sink, int]) -> None:
+    handler, port = sink
+    handler.rejected.add("nobody@example.com")
+    async with _pool(port) as pool:
+        with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+            await pool.send(_message("nobody@example.com"))
+        await pool.send(_message())
+
+    assert len(handler.messages) == 1
+    assert pool.messages_sent == 1
+
+
+async def test_reconnects_when_server_dropped_pooled_connection(sink: tuple[_Sink, int]) -> None:
+    handler, port = sink
+    async with _pool(port) as pool:
+        await pool.send(_message())
+        pool._idle[0].client.transport.close()
+        await pool.send(_message())
+
+    assert len(handler.messages) == 2
+    assert pool.connections_opened == 2
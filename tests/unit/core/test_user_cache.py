@@ -0,0 +1,224 @@
+"""Unit tests for the per-process authenticated user cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect
+
+from pydotorg.core.auth.user_cache import (
+    INVALIDATE_ALL,
+    UserCache,
+    _handle_invalidation_message,
+    _restore_user,
+    changed_users,
+    publish_user_invalidation,
+)
+from pydotorg.domains.users.models import EmailPrivacy, MembershipType, SearchVisibility, User
+
+
+def _user_values(**overrides) -> dict:
+    now = datetime.now(tz=UTC)
+    values = {
+        "id": uuid4(),
+        "username": "cached",
+        "email": "cached@example.com",
+        "password_hash": None,
+        "first_name": "Cached",
+        "last_name": "User",
+        "is_active": True,
+        "is_staff": False,
+        "is_superuser": False,
+        "email_verified": True,
+        "oauth_provider": None,
+        "oauth_id": None,
+        "date_joined": now,
+        "last_login": None,
+        "bio": "",
+        "search_visibility": SearchVisibility.PUBLIC,
+        "email_privacy": EmailPrivacy.PRIVATE,
+        "public_profile": True,
+        "_sentinel": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    values.update(overrides)
+    return values
+
+
+def _membership_values(user_id) -> dict:
+    now = datetime.now(tz=UTC)
+    return {
+        "id": uuid4(),
+        "user_id": user_id,
+        "membership_type": MembershipType.FELLOW,
+        "legal_name": "",
+        "preferred_name": "",
+        "email_address": "",
+        "city": "",
+        "region": "",
+        "country": "",
+        "postal_code": "",
+        "psf_code_of_conduct": True,
+        "psf_announcements": False,
+        "votes": True,
+        "last_vote_affirmation": None,
+        "_sentinel": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+@pytest.fixture
+def loaded_user() -> User:
+    """A detached user shaped like a query result (columns + membership loaded)."""
+    values = _user_values()
+    return _restore_user(values, _membership_values(values["id"]))
+
+
+class TestUserCache:
+    def test_miss_returns_none(self) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        assert cache.get(uuid4()) is None
+        assert cache.misses == 1
+
+    def test_hit_returns_detached_copy(self, loaded_user: User) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        cache.set(loaded_user)
+
+        cached = cache.get(loaded_user.id)
+
+        assert cached is not None
+        assert cached is not loaded_user
+        assert cached.id == loaded_user.id
+        assert cached.username == loaded_user.username
+        assert cached.membership is not None
+        assert cached.membership.membership_type == MembershipType.FELLOW
+        assert cached.sponsorships == []
+        assert inspect(cached).detached
+        assert cache.hits == 1
+
+    def test_mutating_copy_does_not_change_cache(self, loaded_user: User) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        cache.set(loaded_user)
+
+        first = cache.get(loaded_user.id)
+        first.first_name = "Changed"
+
+        assert cache.get(loaded_user.id).first_name == "Cached"
+
+    def test_user_without_membership(self) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        user = _restore_user(_user_values(), None)
+        cache.set(user)
+
+        cached = cache.get(user.id)
+        assert cached is not None
+        assert cached.membership is None
+        assert cached.has_membership is False
+
+    def test_expired_entry_is_dropped(self, loaded_user: User) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        with patch("pydotorg.core.auth.user_cache.time.monotonic", return_value=1000.0):
+            cache.set(loaded_user)
+        with patch("pydotorg.core.auth.user_cache.time.monotonic", return_value=1061.0):
+            assert cache.get(loaded_user.id) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        cache = UserCache(maxsize=2, ttl=60)
+        users = [_restore_user(_user_values(), None) for _ in range(3)]
+        cache.set(users[0])
+        cache.set(users[1])
+        cache.get(users[0].id)
+        cache.set(users[2])
+
+        assert cache.get(users[1].id) is None
+        assert cache.get(users[0].id) is not None
+        assert cache.get(users[2].id) is not None
+
+    def test_inactive_user_not_cached(self) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        user = _restore_user(_user_values(is_active=False), None)
+        cache.set(user)
+        assert len(cache) == 0
+
+    def test_disabled_with_zero_ttl(self, loaded_user: User) -> None:
+        cache = UserCache(maxsize=10, ttl=0)
+        cache.set(loaded_user)
+        assert len(cache) == 0
+
+    def test_partially_loaded_user_not_cached(self) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        cache.set(User(id=uuid4(), username="partial", email="partial@example.com", is_active=True))
+        assert len(cache) == 0
+
+    def test_invalidate_and_clear(self, loaded_user: User) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        cache.set(loaded_user)
+        cache.invalidate([loaded_user.id])
+        assert cache.get(loaded_user.id) is None
+
+        cache.set(loaded_user)
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestInvalidationMessages:
+    def test_message_invalidates_user(self, loaded_user: User) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        cache.set(loaded_user)
+        _handle_invalidation_message(cache, str(loaded_user.id))
+        assert len(cache) == 0
+
+    def test_wildcard_clears_cache(self, loaded_user: User) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        cache.set(loaded_user)
+        _handle_invalidation_message(cache, INVALIDATE_ALL)
+        assert len(cache) == 0
+
+    def test_malformed_message_is_rejected(self, loaded_user: User) -> None:
+        cache = UserCache(maxsize=10, ttl=60)
+        cache.set(loaded_user)
+        with pytest.raises(ValueError, match="badly formed"):
+            _handle_invalidation_message(cache, "not-a-uuid")
+        assert len(cache) == 1
+
+
+class TestSessionEvents:
+    def test_commit_invalidates_changed_users(self, loaded_user: User) -> None:
+        membership = loaded_user.membership
+        session = MagicMock()
+        session.info = {}
+        session.dirty = [loaded_user]
+        session.deleted = []
+        session.new = [membership]
+
+        changed_users.flush(session)
+
+        with (
+            patch("pydotorg.core.auth.user_cache.user_cache") as mock_cache,
+            patch("pydotorg.core.auth.user_cache.run_in_background") as mock_run,
+        ):
+            changed_users.commit(session)
+
+        mock_cache.invalidate.assert_called_once_with({loaded_user.id})
+        mock_run.assert_called_once_with(publish_user_invalidation, {loaded_user.id})
+        assert session.info == {}
+
+    def test_commit_without_user_changes_is_noop(self) -> None:
+        session = MagicMock()
+        session.info = {}
+        session.dirty = [object()]
+        session.deleted = []
+        session.new = []
+
+        changed_users.flush(session)
+
+        with patch("pydotorg.core.auth.user_cache.run_in_background") as mock_run:
+            changed_users.commit(session)
+
+        mock_run.assert_not_called()
@@ -0,0 +1,134 @@
+"""Tests for concurrent, conditional feed fetching and storing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from pydotorg.core.database.base import AuditBase
+from pydotorg.domains.blogs.fetcher import FeedFetcher, FetchedFeed, parse_feed
+from pydotorg.domains.blogs.models import BlogEntry, Feed
+from pydotorg.domains.blogs.services import FeedService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Python Insider</title>
+<item><guid>post-1</guid><title>Python 3.14 released</title><link>https://blog.python.org/1</link>
+<pubDate>Tue, 07 Oct 2025 12:00:00 GMT</pubDate><description>Summary</description></item>
+<item><title>No link, skipped</title></item>
+</channel></rss>"""
+
+
+def _feed(url: str = "https://blog.python.org/feed", **kwargs: object) -> Feed:
+    return Feed(id=uuid4(), name="Python Insider", website_url="https://blog.python.org", feed_url=url, **kwargs)
+
+
+class TestParseFeed:
+    def test_extracts_entry_columns(self) -> None:
+        [entry] = parse_feed(RSS)
+
+        assert entry["guid"] == "post-1"
+        assert entry["url"] == "https://blog.python.org/1"
+        assert entry["summary"] == "Summary"
+        assert entry["pub_date"].isoformat() == "2025-10-07T12:00:00+00:00"
+
+
+class TestFeedFetcher:
+    async def test_stores_validators_and_parses_off_loop(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "If-None-Match" not in request.headers
+            return httpx.Response(200, content=RSS, headers={"ETag": '"v1"', "Last-Modified": "Tue, 07 Oct 2025"})
+
+        feed = _feed()
+        with patch("pydotorg.domains.blogs.fetcher.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            async with FeedFetcher(transport=httpx.MockTransport(handler)) as fetcher:
+                fetched = await fetcher.fetch(feed)
+
+        to_thread.assert_called_once()
+        assert fetched.feed_id == feed.id
+        assert fetched.etag == '"v1"'
+        assert fetched.last_modified == "Tue, 07 Oct 2025"
+        assert [entry["guid"] for entry in fetched.entries] == ["post-1"]
+
+    async def test_not_modified_skips_parsing(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["If-None-Match"] == '"v1"'
+            assert request.headers["If-Modified-Since"] == "Tue, 07 Oct 2025"
+            return httpx.Response(304)
+
+        feed = _feed(etag='"v1"', last_modified="Tue, 07 Oct 2025")
+        with patch("pydotorg.domains.blogs.fetcher.parse_feed") as parse:
+            async with FeedFetcher(transport=httpx.MockTransport(handler)) as fetcher:
+                fetched = await fetcher.fetch(feed)
+
+        parse.assert_not_called()
+        assert fetched.not_modified is True
+        assert fetched.etag == '"v1"'
+
+    async def test_error_status_raises(self) -> None:
+        async with FeedFetcher(transport=httpx.MockTransport(lambda _request: httpx.Response(503))) as fetcher:
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetcher.fetch(_feed())
+
+    async def test_limits_concurrency_per_host(self) -> None:
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(304)
+
+        feeds = [_feed(f"https://{host}/feed/{i}") for host in ("a.example", "b.example") for i in range(5)]
+        async with FeedFetcher(concurrency=3, per_host=2, transport=httpx.MockTransport(handler)) as fetcher:
+            await asyncio.gather(*(fetcher.fetch(feed) for feed in feeds))
+
+        assert peak == {"a.example": 2, "b.example": 2}
+
+
+@pytest.fixture
+async def session(tmp_path: Path) -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'feeds.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(AuditBase.metadata.create_all)
+    async with async_sessionmaker(engine)() as session:
+        yield session
+    await engine.dispose()
+
+
+async def test_store_feed_upserts_entries_and_validators(session: AsyncSession) -> None:
+    feed = _feed()
+    feed_id = feed.id
+    session.add(feed)
+    await session.commit()
+    service = FeedService(session=session)
+    entries = parse_feed(RSS)
+
+    with patch("pydotorg.domains.blogs.services.enqueue_task", AsyncMock(return_value="key")) as enqueue:
+        await service.store_feed(FetchedFeed(feed_id=feed_id, entries=entries, etag='"v1"'))
+        entries[0]["title"] = "Python 3.14.0 released"
+        stored = await service.store_feed(FetchedFeed(feed_id=feed_id, entries=entries, etag='"v2"'))
+        assert await service.store_feed(FetchedFeed(feed_id=feed_id, not_modified=True, etag='"v2"')) == []
+
+    assert len(stored) == 1
+    assert enqueue.await_count == 2
+    titles = (await session.scalars(select(BlogEntry.title))).all()
+    assert titles == ["Python 3.14.0 released"]
+    stored_feed = await session.get(Feed, feed_id)
+    assert stored_feed.etag == '"v2"'
+    assert stored_feed.last_fetched is not None
@@ -0,0 +1,49 @@
+"""Unit tests for downloads domain services."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from pydotorg.core import release_tree
+from pydotorg.domains.downloads.models import PythonVersion, Release
+from pydotorg.domains.downloads.repositories import ReleaseRepository
+from pydotorg.domains.downloads.services import ReleaseService
+
+
+class TestMarkAsLatest:
+    """Tests for ReleaseService.mark_as_latest."""
+
+    async def test_updates_in_two_statements_and_invalidates_caches(self) -> None:
+        """Test the latest flag is moved with set-based updates, then caches are invalidated."""
+        release_id = uuid4()
+        session = AsyncMock()
+        session.info = {}
+        repository = ReleaseRepository(session=session)
+        service = MagicMock(repository=repository)
+        service.get = AsyncMock(return_value=Release(id=release_id, is_latest=True))
+
+        with patch("pydotorg.domains.downloads.services.enqueue_task", new_callable=AsyncMock) as mock_enqueue:
+            release = await ReleaseService.mark_as_latest(service, release_id, PythonVersion.PYTHON3)
+
+        statements = [
+            str(call.args[0].compile(dialect=postgresql.dialect())) for call in session.execute.await_args_list
+        ]
+        assert len(statements) == 2
+        assert statements[0].startswith("UPDATE releases SET is_latest=")
+        assert "releases.is_latest IS true" in statements[0]
+        assert "releases.id = " in statements[1]
+        session.commit.assert_awaited_once()
+        assert session.info[release_tree._SESSION_INFO_KEY] == {release_id}
+        mock_enqueue.assert_awaited_once_with("invalidate_page_response_cache", tags=["path:/", "domain:/downloads"])
+        assert release.is_latest is True
+
+    def test_one_latest_release_per_version_is_enforced(self) -> None:
+        """Test the partial unique index is declared on the model."""
+        index = next(i for i in Release.__table__.indexes if i.name == "uq_releases_latest_per_version")
+
+        assert index.unique is True
+        assert [c.name for c in index.columns] == ["version"]
+        assert str(index.dialect_options["postgresql"]["where"]) == "is_latest"
@@ -0,0 +1 @@
+"""Mailing domain unit tests."""
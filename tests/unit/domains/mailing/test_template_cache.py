@@ -0,0 +1,107 @@
+"""Tests for the compiled email template cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from jinja2 import TemplateSyntaxError
+
+from pydotorg.domains.mailing.models import CompiledTemplateCache, EmailTemplate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def _template(**overrides: object) -> EmailTemplate:
+    fields = {
+        "id": uuid4(),
+        "updated_at": datetime(2026, 1, 1, tzinfo=UTC),
+        "internal_name": "welcome",
+        "display_name": "Welcome",
+        "subject": "Welcome, {{ name }}",
+        "content_text": "Hello {{ name }}",
+        "content_html": "<p>Hello {{ name }}</p>",
+    }
+    return EmailTemplate(**(fields | overrides))
+
+
+@pytest.fixture
+def cache() -> Iterator[CompiledTemplateCache]:
+    cache = CompiledTemplateCache(max_entries=8)
+    with patch("pydotorg.domains.mailing.models.email_template_cache", cache):
+        yield cache
+
+
+def test_rendering_many_recipients_compiles_each_field_once(cache: CompiledTemplateCache) -> None:
+    template = _template()
+
+    rendered = [template.render_content_html({"name": f"user{n}"}) for n in range(100)]
+
+    assert rendered[3] == "<p>Hello user3</p>"
+    assert cache.stats() == {"entries": 1, "hits": 99, "misses": 1}
+
+
+def test_saving_a_new_revision_recompiles(cache: CompiledTemplateCache) -> None:
+    template = _template()
+    assert template.render_subject({"name": "Guido"}) == "Welcome, Guido"
+
+    template.subject = "Hi {{ name }}"
+    template.updated_at += timedelta(minutes=1)
+
+    assert template.render_subject({"name": "Guido"}) == "Hi Guido"
+    assert cache.misses == 2
+
+
+def test_unsaved_edits_are_not_served_stale(cache: CompiledTemplateCache) -> None:
+    template = _template()
+    template.render_subject({"name": "Guido"})
+
+    template.subject = "Hi {{ name }}"
+
+    assert template.render_subject({"name": "Guido"}) == "Hi Guido"
+
+
+def test_templates_without_identity_are_not_cached(cache: CompiledTemplateCache) -> None:
+    template = _template(id=None)
+
+    template.render_subject({"name": "Guido"})
+    template.render_subject({"name": "Guido"})
+
+    assert (len(cache), cache.misses) == (0, 2)
+
+
+def test_least_recently_used_templates_are_evicted() -> None:
+    cache = CompiledTemplateCache(max_entries=2)
+    cache.get_template("a", key="a")
+    cache.get_template("b", key="b")
+    cache.get_template("a", key="a")
+    cache.get_template("c", key="c")
+
+    cache.get_template("a", key="a")
+    cache.get_template("b", key="b")
+
+    assert cache.stats() == {"entries": 2, "hits": 2, "misses": 4}
+
+
+def test_zero_size_disables_the_cache() -> None:
+    cache = CompiledTemplateCache(max_entries=0)
+    cache.get_template("a", key="a")
+    cache.get_template("a", key="a")
+
+    assert (len(cache), cache.hits) == (0, 0)
+
+
+def test_validation_reports_syntax_errors_and_compiles_through_the_cache(cache: CompiledTemplateCache) -> None:
+    template = _template(content_text="{% if %}")
+
+    errors = template.validate_templates()
+
+    assert len(errors) == 1
+    assert errors[0].startswith("content_text: Template syntax error")
+    with pytest.raises(TemplateSyntaxError):
+        template.render_content_text()
+    assert len(cache) == 2
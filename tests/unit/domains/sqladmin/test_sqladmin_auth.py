@@ -18,7 +18,7 @@ class TestAdminAuthBackend:
         """Create an AdminAuthBackend instance for testing."""
         with patch("pydotorg.domains.sqladmin.auth.SessionService"):
             backend = AdminAuthBackend(secret_key="test-secret-key-12345")
-            backend._litestar_session_service = MagicMock()
+            backend._litestar_session_service = AsyncMock()
             backend._litestar_session_service.get_user_id_from_session.return_value = None
             return backend
 
@@ -121,7 +121,10 @@ class TestAdminAuthBackend:
 
         with (
             patch.object(auth_backend, "_session_maker") as mock_session_maker,
-            patch("pydotorg.domains.sqladmin.auth.verify_password", return_value=False),
+            patch(
+                "pydotorg.domains.sqladmin.auth.password_service.verify_and_update",
+                AsyncMock(return_value=(False, None)),
+            ),
         ):
             mock_session = AsyncMock()
             mock_result = MagicMock()
@@ -144,7 +147,10 @@ class TestAdminAuthBackend:
 
         with (
             patch.object(auth_backend, "_session_maker") as mock_session_maker,
-            patch("pydotorg.domains.sqladmin.auth.verify_password", return_value=True),
+            patch(
+                "pydotorg.domains.sqladmin.auth.password_service.verify_and_update",
+                AsyncMock(return_value=(True, None)),
+            ),
         ):
             mock_session = AsyncMock()
             mock_result = MagicMock()
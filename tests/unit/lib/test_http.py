@@ -0,0 +1,57 @@
+"""Tests for the pooled, bounded HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from pydotorg.lib.http import BoundedHTTPClient
+
+
+def _counting_transport(peak: dict[str, int]) -> httpx.MockTransport:
+    in_flight: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        peak["total"] = max(peak.get("total", 0), sum(in_flight.values()))
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    return httpx.MockTransport(handler)
+
+
+async def test_limits_total_requests_in_flight() -> None:
+    peak: dict[str, int] = {}
+    urls = [f"https://{host}/{i}" for host in ("a.example", "b.example") for i in range(5)]
+
+    async with BoundedHTTPClient(concurrency=3, timeout=5.0, transport=_counting_transport(peak)) as client:
+        await asyncio.gather(*(client.get(url) for url in urls))
+
+    assert peak["total"] == 3
+
+
+async def test_per_host_limit_is_optional() -> None:
+    peak: dict[str, int] = {}
+    urls = [f"https://a.example/{i}" for i in range(5)]
+
+    async with BoundedHTTPClient(concurrency=4, timeout=5.0, per_host=1, transport=_counting_transport(peak)) as client:
+        await asyncio.gather(*(client.get(url) for url in urls))
+
+    assert peak["a.example"] == 1
+
+
+async def test_error_status_raises_but_not_modified_does_not() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(304 if request.url.path == "/cached" else 404)
+
+    async with BoundedHTTPClient(concurrency=1, timeout=5.0, transport=httpx.MockTransport(handler)) as client:
+        response = await client.get("https://a.example/cached")
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get("https://a.example/missing")
+
+    assert response.status_code == 304
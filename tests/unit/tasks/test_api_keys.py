@@ -0,0 +1,42 @@
+"""Tests for API key background tasks."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pydotorg.tasks.api_keys import cron_flush_api_key_usage, flush_api_key_usage
+
+
+class TestFlushAPIKeyUsage:
+    async def test_flushes_with_context_redis(self, mock_ctx: dict) -> None:
+        with patch("pydotorg.tasks.api_keys.flush_api_key_last_used", AsyncMock(return_value=3)) as mock_flush:
+            result = await flush_api_key_usage(mock_ctx)
+
+        assert result == {"count": 3}
+        session = mock_ctx["session_maker"].return_value.__aenter__.return_value
+        mock_flush.assert_awaited_once_with(mock_ctx["redis"], session)
+
+    async def test_falls_back_to_shared_redis(self, mock_ctx: dict) -> None:
+        del mock_ctx["redis"]
+        with (
+            patch("pydotorg.tasks.api_keys.get_redis") as mock_get_redis,
+            patch("pydotorg.tasks.api_keys.flush_api_key_last_used", AsyncMock(return_value=0)) as mock_flush,
+        ):
+            await flush_api_key_usage(mock_ctx)
+
+        assert mock_flush.await_args.args[0] is mock_get_redis.return_value
+
+    async def test_propagates_errors(self, mock_ctx: dict) -> None:
+        with (
+            patch("pydotorg.tasks.api_keys.flush_api_key_last_used", AsyncMock(side_effect=RuntimeError("boom"))),
+            pytest.raises(RuntimeError),
+        ):
+            await flush_api_key_usage(mock_ctx)
+
+    def test_cron_registered(self) -> None:
+        from pydotorg.tasks.worker import get_cron_jobs
+
+        assert cron_flush_api_key_usage in get_cron_jobs()
+        assert cron_flush_api_key_usage.cron == "* * * * *"
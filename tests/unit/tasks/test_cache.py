@@ -9,10 +9,12 @@ from uuid import uuid4
 
 import pytest
 
+from pydotorg.core.cache.store import TaggedRedisStore
 from pydotorg.tasks.cache import (
     CACHE_KEY_PREFIX,
     clear_cache,
     get_cache_stats,
+    invalidate_page_response_cache,
     warm_blogs_cache,
     warm_events_cache,
     warm_homepage_cache,
@@ -32,6 +34,7 @@ def mock_context() -> dict:
     redis_mock.get = AsyncMock(return_value=None)
     redis_mock.scan = AsyncMock(return_value=(0, []))
     redis_mock.delete = AsyncMock()
+    redis_mock.register_script = MagicMock()
     redis_mock.info = AsyncMock(
         return_value={
             "keyspace_hits": 1000,
@@ -287,3 +290,38 @@ async def test_warm_homepage_cache_handles_errors(mock_context: dict) -> None:
 
         assert result["errors"] == 1
         assert result["cached"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_page_response_cache_uses_tags(mock_context: dict) -> None:
+    """Test page invalidation goes through the tag index, not a key scan."""
+    page_id = str(uuid4())
+    with patch.object(TaggedRedisStore, "invalidate_tags", AsyncMock(return_value=3)) as mock_invalidate:
+        result = await invalidate_page_response_cache(mock_context, page_path="/about/", page_id=page_id)
+
+    assert result == {"cleared": 3, "path": "/about/"}
+    mock_invalidate.assert_awaited_once_with("path:/about", f"page-{page_id}")
+    mock_context["redis"].scan.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_page_response_cache_extra_tags(mock_context: dict) -> None:
+    """Test extra tags are invalidated without clearing every page."""
+    with (
+        patch.object(TaggedRedisStore, "invalidate_tags", AsyncMock(return_value=2)) as mock_invalidate,
+        patch.object(TaggedRedisStore, "invalidate_all", AsyncMock()) as mock_invalidate_all,
+    ):
+        result = await invalidate_page_response_cache(mock_context, tags=["path:/", "domain:/downloads"])
+
+    assert result == {"cleared": 2, "path": "all"}
+    mock_invalidate.assert_awaited_once_with("path:/", "domain:/downloads")
+    mock_invalidate_all.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_page_response_cache_reports_errors(mock_context: dict) -> None:
+    """Test invalidation failures are reported instead of raised."""
+    with patch.object(TaggedRedisStore, "invalidate_all", AsyncMock(side_effect=ConnectionError)):
+        result = await invalidate_page_response_cache(mock_context)
+
+    assert result == {"cleared": 0, "path": "all", "error": "failed"}
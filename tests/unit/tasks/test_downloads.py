@@ -2,23 +2,37 @@
 
 from __future__ import annotations
 
-from datetime import date, timedelta
+from datetime import UTC, date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
 
 import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.dialects import postgresql
 
 from pydotorg.tasks.downloads import (
     DownloadStatsService,
     aggregate_download_stats,
+    cleanup_download_stats,
     flush_download_stats,
     get_download_stats_service,
+    migrate_download_stats,
 )
 
 if TYPE_CHECKING:
     pass
 
 
+PREFIX = "pydotorg:downloads:stats"
+
+
+@pytest.fixture
+def fake_redis() -> FakeAsyncRedis:
+    """In-process Redis with Lua support."""
+    return FakeAsyncRedis(decode_responses=True)
+
+
 @pytest.fixture
 def mock_redis() -> AsyncMock:
     """Mock Redis client for testing."""
@@ -71,76 +85,95 @@ class TestDownloadStatsService:
         assert key == "test:downloads:stats:file:123:total"
 
     @pytest.mark.anyio
-    async def test_track_download(self, mock_redis: AsyncMock) -> None:
-        service = DownloadStatsService(mock_redis)
+    async def test_track_download(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
         await service.track_download("file-123")
+        today = datetime.now(UTC).date().isoformat()
 
-        assert mock_redis.incr.call_count == 4
-        calls = [call[0][0] for call in mock_redis.incr.call_args_list]
-        assert "pydotorg:downloads:stats:file:file-123:total" in calls
-        assert "pydotorg:downloads:stats:total:all" in calls
+        assert await fake_redis.zscore(f"{PREFIX}:files:total", "file-123") == 1
+        assert await fake_redis.hget(f"{PREFIX}:files:daily:{today}", "file-123") == "1"
+        assert await fake_redis.get(f"{PREFIX}:total:all") == "1"
+        assert await fake_redis.get(f"{PREFIX}:daily:{today}") == "1"
+        assert not await fake_redis.keys(f"{PREFIX}:releases:*")
 
     @pytest.mark.anyio
-    async def test_track_download_with_release(self, mock_redis: AsyncMock) -> None:
-        service = DownloadStatsService(mock_redis)
+    async def test_track_download_with_release(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
         await service.track_download("file-123", release_id="release-456")
+        await service.track_download("file-789", release_id="release-456")
 
-        assert mock_redis.incr.call_count == 6
-        calls = [call[0][0] for call in mock_redis.incr.call_args_list]
-        assert "pydotorg:downloads:stats:release:release-456:total" in calls
+        assert await service.get_release_downloads("release-456") == 2
+        assert await service.get_total_downloads() == 2
 
     @pytest.mark.anyio
-    async def test_track_download_redis_error(self, mock_redis: AsyncMock) -> None:
-        mock_redis.incr.side_effect = Exception("Redis connection error")
-        service = DownloadStatsService(mock_redis)
+    async def test_track_download_sets_ttl_on_daily_keys_only(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis, daily_ttl=3600)
+        await service.track_download("file-123", release_id="release-456")
+        today = datetime.now(UTC).date().isoformat()
+
+        assert 0 < await fake_redis.ttl(f"{PREFIX}:files:daily:{today}") <= 3600
+        assert 0 < await fake_redis.ttl(f"{PREFIX}:releases:daily:{today}") <= 3600
+        assert 0 < await fake_redis.ttl(f"{PREFIX}:daily:{today}") <= 3600
+        assert await fake_redis.ttl(f"{PREFIX}:files:total") == -1
+        assert await fake_redis.ttl(f"{PREFIX}:total:all") == -1
+
+    @pytest.mark.anyio
+    async def test_track_download_does_not_extend_ttl(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis, daily_ttl=3600)
+        daily_key = f"{PREFIX}:files:daily:{datetime.now(UTC).date().isoformat()}"
         await service.track_download("file-123")
+        await fake_redis.expire(daily_key, 60)
+        await service.track_download("file-123")
+
+        assert await fake_redis.ttl(daily_key) <= 60
 
     @pytest.mark.anyio
-    async def test_get_file_downloads(self, mock_redis: AsyncMock) -> None:
-        mock_redis.get.return_value = b"42"
-        service = DownloadStatsService(mock_redis)
-        count = await service.get_file_downloads("file-123")
-        assert count == 42
-        mock_redis.get.assert_called_once_with("pydotorg:downloads:stats:file:file-123:total")
+    async def test_track_downloads_batch(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
+        events = [("file-1", "release-1"), ("file-1", "release-1"), ("file-2", None), ("file-3", "release-1")]
+
+        assert await service.track_downloads(events) == 4
+        assert await service.get_file_downloads("file-1") == 2
+        assert await service.get_file_downloads_daily("file-2") == 1
+        assert await service.get_release_downloads("release-1") == 3
+        assert await service.get_total_downloads() == 4
+        assert await service.get_daily_downloads() == 4
 
     @pytest.mark.anyio
-    async def test_get_file_downloads_no_data(self, mock_redis: AsyncMock) -> None:
-        mock_redis.get.return_value = None
+    async def test_track_downloads_empty_batch(self, mock_redis: AsyncMock) -> None:
         service = DownloadStatsService(mock_redis)
-        count = await service.get_file_downloads("file-123")
-        assert count == 0
+        assert await service.track_downloads([]) == 0
+        mock_redis.register_script.assert_not_called()
 
     @pytest.mark.anyio
-    async def test_get_file_downloads_error(self, mock_redis: AsyncMock) -> None:
-        mock_redis.get.side_effect = Exception("Error")
+    async def test_track_download_redis_error(self, mock_redis: AsyncMock) -> None:
+        mock_redis.register_script = MagicMock(return_value=AsyncMock(side_effect=Exception("Redis connection error")))
         service = DownloadStatsService(mock_redis)
-        count = await service.get_file_downloads("file-123")
-        assert count == 0
+        await service.track_download("file-123")
+        assert await service.track_downloads([("file-123", None)]) == 0
 
     @pytest.mark.anyio
-    async def test_get_file_downloads_daily(self, mock_redis: AsyncMock) -> None:
-        mock_redis.get.return_value = b"10"
-        service = DownloadStatsService(mock_redis)
-        today = date.today()
-        count = await service.get_file_downloads_daily("file-123", today)
-        assert count == 10
-        expected_key = f"pydotorg:downloads:stats:file:file-123:daily:{today.isoformat()}"
-        mock_redis.get.assert_called_once_with(expected_key)
+    async def test_get_file_downloads_no_data(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
+        assert await service.get_file_downloads("file-123") == 0
+        assert await service.get_file_downloads_daily("file-123") == 0
+        assert await service.get_release_downloads("release-456") == 0
 
     @pytest.mark.anyio
-    async def test_get_file_downloads_daily_default_today(self, mock_redis: AsyncMock) -> None:
-        mock_redis.get.return_value = b"5"
+    async def test_get_file_downloads_error(self, mock_redis: AsyncMock) -> None:
+        mock_redis.zscore.side_effect = Exception("Error")
         service = DownloadStatsService(mock_redis)
-        count = await service.get_file_downloads_daily("file-123")
-        assert count == 5
+        count = await service.get_file_downloads("file-123")
+        assert count == 0
 
     @pytest.mark.anyio
-    async def test_get_release_downloads(self, mock_redis: AsyncMock) -> None:
-        mock_redis.get.return_value = b"100"
-        service = DownloadStatsService(mock_redis)
-        count = await service.get_release_downloads("release-456")
-        assert count == 100
-        mock_redis.get.assert_called_once_with("pydotorg:downloads:stats:release:release-456:total")
+    async def test_get_file_downloads_daily(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
+        today = datetime.now(UTC).date()
+        await fake_redis.hset(f"{PREFIX}:files:daily:{(today - timedelta(days=1)).isoformat()}", "file-123", 10)
+
+        assert await service.get_file_downloads_daily("file-123", today - timedelta(days=1)) == 10
+        assert await service.get_file_downloads_daily("file-123") == 0
 
     @pytest.mark.anyio
     async def test_get_total_downloads(self, mock_redis: AsyncMock) -> None:
@@ -161,59 +194,47 @@ class TestDownloadStatsService:
         mock_redis.get.assert_called_once_with(expected_key)
 
     @pytest.mark.anyio
-    async def test_get_top_downloads(self, mock_redis: AsyncMock) -> None:
-        mock_redis.scan_iter = MagicMock(
-            return_value=AsyncIteratorMock(
-                [
-                    b"pydotorg:downloads:stats:file:abc:total",
-                    b"pydotorg:downloads:stats:file:def:total",
-                ]
-            )
-        )
-        mock_redis.get = AsyncMock(side_effect=[b"100", b"50"])
+    async def test_get_top_downloads(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
+        await service.track_downloads([("abc", None)] * 3 + [("def", None)] * 2 + [("ghi", None)])
+
+        assert await service.get_top_downloads(limit=2) == [("abc", 3), ("def", 2)]
+        assert await service.get_top_downloads(limit=0) == []
 
+    @pytest.mark.anyio
+    async def test_get_top_downloads_is_one_command(self, mock_redis: AsyncMock) -> None:
+        mock_redis.zrevrange.return_value = [(b"abc", 100.0), (b"def", 50.0)]
         service = DownloadStatsService(mock_redis)
-        top = await service.get_top_downloads(limit=5)
 
-        assert len(top) == 2
-        assert top[0] == ("abc", 100)
-        assert top[1] == ("def", 50)
+        assert await service.get_top_downloads(limit=5) == [("abc", 100), ("def", 50)]
+        mock_redis.zrevrange.assert_awaited_once_with(f"{PREFIX}:files:total", 0, 4, withscores=True)
+        mock_redis.scan_iter.assert_not_called()
 
     @pytest.mark.anyio
-    async def test_get_top_downloads_empty(self, mock_redis: AsyncMock) -> None:
-        mock_redis.scan_iter = MagicMock(return_value=AsyncIteratorMock([]))
-        service = DownloadStatsService(mock_redis)
+    async def test_get_top_downloads_empty(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
         top = await service.get_top_downloads()
         assert top == []
 
     @pytest.mark.anyio
-    async def test_get_all_file_stats(self, mock_redis: AsyncMock) -> None:
-        mock_redis.scan_iter = MagicMock(
-            return_value=AsyncIteratorMock(
-                [
-                    b"pydotorg:downloads:stats:file:xyz:total",
-                ]
-            )
-        )
-        mock_redis.get = AsyncMock(return_value=b"75")
-
-        service = DownloadStatsService(mock_redis)
-        stats = await service.get_all_file_stats()
+    async def test_get_all_file_stats(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
+        await service.track_downloads([("xyz", "release-1"), ("xyz", None), ("abc", None)])
 
-        assert stats == {"xyz": 75}
+        assert await service.get_all_file_stats() == {"xyz": 2, "abc": 1}
+        assert await service.get_file_stats_daily() == {"xyz": 2, "abc": 1}
 
     @pytest.mark.anyio
-    async def test_get_stats_summary(self, mock_redis: AsyncMock) -> None:
-        mock_redis.get = AsyncMock(return_value=b"500")
-        mock_redis.scan_iter = MagicMock(return_value=AsyncIteratorMock([]))
+    async def test_get_stats_summary(self, fake_redis: FakeAsyncRedis) -> None:
+        service = DownloadStatsService(fake_redis)
+        await service.track_downloads([("abc", None)] * 5)
 
-        service = DownloadStatsService(mock_redis)
         summary = await service.get_stats_summary()
 
-        assert summary["total_downloads"] == 500
-        assert summary["downloads_today"] == 500
+        assert summary["total_downloads"] == 5
+        assert summary["downloads_today"] == 5
         assert "last_updated" in summary
-        assert summary["top_files"] == []
+        assert summary["top_files"] == [("abc", 5)]
 
     @pytest.mark.anyio
     async def test_cleanup_old_daily_keys(self, mock_redis: AsyncMock) -> None:
@@ -225,13 +246,13 @@ class TestDownloadStatsService:
                 ]
             )
         )
-        mock_redis.delete = AsyncMock(return_value=1)
+        mock_redis.unlink = AsyncMock(return_value=1)
 
         service = DownloadStatsService(mock_redis)
         deleted = await service.cleanup_old_daily_keys(days_to_keep=7)
 
         assert deleted == 1
-        mock_redis.delete.assert_called_once()
+        mock_redis.unlink.assert_awaited_once()
 
     @pytest.mark.anyio
     async def test_cleanup_old_daily_keys_keeps_recent(self, mock_redis: AsyncMock) -> None:
@@ -248,7 +269,176 @@ class TestDownloadStatsService:
         deleted = await service.cleanup_old_daily_keys(days_to_keep=7)
 
         assert deleted == 0
-        mock_redis.delete.assert_not_called()
+        mock_redis.unlink.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_cleanup_old_daily_keys_unlinks_in_one_call(self, fake_redis: FakeAsyncRedis) -> None:
+        today = datetime.now(UTC).date()
+        old, recent = (today - timedelta(days=10)).isoformat(), today.isoformat()
+        for key in (f"files:daily:{old}", f"releases:daily:{old}", f"daily:{old}", f"file:abc:daily:{old}"):
+            await fake_redis.set(f"{PREFIX}:{key}", 1)
+        await fake_redis.hset(f"{PREFIX}:files:daily:{recent}", "abc", 1)
+        await fake_redis.zadd(f"{PREFIX}:files:total", {"abc": 1})
+        service = DownloadStatsService(fake_redis)
+
+        assert await service.cleanup_old_daily_keys(days_to_keep=7) == 4
+        assert sorted(await fake_redis.keys(f"{PREFIX}:*")) == [
+            f"{PREFIX}:files:daily:{recent}",
+            f"{PREFIX}:files:total",
+        ]
+
+
+def _flush_session(existing_ids: set[UUID]) -> AsyncMock:
+    session = AsyncMock()
+    session.scalars = AsyncMock(return_value=existing_ids)
+    return session
+
+
+class TestFlushToDatabase:
+    """Tests for the incremental download statistics flush."""
+
+    @pytest.mark.anyio
+    async def test_upserts_pending_deltas(self, fake_redis: FakeAsyncRedis) -> None:
+        file_a, file_b = uuid4(), uuid4()
+        service = DownloadStatsService(fake_redis)
+        await service.track_downloads([(str(file_a), None), (str(file_a), None), (str(file_b), None)])
+        session = _flush_session({file_a, file_b})
+
+        assert await service.flush_to_database(session) == 2
+
+        stmt, rows = session.execute.await_args.args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (release_file_id, date) DO UPDATE" in sql
+        assert "download_count = (download_statistics.download_count + excluded.download_count)" in sql
+        today = datetime.now(UTC).date()
+        assert sorted((row["release_file_id"], row["date"], row["download_count"]) for row in rows) == sorted(
+            [(file_a, today, 2), (file_b, today, 1)]
+        )
+        session.commit.assert_awaited_once()
+        assert not await fake_redis.keys(f"{PREFIX}:files:pending*")
+
+    @pytest.mark.anyio
+    async def test_second_flush_only_writes_new_downloads(self, fake_redis: FakeAsyncRedis) -> None:
+        file_id = uuid4()
+        service = DownloadStatsService(fake_redis)
+        await service.track_download(str(file_id))
+        session = _flush_session({file_id})
+        await service.flush_to_database(session)
+        session.reset_mock()
+
+        assert await service.flush_to_database(session) == 0
+        session.execute.assert_not_called()
+
+        await service.track_download(str(file_id))
+        assert await service.flush_to_database(session) == 1
+        _, rows = session.execute.await_args.args
+        assert rows[0]["download_count"] == 1
+
+    @pytest.mark.anyio
+    async def test_failed_batch_is_retried_before_new_downloads(self, fake_redis: FakeAsyncRedis) -> None:
+        file_id = uuid4()
+        service = DownloadStatsService(fake_redis)
+        await service.track_download(str(file_id))
+        failing = _flush_session({file_id})
+        failing.execute.side_effect = Exception("database unavailable")
+
+        assert await service.flush_to_database(failing) == 0
+        failing.rollback.assert_awaited_once()
+
+        await service.track_download(str(file_id))
+        session = _flush_session({file_id})
+        assert await service.flush_to_database(session) == 1
+        _, rows = session.execute.await_args.args
+        assert rows[0]["download_count"] == 1
+        assert await service.flush_to_database(session) == 1
+        _, rows = session.execute.await_args.args
+        assert rows[0]["download_count"] == 1
+
+    @pytest.mark.anyio
+    async def test_drops_counts_for_deleted_files(self, fake_redis: FakeAsyncRedis) -> None:
+        kept, deleted = uuid4(), uuid4()
+        service = DownloadStatsService(fake_redis)
+        await service.track_downloads([(str(kept), None), (str(deleted), None), ("not-a-uuid", None)])
+        session = _flush_session({kept})
+
+        assert await service.flush_to_database(session) == 1
+        _, rows = session.execute.await_args.args
+        assert [row["release_file_id"] for row in rows] == [kept]
+
+    @pytest.mark.anyio
+    async def test_legacy_daily_counts_are_queued_for_flush(self, fake_redis: FakeAsyncRedis) -> None:
+        file_id = uuid4()
+        day = datetime.now(UTC).date() - timedelta(days=1)
+        await fake_redis.set(f"{PREFIX}:file:{file_id}:daily:{day.isoformat()}", 7)
+        service = DownloadStatsService(fake_redis)
+        await service.migrate_legacy_keys()
+        session = _flush_session({file_id})
+
+        assert await service.flush_to_database(session) == 1
+        _, rows = session.execute.await_args.args
+        assert rows == [{"release_file_id": file_id, "date": day, "download_count": 7}]
+
+
+class TestMigrateLegacyKeys:
+    """Tests for folding the per-id key layout into sorted sets and hashes."""
+
+    @pytest.mark.anyio
+    async def test_migrates_and_removes_legacy_keys(self, fake_redis: FakeAsyncRedis) -> None:
+        day = datetime.now(UTC).date().isoformat()
+        await fake_redis.set(f"{PREFIX}:file:abc:total", 40)
+        await fake_redis.set(f"{PREFIX}:file:abc:daily:{day}", 4)
+        await fake_redis.set(f"{PREFIX}:release:rel:total", 7)
+        await fake_redis.set(f"{PREFIX}:total:all", 40)
+        service = DownloadStatsService(fake_redis, daily_ttl=3600)
+        await service.track_download("abc", release_id="rel")
+
+        assert await service.migrate_legacy_keys() == 3
+        assert await service.get_file_downloads("abc") == 41
+        assert await service.get_file_downloads_daily("abc") == 5
+        assert await service.get_release_downloads("rel") == 8
+        assert await service.get_total_downloads() == 41
+        assert not await fake_redis.keys(f"{PREFIX}:file:*")
+        assert not await fake_redis.keys(f"{PREFIX}:release:*")
+
+    @pytest.mark.anyio
+    async def test_migration_is_idempotent(self, fake_redis: FakeAsyncRedis) -> None:
+        await fake_redis.set(f"{PREFIX}:file:abc:total", 3)
+        service = DownloadStatsService(fake_redis)
+
+        assert await service.migrate_legacy_keys() == 1
+        assert await service.migrate_legacy_keys() == 0
+        assert await service.get_file_downloads("abc") == 3
+
+    @pytest.mark.anyio
+    async def test_task_reports_migrated_keys(self, fake_redis: FakeAsyncRedis) -> None:
+        await fake_redis.set(f"{PREFIX}:file:abc:total", 3)
+
+        result = await migrate_download_stats({"redis": fake_redis})
+
+        assert result == {"success": True, "migrated_keys": 1}
+
+    @pytest.mark.anyio
+    async def test_task_without_redis(self) -> None:
+        result = await migrate_download_stats({})
+        assert result["success"] is False
+
+
+class TestCleanupDownloadStatsTask:
+    """Tests for the one-off cleanup_download_stats SAQ task."""
+
+    @pytest.mark.anyio
+    async def test_task_reports_cleaned_keys(self, fake_redis: FakeAsyncRedis) -> None:
+        old = (datetime.now(UTC).date() - timedelta(days=10)).isoformat()
+        await fake_redis.set(f"{PREFIX}:file:abc:daily:{old}", 1)
+
+        result = await cleanup_download_stats({"redis": fake_redis})
+
+        assert result == {"success": True, "cleaned_keys": 1}
+
+    @pytest.mark.anyio
+    async def test_task_without_redis(self) -> None:
+        result = await cleanup_download_stats({})
+        assert result["success"] is False
 
 
 class TestGetDownloadStatsService:
@@ -259,11 +449,12 @@ class TestGetDownloadStatsService:
         redis = AsyncMock()
         ctx: dict[str, Any] = {"redis": redis}
 
-        with patch("pydotorg.config.settings") as mock_settings:
+        with patch("pydotorg.tasks.downloads.settings") as mock_settings:
             mock_settings.redis_stats_namespace = "test_ns"
             service = await get_download_stats_service(ctx)
 
         assert service is not None
+        assert service.namespace == "test_ns"
         assert "download_stats_service" in ctx
 
     @pytest.mark.anyio
@@ -304,18 +495,20 @@ class TestFlushDownloadStatsTask:
         assert "Database session unavailable" in result["error"]
 
     @pytest.mark.anyio
-    async def test_successful_flush(self) -> None:
-        redis = AsyncMock()
-        redis.scan_iter = MagicMock(return_value=AsyncIteratorMock([]))
-        session = AsyncMock()
+    async def test_successful_flush(self, fake_redis: FakeAsyncRedis) -> None:
+        file_id = uuid4()
+        await DownloadStatsService(fake_redis).track_download(str(file_id))
+        session = _flush_session({file_id})
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__.return_value = session
 
-        ctx: dict[str, Any] = {"redis": redis, "db_session": session}
+        ctx: dict[str, Any] = {"redis": fake_redis, "session_maker": session_maker}
 
-        result = await flush_download_stats(ctx)
+        with patch.object(DownloadStatsService, "cleanup_old_daily_keys") as mock_cleanup:
+            result = await flush_download_stats(ctx)
 
-        assert result["success"] is True
-        assert "flushed" in result
-        assert "cleaned_keys" in result
+        assert result == {"success": True, "flushed": 1}
+        mock_cleanup.assert_not_called()
 
 
 class TestAggregateDownloadStatsTask:
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from pydotorg.config import settings
+from pydotorg.core.database.base import AuditBase
+from pydotorg.domains.mailing.models import CompiledTemplateCache, EmailTemplate
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.mark.unit
@@ -283,7 +293,7 @@ class TestSendBulkEmail:
         with patch("pydotorg.tasks.email.EmailService") as mock_email_class:
             mock_service = mock_email_class.return_value
             mock_service._create_message = MagicMock()
-            mock_service._send_email = MagicMock()
+            mock_service.send_message = AsyncMock()
 
             from pydotorg.tasks.email import send_bulk_email
 
@@ -295,6 +305,7 @@ class TestSendBulkEmail:
             assert result["total"] == len(recipients)
             assert result["sent"] == len(recipients)
             assert result["failed"] == 0
+            assert mock_service.send_message.await_count == len(recipients)
 
     async def test_continues_on_individual_failures(self) -> None:
         """Test that bulk send continues when individual emails fail."""
@@ -304,7 +315,7 @@ class TestSendBulkEmail:
         with patch("pydotorg.tasks.email.EmailService") as mock_email_class:
             mock_service = mock_email_class.return_value
             mock_service._create_message = MagicMock()
-            mock_service._send_email = MagicMock(side_effect=[None, Exception("SMTP error"), None])
+            mock_service.send_message = AsyncMock(side_effect=[None, Exception("SMTP error"), None])
 
             from pydotorg.tasks.email import send_bulk_email
 
@@ -329,6 +340,100 @@ class TestSendBulkEmail:
             assert result["total"] == 0
             assert result["sent"] == 0
 
+    async def test_splits_large_lists_into_chunk_jobs(self) -> None:
+        """Test that lists longer than the chunk size are enqueued as one job per chunk."""
+        recipients = [f"user{i}@example.com" for i in range(5)]
+
+        with (
+            patch.object(settings, "email_bulk_chunk_size", 2),
+            patch("pydotorg.tasks.email.enqueue_task", AsyncMock(side_effect=["job-0", None, "job-2"])) as enqueue,
+            patch("pydotorg.tasks.email.EmailService") as mock_email_class,
+        ):
+            from pydotorg.tasks.email import send_bulk_email
+
+            result = await send_bulk_email({}, recipients=recipients, subject="Test", template="Hi", context={})
+
+        mock_email_class.assert_not_called()
+        assert [call.kwargs["recipients"] for call in enqueue.await_args_list] == [
+            recipients[:2],
+            recipients[2:4],
+            recipients[4:],
+        ]
+        batch_ids = [call.kwargs["batch_id"] for call in enqueue.await_args_list]
+        assert batch_ids == [f"{result['batch']}:{index}" for index in range(3)]
+        assert result["success"] is False
+        assert (result["chunks"], result["job_keys"], result["failed"]) == (3, ["job-0", "job-2"], 2)
+
+    async def test_chunk_resumes_after_partial_failure(self) -> None:
+        """Test that a retried chunk skips recipients an earlier attempt sent to."""
+        ctx = {"redis": FakeAsyncRedis()}
+        recipients = ["user1@example.com", "user2@example.com", "user3@example.com"]
+
+        with patch("pydotorg.tasks.email.EmailService") as mock_email_class:
+            mock_service = mock_email_class.return_value
+            mock_service._create_message = MagicMock(side_effect=lambda to_email, *_: to_email)
+            mock_service.send_message = AsyncMock(side_effect=[None, Exception("SMTP error"), None])
+
+            from pydotorg.tasks.email import send_bulk_email
+
+            first = await send_bulk_email(
+                ctx, recipients=recipients, subject="Test", template="Hi", context={}, batch_id="batch:0"
+            )
+            mock_service.send_message = AsyncMock()
+            second = await send_bulk_email(
+                ctx, recipients=recipients, subject="Test", template="Hi", context={}, batch_id="batch:0"
+            )
+
+        assert (first["sent"], first["failed"]) == (2, 1)
+        assert (second["sent"], second["failed"], second["skipped"]) == (1, 0, 2)
+        mock_service.send_message.assert_awaited_once_with("user2@example.com")
+
+    async def test_renders_stored_template_once_per_job(self, tmp_path: Path) -> None:
+        """Test that a named EmailTemplate is rendered once from the shared compiled-template cache."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(AuditBase.metadata.create_all)
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as session:
+            session.add(
+                EmailTemplate(
+                    internal_name="newsletter",
+                    display_name="Newsletter",
+                    subject="News for {{ month }}",
+                    content_text="Read the {{ month }} news",
+                    content_html="<p>Read the {{ month }} news</p>",
+                )
+            )
+            await session.commit()
+        recipients = [f"user{i}@example.com" for i in range(20)]
+        cache = CompiledTemplateCache()
+
+        with (
+            patch("pydotorg.domains.mailing.models.email_template_cache", cache),
+            patch("pydotorg.tasks.email.EmailService") as mock_email_class,
+        ):
+            mock_service = mock_email_class.return_value
+            mock_service._create_message = MagicMock()
+            mock_service.send_message = AsyncMock()
+
+            from pydotorg.tasks.email import send_bulk_email
+
+            for _ in range(2):
+                result = await send_bulk_email(
+                    {"session_maker": session_maker},
+                    recipients=recipients,
+                    subject="",
+                    template="newsletter",
+                    context={"month": "May"},
+                )
+        await engine.dispose()
+
+        assert result["sent"] == len(recipients)
+        mock_service._create_message.assert_called_with(
+            recipients[-1], "News for May", "Read the May news", "<p>Read the May news</p>"
+        )
+        assert cache.stats() == {"entries": 3, "hits": 3, "misses": 3}
+
 
 @pytest.mark.unit
 class TestSendJobSubmittedEmail:
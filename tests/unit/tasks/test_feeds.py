@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
+from pydotorg.domains.blogs.fetcher import FetchedFeed
 from pydotorg.domains.blogs.models import Feed
 
 
@@ -17,7 +18,18 @@ def mock_feeds_ctx(mock_session_maker: AsyncMock) -> dict:
     return {"session_maker": mock_session_maker}
 
 
+@pytest.fixture
+def mock_fetcher() -> MagicMock:
+    """Patch FeedFetcher with a fetcher whose fetches succeed immediately."""
+    fetcher = MagicMock()
+    fetcher.fetch = AsyncMock(side_effect=lambda feed: FetchedFeed(feed_id=feed.id))
+    with patch("pydotorg.domains.blogs.fetcher.FeedFetcher") as mock_fetcher_class:
+        mock_fetcher_class.return_value.__aenter__.return_value = fetcher
+        yield fetcher
+
+
 @pytest.mark.unit
+@pytest.mark.usefixtures("mock_fetcher")
 class TestRefreshAllFeeds:
     """Test suite for refresh_all_feeds task."""
 
@@ -32,7 +44,7 @@ class TestRefreshAllFeeds:
         with patch("pydotorg.domains.blogs.services.FeedService") as mock_service_class:
             mock_service = mock_service_class.return_value
             mock_service.get_active_feeds = AsyncMock(return_value=sample_feeds)
-            mock_service.fetch_feed = AsyncMock(return_value=sample_blog_entries)
+            mock_service.store_feed = AsyncMock(return_value=sample_blog_entries)
 
             from pydotorg.tasks.feeds import refresh_all_feeds
 
@@ -42,7 +54,8 @@ class TestRefreshAllFeeds:
             assert result["error_count"] == 0
             assert result["total_feeds"] == len(sample_feeds)
             mock_service.get_active_feeds.assert_called_once_with(limit=1000)
-            assert mock_service.fetch_feed.call_count == len(sample_feeds)
+            stored_ids = [call.args[0].feed_id for call in mock_service.store_feed.call_args_list]
+            assert stored_ids == [feed.id for feed in sample_feeds]
 
     async def test_handles_empty_feed_list(self, mock_feeds_ctx: dict, mock_session_maker: AsyncMock) -> None:
         """Test handling when no active feeds exist."""
@@ -65,7 +78,7 @@ class TestRefreshAllFeeds:
         with patch("pydotorg.domains.blogs.services.FeedService") as mock_service_class:
             mock_service = mock_service_class.return_value
             mock_service.get_active_feeds = AsyncMock(return_value=sample_feeds)
-            mock_service.fetch_feed = AsyncMock(
+            mock_service.store_feed = AsyncMock(
                 side_effect=[
                     Exception("Parse error"),
                     [],
@@ -94,6 +107,7 @@ class TestRefreshAllFeeds:
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("mock_fetcher")
 class TestRefreshStaleFeeds:
     """Test suite for refresh_stale_feeds task."""
 
@@ -106,7 +120,7 @@ class TestRefreshStaleFeeds:
         with patch("pydotorg.domains.blogs.services.FeedService") as mock_service_class:
             mock_service = mock_service_class.return_value
             mock_service.get_feeds_needing_update = AsyncMock(return_value=stale_feeds)
-            mock_service.fetch_feed = AsyncMock(return_value=[])
+            mock_service.store_feed = AsyncMock(return_value=[])
 
             from pydotorg.tasks.feeds import refresh_stale_feeds
 
@@ -132,13 +146,18 @@ class TestRefreshStaleFeeds:
             assert result["max_age_hours"] == 1
 
     async def test_handles_partial_failure_stale(
-        self, mock_feeds_ctx: dict, mock_session_maker: AsyncMock, sample_feeds: list[Feed]
+        self,
+        mock_feeds_ctx: dict,
+        mock_session_maker: AsyncMock,
+        mock_fetcher: MagicMock,
+        sample_feeds: list[Feed],
     ) -> None:
-        """Test handling partial failures in stale feed refresh."""
+        """Test that a failed fetch does not stop the other feeds from being stored."""
+        mock_fetcher.fetch.side_effect = [Exception("Network error"), FetchedFeed(feed_id=sample_feeds[1].id)]
         with patch("pydotorg.domains.blogs.services.FeedService") as mock_service_class:
             mock_service = mock_service_class.return_value
             mock_service.get_feeds_needing_update = AsyncMock(return_value=sample_feeds[:2])
-            mock_service.fetch_feed = AsyncMock(side_effect=[Exception("Network error"), []])
+            mock_service.store_feed = AsyncMock(return_value=[])
 
             from pydotorg.tasks.feeds import refresh_stale_feeds
 
@@ -146,6 +165,7 @@ class TestRefreshStaleFeeds:
 
             assert result["success_count"] == 1
             assert result["error_count"] == 1
+            mock_service.store_feed.assert_awaited_once()
 
 
 @pytest.mark.unit
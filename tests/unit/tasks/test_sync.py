@@ -0,0 +1,188 @@
+"""Tests for external content sync tasks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from pydotorg.core.database.base import AuditBase
+from pydotorg.domains.events.models import Calendar, Event, EventLocation, EventOccurrence
+from pydotorg.domains.jobs.models import Job, JobCategory
+from pydotorg.domains.users.models import User
+from pydotorg.tasks.sync import (
+    JOBS_RSS_URL,
+    PYTHON_EVENTS_CALENDAR_URL,
+    sync_all_external_content,
+    sync_events_from_ics,
+    sync_http_client,
+    sync_jobs_from_rss,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+ICS = b"""BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+UID:pycon-2026-day-1
+SUMMARY:PyCon US 2026
+LOCATION:Long Beach, California
+DTSTART:20260514T090000Z
+DTEND:20260514T170000Z
+END:VEVENT
+BEGIN:VEVENT
+UID:pycon-2026-day-2
+SUMMARY:PyCon US 2026
+LOCATION:Long Beach, California
+DTSTART:20260515T090000Z
+DTEND:20260515T170000Z
+END:VEVENT
+BEGIN:VEVENT
+UID:sprint
+SUMMARY:CPython Core Sprint
+LOCATION:Online
+DTSTART;VALUE=DATE:20260601
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:No UID
+END:VEVENT
+END:VCALENDAR
+"""
+
+JOBS_RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Jobs</title>
+<item><title>Senior Python Developer, Acme</title><link>https://example.com/1</link>
+<description>{description}</description><category>python</category></item>
+<item><title>Data Engineer at Initech</title><link>https://example.com/2</link>
+<description>Pipelines</description></item>
+<item><title>   </title><link>https://example.com/3</link></item>
+</channel></rss>
+"""
+
+
+@pytest.fixture
+async def session_maker(tmp_path: Path) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sync.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(AuditBase.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        session.add(User(username="admin", email="admin@python.org", is_superuser=True))
+        await session.commit()
+    yield maker
+    await engine.dispose()
+
+
+def _ctx(session_maker: async_sessionmaker[AsyncSession], redis: FakeAsyncRedis, content: dict[str, bytes]) -> dict:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=content[str(request.url)]))
+    return {"session_maker": session_maker, "redis": redis, "sync_fetcher": sync_http_client(transport=transport)}
+
+
+async def _count(session_maker: async_sessionmaker[AsyncSession], model: type) -> int:
+    async with session_maker() as session:
+        return await session.scalar(select(func.count()).select_from(model))
+
+
+async def test_sync_events_upserts_events_and_occurrences(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    redis = FakeAsyncRedis()
+    ctx = _ctx(session_maker, redis, {PYTHON_EVENTS_CALENDAR_URL: ICS})
+
+    first = await sync_events_from_ics(ctx)
+    second = await sync_events_from_ics(ctx, full=True)
+
+    assert (first["created"], first["occurrences"], first["skipped"]) == (2, 3, 1)
+    assert (second["created"], second["updated"], second["unchanged"], second["occurrences"]) == (0, 0, 2, 0)
+    assert {"fetch", "parse", "prefetch", "diff", "write", "commit"} <= set(second["timings"])
+    assert await _count(session_maker, Event) == 2
+    assert await _count(session_maker, EventLocation) == 2
+    assert await _count(session_maker, EventOccurrence) == 3
+
+
+async def test_sync_events_leaves_other_calendars_events_alone(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    async with session_maker() as session:
+        admin = await session.scalar(select(User))
+        calendar = Calendar(name="Community", slug="community", creator_id=admin.id)
+        session.add(calendar)
+        await session.flush()
+        session.add(Event(name="pycon", slug="pycon-us-2026", title="Our PyCon", calendar_id=calendar.id))
+        await session.commit()
+    ctx = _ctx(session_maker, FakeAsyncRedis(), {PYTHON_EVENTS_CALENDAR_URL: ICS})
+
+    result = await sync_events_from_ics(ctx)
+
+    assert (result["created"], result["conflicts"], result["occurrences"]) == (1, 1, 1)
+    async with session_maker() as session:
+        event = await session.scalar(select(Event).where(Event.slug == "pycon-us-2026"))
+        assert (event.title, event.calendar_id) == ("Our PyCon", calendar.id)
+        assert await session.scalar(select(func.count()).where(EventOccurrence.event_id == event.id)) == 0
+
+
+async def test_sync_events_skips_unchanged_calendar(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    redis = FakeAsyncRedis()
+    ctx = _ctx(session_maker, redis, {PYTHON_EVENTS_CALENDAR_URL: ICS})
+    await sync_events_from_ics(ctx)
+
+    with patch("pydotorg.tasks.sync._parse_ics_events") as parse:
+        result = await sync_events_from_ics(ctx)
+
+    parse.assert_not_called()
+    assert result["not_modified"] == 1
+    assert "parse" not in result["timings"]
+
+
+async def test_sync_jobs_updates_changed_descriptions(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    redis = FakeAsyncRedis()
+
+    first = await sync_jobs_from_rss(
+        _ctx(session_maker, redis, {JOBS_RSS_URL: JOBS_RSS.format(description="Build things").encode()})
+    )
+    second = await sync_jobs_from_rss(
+        _ctx(session_maker, redis, {JOBS_RSS_URL: JOBS_RSS.format(description="Build more things").encode()})
+    )
+
+    assert (first["created"], first["skipped"]) == (2, 1)
+    assert (second["created"], second["updated"], second["unchanged"], second["not_modified"]) == (0, 1, 1, 0)
+    async with session_maker() as session:
+        job = await session.scalar(select(Job).where(Job.slug == "senior-python-developer-acme"))
+        category = await session.scalar(select(JobCategory))
+    assert job.description == "Build more things"
+    assert job.company_name == "Acme"
+    assert job.category_id == category.id
+
+
+async def test_sync_all_shares_one_fetcher_and_isolates_failures() -> None:
+    fetchers: list[Any] = []
+
+    async def succeed(ctx: dict[str, Any], *, full: bool) -> dict[str, Any]:
+        fetchers.append(ctx["sync_fetcher"])
+        return {"created": 1, "full": full}
+
+    async def fail(ctx: dict[str, Any], *, full: bool) -> dict[str, Any]:
+        fetchers.append(ctx["sync_fetcher"])
+        msg = "No users found in database"
+        raise RuntimeError(msg)
+
+    with (
+        patch("pydotorg.tasks.sync.sync_events_from_ics", succeed),
+        patch("pydotorg.tasks.sync.sync_news_from_feeds", succeed),
+        patch("pydotorg.tasks.sync.sync_success_stories", fail),
+        patch("pydotorg.tasks.sync.sync_jobs_from_rss", succeed),
+    ):
+        result = await sync_all_external_content({"session_maker": None}, full=True)
+
+    assert result["events"] == {"created": 1, "full": True}
+    assert result["stories"] == {"error": "No users found in database"}
+    assert result["jobs"] == {"created": 1, "full": True}
+    assert len(fetchers) == 4
+    assert len(set(map(id, fetchers))) == 1
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -10,7 +13,7 @@ from jose import jwt
 
 from pydotorg.config import settings
 from pydotorg.core.auth.jwt import jwt_service
-from pydotorg.core.auth.password import password_service
+from pydotorg.core.auth.password import PasswordHashingBusyError, PasswordService, password_service
 
 
 class TestPasswordService:
@@ -59,6 +62,80 @@ class TestPasswordService:
         assert error is None
 
 
+class TestPasswordHashingPool:
+    async def test_hashing_runs_on_the_bcrypt_pool(self) -> None:
+        service = PasswordService(rounds=4)
+        loop_thread = threading.current_thread()
+        with patch.object(service, "verify_password", side_effect=lambda *_: threading.current_thread()):
+            worker = await service.verify("TestPassword123", "hash")
+        service.shutdown()
+
+        assert worker is not loop_thread
+        assert worker.name.startswith("bcrypt")
+
+    async def test_hash_and_verify_round_trip(self) -> None:
+        service = PasswordService(rounds=4)
+        hashed = await service.hash("TestPassword123")
+
+        results = await asyncio.gather(service.verify("TestPassword123", hashed), service.verify("Wrong", hashed))
+        service.shutdown()
+
+        assert results == [True, False]
+        assert service.stats() == {
+            "workers": service.max_workers,
+            "pending": 0,
+            "peak_pending": 2,
+            "completed": 3,
+            "failed": 0,
+            "rejected": 0,
+            "rehashed": 0,
+        }
+
+    async def test_rejects_work_beyond_max_pending(self) -> None:
+        service = PasswordService(rounds=4, max_workers=1, max_pending=1)
+        hashed = service.hash_password("TestPassword123")
+        first = asyncio.create_task(service.verify("TestPassword123", hashed))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHashingBusyError) as exc_info:
+            await service.verify("TestPassword123", hashed)
+
+        assert await first is True
+        assert await service.verify("TestPassword123", hashed) is True
+        service.shutdown()
+        assert exc_info.value.status_code == 429
+        assert (service.rejected, service.completed) == (1, 2)
+
+    async def test_failed_operations_are_not_counted_as_completed(self) -> None:
+        service = PasswordService(rounds=4)
+
+        with pytest.raises(ValueError, match="Invalid salt"):
+            await service.verify("TestPassword123", "not-a-bcrypt-hash")
+        service.shutdown()
+
+        assert (service.completed, service.failed, service.stats()["pending"]) == (0, 1, 0)
+
+    async def test_verify_and_update_rehashes_when_cost_changes(self) -> None:
+        old_hash = PasswordService(rounds=4).hash_password("TestPassword123")
+        service = PasswordService(rounds=5)
+
+        assert await service.verify_and_update("Wrong", old_hash) == (False, None)
+        is_valid, new_hash = await service.verify_and_update("TestPassword123", old_hash)
+        assert await service.verify_and_update("TestPassword123", new_hash) == (True, None)
+        service.shutdown()
+
+        assert is_valid is True
+        assert new_hash.startswith("$2b$05$")
+        assert service.verify_password("TestPassword123", new_hash) is True
+        assert service.rehashed == 1
+
+    def test_needs_rehash_ignores_unparseable_hashes(self) -> None:
+        service = PasswordService(rounds=12)
+
+        assert service.needs_rehash(PasswordService(rounds=4).hash_password("x")) is True
+        assert service.needs_rehash("not-a-bcrypt-hash") is False
+
+
 class TestJWTService:
     def test_create_access_token(self) -> None:
         user_id = uuid4()